@@ -1,8 +1,26 @@
 """
 Defines interface to track factsheet file contents against in-memory
 model.
+
+A model component may consist of parts that track their own change
+state (for example, a factsheet consists of identity text and topics).
+Each part (see :class:`PartStale`) reports to its owners (see
+:class:`InterfaceStaleOwner`) when the part becomes stale or fresh.
+An owner keeps the set of its stale parts, so that it can answer
+whether it is stale without visiting every part.
+
+.. data:: g_hooks_stale
+
+    Functions to call whenever a model component becomes stale.  See
+    :func:`notify_stale`.
+
+.. data:: HookStale
+
+    Type hint for function to call with a model component that became
+    stale.
 """
 import abc
+import typing
 
 
 class InterfaceStaleFile(abc.ABC):
@@ -27,3 +45,96 @@ class InterfaceStaleFile(abc.ABC):
     def set_stale(self):
         """Mark model in memory changed from file contents."""
         raise NotImplementedError
+
+
+class InterfaceStaleOwner(abc.ABC):
+    """Interface for a model component that tracks change state of its
+    parts.
+    """
+
+    @abc.abstractmethod
+    def on_fresh_part(self, p_part: 'PartStale') -> None:
+        """Forget part that became consistent with file contents.
+
+        :param p_part: part that became fresh.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def on_stale_part(self, p_part: 'PartStale') -> None:
+        """Record part that changed from file contents.
+
+        :param p_part: part that became stale.
+        """
+        raise NotImplementedError
+
+
+class PartStale(InterfaceStaleFile):
+    """Model component that reports change state to its owners.
+
+    Implementations call :meth:`_notify_stale` when the component
+    becomes stale and :meth:`_notify_fresh` when the component becomes
+    fresh.  Owners are run-time information, which implementations
+    exclude from persistent form.
+    """
+
+    def add_owner_stale(self, p_owner: InterfaceStaleOwner) -> None:
+        """Report change state to given owner.
+
+        Method reports a stale part to the owner immediately, even when
+        the owner was added before, since the owner may have reset its
+        record of stale parts (for example, when a topic body loads).
+        Method adds an owner at most once.
+
+        :param p_owner: owner to add.
+        """
+        owners = self._get_owners_stale()
+        if not any(p_owner is o for o in owners):
+            owners.append(p_owner)
+        if self.is_stale():
+            p_owner.on_stale_part(self)
+
+    def _get_owners_stale(self) -> typing.List[InterfaceStaleOwner]:
+        """Return owners of part, adding attribute for owners if
+        needed.
+        """
+        return self.__dict__.setdefault('_owners_stale', list())
+
+    def _notify_fresh(self) -> None:
+        """Report to each owner that part is fresh."""
+        for owner in self.__dict__.get('_owners_stale', ()):
+            owner.on_fresh_part(self)
+
+    def _notify_stale(self) -> None:
+        """Report to each owner that part is stale."""
+        for owner in self.__dict__.get('_owners_stale', ()):
+            owner.on_stale_part(self)
+
+    def remove_owner_stale(self, p_owner: InterfaceStaleOwner) -> None:
+        """Stop reporting change state to given owner.
+
+        The owner forgets the part.
+
+        :param p_owner: owner to remove.
+        """
+        owners = self._get_owners_stale()
+        owners[:] = [o for o in owners if o is not p_owner]
+        p_owner.on_fresh_part(self)
+
+
+HookStale = typing.Callable[[InterfaceStaleFile], None]
+
+g_hooks_stale: typing.List[HookStale] = list()
+
+
+def notify_stale(p_source: InterfaceStaleFile) -> None:
+    """Call each function in :data:`g_hooks_stale` with stale component.
+
+    Implementations of :meth:`.InterfaceStaleFile.set_stale` call this
+    function so that services such as autosave (see
+    :mod:`.journal_sheet`) learn of changes as they happen.
+
+    :param p_source: model component that became stale.
+    """
+    for hook in g_hooks_stale:
+        hook(p_source)
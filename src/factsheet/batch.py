@@ -0,0 +1,208 @@
+"""
+Defines headless batch entry point to check facts of factsheet files.
+
+Run from the source directory with, for example,
+``python -m factsheet.batch --format csv --output checks.csv *.fsg``.
+The batch loads each factsheet file without a display, checks every
+fact of every topic (see :meth:`.Fact.check`), and writes one result
+row per fact as JSON or CSV.  Files load and check in parallel on a
+process pool.  A file that fails to load yields a row with an error
+and no fact.
+
+The batch checks the facts each topic lists (see
+:meth:`.Topic.iter_facts`).  Built-in topics do not yet hold facts, so
+a file of built-in topics yields no rows.
+
+.. data:: FIELDS_ROW
+
+    Names of fields in each result row, in CSV column order.
+
+.. data:: RowCheck
+
+    Type hint for result row: a mapping from field name to value.
+"""
+import argparse
+import concurrent.futures as CF
+import csv
+import json
+import logging
+import os
+from pathlib import Path
+import pickle
+import sys
+import typing
+
+import factsheet.control.format_sheet as CFORMAT
+import factsheet.model.sheet as MSHEET
+
+logger = logging.getLogger('Main.batch')
+
+FIELDS_ROW = ('path', 'topic', 'fact', 'status', 'value', 'error')
+RowCheck = typing.Dict[str, typing.Optional[str]]
+
+
+def check_file(p_path: Path) -> typing.List[RowCheck]:
+    """Return result rows from check of each fact in factsheet file.
+
+    Function runs in a worker process, so it reports failure as a row
+    rather than an exception.
+
+    :param p_path: location of factsheet file.
+    """
+    try:
+        sheet = load_file(p_path)
+    except Exception as err:
+        logger.error('Could not load {}: {}'.format(p_path, err))
+        return [new_row(p_path, p_error=err)]
+
+    rows = list()
+    for topic in sheet.topics():
+        for fact in topic.iter_facts():
+            try:
+                status = fact.check()
+            except Exception as err:
+                rows.append(new_row(p_path, topic.name.text,
+                                    fact.name.text, p_error=err))
+                continue
+
+            value = None if fact.value is None else str(fact.value)
+            rows.append(new_row(p_path, topic.name.text, fact.name.text,
+                                status.name, value))
+    return rows
+
+
+def check_files(p_paths: typing.Sequence[Path], p_jobs: int
+                ) -> typing.Iterator[RowCheck]:
+    """Return iterator over result rows for factsheet files in order.
+
+    :param p_paths: locations of factsheet files.
+    :param p_jobs: number of worker processes.  When 1 or when there is
+        one file, check files in the current process.
+    """
+    if p_jobs <= 1 or len(p_paths) <= 1:
+        for path in p_paths:
+            yield from check_file(path)
+        return
+
+    with CF.ProcessPoolExecutor(max_workers=p_jobs) as executor:
+        for rows in executor.map(check_file, p_paths):
+            yield from rows
+
+
+def load_file(p_path: Path) -> MSHEET.Sheet:
+    """Return factsheet model loaded eagerly from file.
+
+    Function imports a file from an earlier release, which contains a
+    pickle of the entire model.
+
+    :param p_path: location of factsheet file.
+    """
+    with p_path.open(mode='rb') as io_in:
+        if CFORMAT.is_format(io_in):
+            return CFORMAT.load_sheet(io_in)
+
+        return pickle.load(io_in)
+
+
+def main(p_argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    """Check factsheet files named on command line and return exit
+    status.
+
+    Exit status is 1 when any file fails to load and 0 otherwise.  An
+    error in the check of a fact appears in the fact's result row and
+    does not affect exit status.
+
+    :param p_argv: command-line arguments.  Default is
+        :data:`sys.argv`.
+    """
+    args = new_parser().parse_args(p_argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(levelname)s | %(name)s | %(message)s')
+    jobs = args.jobs or os.cpu_count() or 1
+    rows = check_files(args.paths, jobs)
+    if args.output is None:
+        status = write_rows(rows, sys.stdout, args.format)
+    else:
+        with args.output.open(mode='w', newline='') as io_out:
+            status = write_rows(rows, io_out, args.format)
+    return status
+
+
+def new_parser() -> argparse.ArgumentParser:
+    """Return parser for command-line arguments."""
+    parser = argparse.ArgumentParser(
+        prog='factsheet-batch',
+        description='Check every fact of factsheet files without a'
+                    ' display and write the results.')
+    parser.add_argument(
+        'paths', nargs='+', type=Path, metavar='PATH',
+        help='factsheet file to check')
+    parser.add_argument(
+        '-f', '--format', choices=('json', 'csv'), default='json',
+        help='format of results (default: %(default)s)')
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=None,
+        help='number of worker processes (default: number of CPUs)')
+    parser.add_argument(
+        '-o', '--output', type=Path, default=None,
+        help='file for results (default: standard output)')
+    parser.add_argument(
+        '-v', '--verbose', action='store_true',
+        help='log progress')
+    return parser
+
+
+def new_row(p_path: Path, p_topic: typing.Optional[str] = None,
+            p_fact: typing.Optional[str] = None,
+            p_status: typing.Optional[str] = None,
+            p_value: typing.Optional[str] = None,
+            p_error: typing.Optional[Exception] = None) -> RowCheck:
+    """Return result row with given field values.
+
+    :param p_path: location of factsheet file.
+    :param p_topic: name of topic.
+    :param p_fact: name of fact.
+    :param p_status: name of fact status after check.
+    :param p_value: fact value after check as text.
+    :param p_error: error that prevented load or check.
+    """
+    error = None
+    if p_error is not None:
+        error = '{}: {}'.format(type(p_error).__name__, p_error)
+    return dict(path=str(p_path), topic=p_topic, fact=p_fact,
+                status=p_status, value=p_value, error=error)
+
+
+def write_rows(p_rows: typing.Iterable[RowCheck], p_io: typing.TextIO,
+               p_format: str) -> int:
+    """Write result rows in given format and return exit status.
+
+    Exit status is 1 when any row reports a load error and 0
+    otherwise.  Rows that report an error in the check of a fact do
+    not affect exit status.
+
+    :param p_rows: result rows to write.
+    :param p_io: open text file for results.
+    :param p_format: 'json' or 'csv'.
+    """
+    status = 0
+    if 'csv' == p_format:
+        writer = csv.DictWriter(p_io, fieldnames=FIELDS_ROW)
+        writer.writeheader()
+        for row in p_rows:
+            writer.writerow(row)
+            if row['error'] is not None and row['fact'] is None:
+                status = 1
+        return status
+
+    rows = list(p_rows)
+    json.dump(rows, p_io, indent=2)
+    p_io.write('\n')
+    if any(r['error'] is not None and r['fact'] is None for r in rows):
+        status = 1
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -18,6 +18,16 @@ Constants and Type Hints
 .. _`Gtk.ComboBox`:
     https://lazka.github.io/pgi-docs/#Gtk-3.0/classes/ComboBox.html
 
+.. data:: g_hooks_removed
+
+    Functions to call whenever lines are removed from a multi-level
+    outline.  See :func:`notify_removed`.
+
+.. data:: HookRemoved
+
+    Type hint for function to call with storage of a multi-level
+    outline and the items removed from it.
+
 .. data:: ItemOpaque
 
     Generic type for an item in an outline.
@@ -34,14 +44,6 @@ Constants and Type Hints
     Type variable for outline representation suitable for persistent
     storage.
 
-.. data:: UiModelOutlineMulti
-
-    Type variable for store of a multi-level outline.  See
-    `Gtk.TreeStore`_.
-
-.. _`Gtk.TreeStore`:
-    https://lazka.github.io/pgi-docs/#Gtk-3.0/classes/TreeStore.html
-
 .. data:: UIModelOutlineSingle
 
     Type variable for store of a single-level outline.  See
@@ -63,9 +65,12 @@ Classes and Functions
     """
 import abc
 import gi
+import itertools
 import typing
 
 from . import bridge_base as BBASE
+from . import store_outline as BSTORE
+import factsheet.instrument as INSTR
 
 gi.require_version('Gtk', '3.0')
 from gi.repository import GObject as GO  # noqa: E402
@@ -76,11 +81,318 @@ ChooserOutline = typing.Union[Gtk.ComboBox]
 ItemOpaque = typing.TypeVar('ItemOpaque')
 LineOutline = typing.Union[Gtk.TreeIter]
 PersistOutline = typing.MutableMapping[str, ItemOpaque]
-UiModelOutlineMulti = typing.Union[Gtk.TreeStore]
 UiModelOutlineSingle = typing.Union[Gtk.ListStore]
+ViewOutline = typing.Union[Gtk.TreeView]
+
+HookRemoved = typing.Callable[
+    ['UiModelOutlineMulti', typing.List[typing.Any]], None]
+
+g_hooks_removed: typing.List[HookRemoved] = list()
+
+
+class UiModelOutlineMulti(GO.GObject, Gtk.TreeModel):
+    """Presents :class:`.StoreOutline` to GTK views as a
+    `Gtk.TreeModel`_.
+
+    The adapter holds no outline content.  Each `Gtk.TreeIter`_ from
+    the adapter carries a line of the store along with the adapter's
+    stamp.  An iter is valid while its line is in the store, and the
+    store never reuses a removed line.  The adapter rejects iters that
+    are not valid.  The adapter answers view
+    queries from the store and relays store changes to views as tree
+    model signals (see :meth:`emit_inserted` and
+    :meth:`emit_deleted_many`).
+    The adapter has one column, which contains outline items.
+
+    Views populate on demand.  A view asks for the children of a line
+    only when the user expands the line, and the store answers each
+    navigation query in constant time.  Views of large outlines should
+    use fixed-height mode (see :class:`.InitColumnsOutlineId`).
+
+    .. _`Gtk.TreeModel`:
+        https://lazka.github.io/pgi-docs/#Gtk-3.0/classes/TreeModel.html
+
+    .. _`Gtk.TreeIter`:
+        https://lazka.github.io/pgi-docs/#Gtk-3.0/classes/TreeIter.html
+
+    :param p_store: store to present.  Default is a new, empty store.
+    """
+
+    _stamps = itertools.count(1)
+
+    def __init__(self, p_store: typing.Optional[BSTORE.StoreOutline] = None
+                 ) -> None:
+        super().__init__()
+        if p_store is None:
+            p_store = BSTORE.StoreOutline()
+        self._store = p_store
+        self._stamp = next(self._stamps) & 0x7FFFFFFF
+
+    def do_get_column_type(self, _column: int) -> GO.GType:
+        """Return type of outline item column."""
+        return GO.TYPE_PYOBJECT
+
+    def do_get_flags(self) -> Gtk.TreeModelFlags:
+        """Return model flags: an iter lasts as long as its line."""
+        return Gtk.TreeModelFlags.ITERS_PERSIST
+
+    def do_get_iter(self, p_path: Gtk.TreePath
+                    ) -> typing.Tuple[bool, typing.Optional[Gtk.TreeIter]]:
+        """Return iter for path when path identifies a line.
+
+        :param p_path: path to line.
+        """
+        line = None
+        for index in p_path.get_indices():
+            line = self._store.child_nth(line, index)
+            if line is None:
+                return False, None
+
+        if line is None:
+            return False, None
+
+        return True, self.iter_from_line(line)
+
+    def do_get_n_columns(self) -> int:
+        """Return number of columns."""
+        return 1
+
+    def do_get_path(self, p_iter: Gtk.TreeIter
+                    ) -> typing.Optional[Gtk.TreePath]:
+        """Return path to line of iter or None when iter is not valid.
+
+        :param p_iter: iter of line.
+        """
+        if not self.has_line(p_iter):
+            return None
+
+        return Gtk.TreePath(self._store.path(p_iter.user_data))
+
+    def do_get_value(self, p_iter: Gtk.TreeIter, _column: int
+                     ) -> typing.Optional[ItemOpaque]:
+        """Return outline item at line of iter or None when iter is not
+        valid.
+
+        :param p_iter: iter of line.
+        """
+        if not self.has_line(p_iter):
+            return None
+
+        return self._store.get_item(p_iter.user_data)
+
+    def do_iter_children(self, p_parent: typing.Optional[Gtk.TreeIter]
+                         ) -> typing.Tuple[bool,
+                                           typing.Optional[Gtk.TreeIter]]:
+        """Return iter for first child of parent when there is one.
+
+        :param p_parent: iter of parent line or None for top level.
+        """
+        if p_parent is not None and not self.has_line(p_parent):
+            return False, None
+
+        line = self._store.child_first(self.line_from_iter(p_parent))
+        if line is None:
+            return False, None
+
+        return True, self.iter_from_line(line)
+
+    def do_iter_has_child(self, p_iter: Gtk.TreeIter) -> bool:
+        """Return True when line of iter has children.
+
+        :param p_iter: iter of line.
+        """
+        if not self.has_line(p_iter):
+            return False
+
+        return self._store.child_first(p_iter.user_data) is not None
+
+    def do_iter_n_children(self, p_iter: typing.Optional[Gtk.TreeIter]
+                           ) -> int:
+        """Return number of children of line of iter.
+
+        :param p_iter: iter of line or None for top level.
+        """
+        if p_iter is not None and not self.has_line(p_iter):
+            return 0
+
+        return self._store.n_children(self.line_from_iter(p_iter))
+
+    def do_iter_next(self, p_iter: Gtk.TreeIter) -> bool:
+        """Move iter to next sibling and return True when there is one.
+
+        :param p_iter: iter to move.
+        """
+        if not self.has_line(p_iter):
+            return False
+
+        line = self._store.next(p_iter.user_data)
+        if line is None:
+            return False
+
+        p_iter.user_data = line
+        return True
+
+    def do_iter_nth_child(
+            self, p_parent: typing.Optional[Gtk.TreeIter], p_n: int
+            ) -> typing.Tuple[bool, typing.Optional[Gtk.TreeIter]]:
+        """Return iter for child of parent at position when there is one.
+
+        :param p_parent: iter of parent line or None for top level.
+        :param p_n: position of child.
+        """
+        if p_parent is not None and not self.has_line(p_parent):
+            return False, None
+
+        line = self._store.child_nth(self.line_from_iter(p_parent), p_n)
+        if line is None:
+            return False, None
+
+        return True, self.iter_from_line(line)
+
+    def do_iter_parent(self, p_child: Gtk.TreeIter
+                       ) -> typing.Tuple[bool, typing.Optional[Gtk.TreeIter]]:
+        """Return iter for parent of child when child is not top level.
+
+        :param p_child: iter of child line.
+        """
+        if not self.has_line(p_child):
+            return False, None
+
+        line = self._store.parent(p_child.user_data)
+        if line is None:
+            return False, None
+
+        return True, self.iter_from_line(line)
+
+    def do_iter_previous(self, p_iter: Gtk.TreeIter) -> bool:
+        """Move iter to previous sibling and return True when there is
+        one.
+
+        :param p_iter: iter to move.
+        """
+        if not self.has_line(p_iter):
+            return False
+
+        line = self._store.prev(p_iter.user_data)
+        if line is None:
+            return False
+
+        p_iter.user_data = line
+        return True
+
+    def emit_deleted_many(self, p_removals: typing.Sequence[typing.Tuple[
+            typing.Tuple[int, ...], typing.Optional[BSTORE.LineStore]]]
+                          ) -> None:
+        """Notify views that store removed sections.
+
+        Method notifies views of the line at top of each section but not
+        of the lines below.  Then method notifies views of each parent
+        that no longer has children.
+
+        :param p_removals: path before removal and parent of each line
+            at top of a removed section, last line first (see
+            :meth:`.StoreOutline.remove_many`).
+        """
+        parents = dict()
+        for path, parent in p_removals:
+            self.row_deleted(Gtk.TreePath(path))
+            if parent is not None:
+                parents[parent] = None
+        for parent in parents:
+            if self._store.child_first(parent) is None:
+                it_parent = self.iter_from_line(parent)
+                self.row_has_child_toggled(
+                    self.get_path(it_parent), it_parent)
+
+    def emit_inserted(self, p_line: BSTORE.LineStore) -> Gtk.TreeIter:
+        """Notify views that store added line and return iter for line.
+
+        :param p_line: new line.
+        """
+        it_new = self.iter_from_line(p_line)
+        self.row_inserted(self.get_path(it_new), it_new)
+        parent = self._store.parent(p_line)
+        if parent is not None and self._store.child_first(parent) == p_line:
+            if self._store.next(p_line) is None:
+                it_parent = self.iter_from_line(parent)
+                self.row_has_child_toggled(
+                    self.get_path(it_parent), it_parent)
+        return it_new
+
+    def emit_inserted_section(self, p_lines: typing.Sequence[
+            BSTORE.LineStore]) -> typing.List[Gtk.TreeIter]:
+        """Notify views that store added consecutive sibling lines,
+        each with its section, and return iters for lines.
+
+        Method notifies views of each given line but not of the lines
+        below.  A view finds the lines below when it expands a line.
+
+        :param p_lines: new sibling lines in order.
+        """
+        if not p_lines:
+            return list()
+
+        iters = [self.iter_from_line(line) for line in p_lines]
+        indices = list(self.get_path(iters[0]).get_indices())
+        for line, it_new in zip(p_lines, iters):
+            path = Gtk.TreePath(indices)
+            self.row_inserted(path, it_new)
+            if self._store.child_first(line) is not None:
+                self.row_has_child_toggled(path, it_new)
+            indices[-1] += 1
+        line_first = p_lines[0]
+        parent = self._store.parent(line_first)
+        is_first = line_first == self._store.child_first(parent)
+        if parent is not None and is_first:
+            it_parent = self.iter_from_line(parent)
+            self.row_has_child_toggled(self.get_path(it_parent), it_parent)
+        return iters
+
+    def has_line(self, p_iter: Gtk.TreeIter) -> bool:
+        """Return True when iter is from adapter and its line is in the
+        store.
+
+        :param p_iter: iter to check.
+        """
+        if self._stamp != p_iter.stamp:
+            return False
+
+        return self._store.is_valid(p_iter.user_data)
+
+    def iter_from_line(self, p_line: BSTORE.LineStore) -> Gtk.TreeIter:
+        """Return iter for line of store.
+
+        :param p_line: line of store.
+        """
+        it_new = Gtk.TreeIter()
+        it_new.stamp = self._stamp
+        it_new.user_data = p_line
+        return it_new
+
+    def line_from_iter(self, p_iter: typing.Optional[Gtk.TreeIter]
+                       ) -> typing.Optional[BSTORE.LineStore]:
+        """Return line of store for iter or None when iter is None.
+
+        :param p_iter: iter from adapter.
+        :raises ValueError: when iter is not valid (for example, iter is
+            from another adapter or line of iter was removed).
+        """
+        if p_iter is None:
+            return None
+
+        if not self.has_line(p_iter):
+            raise ValueError('Iter does not identify a line of outline.')
+
+        return p_iter.user_data
+
+    @property
+    def store(self) -> BSTORE.StoreOutline:
+        """Return store that adapter presents."""
+        return self._store
+
+
 UiModelOutline = typing.TypeVar(
     'UiModelOutline', UiModelOutlineMulti, UiModelOutlineSingle)
-ViewOutline = typing.Union[Gtk.TreeView]
 
 
 class FactoryChooserOutline(BBASE.FactoryUiViewAbstract[UiModelOutline],
@@ -171,6 +483,7 @@ class ModelOutline(BBASE.BridgeBase[UiModelOutline, PersistOutline],
         """
         return p_model.get_value(p_line, cls.C_ITEM)
 
+    @INSTR.timed('ModelOutline._get_persist')
     def _get_persist(self) -> PersistOutline:
         """Return outline in form suitable for persistent storage."""
         persist: PersistOutline = dict()
@@ -241,7 +554,10 @@ class ModelOutlineMulti(ModelOutline[UiModelOutlineMulti, ItemOpaque],
     Class is generic in type of items contained in the outline.
 
     Encapsulates visual element storage with methods tailored to
-    Factsheet.
+    Factsheet.  Outline content is in a :class:`.StoreOutline`, so
+    outline operations run without calls into the widget toolkit.
+    Views reach the content through :class:`.UiModelOutlineMulti`.
+    Lines are iters from the adapter.
 
     .. admonition:: About Equality
 
@@ -251,6 +567,71 @@ class ModelOutlineMulti(ModelOutline[UiModelOutlineMulti, ItemOpaque],
         and may be different.
     """
 
+    def clear(self) -> None:
+        """Remove all items from outline."""
+        store = self._ui_model.store
+        lines = list()
+        line = store.child_first()
+        while line is not None:
+            lines.append(line)
+            line = store.next(line)
+        self._remove_lines(lines)
+
+    def depth(self, p_line: LineOutline) -> int:
+        """Return depth of given line in outline.
+
+        Top-level lines have depth 0.
+
+        :param p_line: line to measure.
+        """
+        line = self._ui_model.line_from_iter(p_line)
+        return self._ui_model.store.depth(line)
+
+    def extend_section(self, p_preorder: typing.Iterable[
+                           typing.Tuple[int, typing.Optional[ItemOpaque]]],
+                       p_line: LineOutline = None) -> typing.List[LineOutline]:
+        """Add section to outline after all existing children of line
+        and return lines at top of section.
+
+        Each entry of the preorder list is depth and item of a new line
+        in depth-first order.  Depth 0 is a child of given line.  Method
+        builds the whole section in the store and then notifies views
+        only of the lines at top of section, so time is linear in the
+        number of new lines.
+
+        :param p_preorder: depth and item of each new line.
+        :param p_line: parent line of section.  Default is top level.
+        :raises ValueError: when a line is deeper than any possible
+            parent.  Method adds no lines in that case.
+        """
+        line_parent = self._ui_model.line_from_iter(p_line)
+        lines_top = self._ui_model.store.extend(p_preorder, line_parent)
+        return self._ui_model.emit_inserted_section(lines_top)
+
+    def get_item(self, p_line: LineOutline) -> typing.Optional[ItemOpaque]:
+        """Return item at given line or None when no item at line.
+
+        :param p_line: line of desired item.
+        """
+        if not self.is_valid(p_line):
+            return None
+
+        return self._ui_model.store.get_item(p_line.user_data)
+
+    @INSTR.timed('ModelOutline._get_persist')
+    def _get_persist(self) -> PersistOutline:
+        """Return outline in form suitable for persistent storage."""
+        persist: PersistOutline = dict()
+        indices: typing.List[int] = list()
+        for depth, _line, item in self._ui_model.store.walk():
+            if depth < len(indices):
+                del indices[depth + 1:]
+                indices[depth] += 1
+            else:
+                indices.append(0)
+            persist[':'.join(map(str, indices))] = item
+        return persist
+
     def insert_after(self, p_item: ItemOpaque,
                      p_line: LineOutline = None) -> LineOutline:
         """Add item to outline after given line.
@@ -261,8 +642,9 @@ class ModelOutlineMulti(ModelOutline[UiModelOutlineMulti, ItemOpaque],
         :param p_line: line to precede new line.
         :returns: line of newly-added item.
         """
-        PARENT = None
-        return self._ui_model.insert_after(PARENT, p_line, [p_item])
+        line = self._ui_model.store.insert_after(
+            p_item, self._ui_model.line_from_iter(p_line))
+        return self._ui_model.emit_inserted(line)
 
     def insert_before(self, p_item: ItemOpaque,
                       p_line: LineOutline = None) -> LineOutline:
@@ -274,8 +656,9 @@ class ModelOutlineMulti(ModelOutline[UiModelOutlineMulti, ItemOpaque],
         :param p_line: line to follow new line.
         :returns: line of newly-added item.
         """
-        PARENT = None
-        return self._ui_model.insert_before(PARENT, p_line, [p_item])
+        line = self._ui_model.store.insert_before(
+            p_item, self._ui_model.line_from_iter(p_line))
+        return self._ui_model.emit_inserted(line)
 
     def insert_child(self, p_item: ItemOpaque,
                      p_line: LineOutline = None) -> LineOutline:
@@ -288,7 +671,22 @@ class ModelOutlineMulti(ModelOutline[UiModelOutlineMulti, ItemOpaque],
         :param p_line: line of parent of new line.
         :returns: line of newly-added item.
         """
-        return self._ui_model.append(p_line, [p_item])
+        line = self._ui_model.store.insert_child(
+            p_item, self._ui_model.line_from_iter(p_line))
+        return self._ui_model.emit_inserted(line)
+
+    def insert_many(self, p_items: typing.Iterable[ItemOpaque],
+                    p_line: LineOutline = None) -> typing.List[LineOutline]:
+        """Add items to outline as children of given line and return
+        lines of new items.
+
+        Add lines in order after all existing children.  See
+        :meth:`extend_section`.
+
+        :param p_items: new items to add.
+        :param p_line: line of parent of new lines.  Default is top level.
+        """
+        return self.extend_section(((0, item) for item in p_items), p_line)
 
     def insert_section(self, p_other: 'ModelOutlineMulti',
                        p_line_parent: LineOutline = None,
@@ -309,15 +707,28 @@ class ModelOutlineMulti(ModelOutline[UiModelOutlineMulti, ItemOpaque],
         :param p_line_section: line to copy along with all descendants.
             Default is to copy all lines.
         """
-        if p_line_section is None:
-            it_to = p_line_parent
-        else:
-            item = p_other.get_item(p_line_section)
-            it_to = self._ui_model.append(p_line_parent, [item])
-        line = p_other._ui_model.iter_children(p_line_section)
-        while line is not None:
-            self.insert_section(p_other, it_to, line)
-            line = p_other._ui_model.iter_next(line)
+        store_other = p_other._ui_model.store
+        line_section = p_other._ui_model.line_from_iter(p_line_section)
+        depth_base = 0
+        if line_section is not None:
+            depth_base = store_other.depth(line_section)
+        preorder = [(depth - depth_base, item)
+                    for depth, _line, item in store_other.walk(line_section)]
+        _ = self.extend_section(preorder, p_line_parent)
+
+    def is_valid(self, p_line: LineOutline) -> bool:
+        """Return True when line identifies a line in outline.
+
+        :param p_line: line to check.  None is not a line.
+        """
+        if p_line is None:
+            return False
+
+        return self._ui_model.has_line(p_line)
+
+    def items(self) -> typing.Iterator[typing.Optional[ItemOpaque]]:
+        """Return iterator over items in outline."""
+        return self._ui_model.store.items_section()
 
     def items_section(self, p_line: LineOutline = None
                       ) -> typing.Iterator[typing.Optional[ItemOpaque]]:
@@ -326,8 +737,8 @@ class ModelOutlineMulti(ModelOutline[UiModelOutlineMulti, ItemOpaque],
         :param p_line: parent line of section.  Default iterates over
             entire outline.
         """
-        for line in self.lines_section(p_line):
-            yield self.get_item(line)
+        return self._ui_model.store.items_section(
+            self._ui_model.line_from_iter(p_line))
 
     def lines(self) -> typing.Iterator[LineOutline]:
         """Return iterator over lines in outline.
@@ -345,31 +756,89 @@ class ModelOutlineMulti(ModelOutline[UiModelOutlineMulti, ItemOpaque],
         :param p_line: parent line of section.  Default iterates over
             entire outline.
         """
-        if p_line is not None:
-            yield p_line
-        line = self._ui_model.iter_children(p_line)
-        while line is not None:
-            yield from self.lines_section(line)
-            line = self._ui_model.iter_next(line)
+        store = self._ui_model.store
+        iter_from_line = self._ui_model.iter_from_line
+        for line in store.lines_section(
+                self._ui_model.line_from_iter(p_line)):
+            yield iter_from_line(line)
 
     def _new_ui_model(self) -> UiModelOutlineMulti:
         """Return toolkit-specific outline storage element."""
-        return UiModelOutlineMulti(GO.TYPE_PYOBJECT)
+        return UiModelOutlineMulti()
+
+    def remove(self, p_line: typing.Optional[LineOutline]) -> None:
+        """Remove item at given line from outline.
+
+        :param p_line: line to remove along with all descendants.  If
+            line is None or invalid, remove no items.
+        """
+        self.remove_many([p_line])
+
+    def remove_many(self, p_lines: typing.Iterable[
+            typing.Optional[LineOutline]]) -> None:
+        """Remove items at given lines from outline.
+
+        Method skips a line that is None or invalid, including a line
+        within the section of another given line.  Method unlinks all
+        sections in one pass over the store and then notifies views only
+        of the line at top of each section (see
+        :meth:`.StoreOutline.remove_many`).
 
+        :param p_lines: lines to remove along with all descendants.
+        """
+        line_from_iter = self._ui_model.line_from_iter
+        self._remove_lines([line_from_iter(line) for line in p_lines
+                            if self.is_valid(line)])
+
+    def _remove_lines(self, p_lines: typing.Sequence[BSTORE.LineStore]
+                      ) -> None:
+        """Remove lines of store along with all descendants.
+
+        Method notifies views of the removal and then, when there are
+        hooks in :data:`g_hooks_removed`, notifies the hooks of the
+        removed items.
+
+        :param p_lines: valid lines to remove.
+        """
+        store = self._ui_model.store
+        items: typing.List[typing.Any] = list()
+        if g_hooks_removed:
+            for line in p_lines:
+                items.extend(store.items_section(line))
+        removals = store.remove_many(p_lines)
+        self._ui_model.emit_deleted_many(removals)
+        if items:
+            notify_removed(self._ui_model, items)
+
+    @INSTR.timed('ModelOutline._set_persist')
     def _set_persist(self, p_persist: PersistOutline) -> None:
         """Set outline storage element from content in persistent form.
 
+        Method fills the store directly, without signals to views.  Call
+        method only for an outline that has no views.
+
         :param p_persist: persistent form for outline content.
         """
-        TOP_LEVEL = 1
-        for path_str, item in (p_persist.items()):
-            path = Gtk.TreePath(path_str)
-            if TOP_LEVEL == path.get_depth():
-                i_parent = None
-            else:
-                _ = path.up()
-                i_parent = self._ui_model.get_iter(path)
-            self._ui_model.append(i_parent, [item])
+        _ = self._ui_model.store.extend(
+            (path_str.count(':'), item)
+            for path_str, item in p_persist.items())
+
+    def walk(self, p_line: LineOutline = None
+             ) -> typing.Iterator[typing.Tuple[
+                 int, LineOutline, typing.Optional[ItemOpaque]]]:
+        """Return iterator over depth, line, and item for each line in
+        section at given line.
+
+        Iteration is depth first in one pass with no recursion.  Top-level
+        lines have depth 0.  See :meth:`.StoreOutline.walk`.
+
+        :param p_line: parent line of section.  Default iterates over
+            entire outline.
+        """
+        iter_from_line = self._ui_model.iter_from_line
+        for depth, line, item in self._ui_model.store.walk(
+                self._ui_model.line_from_iter(p_line)):
+            yield depth, iter_from_line(line), item
 
 
 class ModelOutlineSingle(ModelOutline[UiModelOutlineSingle, ItemOpaque],
@@ -422,6 +891,7 @@ class ModelOutlineSingle(ModelOutline[UiModelOutlineSingle, ItemOpaque],
         """Return toolkit-specific outline storage element."""
         return UiModelOutlineSingle(GO.TYPE_PYOBJECT)
 
+    @INSTR.timed('ModelOutline._set_persist')
     def _set_persist(self, p_persist: PersistOutline) -> None:
         """Set outline storage element from content in persistent form.
 
@@ -430,3 +900,19 @@ class ModelOutlineSingle(ModelOutline[UiModelOutlineSingle, ItemOpaque],
         for path_str, item in (p_persist.items()):
             position = int(path_str)
             self._ui_model.insert(position, [item])
+
+
+def notify_removed(p_ui_model: UiModelOutlineMulti,
+                   p_items: typing.List[typing.Any]) -> None:
+    """Call each function in :data:`g_hooks_removed` with storage of
+    outline and items removed from it.
+
+    Services that follow outline content (for example, the search index
+    of :class:`.InitSearchOutlineId`) drop removed items without a walk
+    over the outline.  An item may appear more than once.
+
+    :param p_ui_model: storage of outline.
+    :param p_items: items removed from outline.
+    """
+    for hook in g_hooks_removed:
+        hook(p_ui_model, p_items)
@@ -266,7 +266,7 @@ def id_display(p_display: DisplayTextMarkup) -> IdDisplay:
     return IdDisplay(id(p_display))
 
 
-class ModelText(ABC_STALE.InterfaceStaleFile,
+class ModelText(ABC_STALE.PartStale,
                 BBASE.BridgeBase[ModelTextOpaque, PersistText],
                 typing.Generic[ModelTextOpaque]):
     """Common ancestor of bridge classes for text.
@@ -297,6 +297,7 @@ class ModelText(ABC_STALE.InterfaceStaleFile,
         """
         state = super().__getstate__()
         del state['_stale']
+        _ = state.pop('_owners_stale', None)
         return state
 
     def __init__(self, p_text: str = '') -> None:
@@ -329,12 +330,20 @@ class ModelText(ABC_STALE.InterfaceStaleFile,
         return self._stale
 
     def set_fresh(self) -> None:
-        """Mark content in memory consistent with file."""
+        """Mark content in memory consistent with file and report to
+        owners.
+        """
         self._stale = False
+        self._notify_fresh()
 
     def set_stale(self) -> None:
-        """Mark content in memory changed from file."""
-        self._stale = True
+        """Mark content in memory changed from file, report change to
+        owners, and notify stale hooks (see :func:`.notify_stale`).
+        """
+        if not self._stale:
+            self._stale = True
+            self._notify_stale()
+        ABC_STALE.notify_stale(self)
 
     @property
     def text(self) -> str:
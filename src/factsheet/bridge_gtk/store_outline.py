@@ -0,0 +1,502 @@
+"""
+Defines storage for a multi-level outline in plain Python.
+
+An outline store holds the structure and items of an outline without
+any widget toolkit.  Each line is a small integer that identifies a
+slot in parallel arrays of parent, child, and sibling links.  Store
+operations run at Python speed and the store is usable in tools and
+tests that have no display.  :class:`.ModelOutlineMulti` presents a
+store to GTK views through :class:`.UiModelOutlineMulti`.
+
+Constants and Type Hints
+========================
+
+.. data:: ItemOpaque
+
+    Generic type for an item in an outline.
+
+.. data:: LineStore
+
+    Type hint for a line of an outline store.
+
+.. data:: NO_LINE
+
+    Link value that identifies no line.  The value also identifies the
+    hidden root line, which is parent of each top-level line.
+
+Classes and Functions
+=====================
+"""
+import typing
+
+ItemOpaque = typing.TypeVar('ItemOpaque')
+LineStore = typing.NewType('LineStore', int)
+
+NO_LINE = LineStore(0)
+
+_FREE = LineStore(-1)
+
+
+class StoreOutline(typing.Generic[ItemOpaque]):
+    """Store for a multi-level outline in parallel arrays.
+
+    Class is generic in type of items contained in the outline.
+
+    A line remains valid until removal of the line.  The store does not
+    reuse the slot of a removed line, so a removed line never identifies
+    a later line.  A removed line keeps a slot of a few machine words
+    until the store is discarded.  Methods that take a line accept None
+    for the hidden root line (that is, the top level of the outline).
+
+    .. admonition:: About Equality
+
+        Two stores are equivalent when they have the same structure and
+        corresponding items are equal.  Line values may differ.
+    """
+
+    def __eq__(self, p_other: typing.Any) -> bool:
+        """Return True when other has same structure and items as self.
+
+        :param p_other: object to test for equality.
+        """
+        if not isinstance(p_other, type(self)):
+            return False
+
+        if len(self) != len(p_other):
+            return False
+
+        pairs = zip(self.lines_section(), p_other.lines_section())
+        for line_self, line_other in pairs:
+            if self.depth(line_self) != p_other.depth(line_other):
+                return False
+
+            if self._items[line_self] != p_other._items[line_other]:
+                return False
+
+        return True
+
+    def __init__(self) -> None:
+        self._items: typing.List[typing.Optional[ItemOpaque]] = [None]
+        self._parent: typing.List[LineStore] = [NO_LINE]
+        self._first: typing.List[LineStore] = [NO_LINE]
+        self._last: typing.List[LineStore] = [NO_LINE]
+        self._next: typing.List[LineStore] = [NO_LINE]
+        self._prev: typing.List[LineStore] = [NO_LINE]
+        self._n_lines = 0
+
+    def __len__(self) -> int:
+        """Return number of lines in outline."""
+        return self._n_lines
+
+    def child_first(self, p_line: typing.Optional[LineStore] = None
+                    ) -> typing.Optional[LineStore]:
+        """Return first child of line or None when line has no children.
+
+        :param p_line: parent line.  Default is top level.
+        """
+        child = self._first[p_line or NO_LINE]
+        return child or None
+
+    def child_last(self, p_line: typing.Optional[LineStore] = None
+                   ) -> typing.Optional[LineStore]:
+        """Return last child of line or None when line has no children.
+
+        :param p_line: parent line.  Default is top level.
+        """
+        child = self._last[p_line or NO_LINE]
+        return child or None
+
+    def child_nth(self, p_line: typing.Optional[LineStore], p_n: int
+                  ) -> typing.Optional[LineStore]:
+        """Return child of line at given position or None when there is
+        no such child.
+
+        :param p_line: parent line.  None is top level.
+        :param p_n: position of child (first child is 0).
+        """
+        if p_n < 0:
+            return None
+
+        child = self._first[p_line or NO_LINE]
+        while child and 0 < p_n:
+            child = self._next[child]
+            p_n -= 1
+        return child or None
+
+    def clear(self) -> None:
+        """Remove all lines from outline.
+
+        Like removed lines, cleared lines keep their slots, so a cleared
+        line never identifies a later line.
+        """
+        n_slots = len(self._items)
+        self._items = [None] * n_slots
+        self._parent = [NO_LINE] + [_FREE] * (n_slots - 1)
+        self._first = [NO_LINE] * n_slots
+        self._last = [NO_LINE] * n_slots
+        self._next = [NO_LINE] * n_slots
+        self._prev = [NO_LINE] * n_slots
+        self._n_lines = 0
+
+    def depth(self, p_line: LineStore) -> int:
+        """Return depth of given line in outline.
+
+        Top-level lines have depth 0.
+
+        :param p_line: line to measure.
+        """
+        depth = -1
+        line = p_line
+        parent = self._parent
+        while line:
+            depth += 1
+            line = parent[line]
+        return depth
+
+    def extend(self, p_preorder: typing.Iterable[
+                   typing.Tuple[int, typing.Optional[ItemOpaque]]],
+               p_line: typing.Optional[LineStore] = None
+               ) -> typing.List[LineStore]:
+        """Add section to outline after all existing children of line
+        and return lines at top of section.
+
+        Each entry of the preorder list is depth and item of a new line
+        in depth-first order.  Depth 0 is a child of given line, depth 1
+        is a grandchild, and so on.  Method links each line directly to
+        its parent, so time is linear in the number of new lines.
+
+        :param p_preorder: depth and item of each new line.
+        :param p_line: parent line of section.  Default is top level.
+        :raises ValueError: when a line is deeper than any possible
+            parent.  Method adds no lines in that case.
+        """
+        preorder = list(p_preorder)
+        depth_prev = -1
+        for i, (depth, _item) in enumerate(preorder):
+            if not 0 <= depth <= depth_prev + 1:
+                raise ValueError('Line {} has depth {} outside 0 to {}.'
+                                 ''.format(i, depth, depth_prev + 1))
+            depth_prev = depth
+        link = self._link
+        last = self._last
+        parents = [p_line or NO_LINE]
+        lines_top: typing.List[LineStore] = list()
+        for depth, item in preorder:
+            del parents[depth + 1:]
+            parent = parents[depth]
+            line = link(item, parent, last[parent], NO_LINE)
+            parents.append(line)
+            if 0 == depth:
+                lines_top.append(line)
+        return lines_top
+
+    def get_item(self, p_line: LineStore) -> typing.Optional[ItemOpaque]:
+        """Return item at given line.
+
+        :param p_line: line of desired item.
+        """
+        return self._items[p_line]
+
+    def insert_after(self, p_item: ItemOpaque,
+                     p_line: typing.Optional[LineStore] = None
+                     ) -> LineStore:
+        """Add item to outline after given line.
+
+        If line is None, prepend item at beginning of outline.
+
+        :param p_item: new item to add.
+        :param p_line: line to precede new line.
+        :returns: line of newly-added item.
+        """
+        if p_line is None:
+            return self._link(p_item, NO_LINE, NO_LINE,
+                              self._first[NO_LINE])
+
+        return self._link(
+            p_item, self._parent[p_line], p_line, self._next[p_line])
+
+    def insert_before(self, p_item: ItemOpaque,
+                      p_line: typing.Optional[LineStore] = None
+                      ) -> LineStore:
+        """Add item to outline before given line.
+
+        If line is None, append item at end of outline.
+
+        :param p_item: new item to add.
+        :param p_line: line to follow new line.
+        :returns: line of newly-added item.
+        """
+        if p_line is None:
+            return self._link(p_item, NO_LINE, self._last[NO_LINE], NO_LINE)
+
+        return self._link(
+            p_item, self._parent[p_line], self._prev[p_line], p_line)
+
+    def insert_child(self, p_item: ItemOpaque,
+                     p_line: typing.Optional[LineStore] = None
+                     ) -> LineStore:
+        """Add item to outline as child of given line.
+
+        Add line after all existing children.  If line is None, append
+        item at end of outline.
+
+        :param p_item: new item to add.
+        :param p_line: line of parent of new line.
+        :returns: line of newly-added item.
+        """
+        parent = p_line or NO_LINE
+        return self._link(p_item, parent, self._last[parent], NO_LINE)
+
+    def is_valid(self, p_line: typing.Optional[LineStore]) -> bool:
+        """Return True when line identifies a line in outline.
+
+        :param p_line: line to check.
+        """
+        if not isinstance(p_line, int) or p_line <= NO_LINE:
+            return False
+
+        if len(self._parent) <= p_line:
+            return False
+
+        return _FREE != self._parent[p_line]
+
+    def items_section(self, p_line: typing.Optional[LineStore] = None
+                      ) -> typing.Iterator[typing.Optional[ItemOpaque]]:
+        """Return iterator over items in section at given line.
+
+        :param p_line: parent line of section.  Default iterates over
+            entire outline.
+        """
+        items = self._items
+        for line in self.lines_section(p_line):
+            yield items[line]
+
+    def _link(self, p_item: ItemOpaque, p_parent: LineStore,
+              p_prev: LineStore, p_next: LineStore) -> LineStore:
+        """Return new line for item linked between siblings.
+
+        :param p_item: item for new line.
+        :param p_parent: parent of new line.
+        :param p_prev: sibling to precede new line (or NO_LINE).
+        :param p_next: sibling to follow new line (or NO_LINE).
+        """
+        line = LineStore(len(self._items))
+        self._items.append(p_item)
+        self._parent.append(p_parent)
+        self._first.append(NO_LINE)
+        self._last.append(NO_LINE)
+        self._next.append(p_next)
+        self._prev.append(p_prev)
+        if p_prev:
+            self._next[p_prev] = line
+        else:
+            self._first[p_parent] = line
+        if p_next:
+            self._prev[p_next] = line
+        else:
+            self._last[p_parent] = line
+        self._n_lines += 1
+        return line
+
+    def lines_section(self, p_line: typing.Optional[LineStore] = None
+                      ) -> typing.Iterator[LineStore]:
+        """Return iterator over lines in section at given line.
+
+        Iteration is depth first.  Iteration is not recursive, so
+        outline depth is unlimited.
+
+        :param p_line: parent line of section.  Default iterates over
+            entire outline.
+        """
+        first = self._first
+        next_ = self._next
+        parent = self._parent
+        top = p_line or NO_LINE
+        if p_line:
+            yield p_line
+        line = first[top]
+        while line:
+            yield line
+            if first[line]:
+                line = first[line]
+                continue
+
+            while line != top and not next_[line]:
+                line = parent[line]
+            if line == top:
+                return
+
+            line = next_[line]
+
+    def n_children(self, p_line: typing.Optional[LineStore] = None) -> int:
+        """Return number of children of line.
+
+        :param p_line: parent line.  Default is top level.
+        """
+        n = 0
+        child = self._first[p_line or NO_LINE]
+        while child:
+            n += 1
+            child = self._next[child]
+        return n
+
+    def next(self, p_line: LineStore) -> typing.Optional[LineStore]:
+        """Return sibling after line or None when line is last child.
+
+        :param p_line: line to start from.
+        """
+        return self._next[p_line] or None
+
+    def parent(self, p_line: LineStore) -> typing.Optional[LineStore]:
+        """Return parent of line or None when line is at top level.
+
+        :param p_line: child line.
+        """
+        return self._parent[p_line] or None
+
+    def path(self, p_line: LineStore) -> typing.Tuple[int, ...]:
+        """Return position of line and of each ancestor, from top level
+        down.
+
+        :param p_line: line to locate.
+        """
+        indices = list()
+        line = p_line
+        while line:
+            index = 0
+            sibling = self._prev[line]
+            while sibling:
+                index += 1
+                sibling = self._prev[sibling]
+            indices.append(index)
+            line = self._parent[line]
+        indices.reverse()
+        return tuple(indices)
+
+    def prev(self, p_line: LineStore) -> typing.Optional[LineStore]:
+        """Return sibling before line or None when line is first child.
+
+        :param p_line: line to start from.
+        """
+        return self._prev[p_line] or None
+
+    def remove(self, p_line: LineStore) -> None:
+        """Remove line from outline along with all descendants.
+
+        :param p_line: line to remove.
+        """
+        self._unlink(p_line)
+
+    def remove_many(self, p_lines: typing.Iterable[
+            typing.Optional[LineStore]]) -> typing.List[typing.Tuple[
+                typing.Tuple[int, ...], typing.Optional[LineStore]]]:
+        """Remove lines from outline along with all descendants and
+        return path and parent of each line at top of a removed section.
+
+        Method skips a line that is None or not valid and a line within
+        the section of another given line.  Each path is the position
+        of a line before removal.  Method returns paths last line first,
+        so each path is the position of its line once the lines after it
+        are gone.  Method finds the positions of lines with one pass over
+        the children of each affected parent.
+
+        :param p_lines: lines to remove.
+        """
+        lines = {line for line in p_lines if self.is_valid(line)}
+        parent = self._parent
+        children_parent: typing.Dict[LineStore, typing.List[LineStore]] = (
+            dict())
+        for line in lines:
+            ancestor = parent[line]
+            while ancestor and ancestor not in lines:
+                ancestor = parent[ancestor]
+            if not ancestor:
+                children_parent.setdefault(parent[line], list()).append(line)
+        removals = list()
+        next_ = self._next
+        for line_parent, children in children_parent.items():
+            path_parent = self.path(line_parent)
+            children_left = set(children)
+            index = 0
+            child = self._first[line_parent]
+            while children_left:
+                if child in children_left:
+                    children_left.remove(child)
+                    removals.append(
+                        (path_parent + (index,), line_parent, child))
+                index += 1
+                child = next_[child]
+        removals.sort(reverse=True)
+        for _path, _parent, line in removals:
+            self._unlink(line)
+        return [(path, line_parent or None)
+                for path, line_parent, _line in removals]
+
+    def set_item(self, p_line: LineStore,
+                 p_item: typing.Optional[ItemOpaque]) -> None:
+        """Replace item at given line.
+
+        :param p_line: line to change.
+        :param p_item: new item for line.
+        """
+        self._items[p_line] = p_item
+
+    def _unlink(self, p_line: LineStore) -> None:
+        """Remove line from outline along with all descendants.
+
+        :param p_line: line to remove.
+        """
+        lines = list(self.lines_section(p_line))
+        parent = self._parent[p_line]
+        prev = self._prev[p_line]
+        next_ = self._next[p_line]
+        if prev:
+            self._next[prev] = next_
+        else:
+            self._first[parent] = next_
+        if next_:
+            self._prev[next_] = prev
+        else:
+            self._last[parent] = prev
+        for line in lines:
+            self._items[line] = None
+            self._parent[line] = _FREE
+        self._n_lines -= len(lines)
+
+    def walk(self, p_line: typing.Optional[LineStore] = None
+             ) -> typing.Iterator[typing.Tuple[
+                 int, LineStore, typing.Optional[ItemOpaque]]]:
+        """Return iterator over depth, line, and item for each line in
+        section at given line.
+
+        Iteration is depth first in one pass.  Depth is relative to top
+        level of outline regardless of section.  Iteration is not
+        recursive, so outline depth is unlimited.
+
+        :param p_line: parent line of section.  Default iterates over
+            entire outline.
+        """
+        first = self._first
+        next_ = self._next
+        parent = self._parent
+        items = self._items
+        top = p_line or NO_LINE
+        depth = self.depth(top)
+        if p_line:
+            yield depth, p_line, items[p_line]
+        depth += 1
+        line = first[top]
+        while line:
+            yield depth, line, items[line]
+            if first[line]:
+                line = first[line]
+                depth += 1
+                continue
+
+            while line != top and not next_[line]:
+                line = parent[line]
+                depth -= 1
+            if line == top:
+                return
+
+            line = next_[line]
@@ -4,6 +4,7 @@ models define the classes.
 
     * :mod:`.bridge_base`
     * :mod:`.bridge_outline`
+    * :mod:`.store_outline`
     * :mod:`.bridge_text`
 
 Outline Types and Classes
@@ -24,6 +25,11 @@ Outline Types and Classes
     Factory to create :data:`.ViewOutline` for an outline
     See :class:`.bridge_outline.FactoryViewOutline`.
 
+.. data:: g_hooks_removed_outline
+
+    Functions to call whenever lines are removed from a multi-level
+    outline.  See :data:`.bridge_outline.g_hooks_removed`.
+
 .. data:: LineOutline
 
     Storage for a line in an outline.
@@ -39,6 +45,16 @@ Outline Types and Classes
     Storage for single-line outline.
     See :class:`.bridge_outline.ModelOutlineSingle`.
 
+.. data:: StoreOutline
+
+    Storage for multi-level outline without widget toolkit.
+    See :class:`.store_outline.StoreOutline`.
+
+.. data:: UiModelOutlineMulti
+
+    Storage of multi-level outline as presented to visual elements.
+    See :class:`.bridge_outline.UiModelOutlineMulti`.
+
 .. data:: ViewOutline
 
     Visual element to view outline in columnar format.
@@ -112,6 +128,7 @@ Text with Styles Types and Classes
 import factsheet.bridge_gtk.bridge_base as BBASE
 import factsheet.bridge_gtk.bridge_outline as BOUTLINE
 import factsheet.bridge_gtk.bridge_text as BTEXT
+import factsheet.bridge_gtk.store_outline as BSTORE
 
 TimeEvent = BBASE.TimeEvent
 TIME_EVENT_CURRENT = BBASE.TIME_EVENT_CURRENT
@@ -119,10 +136,13 @@ TIME_EVENT_CURRENT = BBASE.TIME_EVENT_CURRENT
 ChooserOutline = BOUTLINE.ChooserOutline
 FactoryChooserOutline = BOUTLINE.FactoryChooserOutline
 FactoryViewOutline = BOUTLINE.FactoryViewOutline
+g_hooks_removed_outline = BOUTLINE.g_hooks_removed
 LineOutline = BOUTLINE.LineOutline
 ModelOutline = BOUTLINE.ModelOutline
 ModelOutlineMulti = BOUTLINE.ModelOutlineMulti
 ModelOutlineSingle = BOUTLINE.ModelOutlineSingle
+StoreOutline = BSTORE.StoreOutline
+UiModelOutlineMulti = BOUTLINE.UiModelOutlineMulti
 ViewOutline = BOUTLINE.ViewOutline
 
 ModelText = BTEXT.ModelText
@@ -7,6 +7,7 @@ import typing
 
 from factsheet.content import spec as XSPEC
 from factsheet.content.note import topic_note as XNOTE
+from factsheet.view import ui as VUI
 
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk   # type: ignore[import]    # noqa: E402
@@ -28,7 +29,7 @@ class SpecNote(XSPEC.Spec):
 
     def __call__(self) -> typing.Optional[XNOTE.Note]:
         """Return topic based on user's input or None when user cancels."""
-        builder = Gtk.Builder.new_from_file(self._path_assist)
+        builder = VUI.new_builder(self._path_assist)
         get_object = builder.get_object
 
         assistant = get_object('ui_assistant')
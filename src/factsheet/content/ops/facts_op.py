@@ -1,14 +1,26 @@
 """
 Defines fact classes for a generic operation.  See :mod:`.topic_op`.
 
+Each fact reads the operation table its topic caches (see
+:meth:`.Operation.table`).  A fact that requires a total operation is
+undefined when the operation is not closed on its set.
+
+.. data:: ElementOpaque
+
+    Generic type for element of set.  See :mod:`.setindexed`.
+
 .. data:: MemberOpaque
 
     Generic type for member component of set element.  See
     :mod:`.setindexed`.
 """
+import typing
+
 import factsheet.content.ops.topic_op as OP
 import factsheet.model.fact as MFACT
+import factsheet.model.setindexed as MSET
 
+from factsheet.model.setindexed import ElementOpaque
 from factsheet.model.setindexed import MemberOpaque
 
 
@@ -25,23 +37,215 @@ class Closed(MFACT.Fact[OP.Operation[MemberOpaque], bool]):
                    ''.format(NAME, self._topic.name))
         TITLE = '{} Is Closed'.format(self._topic.name)
         self.init_identity(p_name=NAME, p_summary=SUMMARY, p_title=TITLE)
-        self._op = self._topic.op
-        self._set_op = self._topic.set_op
-        # STUB: pending topic revision
-
-    def check(self) -> MFACT.StatusOfFact:
-        """Set fact value and set corresponding state of fact check."""
-        self._value = True
-        for a in self._set_op:
-            for b in self._set_op:
-                if self._op(a, b) is None:
-                    self._value = False
-                    break
-            if not self._value:
-                break
-
-        self._status = MFACT.StatusOfFact.DEFINED
-        return super().check()
+
+    def compute(self) -> typing.Tuple[
+            MFACT.StatusOfFact, typing.Optional[bool]]:
+        """Return status and value from check of fact.
+
+        The fact reads the topic's operation table.  See
+        :meth:`.Operation.table`.
+        """
+        table = self._topic.table()
+        return MFACT.StatusOfFact.DEFINED, table.is_closed()
+
+    def clear(self) -> None:
+        """Clear fact value and set state of fact check to unchecked."""
+        self._value = None
+        self._status = MFACT.StatusOfFact.UNCHECKED
+        super().clear()
+
+
+class Associative(MFACT.Fact[OP.Operation[MemberOpaque], bool]):
+    """Fact that an operation topic is associative.
+
+    :param p_topic: operation topic for fact.
+    """
+
+    def __init__(self, *, p_topic: OP.Operation[MemberOpaque]) -> None:
+        super().__init__(p_topic=p_topic)
+        NAME = 'Associative'
+        SUMMARY = ('{} is True when {} is associative.'
+                   ''.format(NAME, self._topic.name))
+        TITLE = '{} Is Associative'.format(self._topic.name)
+        self.init_identity(p_name=NAME, p_summary=SUMMARY, p_title=TITLE)
+
+    def compute(self) -> typing.Tuple[
+            MFACT.StatusOfFact, typing.Optional[bool]]:
+        """Return status and value from check of fact."""
+        table = self._topic.table()
+        if not table.is_closed():
+            return MFACT.StatusOfFact.UNDEFINED, None
+
+        return MFACT.StatusOfFact.DEFINED, table.is_associative()
+
+    def clear(self) -> None:
+        """Clear fact value and set state of fact check to unchecked."""
+        self._value = None
+        self._status = MFACT.StatusOfFact.UNCHECKED
+        super().clear()
+
+
+class Commutative(MFACT.Fact[OP.Operation[MemberOpaque], bool]):
+    """Fact that an operation topic is commutative.
+
+    A partial operation is commutative when, for each pair of elements,
+    either both orders are undefined or both give the same element.
+
+    :param p_topic: operation topic for fact.
+    """
+
+    def __init__(self, *, p_topic: OP.Operation[MemberOpaque]) -> None:
+        super().__init__(p_topic=p_topic)
+        NAME = 'Commutative'
+        SUMMARY = ('{} is True when {} is commutative.'
+                   ''.format(NAME, self._topic.name))
+        TITLE = '{} Is Commutative'.format(self._topic.name)
+        self.init_identity(p_name=NAME, p_summary=SUMMARY, p_title=TITLE)
+
+    def compute(self) -> typing.Tuple[
+            MFACT.StatusOfFact, typing.Optional[bool]]:
+        """Return status and value from check of fact."""
+        table = self._topic.table()
+        return MFACT.StatusOfFact.DEFINED, table.is_commutative()
+
+    def clear(self) -> None:
+        """Clear fact value and set state of fact check to unchecked."""
+        self._value = None
+        self._status = MFACT.StatusOfFact.UNCHECKED
+        super().clear()
+
+
+class IdentityElement(MFACT.Fact[OP.Operation[MemberOpaque],
+                                 ElementOpaque[MemberOpaque]]):
+    """Fact that provides two-sided identity element of an operation
+    topic.
+
+    The fact is undefined when the operation has no identity.
+
+    :param p_topic: operation topic for fact.
+    """
+
+    def __init__(self, *, p_topic: OP.Operation[MemberOpaque]) -> None:
+        super().__init__(p_topic=p_topic)
+        NAME = 'Identity'
+        SUMMARY = ('{} provides the identity element of {}.'
+                   ''.format(NAME, self._topic.name))
+        TITLE = '{} Identity Element'.format(self._topic.name)
+        self.init_identity(p_name=NAME, p_summary=SUMMARY, p_title=TITLE)
+
+    def compute(self) -> typing.Tuple[
+            MFACT.StatusOfFact, typing.Optional[ElementOpaque[MemberOpaque]]]:
+        """Return status and value from check of fact."""
+        table = self._topic.table()
+        identity = table.identity()
+        if identity is None:
+            return MFACT.StatusOfFact.UNDEFINED, None
+
+        elements = self._topic.set_op.elements
+        element = elements.find_element(p_index=table.index_of(identity))
+        return MFACT.StatusOfFact.DEFINED, element
+
+    def clear(self) -> None:
+        """Clear fact value and set state of fact check to unchecked."""
+        self._value = None
+        self._status = MFACT.StatusOfFact.UNCHECKED
+        super().clear()
+
+
+class Idempotents(MFACT.Fact[OP.Operation[MemberOpaque],
+                             MSET.SetIndexed[MemberOpaque]]):
+    """Fact that provides elements `a` of an operation topic where `a`
+    op `a` is `a`.
+
+    :param p_topic: operation topic for fact.
+    """
+
+    def __init__(self, *, p_topic: OP.Operation[MemberOpaque]) -> None:
+        super().__init__(p_topic=p_topic)
+        NAME = 'Idempotents'
+        SUMMARY = ('{} provides the idempotent elements of {}.'
+                   ''.format(NAME, self._topic.name))
+        TITLE = '{} Idempotent Elements'.format(self._topic.name)
+        self.init_identity(p_name=NAME, p_summary=SUMMARY, p_title=TITLE)
+
+    def compute(self) -> typing.Tuple[MFACT.StatusOfFact, typing.Optional[
+            MSET.SetIndexed[MemberOpaque]]]:
+        """Return status and value from check of fact."""
+        table = self._topic.table()
+        elements = self._topic.set_op.elements
+        idempotents = (elements.find_element(p_index=table.index_of(i))
+                       for i in table.idempotents())
+        value = MSET.SetIndexed.new_from_elements(idempotents)
+        return MFACT.StatusOfFact.DEFINED, value
+
+    def clear(self) -> None:
+        """Clear fact value and set state of fact check to unchecked."""
+        self._value = None
+        self._status = MFACT.StatusOfFact.UNCHECKED
+        super().clear()
+
+
+class Inverses(MFACT.Fact[OP.Operation[MemberOpaque], bool]):
+    """Fact that each element of an operation topic has a two-sided
+    inverse.
+
+    The fact is undefined when the operation is not closed or has no
+    identity.
+
+    :param p_topic: operation topic for fact.
+    """
+
+    def __init__(self, *, p_topic: OP.Operation[MemberOpaque]) -> None:
+        super().__init__(p_topic=p_topic)
+        NAME = 'Inverses'
+        SUMMARY = ('{} is True when each element of {} has an inverse.'
+                   ''.format(NAME, self._topic.name))
+        TITLE = '{} Has Inverses'.format(self._topic.name)
+        self.init_identity(p_name=NAME, p_summary=SUMMARY, p_title=TITLE)
+
+    def compute(self) -> typing.Tuple[
+            MFACT.StatusOfFact, typing.Optional[bool]]:
+        """Return status and value from check of fact."""
+        table = self._topic.table()
+        identity: typing.Optional[int] = None
+        if table.is_closed():
+            identity = table.identity()
+        if identity is None:
+            return MFACT.StatusOfFact.UNDEFINED, None
+
+        return MFACT.StatusOfFact.DEFINED, table.has_inverses(identity)
+
+    def clear(self) -> None:
+        """Clear fact value and set state of fact check to unchecked."""
+        self._value = None
+        self._status = MFACT.StatusOfFact.UNCHECKED
+        super().clear()
+
+
+class LatinSquare(MFACT.Fact[OP.Operation[MemberOpaque], bool]):
+    """Fact that the operation table of an operation topic is a Latin
+    square.
+
+    Each row and each column of a Latin square contains each element
+    exactly once.  The table of a partial operation is not a Latin
+    square.
+
+    :param p_topic: operation topic for fact.
+    """
+
+    def __init__(self, *, p_topic: OP.Operation[MemberOpaque]) -> None:
+        super().__init__(p_topic=p_topic)
+        NAME = 'Latin Square'
+        SUMMARY = ('{} is True when the table of {} is a Latin square.'
+                   ''.format(NAME, self._topic.name))
+        TITLE = '{} Is Latin Square'.format(self._topic.name)
+        self.init_identity(p_name=NAME, p_summary=SUMMARY, p_title=TITLE)
+
+    def compute(self) -> typing.Tuple[
+            MFACT.StatusOfFact, typing.Optional[bool]]:
+        """Return status and value from check of fact."""
+        table = self._topic.table()
+        return MFACT.StatusOfFact.DEFINED, table.is_latin_square()
 
     def clear(self) -> None:
         """Clear fact value and set state of fact check to unchecked."""
@@ -10,6 +10,7 @@ import factsheet.content.spec as XSPEC
 import factsheet.content.ops.int.topic_plusmodn as XPLUS_N
 import factsheet.content.sets.int.topic_setint as XSETINT
 import factsheet.view.types_view as VTYPES
+import factsheet.view.ui as VUI
 
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk   # type: ignore[import]    # noqa: E402
@@ -60,7 +61,7 @@ class SpecPlusModN(XSPEC.Spec):
 
     def __call__(self) -> typing.Optional[XPLUS_N.PlusModN]:
         """Return topic based on user's input or None when user cancels."""
-        builder = Gtk.Builder.new_from_file(self._path_assist)
+        builder = VUI.new_builder(self._path_assist)
         get_ui = builder.get_object
 
         assistant = get_ui('ui_assistant')
@@ -4,8 +4,12 @@ Defines class for modular addition operation topics.  See
 """
 import typing
 
+import numpy as NP   # type: ignore[import]
+
 import factsheet.content.ops.int.topic_opint as XOPINT
+import factsheet.content.ops.table_op as XTABLE
 import factsheet.content.sets.int.topic_setint as XSETINT
+import factsheet.model.topic as MTOPIC
 
 from factsheet.content.sets.int.topic_setint import ElementInt
 
@@ -56,8 +60,20 @@ class PlusModN(XOPINT.OperationInt):
             self._modulus = MODULUS_MIN
         self._reps = self._reduce_reps(p_set)
 
-    def _op(self, left: ElementInt, right: ElementInt
-            ) -> typing.Optional[ElementInt]:
+    def fingerprint(self) -> typing.Optional[MTOPIC.FingerprintTopic]:
+        """Return summary of modular addition topic content.
+
+        The content of a modular addition topic is its modulus and the
+        content of its set.  Return None when set has no fingerprint.
+        """
+        fingerprint_set = self._set_op.fingerprint()
+        if fingerprint_set is None:
+            return None
+
+        return (type(self).__name__, self._modulus, fingerprint_set)
+
+    def op(self, left: ElementInt, right: ElementInt
+           ) -> typing.Optional[ElementInt]:
         """Return image of element pair under operation or None.
 
         Return None when operation is partial and sum of pair is not
@@ -95,3 +111,30 @@ class PlusModN(XOPINT.OperationInt):
             key = element.member % self._modulus
             reps[key] = element
         return reps
+
+    def _new_table(self) -> XTABLE.TableOp:
+        """Return new operation table for modular addition on topic set.
+
+        The method computes residues of all sums in one vectorized pass
+        and maps each residue to the position of its congruence class
+        representative (see :meth:`_reduce_reps`).  The method falls
+        back to pair-by-pair construction when members or modulus
+        exceed 64-bit arithmetic.
+        """
+        BOUND_MODULUS = 1 << 62
+        if BOUND_MODULUS <= self._modulus:
+            return super()._new_table()
+
+        elements = self._set_op.elements
+        indices = [e.index for e in elements]
+        try:
+            members = NP.fromiter((e.member for e in elements),
+                                  dtype=NP.int64, count=len(indices))
+        except OverflowError:
+            return super()._new_table()
+
+        keys = members % self._modulus
+        image_keys = keys[:, NP.newaxis] + keys[NP.newaxis, :]
+        NP.remainder(image_keys, self._modulus, out=image_keys)
+        return XTABLE.TableOp.new_from_reps(
+            indices, keys, image_keys, p_bound_keys=self._modulus)
@@ -0,0 +1,237 @@
+"""
+Defines class for operation tables (Cayley tables).  See
+:mod:`.topic_op`.
+
+An operation table records the result of a binary operation for every
+pair of elements of the operation's set.  Facts about an operation
+read the table rather than apply the operation pair by pair.
+
+.. data:: BOUND_LOOKUP
+
+    Largest key bound for which tables map keys through a lookup array.
+
+.. data:: SIZE_BLOCK
+
+    Approximate number of entries in each block of the associativity
+    check.
+
+.. data:: UNDEFINED
+
+    Table entry for a pair of elements where a partial operation is not
+    defined or where the result is not in the operation's set.
+"""
+import typing
+
+import numpy as NP   # type: ignore[import]
+
+import factsheet.model.setindexed as MSET
+
+from factsheet.model.element import ElementOpaque
+from factsheet.model.element import IndexElement
+from factsheet.model.element import MemberOpaque
+
+UNDEFINED = -1
+
+BOUND_LOOKUP = 1 << 24
+
+SIZE_BLOCK = 1 << 22
+
+
+class TableOp:
+    """Operation table for a binary operation on an indexed set.
+
+    The table orders elements by position, which is the order in which
+    the indexed set iterates.  Table entry `results[i, j]` is the
+    position of the result of the operation on the elements at
+    positions `i` and `j`, or :data:`UNDEFINED`.
+
+    :param p_indices: indices of set elements in position order.
+    :param p_results: square array of result positions.
+    """
+
+    def __init__(self, p_indices: typing.Sequence[IndexElement],
+                 p_results: NP.ndarray) -> None:
+        self._indices = p_indices
+        self._results = p_results
+
+    @staticmethod
+    def dtype(p_size: int) -> NP.dtype:
+        """Return smallest integer type that holds table positions.
+
+        :param p_size: number of elements in table.
+        """
+        if p_size < NP.iinfo(NP.int32).max:
+            return NP.dtype(NP.int32)
+        return NP.dtype(NP.int64)
+
+    def has_inverses(self, p_identity: int) -> bool:
+        """Return True when every element has a two-sided inverse with
+        respect to given identity, or False otherwise.
+
+        :param p_identity: position of identity element.
+        """
+        is_identity = self._results == p_identity
+        is_inverse = NP.logical_and(is_identity, is_identity.T)
+        return bool(NP.all(NP.any(is_inverse, axis=1)))
+
+    def identity(self) -> typing.Optional[int]:
+        """Return position of two-sided identity element or None when
+        operation has no identity.
+        """
+        positions = NP.arange(self.size)
+        is_left = NP.all(self._results == positions[:, NP.newaxis], axis=0)
+        is_right = NP.all(self._results == positions[NP.newaxis, :], axis=1)
+        candidates = NP.flatnonzero(NP.logical_and(is_left, is_right))
+        if not len(candidates):
+            return None
+
+        return int(candidates[0])
+
+    def idempotents(self) -> typing.List[int]:
+        """Return positions of elements `a` where `a` op `a` is `a`."""
+        positions = NP.arange(self.size)
+        is_idempotent = NP.diagonal(self._results) == positions
+        return NP.flatnonzero(is_idempotent).tolist()
+
+    def index_of(self, p_position: int) -> IndexElement:
+        """Return index of set element at given position.
+
+        :param p_position: position of element in table.
+        """
+        return self._indices[p_position]
+
+    @property
+    def indices(self) -> typing.Sequence[IndexElement]:
+        """Return indices of set elements in position order."""
+        return self._indices
+
+    def is_closed(self) -> bool:
+        """Return True when operation is defined and within set for
+        every pair of elements, or False otherwise.
+        """
+        return not NP.any(self._results == UNDEFINED)
+
+    def is_associative(self) -> bool:
+        """Return True when operation is associative, or False otherwise.
+
+        The method compares (`a` op `b`) op `c` with `a` op (`b` op `c`)
+        for all triples.  It works through blocks of rows `a` so that
+        each comparison holds about :data:`SIZE_BLOCK` entries.
+
+        .. note:: Table must be closed (see :meth:`is_closed`).
+        """
+        size = self.size
+        if not size:
+            return True
+
+        n_rows = max(1, SIZE_BLOCK // (size * size))
+        for start in range(0, size, n_rows):
+            block = self._results[start:start + n_rows]
+            left = self._results[block]
+            right = NP.take(block, self._results, axis=1)
+            if not NP.array_equal(left, right):
+                return False
+
+        return True
+
+    def is_commutative(self) -> bool:
+        """Return True when operation is commutative, or False otherwise.
+
+        A partial operation is commutative when `a` op `b` and `b` op
+        `a` are both undefined or are equal.
+        """
+        return NP.array_equal(self._results, self._results.T)
+
+    def is_latin_square(self) -> bool:
+        """Return True when each row and each column of table contains
+        each element exactly once, or False otherwise.
+        """
+        positions = NP.arange(self.size)
+        rows = NP.sort(self._results, axis=1)
+        if not NP.all(rows == positions[NP.newaxis, :]):
+            return False
+
+        columns = NP.sort(self._results, axis=0)
+        return bool(NP.all(columns == positions[:, NP.newaxis]))
+
+    @classmethod
+    def new_from_op(cls, p_set: MSET.SetIndexed[MemberOpaque],
+                    p_op: typing.Callable[
+                        [ElementOpaque[MemberOpaque],
+                         ElementOpaque[MemberOpaque]],
+                        typing.Optional[ElementOpaque[MemberOpaque]]]
+                    ) -> 'TableOp':
+        """Return table for operation applied to each pair of elements.
+
+        Method ``new_from_op`` applies the operation pair by pair.  Use
+        it for operations that have no vectorized table method.
+
+        :param p_set: set on which operation acts.
+        :param p_op: operation that returns element or None when pair
+            is not defined.
+        """
+        elements = list(p_set)
+        indices = [e.index for e in elements]
+        positions = {index: i for i, index in enumerate(indices)}
+        size = len(elements)
+        results = NP.full((size, size), UNDEFINED, dtype=cls.dtype(size))
+        for i, left in enumerate(elements):
+            row = results[i]
+            for j, right in enumerate(elements):
+                image = p_op(left, right)
+                if image is None or image not in p_set:
+                    continue
+                row[j] = positions[image.index]
+        return TableOp(indices, results)
+
+    @classmethod
+    def new_from_reps(cls, p_indices: typing.Sequence[IndexElement],
+                      p_keys: NP.ndarray, p_image_keys: NP.ndarray,
+                      p_bound_keys: typing.Optional[int] = None
+                      ) -> 'TableOp':
+        """Return table from keys of images under operation.
+
+        Several elements may share a key (for example, members in the
+        same congruence class).  The image of a pair is the last
+        element in position order with the image key.  A pair has no
+        image when no element has the image key.
+
+        When keys lie in [0, `p_bound_keys`) and the bound is moderate,
+        the method maps image keys through a lookup array indexed by
+        key.  Otherwise, the method searches a sorted array of keys.
+
+        :param p_indices: indices of set elements in position order.
+        :param p_keys: key of each element in position order.
+        :param p_image_keys: square array of image key for each pair.
+        :param p_bound_keys: upper bound of keys, if known.
+        """
+        size = len(p_indices)
+        dtype = cls.dtype(size)
+        keys_reversed = p_keys[::-1]
+        keys_reps, first_reversed = NP.unique(
+            keys_reversed, return_index=True)
+        positions_reps = (size - 1 - first_reversed).astype(dtype)
+        if not len(keys_reps):
+            results = NP.full(p_image_keys.shape, UNDEFINED, dtype=dtype)
+            return TableOp(p_indices, results)
+
+        if p_bound_keys is not None and p_bound_keys <= BOUND_LOOKUP:
+            lookup = NP.full(p_bound_keys, UNDEFINED, dtype=dtype)
+            lookup[keys_reps] = positions_reps
+            return TableOp(p_indices, lookup[p_image_keys])
+
+        slots = NP.searchsorted(keys_reps, p_image_keys)
+        NP.minimum(slots, len(keys_reps) - 1, out=slots)
+        found = keys_reps[slots] == p_image_keys
+        results = NP.where(found, positions_reps[slots], UNDEFINED)
+        return TableOp(p_indices, results.astype(dtype, copy=False))
+
+    @property
+    def results(self) -> NP.ndarray:
+        """Return square array of result positions."""
+        return self._results
+
+    @property
+    def size(self) -> int:
+        """Return number of elements in table."""
+        return len(self._indices)
@@ -2,9 +2,12 @@
 Defines ancestor class for binary operation topics.
 See :mod:`.topic`.
 """
+import threading
 import typing
 
+import factsheet.content.ops.table_op as XTABLE
 import factsheet.content.sets.topic_set as XSET
+import factsheet.model.setindexed as MSET
 import factsheet.model.topic as MTOPIC
 
 
@@ -22,6 +25,15 @@ class Operation(MTOPIC.Topic, typing.Generic[MemberOpaque]):
 
     :param p_set: underlying set topic on which operation acts.
     :param kwargs: keyword arguments for superclass.
+
+    .. admonition:: About Operation Tables
+
+        An operation topic caches its operation table (see
+        :meth:`table`), so facts about the topic share one table.  The
+        topic rebuilds the table when the underlying set changes.
+        Checks of facts run on worker threads (see
+        :mod:`.scheduler_check`), so a lock guards the cache and at most
+        one thread builds the table.
     """
 
     def __eq__(self, p_other: typing.Any) -> bool:
@@ -38,21 +50,74 @@ class Operation(MTOPIC.Topic, typing.Generic[MemberOpaque]):
 
         return True
 
+    def __getstate__(self) -> typing.Dict:
+        """Return operation topic in form pickle can persist.
+
+        Persistent form of operation topic excludes cached table and
+        its lock.
+        """
+        state = super().__getstate__()
+        state['_table'] = None
+        state['_table_source'] = None
+        _ = state.pop('_lock_table', None)
+        return state
+
     def __init__(self, *, p_set: XSET.Set[MemberOpaque], **kwargs) -> None:
         super().__init__(**kwargs)
         self._set_op = p_set
+        self._lock_table = threading.Lock()
+        self._table: typing.Optional[XTABLE.TableOp] = None
+        self._table_source: typing.Optional[
+            MSET.SetIndexed[MemberOpaque]] = None
+
+    def __setstate__(self, p_state: typing.Dict) -> None:
+        """Reconstruct operation topic from state pickle loads.
+
+        :param p_state: unpickled state of stored operation topic.
+        """
+        super().__setstate__(p_state)
+        self._lock_table = threading.Lock()
+
+    def _new_table(self) -> XTABLE.TableOp:
+        """Return new operation table for operation on topic set.
+
+        Subclasses may override this method with a vectorized
+        construction.  The default applies the operation to each pair
+        of elements.
+        """
+        return XTABLE.TableOp.new_from_op(self._set_op.elements, self.op)
+
+    def invalidate_table(self) -> None:
+        """Discard cached operation table."""
+        with self._lock_table:
+            self._table = None
+            self._table_source = None
 
     def op(self, _left: Element, _right: Element) -> typing.Optional[Element]:
         """Return image of element pair under operation.
 
         Return None when operation is partial and element pair is not
-        defined.
+        defined.  Facts about the operation use the operation table
+        (see :meth:`table`) rather than call this method directly.
 
         :param left: lefthand operand.
         :param right: righthand operand.
         """
         return None
 
+    def table(self) -> XTABLE.TableOp:
+        """Return operation table for operation on topic set.
+
+        The method returns the cached table when the topic set is
+        unchanged since the table was built.
+        """
+        elements = self._set_op.elements
+        with self._lock_table:
+            if self._table is None or self._table_source is not elements:
+                self._table = self._new_table()
+                self._table_source = elements
+            return self._table
+
     @property
     def set_op(self) -> XSET.Set[MemberOpaque]:
         """Return topic set."""
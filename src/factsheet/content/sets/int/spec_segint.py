@@ -8,6 +8,7 @@ import typing
 
 import factsheet.content.spec as XSPEC
 import factsheet.content.sets.int.topic_segint as XSEGINT
+import factsheet.view.ui as VUI
 
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk   # type: ignore[import]    # noqa: E402
@@ -36,7 +37,7 @@ class SpecSegInt(XSPEC.Spec):
 
     def __call__(self) -> typing.Optional[XSEGINT.SegInt]:
         """Return topic based on user's input or None when user cancels."""
-        builder = Gtk.Builder.new_from_file(self._path_assist)
+        builder = VUI.new_builder(self._path_assist)
         get_object = builder.get_object
 
         ui_topic = UiArgs(
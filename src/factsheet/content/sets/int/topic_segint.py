@@ -3,13 +3,16 @@ Defines class for initial segment of natural numbers topics.  See
 :mod:`.topic_setint`.
 """
 import factsheet.content.sets.int.topic_setint as XSETINT
+import factsheet.model.setindexed as MSET
 
 
 class SegInt(XSETINT.SetInt):
     """Defines topic for initial segment of integers.
 
     Class ``SegInt`` represents sets of nautral numbers of the form
-    [0, `k`) for `k` a positive integer.
+    [0, `k`) for `k` a positive integer.  The topic's indexed set is
+    range-backed (see :class:`.SetIndexedRange`), so the set takes
+    constant memory regardless of bound.
 
     :param p_bound: upper bound for segment. Default is 1.
     :param kwargs: keyword arguments for superclass.
@@ -29,5 +32,5 @@ class SegInt(XSETINT.SetInt):
         if bound < BOUND_MIN:
             bound = BOUND_MIN
 
-        members = range(bound)
+        members = MSET.SetIndexedRange(bound)
         super().__init__(p_members=members, **kwargs)
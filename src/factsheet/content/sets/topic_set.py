@@ -16,7 +16,8 @@ class Set(MTOPIC.Topic, typing.Generic[MemberOpaque]):
     represent sets.  The class augments class :class:`~.Topic` with
     class :class:`~.SetIndexed`.
 
-    :param p_members: members for topic's set.
+    :param p_members: members for topic's set.  When members are an
+        indexed set already, the topic uses that set as is.
     :param kwargs: keyword arguments for superclass.
 
     .. admonition:: About Equality
@@ -54,8 +55,12 @@ class Set(MTOPIC.Topic, typing.Generic[MemberOpaque]):
             self, *,
             p_members: typing.Optional[typing.Iterable[MemberOpaque]] = None,
             **kwargs: typing.Any) -> None:
-        members = p_members if p_members is not None else list()
-        self._elements = MSET.SetIndexed[MemberOpaque](p_members=members)
+        if isinstance(p_members, MSET.SetIndexed):
+            self._elements = p_members
+        else:
+            members = p_members if p_members is not None else list()
+            self._elements = MSET.SetIndexed[MemberOpaque](
+                p_members=members)
         super().__init__(**kwargs)
 
     def __iter__(self) -> typing.Iterator[
@@ -63,6 +68,13 @@ class Set(MTOPIC.Topic, typing.Generic[MemberOpaque]):
         """Return iterator over indexed elements in set topic."""
         return iter(self._elements)
 
+    def fingerprint(self) -> typing.Optional[MTOPIC.FingerprintTopic]:
+        """Return summary of set topic content.
+
+        The content of a set topic is its indexed set of elements.
+        """
+        return self._elements.fingerprint()
+
     @property
     def elements(self) -> MSET.SetIndexed:
         """Return elements of set."""
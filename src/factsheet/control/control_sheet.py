@@ -176,15 +176,24 @@ Classes
 -------
 """
 import abc
+import concurrent.futures as CF
 import logging
+import os
 from pathlib import Path
 import pickle
+import shutil
+import tempfile
 import traceback as TB
 import typing
 
 
 import factsheet.bridge_ui as BUI
 import factsheet.control.control_topic as CTOPIC
+import factsheet.control.format_sheet as CFORMAT
+import factsheet.control.journal_sheet as CJOURNAL
+import factsheet.control.scheduler_save as CSAVE
+import factsheet.control.search_sheets as CSEARCH
+import factsheet.instrument as INSTR
 import factsheet.model.sheet as MSHEET
 import factsheet.model.topic as MTOPIC
 
@@ -240,13 +249,15 @@ class ControlApp:
     """Maintains collection of open factsheets.
 
     A user may open a factsheet by requesting a new, empty factsheet or
-    opening a factsheet file.
+    opening a factsheet file.  A user may search topics of all open
+    factsheets (see :mod:`.search_sheets`).
     """
 
     def __init__(self) -> None:
         """Initialize empty roster for factsheets."""
         self._roster_sheets: typing.MutableMapping[
             MSHEET.TagSheet, 'ControlSheet'] = dict()
+        self._engine_search = CSEARCH.EngineSearch()
 
     def close_all_factsheets(self) -> None:
         """TBD"""
@@ -281,8 +292,9 @@ class ControlApp:
                     if path_absolute == control._path.resolve():
                         control.present_views(p_time)
                         return None
-        control = ControlSheet(p_path)
+        control = ControlSheet(p_path, p_autosave=True)
         self._roster_sheets[control.tag] = control
+        self._engine_search.add_sheet(control._model)
         return control
 
     def remove_factsheet(self, p_control: 'ControlSheet') -> None:
@@ -298,6 +310,22 @@ class ControlApp:
             logger.warning('Missing control: 0x{:X} ({}.{})'.format(
                 p_control.tag, self.__class__.__name__,
                 self.remove_factsheet.__name__))
+            return
+
+        self._engine_search.remove_sheet(p_control._model)
+
+    def search(self, p_query: str, p_n_max: int = 50
+               ) -> typing.List[CSEARCH.HitSearch]:
+        """Return topics of open factsheets that best match query.
+
+        Each result contains the tag of a factsheet in the roster, the
+        tag of a topic in that factsheet, and a score.  The tags locate
+        the factsheet control and topic control for navigation.
+
+        :param p_query: words to find (see :mod:`.search_sheets`).
+        :param p_n_max: maximum number of results.
+        """
+        return self._engine_search.search(p_query, p_n_max)
 
 
 g_control_app = ControlApp()
@@ -312,12 +340,20 @@ class ControlSheet:
     in the collection of factsheet views (such as add or remove a view).
     """
 
-    def __init__(self, p_path: Path = None) -> None:
+    def __init__(self, p_path: Path = None, p_autosave: bool = False
+                 ) -> None:
         """Initialize instance from given file or with default attributes.
 
         :param p_path: location of file for factsheet model.
+        :param p_autosave: when True, journal edits between saves once
+            the factsheet has a file (see :mod:`.journal_sheet`).
         """
         self._path = p_path
+        self._autosave = p_autosave
+        self._future_save: typing.Optional[CF.Future] = None
+        self._journal: typing.Optional[CJOURNAL.JournalSheet] = None
+        self._size_journal: typing.Optional[int] = None
+        self._writer = CFORMAT.WriterSheet()
         self._model = self._model_from_path(p_path)
 
         self._factory_display_name = FactoryDisplayName(self._model.name)
@@ -340,6 +376,8 @@ class ControlSheet:
         for topic in self._model.topics():
             control_new = CTOPIC.ControlTopic(p_model=topic)
             self._insert_topic_control(p_control=control_new)
+        if self._autosave:
+            self._start_journal()
 
     def add_view(self, p_view: 'ObserverControlSheet') -> None:
         """Add given view to collection of active views.
@@ -451,6 +489,7 @@ class ControlSheet:
         model = MSHEET.Sheet(p_name=name, p_summary=summary, p_title=title)
         return model
 
+    @INSTR.timed('ControlSheet._model_from_path')
     def _model_from_path(self, p_path: typing.Optional[Path]) -> MSHEET.Sheet:
         """Return sheet model from file at given location or a new model.
 
@@ -459,6 +498,17 @@ class ControlSheet:
         at given path, return a sheet model containing error
         information.
 
+        A file in factsheet format loads record by record (see
+        :mod:`.format_sheet`).  Method loads only the topics outline and
+        topic identities.  Each topic body loads when first accessed
+        (for example, when a sheet view shows the topic).  Method
+        imports a file from an earlier release, which contains a pickle
+        of the entire model.
+
+        When a journal for the file exists (for example, after a crash),
+        method replays edits from the journal.  The factsheet is then
+        stale.
+
         :param p_path: location of file for factsheet model.
         """
         if p_path is None:
@@ -466,16 +516,25 @@ class ControlSheet:
             return model
 
         try:
-            with p_path.open(mode='rb') as io_in:
-                try:
-                    model = pickle.load(io_in)
-                except Exception as err:
-                    message = 'Factsheet not open! could not read file.'
-                    model = self._model_from_error(err, message)
+            io_in = p_path.open(mode='rb')
         except FileNotFoundError:
-            model = MSHEET.Sheet()
+            return MSHEET.Sheet()
         except Exception as err:
             message = 'Factsheet not open! could not open file.'
+            return self._model_from_error(err, message)
+
+        try:
+            if CFORMAT.is_format(io_in):
+                reader = CFORMAT.ReaderSheet(io_in, p_close=True)
+                model = reader.load_sheet(p_lazy=True)
+                self._writer = CFORMAT.WriterSheet(p_reader=reader)
+                self._replay_journal(p_path, reader, model)
+            else:
+                with io_in:
+                    model = pickle.load(io_in)
+        except Exception as err:
+            io_in.close()
+            message = 'Factsheet not open! could not read file.'
             model = self._model_from_error(err, message)
         return model
 
@@ -520,30 +579,24 @@ class ControlSheet:
         """Return factory for editors of sheet title."""
         return self._factory_view_topics
 
-    def _open_file_save(self) -> typing.BinaryIO:
-        """Return an open file object after backing up any existing file.
+    def _open_file_save(self) -> typing.Tuple[typing.BinaryIO, Path]:
+        """Return an open temporary file and its path.
 
-        Backup provides (minimal) guard against inadvertent overwrite.
+        The temporary file is in the same directory as the factsheet
+        file so that a save may replace the factsheet file with the
+        temporary file in one step (see :meth:`_commit_file_save`).
 
         :raises FactsheetError: see :meth:`~.ControlSheet.save`.
-        :returns: Open file object at control's path.
         """
         if self._path is None:
             raise NoFileError('Save: cannot open path None.')
         try:
-            io_out = self._path.open(mode='xb')
-        except FileExistsError:
-            try:
-                self._path.replace(str(self._path) + '~')
-            except Exception as err_replace:
-                raise BackupFileError from err_replace
-            try:
-                io_out = self._path.open(mode='xb')
-            except Exception as err_reopen:
-                raise OpenFileError from err_reopen
+            fd, name_temp = tempfile.mkstemp(
+                prefix='.{}.'.format(self._path.name), suffix='.tmp',
+                dir=self._path.parent)
         except Exception as err_open:
             raise OpenFileError from err_open
-        return io_out
+        return os.fdopen(fd, mode='wb'), Path(name_temp)
 
     @property
     def path(self) -> typing.Optional[Path]:
@@ -572,10 +625,27 @@ class ControlSheet:
         :param p_line: line of topic to remove along with all its
             descendants.  If line is None, remove no topics.
         """
-        if p_line is not None:
-            for topic in self._model.topics(p_line):
-                _ = self._roster_topics.pop(topic.tag)
-            self._model.remove_topic(p_line)
+        self.remove_topics([p_line])
+
+    def remove_topics(self, p_lines: typing.Iterable[BUI.LineOutline]
+                      ) -> None:
+        """Remove topics from roster of topics and from topics outline.
+
+        Method removes all given topics from the outline in one bulk
+        removal (see :meth:`.Sheet.remove_topics`).
+
+        :param p_lines: lines of topics to remove along with all their
+            descendants.  Method skips a line that is None or invalid.
+        """
+        outline = self._model.outline_topics
+        lines = [line for line in p_lines if outline.is_valid(line)]
+        if not lines:
+            return
+
+        for line in lines:
+            for topic in self._model.topics(line):
+                _ = self._roster_topics.pop(topic.tag, None)
+        self._model.remove_topics(lines)
 
     def remove_view(self, p_view: 'ObserverControlSheet') -> None:
         """Remove given view from collection of active views.
@@ -598,6 +668,7 @@ class ControlSheet:
             return
 
         if not self._roster_views:
+            self._stop_journal()
             global g_control_app
             g_control_app.remove_factsheet(p_control=self)
 
@@ -617,24 +688,209 @@ class ControlSheet:
 
         return True
 
-    def save(self, p_path: typing.Optional[Path] = None) -> None:
+    def _replay_journal(self, p_path: Path, p_reader: CFORMAT.ReaderSheet,
+                        p_model: MSHEET.Sheet) -> None:
+        """Apply journal for factsheet file, if any, to model.
+
+        Log an error when replay fails and keep the journal for
+        recovery by hand (path with '~' appended).
+
+        :param p_path: location of factsheet file.
+        :param p_reader: reader of factsheet file.
+        :param p_model: factsheet from reader.
+        """
+        path_journal = CJOURNAL.path_journal(p_path)
+        try:
+            io_journal = path_journal.open(mode='rb')
+        except FileNotFoundError:
+            return
+
+        try:
+            with io_journal:
+                self._size_journal = CJOURNAL.replay(
+                    io_journal, p_reader, p_model, self._writer)
+        except Exception as err:
+            logger.error('Journal not replayed: {} ({}.{})'.format(
+                err, self.__class__.__name__, self._replay_journal.__name__))
+            self._size_journal = None
+            _ = path_journal.replace(
+                path_journal.with_name(path_journal.name + '~'))
+
+    def _reset_journal(self) -> None:
+        """Start journal or empty journal after save."""
+        if not self._autosave:
+            return
+
+        if self._journal is None:
+            self._start_journal()
+        else:
+            self._journal.reset()
+
+    @INSTR.timed('ControlSheet.save')
+    def save(self, p_path: typing.Optional[Path] = None,
+             p_backup: bool = True) -> None:
         """Save factsheet contents to file at factsheet's path.
 
+        Method writes factsheet format (see :mod:`.format_sheet`).  When
+        the factsheet file is current, method appends only changes since
+        the previous save.  Otherwise, or when the file needs
+        compaction, method writes the factsheet in full to a temporary
+        file and then replaces the factsheet file.  In either case, a
+        crash during save leaves a complete factsheet file at the path.
+
         :param p_path: path to replace factsheet's path.
+        :param p_backup: when True, a full save keeps the previous
+            factsheet file as a backup (path with '~' appended).  An
+            incremental save keeps no backup, since it only appends to
+            the file and leaves the previous contents in place.
 
         :raises BackupFileError: when backup fails.
         :raises DumpFileError: when factsheet cannot be written to file.
         :raises OpenFileError: for all other errors.
         :raises NoFileError: when path to save file is None.
         """
-        if p_path is not None:
+        commit = self._save_snapshot(p_path, p_backup)
+        commit()
+        self._model.set_fresh()
+        self._reset_journal()
+
+    def save_background(
+            self, p_path: typing.Optional[Path] = None,
+            p_backup: bool = True,
+            p_on_done: typing.Optional[CSAVE.OnDoneSave] = None) -> None:
+        """Save factsheet contents and finish save on background thread.
+
+        Method writes a snapshot of the factsheet on the calling thread
+        and then submits the slow part of the save (flush to storage,
+        backup, and replacement of factsheet file) to
+        :data:`.g_scheduler_save`.  The factsheet is fresh once method
+        returns.  When the save fails, the factsheet becomes stale
+        again.
+
+        .. admonition:: Limitation
+
+            Serialization of the factsheet runs on the calling thread,
+            since text models are GTK buffers that only the main loop
+            may read.  An incremental save serializes only changed
+            topics, but a full save (see :meth:`.WriterSheet.dump_full`)
+            serializes every topic and loads the body of each lazy
+            topic, so a full save of a large factsheet still blocks the
+            main loop.
+
+        :param p_path: path to replace factsheet's path.
+        :param p_backup: see :meth:`save`.
+        :param p_on_done: function to call on main loop with exception
+            from save or with None when save succeeded.
+
+        :raises FactsheetError: see :meth:`save` for errors while
+            writing snapshot.
+        """
+        commit = self._save_snapshot(p_path, p_backup)
+        self._model.set_fresh()
+
+        def on_done(p_error: typing.Optional[Exception]) -> None:
+            if p_error is not None:
+                self._model.set_stale()
+            if p_on_done is not None:
+                p_on_done(p_error)
+
+        self._future_save = CSAVE.g_scheduler_save.submit(commit, on_done)
+        self._reset_journal()
+
+    def _save_snapshot(self, p_path: typing.Optional[Path],
+                       p_backup: bool) -> typing.Callable[[], None]:
+        """Write snapshot of factsheet and return function to finish save.
+
+        Method waits for a background save in progress to finish.  The
+        returned function makes the snapshot durable.  When the function
+        fails, the next save is a full save.
+
+        :param p_path: path to replace factsheet's path.
+        :param p_backup: see :meth:`save`.
+
+        :raises FactsheetError: see :meth:`save`.
+        """
+        if self._future_save is not None:
+            _ = CF.wait([self._future_save])
+            self._future_save = None
+        if p_path is not None and p_path != self._path:
+            self._stop_journal()
             self._path = p_path
-        with self._open_file_save() as io_out:
+            self._writer.detach()
+        path = self._path
+        io_stale = self._save_stale()
+        if io_stale is not None:
+            def finish() -> None:
+                _commit_file_stale(io_stale)
+        else:
+            io_out, path_temp = self._open_file_save()
             try:
-                pickle.dump(self._model, io_out)
+                self._writer.dump_full(self._model, io_out)
             except Exception as err_dump:
+                io_out.close()
+                path_temp.unlink()
+                self._writer.detach()
                 raise DumpFileError from err_dump
-        self._model.set_fresh()
+
+            def finish() -> None:
+                _commit_file_save(io_out, path_temp, path, p_backup)
+
+        def commit() -> None:
+            try:
+                finish()
+            except Exception:
+                self._writer.detach()
+                raise
+
+        return commit
+
+    def _save_stale(self) -> typing.Optional[typing.BinaryIO]:
+        """Append changes since previous save to factsheet file.
+
+        Return the open factsheet file when append succeeded or None
+        when factsheet needs a full save.
+
+        :raises DumpFileError: when changes cannot be written to file.
+        :raises OpenFileError: when file cannot be opened.
+        """
+        if self._path is None or not self._writer.can_append():
+            return None
+
+        try:
+            io_out = self._path.open(mode='r+b')
+        except FileNotFoundError:
+            self._writer.detach()
+            return None
+        except Exception as err_open:
+            raise OpenFileError from err_open
+
+        try:
+            self._writer.dump_stale(self._model, io_out)
+        except Exception as err_dump:
+            io_out.close()
+            self._writer.detach()
+            raise DumpFileError from err_dump
+        return io_out
+
+    def _start_journal(self) -> None:
+        """Start journal of edits when factsheet has a saved file.
+
+        When the journal grows too large, the factsheet saves in the
+        background and the journal starts over.
+        """
+        if self._path is None or self._writer.mark is None:
+            return
+
+        self._journal = CJOURNAL.JournalSheet(
+            CJOURNAL.path_journal(self._path), self._model, self._writer,
+            p_on_full=self.save_background, p_size=self._size_journal)
+        self._size_journal = None
+
+    def _stop_journal(self) -> None:
+        """Stop journal of edits and remove journal file."""
+        if self._journal is not None:
+            self._journal.stop()
+            self._journal = None
 
     @property
     def tag(self) -> MSHEET.TagSheet:
@@ -647,6 +903,98 @@ class ControlSheet:
             yield control
 
 
+def _backup_file(p_path: Path) -> None:
+    """Keep copy of file at path with '~' appended.
+
+    Function links the backup to the file when the file system supports
+    links and copies the file otherwise.
+
+    :param p_path: location of file to back up.
+    """
+    path_backup = p_path.with_name(p_path.name + '~')
+    path_link = p_path.with_name(p_path.name + '~.tmp')
+    try:
+        os.link(p_path, path_link)
+    except OSError:
+        _ = shutil.copy2(p_path, path_link)
+    os.replace(path_link, path_backup)
+
+
+def _commit_file_save(p_io: typing.BinaryIO, p_path_temp: Path,
+                      p_path: Path, p_backup: bool) -> None:
+    """Flush temporary file to storage and replace factsheet file.
+
+    The factsheet file remains unchanged until the temporary file is
+    complete on storage.  Function removes the temporary file when it
+    cannot replace the factsheet file.
+
+    :param p_io: open temporary file with factsheet contents.
+    :param p_path_temp: location of temporary file.
+    :param p_path: location of factsheet file.
+    :param p_backup: when True, keep any existing factsheet file as a
+        backup.
+
+    :raises BackupFileError: when backup fails.
+    :raises DumpFileError: when temporary file cannot be flushed.
+    :raises OpenFileError: when factsheet file cannot be replaced.
+    """
+    try:
+        with p_io:
+            p_io.flush()
+            os.fsync(p_io.fileno())
+    except Exception as err_sync:
+        p_path_temp.unlink()
+        raise DumpFileError from err_sync
+
+    if p_backup and p_path.exists():
+        try:
+            _backup_file(p_path)
+        except Exception as err_backup:
+            p_path_temp.unlink()
+            raise BackupFileError from err_backup
+
+    try:
+        os.replace(p_path_temp, p_path)
+    except Exception as err_replace:
+        p_path_temp.unlink()
+        raise OpenFileError from err_replace
+
+    _sync_directory(p_path.parent)
+
+
+def _commit_file_stale(p_io: typing.BinaryIO) -> None:
+    """Flush appended changes to storage and close factsheet file.
+
+    :param p_io: open factsheet file.
+
+    :raises DumpFileError: when file cannot be flushed.
+    """
+    try:
+        with p_io:
+            p_io.flush()
+            os.fsync(p_io.fileno())
+    except Exception as err_sync:
+        raise DumpFileError from err_sync
+
+
+def _sync_directory(p_path: Path) -> None:
+    """Flush directory entries to storage where platform allows.
+
+    :param p_path: location of directory.
+    """
+    try:
+        fd = os.open(p_path, os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 def id_view_sheet(p_view_sheet: 'ObserverControlSheet') -> IdViewSheet:
     """Return unique identifier for a sheet view.
 
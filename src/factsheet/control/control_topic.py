@@ -22,10 +22,11 @@ Classes
 import typing
 
 import factsheet.bridge_ui as BUI
+import factsheet.control.scheduler_check as CSCHEDULE
+import factsheet.model.fact as MFACT
 import factsheet.model.topic as MTOPIC
 # import factsheet.control.control_fact as CFACT
 # import factsheet.control.control_idcore as CIDCORE
-# import factsheet.model.fact as MFACT
 # import factsheet.model.idcore as MIDCORE
 
 # from factsheet.model.types_model import IndexFact
@@ -59,12 +60,19 @@ class ControlTopic:
     """Translates user requests in topic view to updates in topic model.
     """
 
-    def __init__(self, p_model: MTOPIC.Topic) -> None:
+    def __init__(self, p_model: MTOPIC.Topic,
+                 p_scheduler: typing.Optional[CSCHEDULE.SchedulerCheck] = None
+                 ) -> None:
         """Initialize model and view factories.
 
         :param p_model: topic model.
+        :param p_scheduler: scheduler for fact checks.  Default is
+            scheduler shared by all topics.
         """
         self._model = p_model
+        if p_scheduler is None:
+            p_scheduler = CSCHEDULE.g_scheduler_check
+        self._scheduler = p_scheduler
         self._factory_display_name = (
             MTOPIC.FactoryDisplayName(self._model.name))
         self._factory_editor_name = (
@@ -86,29 +94,27 @@ class ControlTopic:
         #     control_new = CFACT.ControlFact(fact)
         #     self._controls_fact[fact.tag] = control_new
 
-    def check_fact(self, p_i: int) -> None:
-        """Request topic check a fact.
+    def check_fact(self, p_fact: MFACT.Fact) -> None:
+        """Request check of a fact off the main loop.
 
-        :param p_i: index of fact to check.
+        :param p_fact: fact to check.
         """
-        raise NotImplementedError
-        # assert self._model is not None
-        # self._model.check_fact(p_i)
+        self._scheduler.check(p_fact)
 
     def clear_all(self) -> None:
-        """Request topic clear all of topic's facts. """
-        raise NotImplementedError
-        # assert self._model is not None
-        # self._model.clear_all()
+        """Request clear of each of topic's facts (see
+        :meth:`.Topic.iter_facts`).
+        """
+        for fact in list(self._model.iter_facts()):
+            self.clear_fact(fact)
 
-    def clear_fact(self, p_i: int) -> None:
-        """Request topic clear a fact.
+    def clear_fact(self, p_fact: MFACT.Fact) -> None:
+        """Request clear of a fact, including any check in progress.
 
-        :param p_i: index of fact to clear.
+        :param p_fact: fact to clear.
         """
-        raise NotImplementedError
-        # assert self._model is not None
-        # self._model.clear_fact(p_i)
+        self._scheduler.cancel(p_fact)
+        p_fact.clear()
 
     # def detach_form(self, p_form: ABC_TOPIC.InterfaceFormTopic) -> None:
     #     """Remove topic form from model.
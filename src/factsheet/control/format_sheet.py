@@ -0,0 +1,968 @@
+"""
+Defines file format for factsheets.
+
+:doc:`../guide/devel_notes` explains how application Factsheet is based
+on a Model-View-Controller (MVC) design.  Module :mod:`format_sheet`
+defines how a sheet control writes a factsheet model to a file and
+reads the model back.
+
+A factsheet file is a container of records.  The file starts with a
+header (see :data:`MAGIC` and :data:`VERSION`).  A sequence of records
+follows the header.  Each record starts with its kind and the length of
+its payload (see :class:`KindRecord`).
+
+    * A :attr:`~KindRecord.SHEET` record contains factsheet identity.
+    * An :attr:`~KindRecord.OUTLINE` record contains the structure of
+      the topics outline.
+    * A :attr:`~KindRecord.TOPIC_HEAD` record contains the identity of
+      one topic (name, summary, and title).
+    * A :attr:`~KindRecord.TOPIC` record contains the body of one topic
+      (everything except identity).
+    * An :attr:`~KindRecord.END` record marks the end of the file.
+
+A writer produces one record at a time and a reader loads one record at
+a time.  Memory use for a save or open is bounded by the size of the
+largest topic rather than by the size of the factsheet.  A reader skips
+records of unknown kinds.
+
+Each topic has a key that stays the same from save to save.  The file is
+append-only between full saves.  A save appends a session of records
+that ends with an end record.  A later record replaces an earlier record
+of the same kind (and, for topic records, with the same key).  A reader
+ignores records after the last end record, which a save interrupted by
+a crash may leave.  An incremental save (see :class:`WriterSheet`)
+appends only records for topics that changed, and so takes time in
+proportion to the size of the changes.  A full save rewrites the file
+and so compacts it.
+
+A reader may open a factsheet lazily.  The reader then loads only the
+outline and topic identities.  Each topic is a :class:`TopicLazy` until
+the first access to its body, at which point the reader loads the body
+and the topic becomes an instance of its saved class.  Time to open a
+factsheet depends on the number of topics rather than on their size.
+
+Factsheet files from earlier releases contain a pickle of the entire
+factsheet model.  Function :func:`is_format` distinguishes the two
+forms so that a sheet control may import earlier files.
+
+Hooks
+-----
+
+.. data:: g_hooks_body
+
+    Functions to call whenever the body of a lazy topic loads.  See
+    :func:`notify_body`.
+
+.. data:: HookBody
+
+    Type hint for function to call with a topic whose body loaded.
+
+Exceptions
+----------
+
+.. exception:: FormatError
+
+    Bases: :exc:`.Exception`
+
+    Raise for a file that does not follow the factsheet format.
+
+Constants
+---------
+
+.. data:: MAGIC
+
+    Bytes that start a factsheet file.
+
+.. data:: RATIO_DEAD_MAX
+
+    Largest fraction of file that may contain replaced records before
+    a writer compacts the file.
+
+.. data:: SIZE_COMPACT_MIN
+
+    Smallest file size in bytes for which a writer compacts the file.
+
+.. data:: VERSION
+
+    Version of factsheet format that module writes.
+
+.. data:: KeyTopic
+
+    Distinct type for key of a topic within a factsheet file.  A topic
+    keeps its key from save to save.
+
+.. data:: MarkSession
+
+    Distinct type for random identifier of a save session.
+
+Classes and Functions
+---------------------
+"""
+import enum
+import io
+import os
+import pickle
+import struct
+import threading
+import typing
+
+import factsheet.model.idcore as MIDCORE
+import factsheet.model.sheet as MSHEET
+import factsheet.model.topic as MTOPIC
+
+
+class FormatError(Exception):
+    pass
+
+
+HookBody = typing.Callable[[MTOPIC.Topic], None]
+
+g_hooks_body: typing.List[HookBody] = list()
+
+
+MAGIC = b'\x89FSHEET\n'
+VERSION = 1
+
+RATIO_DEAD_MAX = 0.5
+SIZE_COMPACT_MIN = 1 << 20
+
+KeyTopic = typing.NewType('KeyTopic', int)
+
+_KEY_NONE = KeyTopic((1 << 64) - 1)
+_SIZE_MARK = 8
+_STRUCT_LINE = struct.Struct('>HQ')
+_STRUCT_HEADER = struct.Struct('>8sH')
+_STRUCT_KEY = struct.Struct('>Q')
+_STRUCT_RECORD = struct.Struct('>BQ')
+
+
+class KindRecord(enum.IntEnum):
+    """Kinds of records in a factsheet file.
+
+    Each save session contains a mark record that identifies the
+    session.  Text records appear only in a factsheet journal (see
+    :mod:`.journal_sheet`).
+    """
+    SHEET = 1
+    OUTLINE = 2
+    TOPIC = 3
+    TOPIC_HEAD = 4
+    MARK = 5
+    TEXT = 6
+    END = 255
+
+
+MarkSession = typing.NewType('MarkSession', bytes)
+
+_KINDS_KEYED = frozenset([KindRecord.TOPIC, KindRecord.TOPIC_HEAD])
+_KINDS_KNOWN = frozenset(
+    k.value for k in KindRecord if k is not KindRecord.TEXT)
+_NAMES_IDENTITY = ('_name', '_summary', '_title')
+
+
+class PicklerTopic(pickle.Pickler):
+    """Pickles part of one topic and refers to topics in factsheet by key.
+
+    Topics may refer to other topics (for example, an operation topic
+    refers to its set topic) and facts refer to their topic.  The
+    pickler replaces each reference to a topic in the factsheet with the
+    topic's key.  The pickler includes a topic outside the factsheet in
+    the pickle.
+
+    :param p_file: file to receive pickle.
+    :param p_keys: map from identifier (`id`) of each topic in factsheet
+        to topic key.
+    """
+
+    def __init__(self, p_file: typing.BinaryIO,
+                 p_keys: typing.Mapping[int, KeyTopic]) -> None:
+        super().__init__(p_file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._keys = p_keys
+
+    def persistent_id(self, p_object: typing.Any
+                      ) -> typing.Optional[KeyTopic]:
+        """Return key for reference to a topic or None otherwise.
+
+        :param p_object: object to pickle.
+        """
+        if isinstance(p_object, MTOPIC.Topic):
+            key = self._keys.get(id(p_object), None)
+            if key is None and isinstance(p_object, TopicLazy):
+                _ = p_object.load_body()
+            return key
+
+        return None
+
+
+class UnpicklerTopic(pickle.Unpickler):
+    """Unpickles one topic and resolves references to other topics.
+
+    :param p_file: file containing pickle.
+    :param p_resolve: function that returns topic for key.
+    """
+
+    def __init__(self, p_file: typing.BinaryIO,
+                 p_resolve: typing.Callable[[KeyTopic], MTOPIC.Topic]
+                 ) -> None:
+        super().__init__(p_file)
+        self._resolve = p_resolve
+
+    def persistent_load(self, p_key: KeyTopic) -> MTOPIC.Topic:
+        """Return topic for key.
+
+        :param p_key: key of topic referenced.
+        """
+        return self._resolve(p_key)
+
+
+class TopicLazy(MTOPIC.Topic):
+    """Topic with identity loaded and body waiting in factsheet file.
+
+    A lazy topic presents its name, summary, and title without loading
+    its body.  The first access to any other attribute loads the body.
+    The topic then becomes an instance of its saved class in place, so
+    that references to the topic (for example, from a topic control or
+    another topic) remain valid.
+
+    A lazy topic is marked fresh when loaded.  Edits to topic identity
+    before the body loads remain stale.
+    """
+
+    _key: KeyTopic
+    _reader: 'ReaderSheet'
+
+    def __contains__(self, p_fact) -> bool:
+        """Load body and return True when fact is in facts outline."""
+        return self.load_body().__contains__(p_fact)
+
+    def __eq__(self, p_other: typing.Any) -> bool:
+        """Load body and return True when p_other equals topic.
+
+        :param p_other: object to compare with self.
+        """
+        return self.load_body().__eq__(p_other)
+
+    def __getattr__(self, p_name: str) -> typing.Any:
+        """Load body and return attribute missing from lazy topic.
+
+        :param p_name: name of attribute.
+        """
+        if p_name.startswith('__') or p_name in ('_key', '_reader'):
+            raise AttributeError(p_name)
+
+        return getattr(self.load_body(), p_name)
+
+    def __iter__(self) -> typing.Iterator:
+        """Load body and return iterator over facts in facts outline."""
+        return self.load_body().__iter__()
+
+    def fingerprint(self) -> typing.Optional[MTOPIC.FingerprintTopic]:
+        """Load body and return summary of topic content."""
+        return self.load_body().fingerprint()
+
+    def is_stale(self) -> bool:
+        """Return True when there is an unsaved change to topic identity.
+
+        The body of a lazy topic is unchanged from file contents.
+        """
+        return MIDCORE.IdCore.is_stale(self)
+
+    def iter_facts(self) -> typing.Iterator[typing.Any]:
+        """Load body and return iterator over facts of topic."""
+        return self.load_body().iter_facts()
+
+    def load_body(self) -> MTOPIC.Topic:
+        """Load topic body from factsheet file and return topic."""
+        self._reader.load_body(self)
+        return self
+
+    def set_fresh(self) -> None:
+        """Mark topic identity consistent with file contents."""
+        MIDCORE.IdCore.set_fresh(self)
+
+
+class ReaderSheet:
+    """Reads factsheet model from file one record at a time.
+
+    The reader first scans record headers to locate each record.  The
+    reader then loads factsheet identity, topics outline, and topic
+    identities.  The reader loads each topic body either eagerly or on
+    first access (see :class:`TopicLazy`).
+
+    :param p_io: open, seekable file positioned at factsheet header.
+    :param p_close: when True, the reader closes the file once the
+        reader has loaded every topic body.
+    """
+
+    def __init__(self, p_io: typing.BinaryIO, p_close: bool = False
+                 ) -> None:
+        self._io = p_io
+        self._close = p_close
+        self._lock = threading.RLock()
+        self._version = read_header(p_io)
+        self._spans: typing.MutableMapping[
+            KindRecord, typing.Tuple[int, int]] = dict()
+        self._spans_keyed: typing.Mapping[
+            KindRecord, typing.MutableMapping[
+                KeyTopic, typing.Tuple[int, int]]] = {
+                    kind: dict() for kind in _KINDS_KEYED}
+        self._mark: typing.Optional[MarkSession] = None
+        self._offset_end = 0
+        self._scan()
+        self._topics: typing.MutableMapping[
+            KeyTopic, MTOPIC.Topic] = dict()
+        self._n_lazy = 0
+
+    def close(self) -> None:
+        """Close file if reader owns file.
+
+        Lazy topics cannot load after the reader closes file.
+        """
+        if self._close and not self._io.closed:
+            self._io.close()
+
+    def _load_head(self, p_key: KeyTopic) -> typing.Optional[TopicLazy]:
+        """Return lazy topic with identity from file.
+
+        :param p_key: key of desired topic.
+        """
+        try:
+            offset, length = self._spans_keyed[KindRecord.TOPIC_HEAD][p_key]
+        except KeyError:
+            return None
+
+        payload = self._read_payload(offset, length)
+        identity = pickle.loads(payload[_STRUCT_KEY.size:])
+        topic = TopicLazy.__new__(TopicLazy)
+        topic._key = p_key
+        topic._reader = self
+        topic.__setstate__(dict(zip(_NAMES_IDENTITY, identity)))
+        self._n_lazy += 1
+        return topic
+
+    def load_body(self, p_topic: TopicLazy) -> None:
+        """Load body of lazy topic from file.
+
+        The topic becomes an instance of its saved class.  Method does
+        nothing when the topic body is loaded already.  Method notifies
+        body hooks (see :func:`notify_body`) once the body loads.
+
+        :param p_topic: topic to load.
+        :raises FormatError: when file contains no body for topic.
+        """
+        with self._lock:
+            if not isinstance(p_topic, TopicLazy):
+                return
+
+            payload = self.read_body(p_topic._key)
+            unpickler = UnpicklerTopic(
+                io.BytesIO(payload[_STRUCT_KEY.size:]), self._resolve)
+            class_topic, state = unpickler.load()
+            is_stale = p_topic.is_stale()
+            for name in _NAMES_IDENTITY:
+                state[name] = p_topic.__dict__[name]
+            restore_topic(p_topic, class_topic, state)
+            if is_stale:
+                p_topic.set_stale()
+            self._n_lazy -= 1
+            if not self._n_lazy:
+                self.close()
+        notify_body(p_topic)
+
+    def load_sheet(self, p_lazy: bool = True) -> MSHEET.Sheet:
+        """Return factsheet model from file.
+
+        :param p_lazy: when True, defer loading each topic body until
+            first access.
+        :raises FormatError: when file content is inconsistent.
+        """
+        sheet = self._new_sheet()
+        insert_outline(sheet, self._read_outline(), self.topic)
+        sheet.set_fresh()
+        if not p_lazy:
+            for topic in list(self._topics.values()):
+                if isinstance(topic, TopicLazy):
+                    topic.load_body()
+        if not self._n_lazy:
+            self.close()
+        return sheet
+
+    def _new_sheet(self) -> MSHEET.Sheet:
+        """Return factsheet with identity from file and no topics."""
+        try:
+            offset, length = self._spans[KindRecord.SHEET]
+        except KeyError:
+            raise FormatError('File contains no sheet record.')
+
+        state = pickle.loads(self._read_payload(offset, length))
+        state['_topics'] = MSHEET.OutlineTopics()
+        sheet = MSHEET.Sheet.__new__(MSHEET.Sheet)
+        sheet.__setstate__(state)
+        return sheet
+
+    def keys(self) -> typing.Mapping[KeyTopic, MTOPIC.Topic]:
+        """Return map from key to each topic the reader has created."""
+        return self._topics
+
+    @property
+    def mark(self) -> typing.Optional[MarkSession]:
+        """Return mark of last save session in file or None when file
+        has no mark.
+        """
+        return self._mark
+
+    def _read_outline(self) -> typing.Iterator[
+            typing.Tuple[int, KeyTopic]]:
+        """Return iterator over depth and topic key of each line in
+        topics outline.
+        """
+        try:
+            offset, length = self._spans[KindRecord.OUTLINE]
+        except KeyError:
+            raise FormatError('File contains no outline record.')
+
+        payload = self._read_payload(offset, length)
+        yield from decode_outline(payload)
+
+    def read_body(self, p_key: KeyTopic) -> bytes:
+        """Return payload of body record for topic with given key.
+
+        :param p_key: key of topic.
+        :raises FormatError: when file contains no body for topic.
+        """
+        with self._lock:
+            try:
+                offset, length = self._spans_keyed[KindRecord.TOPIC][p_key]
+            except KeyError:
+                raise FormatError('File contains no body for topic {}.'
+                                  ''.format(p_key))
+
+            return self._read_payload(offset, length)
+
+    def _read_payload(self, p_offset: int, p_length: int) -> bytes:
+        """Return payload of record at given file location.
+
+        :param p_offset: file position of payload.
+        :param p_length: length of payload.
+        """
+        _ = self._io.seek(p_offset)
+        payload = self._io.read(p_length)
+        if len(payload) < p_length:
+            raise FormatError('File ends within record.')
+
+        return payload
+
+    def _resolve(self, p_key: KeyTopic) -> MTOPIC.Topic:
+        """Return topic that another topic refers to.
+
+        :param p_key: key of topic referenced.
+        :raises FormatError: when file contains no topic for key.
+        """
+        topic = self.topic(p_key)
+        if topic is None:
+            raise FormatError('Reference to missing topic {}.'.format(p_key))
+
+        return topic
+
+    def _scan(self) -> None:
+        """Record location of each record in file.
+
+        Records take effect at the end record of their session.  Method
+        ignores records after the last end record.
+
+        :raises FormatError: when file contains no end record.
+        """
+        mark = None
+        spans: typing.MutableMapping[
+            KindRecord, typing.Tuple[int, int]] = dict()
+        spans_keyed: typing.Mapping[
+            KindRecord, typing.MutableMapping[
+                KeyTopic, typing.Tuple[int, int]]] = {
+                    kind: dict() for kind in _KINDS_KEYED}
+        while True:
+            header = self._io.read(_STRUCT_RECORD.size)
+            if len(header) < _STRUCT_RECORD.size:
+                break
+
+            kind, length = _STRUCT_RECORD.unpack(header)
+            offset = self._io.tell()
+            if KindRecord.MARK == kind:
+                mark = MarkSession(self._io.read(length))
+            elif KindRecord.END == kind:
+                self._mark = mark
+                self._spans.update(spans)
+                spans.clear()
+                for kind_keyed, spans_kind in spans_keyed.items():
+                    self._spans_keyed[kind_keyed].update(spans_kind)
+                    spans_kind.clear()
+                self._offset_end = offset + length
+            elif kind in _KINDS_KEYED:
+                key_bytes = self._io.read(_STRUCT_KEY.size)
+                if len(key_bytes) < _STRUCT_KEY.size:
+                    break
+                (key,) = _STRUCT_KEY.unpack(key_bytes)
+                spans_keyed[KindRecord(kind)][KeyTopic(key)] = (
+                    offset, length)
+            elif kind in _KINDS_KNOWN:
+                spans[KindRecord(kind)] = (offset, length)
+            _ = self._io.seek(offset + length)
+
+        if not self._offset_end:
+            raise FormatError('File ends before end record.')
+
+    def topic(self, p_key: KeyTopic) -> typing.Optional[MTOPIC.Topic]:
+        """Return topic for key or None when file has no topic for key.
+
+        :param p_key: key of desired topic.
+        """
+        try:
+            return self._topics[p_key]
+        except KeyError:
+            pass
+
+        if _KEY_NONE == p_key:
+            return None
+
+        topic = self._load_head(p_key)
+        if topic is not None:
+            self._topics[p_key] = topic
+        return topic
+
+    @property
+    def version(self) -> int:
+        """Return format version of file."""
+        return self._version
+
+
+class WriterSheet:
+    """Writes factsheet model to file in full or incrementally.
+
+    A writer assigns each topic a key and keeps the key from save to
+    save.  A full save writes a complete file.  An incremental save
+    appends to the file from the previous save.  The session appended
+    contains records for the factsheet identity, the topics outline, and
+    each topic that is new or stale.  For a lazy topic (see
+    :class:`TopicLazy`), an incremental save appends only the topic
+    identity and does not load the topic body.
+
+    A writer tracks how much of the file contains replaced records and
+    reports when the file needs compaction (see :meth:`can_append`).
+
+    :param p_reader: reader of the file to which writer should append.
+        Default is a writer with no file.
+    """
+
+    def __init__(self, p_reader: typing.Optional[ReaderSheet] = None
+                 ) -> None:
+        self._keys: typing.MutableMapping[int, KeyTopic] = dict()
+        self._keys_unsaved: typing.Set[KeyTopic] = set()
+        self._topics: typing.MutableMapping[
+            KeyTopic, MTOPIC.Topic] = dict()
+        self._key_next = 0
+        self._mark: typing.Optional[MarkSession] = None
+        self._offset_end: typing.Optional[int] = None
+        self._sizes: typing.MutableMapping[
+            typing.Tuple[KindRecord, KeyTopic], int] = dict()
+        self._size_fixed = 0
+        if p_reader is not None:
+            self._init_from_reader(p_reader)
+
+    def adopt(self, p_key: KeyTopic, p_topic: MTOPIC.Topic) -> None:
+        """Assign given key to topic not yet saved in writer's file.
+
+        For example, a journal replay (see :mod:`.journal_sheet`) adopts
+        each topic it recreates.
+
+        :param p_key: key for topic.
+        :param p_topic: topic to adopt.
+        """
+        topic_old = self._topics.get(p_key, None)
+        if topic_old is not None:
+            del self._keys[id(topic_old)]
+        self._keys[id(p_topic)] = p_key
+        self._topics[p_key] = p_topic
+        self._keys_unsaved.add(p_key)
+        self._key_next = max(self._key_next, p_key + 1)
+
+    def can_append(self) -> bool:
+        """Return True when next save may be incremental.
+
+        Return False when writer has no file or when the fraction of
+        the file that contains replaced records exceeds
+        :data:`RATIO_DEAD_MAX`.
+        """
+        if self._offset_end is None:
+            return False
+
+        if self._offset_end < SIZE_COMPACT_MIN:
+            return True
+
+        size_live = self._size_fixed + sum(self._sizes.values())
+        size_dead = self._offset_end - size_live
+        return size_dead <= RATIO_DEAD_MAX * self._offset_end
+
+    def detach(self) -> None:
+        """Forget file so that next save is a full save."""
+        self._offset_end = None
+
+    def dump_full(self, p_sheet: MSHEET.Sheet, p_io: typing.BinaryIO
+                  ) -> None:
+        """Write complete factsheet to file.
+
+        Method loads the body of each lazy topic.
+
+        :param p_sheet: factsheet to write.
+        :param p_io: open, empty file.
+        """
+        self._sizes.clear()
+        p_io.write(_STRUCT_HEADER.pack(MAGIC, VERSION))
+        self._dump_session(p_sheet, p_io, p_full=True)
+        self._offset_end = p_io.tell()
+
+    def dump_stale(self, p_sheet: MSHEET.Sheet, p_io: typing.BinaryIO
+                   ) -> None:
+        """Append records for changes to factsheet since previous save.
+
+        :param p_sheet: factsheet to write.
+        :param p_io: file from previous save open for update.
+        :raises FormatError: when writer has no file.
+        """
+        if self._offset_end is None:
+            raise FormatError('Incremental save requires previous save.')
+
+        _ = p_io.seek(self._offset_end)
+        _ = p_io.truncate()
+        self._dump_session(p_sheet, p_io, p_full=False)
+        self._offset_end = p_io.tell()
+
+    def _dump_session(self, p_sheet: MSHEET.Sheet, p_io: typing.BinaryIO,
+                      p_full: bool) -> None:
+        """Write session of records for factsheet.
+
+        :param p_sheet: factsheet to write.
+        :param p_io: file positioned at end of previous session.
+        :param p_full: when True, write every topic.  Otherwise, write
+            only new and stale topics.  An incremental save keeps the key
+            of a topic removed from the outline, since the saved body of
+            another topic may refer to the key.
+        """
+        lines = self.encode_outline(p_sheet)
+        topics = {self._keys[id(topic)]: topic
+                  for topic in p_sheet.outline_topics.items()
+                  if topic is not None}
+        for key in set(self._topics) - set(topics):
+            _ = self._sizes.pop((KindRecord.TOPIC_HEAD, key), None)
+            _ = self._sizes.pop((KindRecord.TOPIC, key), None)
+            if p_full:
+                del self._keys[id(self._topics.pop(key))]
+                self._keys_unsaved.discard(key)
+
+        for key, topic in topics.items():
+            if p_full or key in self._keys_unsaved or topic.is_stale():
+                self._dump_topic(p_io, key, topic, p_full)
+
+        state = p_sheet.__getstate__()
+        del state['_topics']
+        self._mark = MarkSession(os.urandom(_SIZE_MARK))
+        self._size_fixed = (
+            _STRUCT_HEADER.size
+            + write_record(p_io, KindRecord.SHEET, pickle.dumps(
+                state, protocol=pickle.HIGHEST_PROTOCOL))
+            + write_record(p_io, KindRecord.OUTLINE, lines)
+            + write_record(p_io, KindRecord.MARK, self._mark)
+            + write_record(p_io, KindRecord.END, b''))
+        p_io.flush()
+
+    def _dump_topic(self, p_io: typing.BinaryIO, p_key: KeyTopic,
+                    p_topic: MTOPIC.Topic, p_full: bool) -> None:
+        """Write records for topic.
+
+        Write only topic identity for a lazy topic in an incremental
+        save.
+
+        :param p_io: file positioned at end of previous record.
+        :param p_key: key of topic.
+        :param p_topic: topic to write.
+        :param p_full: True for a full save.
+        """
+        if p_full and isinstance(p_topic, TopicLazy):
+            _ = p_topic.load_body()
+        head, body = self.encode_topic(p_key, p_topic)
+        self._sizes[(KindRecord.TOPIC_HEAD, p_key)] = write_record(
+            p_io, KindRecord.TOPIC_HEAD, head)
+        if body is not None:
+            self._sizes[(KindRecord.TOPIC, p_key)] = write_record(
+                p_io, KindRecord.TOPIC, body)
+        self._keys_unsaved.discard(p_key)
+
+    def encode_outline(self, p_sheet: MSHEET.Sheet) -> bytes:
+        """Return payload of outline record for factsheet.
+
+        Method assigns a key to each topic new to the writer.
+
+        :param p_sheet: factsheet with topics outline to encode.
+        """
+        outline = p_sheet.outline_topics
+        lines = bytearray()
+        for depth, _line, topic in outline.walk():
+            key = _KEY_NONE if topic is None else self.key(topic)
+            lines.extend(_STRUCT_LINE.pack(depth, key))
+        return bytes(lines)
+
+    def encode_topic(self, p_key: KeyTopic, p_topic: MTOPIC.Topic
+                     ) -> typing.Tuple[bytes, typing.Optional[bytes]]:
+        """Return payloads of identity and body records for topic.
+
+        Body payload is None for a lazy topic (see :class:`TopicLazy`).
+
+        :param p_key: key of topic.
+        :param p_topic: topic to encode.
+        """
+        identity = (p_topic.name, p_topic.summary, p_topic.title)
+        head = _STRUCT_KEY.pack(p_key) + pickle.dumps(
+            identity, pickle.HIGHEST_PROTOCOL)
+        if isinstance(p_topic, TopicLazy):
+            return head, None
+
+        state = p_topic.__getstate__()
+        for name in _NAMES_IDENTITY:
+            del state[name]
+        buffer = io.BytesIO()
+        buffer.write(_STRUCT_KEY.pack(p_key))
+        PicklerTopic(buffer, self._keys).dump((type(p_topic), state))
+        return head, buffer.getvalue()
+
+    def _init_from_reader(self, p_reader: ReaderSheet) -> None:
+        """Set topic keys and file layout from reader.
+
+        :param p_reader: reader of file to which writer should append.
+        """
+        for key, topic in p_reader.keys().items():
+            self._keys[id(topic)] = key
+            self._topics[key] = topic
+        keys_all = [key for spans in p_reader._spans_keyed.values()
+                    for key in spans]
+        keys_all.extend(p_reader.keys())
+        self._key_next = 1 + max(keys_all, default=-1)
+        for kind, spans in p_reader._spans_keyed.items():
+            for key, (_offset, length) in spans.items():
+                if key in self._topics:
+                    self._sizes[(kind, key)] = _STRUCT_RECORD.size + length
+        self._size_fixed = _STRUCT_HEADER.size + _STRUCT_RECORD.size
+        for _offset, length in p_reader._spans.values():
+            self._size_fixed += _STRUCT_RECORD.size + length
+        self._mark = p_reader.mark
+        if self._mark is not None:
+            self._size_fixed += _STRUCT_RECORD.size + len(self._mark)
+        self._offset_end = p_reader._offset_end
+
+    def key(self, p_topic: MTOPIC.Topic) -> KeyTopic:
+        """Return key of topic, assigning a new key when topic has none.
+
+        A lazy topic unknown to writer loads its body, since the topic
+        key from its file may not be unique in writer's file.
+
+        :param p_topic: topic of interest.
+        """
+        try:
+            return self._keys[id(p_topic)]
+        except KeyError:
+            pass
+
+        if isinstance(p_topic, TopicLazy):
+            _ = p_topic.load_body()
+        key = KeyTopic(self._key_next)
+        self._key_next += 1
+        self._keys[id(p_topic)] = key
+        self._topics[key] = p_topic
+        self._keys_unsaved.add(key)
+        return key
+
+    @property
+    def mark(self) -> typing.Optional[MarkSession]:
+        """Return mark of last session writer wrote or found in file."""
+        return self._mark
+
+    def topics_unsaved(self) -> typing.Mapping[KeyTopic, MTOPIC.Topic]:
+        """Return map from key to each topic that has a key but is not
+        yet saved in writer's file.
+        """
+        return {key: self._topics[key] for key in self._keys_unsaved}
+
+
+def decode_outline(p_payload: bytes
+                   ) -> typing.Iterator[typing.Tuple[int, KeyTopic]]:
+    """Return iterator over depth and topic key of each line in payload
+    of outline record.
+
+    :param p_payload: payload from :meth:`.WriterSheet.encode_outline`.
+    """
+    for depth, key in _STRUCT_LINE.iter_unpack(p_payload):
+        yield depth, KeyTopic(key)
+
+
+def dump_sheet(p_sheet: MSHEET.Sheet, p_io: typing.BinaryIO) -> None:
+    """Write complete factsheet model to file one record at a time.
+
+    :param p_sheet: factsheet to write.
+    :param p_io: open file positioned where factsheet should start.
+    """
+    WriterSheet().dump_full(p_sheet, p_io)
+
+
+def insert_outline(
+        p_sheet: MSHEET.Sheet,
+        p_lines: typing.Iterable[typing.Tuple[int, KeyTopic]],
+        p_resolve: typing.Callable[[KeyTopic],
+                                   typing.Optional[MTOPIC.Topic]]) -> None:
+    """Add lines to end of factsheet's topics outline.
+
+    The function checks all lines first and then adds them in one step,
+    so views of the outline learn only of new top-level lines.
+
+    :param p_sheet: factsheet to extend.
+    :param p_lines: depth and topic key of each line in outline order.
+    :param p_resolve: function that returns topic for key.
+    :raises FormatError: when a line is deeper than any possible parent.
+    """
+    preorder: typing.List[typing.Tuple[
+        int, typing.Optional[MTOPIC.Topic]]] = list()
+    depth_prev = -1
+    for i, (depth, key) in enumerate(p_lines):
+        if depth_prev + 1 < depth:
+            raise FormatError('Outline line {} has depth {} below '
+                              'depth {}.'.format(i, depth, depth_prev + 1))
+        preorder.append((depth, p_resolve(key)))
+        depth_prev = depth
+    _ = p_sheet.extend_topics(preorder)
+
+
+def is_format(p_io: typing.BinaryIO) -> bool:
+    """Return True when file starts with factsheet header.
+
+    The function leaves the file position unchanged.
+
+    :param p_io: open, seekable file.
+    """
+    position = p_io.tell()
+    magic = p_io.read(len(MAGIC))
+    _ = p_io.seek(position)
+    return MAGIC == magic
+
+
+def iter_sessions(p_io: typing.BinaryIO) -> typing.Iterator[
+        typing.List[typing.Tuple[int, bytes]]]:
+    """Return iterator over sessions of records from current position.
+
+    Each session is a list of kind and payload of each record up to an
+    end record.  Iterator ignores records after the last end record,
+    including a partly-written record with a damaged length.
+
+    :param p_io: open, seekable file positioned at a record.
+    """
+    position = p_io.tell()
+    end = p_io.seek(0, io.SEEK_END)
+    _ = p_io.seek(position)
+    session: typing.List[typing.Tuple[int, bytes]] = list()
+    while True:
+        header = p_io.read(_STRUCT_RECORD.size)
+        if len(header) < _STRUCT_RECORD.size:
+            return
+
+        kind, length = _STRUCT_RECORD.unpack(header)
+        if end - p_io.tell() < length:
+            return
+
+        payload = p_io.read(length)
+
+        if KindRecord.END == kind:
+            yield session
+            session = list()
+        else:
+            session.append((kind, payload))
+
+
+def load_sheet(p_io: typing.BinaryIO) -> MSHEET.Sheet:
+    """Return factsheet model read eagerly from file.
+
+    :param p_io: open, seekable file positioned at factsheet header.
+    :raises FormatError: when file does not follow factsheet format.
+    """
+    return ReaderSheet(p_io).load_sheet(p_lazy=False)
+
+
+def notify_body(p_topic: MTOPIC.Topic) -> None:
+    """Call each function in :data:`g_hooks_body` with topic whose body
+    loaded.
+
+    Services that skip the body of a lazy topic (for example, search
+    in :mod:`.search_sheets`) learn when the body becomes available.
+
+    :param p_topic: topic that is no longer lazy.
+    """
+    for hook in g_hooks_body:
+        hook(p_topic)
+
+
+def read_header(p_io: typing.BinaryIO) -> int:
+    """Return format version from factsheet header.
+
+    :param p_io: open file positioned at factsheet header.
+    :raises FormatError: when header is missing or version is not
+        :data:`VERSION`.
+    """
+    header = p_io.read(_STRUCT_HEADER.size)
+    if len(header) < _STRUCT_HEADER.size:
+        raise FormatError('File too short for factsheet header.')
+
+    magic, version = _STRUCT_HEADER.unpack(header)
+    if MAGIC != magic:
+        raise FormatError('File is not a factsheet.')
+
+    if VERSION != version:
+        raise FormatError('Factsheet format version {} is not supported '
+                          'version {}.'.format(version, VERSION))
+
+    return version
+
+
+def restore_topic(p_topic: MTOPIC.Topic, p_class: typing.Type,
+                  p_state: typing.Dict) -> None:
+    """Replace content of topic in place with state pickle loads.
+
+    The topic becomes an instance of the given class.  References to
+    the topic remain valid, and the topic continues to report change
+    state to its owners (see :class:`.PartStale`).  The topic is fresh.
+
+    :param p_topic: topic to replace.
+    :param p_class: class of restored topic.
+    :param p_state: unpickled state of restored topic.
+    """
+    owners = p_topic.__dict__.get('_owners_stale', list())
+    p_topic.__dict__.clear()
+    p_topic.__class__ = p_class
+    p_topic.__dict__['_owners_stale'] = owners
+    p_topic.__setstate__(p_state)
+
+
+def split_key(p_payload: bytes) -> typing.Tuple[KeyTopic, bytes]:
+    """Return topic key and remainder of payload of topic record.
+
+    :param p_payload: payload of topic identity or topic body record.
+    """
+    (key,) = _STRUCT_KEY.unpack_from(p_payload)
+    return KeyTopic(key), p_payload[_STRUCT_KEY.size:]
+
+
+def write_record(p_io: typing.BinaryIO, p_kind: KindRecord,
+                 p_payload: bytes) -> int:
+    """Write record with given kind and payload to file and return size
+    of record.
+
+    :param p_io: open file positioned at end of previous record.
+    :param p_kind: kind of record.
+    :param p_payload: content of record.
+    """
+    p_io.write(_STRUCT_RECORD.pack(p_kind, len(p_payload)))
+    p_io.write(p_payload)
+    return _STRUCT_RECORD.size + len(p_payload)
@@ -0,0 +1,470 @@
+"""
+Defines autosave service that journals factsheet edits between saves.
+
+:doc:`../guide/devel_notes` explains how application Factsheet is based
+on a Model-View-Controller (MVC) design.  A journal is a file beside
+the factsheet file (see :func:`path_journal`).  The journal records
+edits made since the last save of the factsheet.  When a factsheet
+opens after a crash, the factsheet control replays the journal (see
+:func:`replay`).
+
+The journal learns of edits through stale hooks (see
+:func:`.notify_stale`).  Shortly after an edit, the journal appends a
+session of records for edits since the previous session.  A session
+contains records for new or changed topics, text edits, and, when the
+topics outline changed, the outline.  Records have the same layout as
+records in a factsheet file (see :mod:`.format_sheet`).  The background
+save thread (see :data:`.g_scheduler_save`) writes each session.
+
+The journal header identifies the save session of the factsheet file to
+which the journal applies (see :attr:`.WriterSheet.mark`).  Replay
+ignores a journal for a different save session.
+
+.. data:: DELAY_FLUSH
+
+    Milliseconds from first edit to journal session for the edit.
+
+.. data:: MAGIC_JOURNAL
+
+    First bytes of a journal file.
+
+.. data:: SIZE_JOURNAL_MAX
+
+    Size in bytes of journal above which journal asks for a full save.
+
+.. data:: VERSION_JOURNAL
+
+    Version of journal format that module writes.
+"""
+import io
+import logging
+import os
+from pathlib import Path
+import pickle
+import struct
+import typing
+
+import factsheet.abc_types.abc_stalefile as ABC_STALE
+import factsheet.control.format_sheet as CFORMAT
+import factsheet.control.scheduler_save as CSAVE
+import factsheet.model.sheet as MSHEET
+import factsheet.model.topic as MTOPIC
+
+from gi.repository import GLib   # type: ignore[import]
+
+logger = logging.getLogger('Main.journal_sheet')
+
+DELAY_FLUSH = 2000
+MAGIC_JOURNAL = b'\x89FSJRNL\n'
+SIZE_JOURNAL_MAX = 4 << 20
+VERSION_JOURNAL = 1
+
+Owner = typing.Union[MSHEET.Sheet, MTOPIC.Topic]
+
+_NAMES_TEXT = ('_name', '_summary', '_title')
+_STRUCT_HEADER = struct.Struct('>8sH8s')
+
+
+class JournalSheet:
+    """Appends factsheet edits to journal file between saves.
+
+    :param p_path: location of journal file.
+    :param p_sheet: factsheet to journal.
+    :param p_writer: writer that assigns topic keys for the factsheet
+        file.
+    :param p_on_full: function to call when journal grows larger than
+        :data:`SIZE_JOURNAL_MAX`.  Typically, the function saves the
+        factsheet.
+    :param p_size: size of committed content of existing journal file
+        to extend (see :func:`replay`).  Default starts a new journal.
+    """
+
+    def __init__(self, p_path: Path, p_sheet: MSHEET.Sheet,
+                 p_writer: CFORMAT.WriterSheet,
+                 p_on_full: typing.Optional[typing.Callable[[], None]] = None,
+                 p_size: typing.Optional[int] = None) -> None:
+        self._path = p_path
+        self._sheet = p_sheet
+        self._writer = p_writer
+        self._on_full = p_on_full
+        self._owners: typing.MutableMapping[
+            int, typing.Tuple[Owner, typing.Optional[str]]] = dict()
+        self._dirty: typing.MutableMapping[
+            int, typing.Tuple[Owner, typing.Optional[str]]] = dict()
+        self._keys_journaled: typing.Set[CFORMAT.KeyTopic] = set()
+        self._id_flush: typing.Optional[int] = None
+        self._size = 0
+        self._index_owners()
+        if p_size is None:
+            self.reset()
+        else:
+            self._keys_journaled.update(p_writer.topics_unsaved())
+            self._size = p_size
+            self._submit(self._task_truncate(p_size))
+        ABC_STALE.g_hooks_stale.append(self._on_stale)
+
+    def _add_owner(self, p_owner: Owner) -> None:
+        """Track factsheet or topic and its text components.
+
+        :param p_owner: factsheet or topic to track.
+        """
+        self._owners[id(p_owner)] = (p_owner, None)
+        for name in _NAMES_TEXT:
+            self._owners[id(getattr(p_owner, name))] = (p_owner, name)
+
+    def flush(self) -> None:
+        """Append session of records for edits since previous session."""
+        if self._id_flush is not None:
+            _ = GLib.source_remove(self._id_flush)
+            self._id_flush = None
+        if not self._dirty:
+            return
+
+        dirty = list(self._dirty.values())
+        self._dirty.clear()
+        buffer = io.BytesIO()
+        lines = None
+        if any(o is self._sheet and n is None for o, n in dirty):
+            lines = self._writer.encode_outline(self._sheet)
+            self._index_owners()
+        topics = {k: t for k, t in self._writer.topics_unsaved().items()
+                  if k not in self._keys_journaled}
+        texts = list()
+        for owner, name in dirty:
+            if owner is self._sheet:
+                if name is not None:
+                    texts.append((None, name, getattr(owner, name).text))
+                continue
+
+            key = self._writer.key(owner)
+            if name is None:
+                topics[key] = owner
+            else:
+                texts.append((key, name, getattr(owner, name).text))
+        for key, topic in topics.items():
+            head, body = self._writer.encode_topic(key, topic)
+            CFORMAT.write_record(buffer, CFORMAT.KindRecord.TOPIC_HEAD, head)
+            if body is not None:
+                CFORMAT.write_record(buffer, CFORMAT.KindRecord.TOPIC, body)
+            self._keys_journaled.add(key)
+        for text in texts:
+            CFORMAT.write_record(buffer, CFORMAT.KindRecord.TEXT,
+                                 pickle.dumps(text, pickle.HIGHEST_PROTOCOL))
+        if lines is not None:
+            CFORMAT.write_record(buffer, CFORMAT.KindRecord.OUTLINE, lines)
+        CFORMAT.write_record(buffer, CFORMAT.KindRecord.END, b'')
+        session = buffer.getvalue()
+        self._size += len(session)
+        self._submit(self._task_append(session))
+        if SIZE_JOURNAL_MAX < self._size and self._on_full is not None:
+            self._on_full()
+
+    def _index_owners(self) -> None:
+        """Track factsheet and each topic in topics outline."""
+        self._owners.clear()
+        self._add_owner(self._sheet)
+        for topic in self._sheet.topics():
+            self._add_owner(topic)
+
+    def _on_stale(self, p_source: ABC_STALE.InterfaceStaleFile) -> None:
+        """Note edit to factsheet and schedule journal session.
+
+        :param p_source: model component that became stale.
+        """
+        try:
+            entry = self._owners[id(p_source)]
+        except KeyError:
+            return
+
+        self._dirty[id(p_source)] = entry
+        if self._id_flush is None:
+            self._id_flush = GLib.timeout_add(DELAY_FLUSH, self._on_timeout)
+
+    def _on_timeout(self) -> bool:
+        """Flush journal on main loop.
+
+        Return False so that GLib removes the timeout source.
+        """
+        self._id_flush = None
+        self.flush()
+        return False
+
+    @property
+    def path(self) -> Path:
+        """Return location of journal file."""
+        return self._path
+
+    def reset(self) -> None:
+        """Start empty journal for writer's latest save session.
+
+        Call method after each save of factsheet.  Edits before the
+        call are in the factsheet file.
+        """
+        if self._id_flush is not None:
+            _ = GLib.source_remove(self._id_flush)
+            self._id_flush = None
+        self._dirty.clear()
+        self._keys_journaled.clear()
+        self._index_owners()
+        header = _STRUCT_HEADER.pack(
+            MAGIC_JOURNAL, VERSION_JOURNAL, self._writer.mark)
+        self._size = len(header)
+        self._submit(self._task_create(header))
+
+    @property
+    def size(self) -> int:
+        """Return size of journal including sessions not yet written."""
+        return self._size
+
+    def stop(self) -> None:
+        """Stop journal and remove journal file.
+
+        Call method when factsheet closes or changes file.
+        """
+        try:
+            ABC_STALE.g_hooks_stale.remove(self._on_stale)
+        except ValueError:
+            return
+
+        if self._id_flush is not None:
+            _ = GLib.source_remove(self._id_flush)
+            self._id_flush = None
+        self._dirty.clear()
+        self._owners.clear()
+        self._submit(self._task_remove())
+
+    def _submit(self, p_task: typing.Callable[[], None]) -> None:
+        """Run file task on background save thread.
+
+        :param p_task: task to run.
+        """
+        _ = CSAVE.g_scheduler_save.submit(p_task)
+
+    def _task_append(self, p_session: bytes) -> typing.Callable[[], None]:
+        """Return task to append session to journal file.
+
+        :param p_session: records of session.
+        """
+        path = self._path
+
+        def task() -> None:
+            with path.open(mode='ab') as io_out:
+                io_out.write(p_session)
+                io_out.flush()
+                os.fsync(io_out.fileno())
+
+        return task
+
+    def _task_create(self, p_header: bytes) -> typing.Callable[[], None]:
+        """Return task to replace journal file with empty journal.
+
+        :param p_header: journal header.
+        """
+        path = self._path
+
+        def task() -> None:
+            with path.open(mode='wb') as io_out:
+                io_out.write(p_header)
+                io_out.flush()
+                os.fsync(io_out.fileno())
+
+        return task
+
+    def _task_remove(self) -> typing.Callable[[], None]:
+        """Return task to remove journal file."""
+        path = self._path
+
+        def task() -> None:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+        return task
+
+    def _task_truncate(self, p_size: int) -> typing.Callable[[], None]:
+        """Return task to remove incomplete session from end of journal.
+
+        :param p_size: size of committed content of journal.
+        """
+        path = self._path
+
+        def task() -> None:
+            with path.open(mode='r+b') as io_out:
+                _ = io_out.truncate(p_size)
+
+        return task
+
+
+class ReplayJournal:
+    """Applies journal sessions to factsheet loaded from file.
+
+    Replay recreates each journaled topic.  A recreated topic with a key
+    in the factsheet file replaces the topic from the file in place, so
+    that references to the topic remain valid.  The writer adopts each
+    recreated topic (see :meth:`.WriterSheet.adopt`).
+
+    :param p_reader: reader of factsheet file.
+    :param p_sheet: factsheet from reader.
+    :param p_writer: writer for factsheet file.
+    """
+
+    def __init__(self, p_reader: CFORMAT.ReaderSheet, p_sheet: MSHEET.Sheet,
+                 p_writer: CFORMAT.WriterSheet) -> None:
+        self._reader = p_reader
+        self._sheet = p_sheet
+        self._writer = p_writer
+        self._topics: typing.MutableMapping[
+            CFORMAT.KeyTopic, MTOPIC.Topic] = dict()
+        self._bodies: typing.MutableMapping[CFORMAT.KeyTopic, bytes] = dict()
+        self._heads: typing.MutableMapping[
+            CFORMAT.KeyTopic, typing.Tuple[typing.Any, ...]] = dict()
+
+    def apply(self, p_session: typing.Sequence[typing.Tuple[int, bytes]]
+              ) -> None:
+        """Apply one journal session to factsheet.
+
+        :param p_session: kind and payload of each record in session.
+        :raises FormatError: when session is inconsistent.
+        """
+        self._bodies.clear()
+        self._heads.clear()
+        lines = None
+        texts = list()
+        for kind, payload in p_session:
+            if CFORMAT.KindRecord.TOPIC_HEAD == kind:
+                key, identity = CFORMAT.split_key(payload)
+                self._heads[key] = pickle.loads(identity)
+            elif CFORMAT.KindRecord.TOPIC == kind:
+                key, body = CFORMAT.split_key(payload)
+                self._bodies[key] = body
+            elif CFORMAT.KindRecord.TEXT == kind:
+                texts.append(pickle.loads(payload))
+            elif CFORMAT.KindRecord.OUTLINE == kind:
+                lines = payload
+        while self._bodies:
+            _ = self._load_topic(next(iter(self._bodies)))
+        for key, identity in self._heads.items():
+            topic = self.topic(key)
+            if topic is None:
+                raise CFORMAT.FormatError(
+                    'Journal names missing topic {}.'.format(key))
+            for name, text in zip(_NAMES_TEXT, identity):
+                getattr(topic, name).text = text.text
+        for key, name, text in texts:
+            owner = self._sheet if key is None else self.topic(key)
+            if owner is None:
+                raise CFORMAT.FormatError(
+                    'Journal names missing topic {}.'.format(key))
+            getattr(owner, name).text = text
+        if lines is not None:
+            self._sheet.clear()
+            CFORMAT.insert_outline(
+                self._sheet, CFORMAT.decode_outline(lines), self.topic)
+        self._heads.clear()
+
+    def _load_topic(self, p_key: CFORMAT.KeyTopic) -> MTOPIC.Topic:
+        """Return topic recreated from journaled body.
+
+        :param p_key: key of topic.
+        :raises FormatError: when journal contains no identity for
+            topic.
+        """
+        body = self._bodies.pop(p_key)
+        identity = self._heads.pop(p_key, None)
+        if identity is None:
+            raise CFORMAT.FormatError(
+                'Journal contains no identity for topic {}.'.format(p_key))
+
+        class_topic, state = CFORMAT.UnpicklerTopic(
+            io.BytesIO(body), self._resolve).load()
+        state.update(zip(_NAMES_TEXT, identity))
+        topic = self.topic(p_key)
+        if topic is None:
+            topic = class_topic.__new__(class_topic)
+        else:
+            if isinstance(topic, CFORMAT.TopicLazy):
+                _ = topic.load_body()
+        CFORMAT.restore_topic(topic, class_topic, state)
+        topic.set_stale()
+        self._topics[p_key] = topic
+        self._writer.adopt(p_key, topic)
+        return topic
+
+    def _resolve(self, p_key: CFORMAT.KeyTopic) -> MTOPIC.Topic:
+        """Return topic that journaled topic refers to.
+
+        A new topic that refers to itself through other new topics has
+        no topic for key.
+
+        :param p_key: key of topic referenced.
+        :raises FormatError: when there is no topic for key.
+        """
+        if p_key in self._bodies:
+            return self._load_topic(p_key)
+
+        topic = self.topic(p_key)
+        if topic is None:
+            raise CFORMAT.FormatError(
+                'Reference to missing topic {}.'.format(p_key))
+
+        return topic
+
+    def topic(self, p_key: CFORMAT.KeyTopic
+              ) -> typing.Optional[MTOPIC.Topic]:
+        """Return topic for key or None when there is no topic for key.
+
+        :param p_key: key of desired topic.
+        """
+        try:
+            return self._topics[p_key]
+        except KeyError:
+            return self._reader.topic(p_key)
+
+
+def path_journal(p_path: Path) -> Path:
+    """Return location of journal for factsheet file.
+
+    :param p_path: location of factsheet file.
+    """
+    return p_path.with_name(p_path.name + '.journal')
+
+
+def replay(p_io: typing.BinaryIO, p_reader: CFORMAT.ReaderSheet,
+           p_sheet: MSHEET.Sheet, p_writer: CFORMAT.WriterSheet
+           ) -> typing.Optional[int]:
+    """Apply journal to factsheet and return size of committed content
+    of journal.
+
+    Return None when journal does not apply to save session of
+    factsheet file.  Function ignores an incomplete session at the end
+    of the journal.
+
+    :param p_io: open journal file.
+    :param p_reader: reader of factsheet file.
+    :param p_sheet: factsheet from reader.
+    :param p_writer: writer for factsheet file.
+    :raises FormatError: when journal is not valid.
+    """
+    header = p_io.read(_STRUCT_HEADER.size)
+    if len(header) < _STRUCT_HEADER.size:
+        return None
+
+    magic, version, mark = _STRUCT_HEADER.unpack(header)
+    if MAGIC_JOURNAL != magic:
+        raise CFORMAT.FormatError('File is not a factsheet journal.')
+
+    if VERSION_JOURNAL < version:
+        raise CFORMAT.FormatError(
+            'Journal version {} is newer than supported version {}.'
+            ''.format(version, VERSION_JOURNAL))
+
+    if p_reader.mark is None or mark != p_reader.mark:
+        return None
+
+    replayer = ReplayJournal(p_reader, p_sheet, p_writer)
+    size = p_io.tell()
+    for session in CFORMAT.iter_sessions(p_io):
+        replayer.apply(session)
+        size = p_io.tell()
+    return size
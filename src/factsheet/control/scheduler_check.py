@@ -0,0 +1,149 @@
+"""
+Defines scheduler to check facts on a worker pool rather than on the
+GTK main loop.
+
+:doc:`../guide/devel_notes` explains how application Factsheet is based
+on a Model-View-Controller (MVC) design.  The scheduler runs
+:meth:`.Fact.compute` on a worker and then applies the outcome to the
+fact on the main loop (see :meth:`.Fact.apply_outcome`).  While a check
+is in progress, fact status is :data:`.StatusOfFact.PENDING`.
+
+.. data:: g_scheduler_check
+
+    Scheduler shared by all topic controls.
+"""
+import concurrent.futures as CF
+import logging
+import typing
+
+import factsheet.model.fact as MFACT
+
+from gi.repository import GLib   # type: ignore[import]
+
+logger = logging.getLogger('Main.scheduler_check')
+
+
+class SchedulerCheck:
+    """Runs fact checks on a worker pool.
+
+    The scheduler submits :meth:`.Fact.compute` to an executor.  When
+    the computation finishes, the scheduler applies the outcome to the
+    fact on the GTK main loop with `GLib.idle_add`_.  The scheduler
+    discards an outcome when the fact was cleared or checked again
+    after the computation started.
+
+    A fact that does not override :meth:`.Fact.compute` determines its
+    value in :meth:`.Fact.check`.  The scheduler checks such a fact on
+    the main loop.  The scheduler also applies an outcome from the
+    outcome cache (see :data:`.g_cache_outcome`) on the main loop
+    without submitting a computation.
+
+    .. _GLib.idle_add:
+        https://lazka.github.io/pgi-docs/GLib-2.0/functions.html
+        #GLib.idle_add
+
+    :param p_executor: pool to run computations.  Default is a thread
+        pool.  A process pool requires facts and outcomes that pickle.
+    """
+
+    def __init__(self, p_executor: typing.Optional[CF.Executor] = None
+                 ) -> None:
+        if p_executor is None:
+            p_executor = CF.ThreadPoolExecutor(
+                thread_name_prefix='CheckFact')
+        self._executor = p_executor
+        self._pending: typing.MutableMapping[
+            MFACT.TagFact, typing.Tuple[MFACT.Fact, CF.Future]] = dict()
+
+    def _apply(self, p_fact: MFACT.Fact, p_generation: MFACT.GenerationCheck,
+               p_future: CF.Future) -> bool:
+        """Apply outcome of computation to fact on main loop.
+
+        Ignore a computation that the scheduler cancelled or replaced.
+        Log and mark fact undefined when computation failed.  Return
+        False so that GLib removes the idle source.
+
+        :param p_fact: fact checked.
+        :param p_generation: generation of fact when check started.
+        :param p_future: finished computation.
+        """
+        _fact, future = self._pending.get(p_fact.tag, (None, None))
+        if future is not p_future:
+            return False
+
+        del self._pending[p_fact.tag]
+        if p_future.cancelled() or p_fact.generation != p_generation:
+            return False
+
+        try:
+            status, value = p_future.result()
+        except Exception as err:
+            logger.error('Check of fact {} failed: {} ({}.{})'.format(
+                p_fact.tag, err, self.__class__.__name__,
+                self._apply.__name__))
+            status, value = MFACT.StatusOfFact.UNDEFINED, None
+        p_fact.apply_outcome(status, value)
+        return False
+
+    def cancel(self, p_fact: MFACT.Fact) -> None:
+        """Cancel check in progress for fact, if any.
+
+        A computation that a worker started already runs to completion,
+        but the scheduler discards the outcome.
+
+        :param p_fact: fact with check to cancel.
+        """
+        try:
+            _fact, future = self._pending.pop(p_fact.tag)
+        except KeyError:
+            return
+
+        _ = future.cancel()
+
+    def cancel_all(self) -> None:
+        """Cancel all checks in progress."""
+        for _fact, future in self._pending.values():
+            _ = future.cancel()
+        self._pending.clear()
+
+    def check(self, p_fact: MFACT.Fact) -> None:
+        """Start check of fact on worker pool.
+
+        A new check of a fact replaces a check in progress.
+
+        :param p_fact: fact to check.
+        """
+        if type(p_fact).compute is MFACT.Fact.compute:
+            _ = p_fact.check()
+            return
+
+        self.cancel(p_fact)
+        outcome = p_fact.outcome_cached()
+        if outcome is not None:
+            status, value = outcome
+            p_fact.apply_outcome(status, value)
+            return
+
+        generation = p_fact.mark_pending()
+        future = self._executor.submit(p_fact.compute_cached)
+        self._pending[p_fact.tag] = (p_fact, future)
+
+        def on_done(p_future: CF.Future) -> None:
+            GLib.idle_add(self._apply, p_fact, generation, p_future)
+
+        future.add_done_callback(on_done)
+
+    def is_pending(self, p_fact: MFACT.Fact) -> bool:
+        """Return True when check of fact is in progress.
+
+        :param p_fact: fact to test.
+        """
+        return p_fact.tag in self._pending
+
+    def shutdown(self) -> None:
+        """Cancel checks in progress and release worker pool."""
+        self.cancel_all()
+        self._executor.shutdown(wait=False)
+
+
+g_scheduler_check = SchedulerCheck()
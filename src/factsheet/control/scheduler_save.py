@@ -0,0 +1,90 @@
+"""
+Defines scheduler to finish factsheet saves on a background thread
+rather than on the GTK main loop.
+
+:doc:`../guide/devel_notes` explains how application Factsheet is based
+on a Model-View-Controller (MVC) design.  A factsheet control writes a
+snapshot of a factsheet on the main loop and then submits the slow part
+of the save (flush to storage and replacement of the factsheet file) to
+the scheduler (see :meth:`.ControlSheet.save_background`).  The
+scheduler reports the outcome on the main loop.
+
+.. data:: g_scheduler_save
+
+    Scheduler shared by all factsheet controls.
+"""
+import concurrent.futures as CF
+import logging
+import typing
+
+from gi.repository import GLib   # type: ignore[import]
+
+logger = logging.getLogger('Main.scheduler_save')
+
+OnDoneSave = typing.Callable[[typing.Optional[Exception]], None]
+
+
+class SchedulerSave:
+    """Runs save tasks one at a time on a background thread.
+
+    The scheduler runs tasks in the order submitted so that a save
+    finishes before the next save of any factsheet begins.  When a task
+    finishes, the scheduler calls the task's completion function on the
+    GTK main loop with `GLib.idle_add`_.
+
+    .. _GLib.idle_add:
+        https://lazka.github.io/pgi-docs/GLib-2.0/functions.html
+        #GLib.idle_add
+
+    :param p_executor: executor to run tasks.  Default is a thread pool
+        with one worker.
+    """
+
+    def __init__(self, p_executor: typing.Optional[CF.Executor] = None
+                 ) -> None:
+        if p_executor is None:
+            p_executor = CF.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='SaveSheet')
+        self._executor = p_executor
+
+    def _report(self, p_future: CF.Future,
+                p_on_done: typing.Optional[OnDoneSave]) -> bool:
+        """Report outcome of task on main loop.
+
+        Return False so that GLib removes the idle source.
+
+        :param p_future: finished task.
+        :param p_on_done: function to call with exception raised by task
+            or with None when task succeeded.
+        """
+        error = p_future.exception()
+        if error is not None:
+            logger.error('Save failed: {} ({}.{})'.format(
+                error, self.__class__.__name__, self._report.__name__))
+        if p_on_done is not None:
+            p_on_done(error)
+        return False
+
+    def shutdown(self) -> None:
+        """Wait for tasks in progress and release worker."""
+        self._executor.shutdown(wait=True)
+
+    def submit(self, p_task: typing.Callable[[], None],
+               p_on_done: typing.Optional[OnDoneSave] = None
+               ) -> CF.Future:
+        """Start task on background thread and return future for task.
+
+        :param p_task: task to run.
+        :param p_on_done: function to call on main loop when task
+            finishes.  See :meth:`_report`.
+        """
+        future = self._executor.submit(p_task)
+
+        def on_done(p_future: CF.Future) -> None:
+            GLib.idle_add(self._report, p_future, p_on_done)
+
+        future.add_done_callback(on_done)
+        return future
+
+
+g_scheduler_save = SchedulerSave()
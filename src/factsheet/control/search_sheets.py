@@ -0,0 +1,432 @@
+"""
+Defines full-text search across open factsheets.
+
+:doc:`../guide/devel_notes` explains how application Factsheet is based
+on a Model-View-Controller (MVC) design.  The search engine indexes the
+name, summary, and title of each topic in each open factsheet along
+with the note of each fact of the topic.  Each document of the index is
+a topic, identified by the tags of the factsheet and the topic, so that
+a view can navigate to each search result (see
+:meth:`.ControlApp.search`).
+
+The engine reads text on the main loop and tokenizes text on a
+background thread, so that opening a large factsheet does not stall
+the user interface.  The engine learns of edits through stale hooks
+(see :func:`.notify_stale`).  An edit marks a topic or factsheet for
+update, and the engine applies the update at the next search.
+
+The engine does not load the body of a lazy topic (see
+:class:`.TopicLazy`).  Until the body loads, the engine indexes only
+the name, summary, and title of the topic.  The engine indexes the
+facts of the topic once the body loads (see :func:`.notify_body`).
+
+A query is a sequence of words.  A result contains every word of the
+query.  A word that ends with :data:`MARK_PREFIX` matches any word
+that begins with the rest of the query word.  The engine ranks results
+by term frequency and inverse document frequency, with matches in a
+name weighted over matches in a title, summary, or note.
+
+.. data:: HitSearch
+
+    Type hint for search result: factsheet tag, topic tag, and score.
+
+.. data:: KeyDoc
+
+    Type hint for identifier of document in index: factsheet tag and
+    topic tag.
+
+.. data:: MARK_PREFIX
+
+    Suffix of a query word that matches words by prefix.
+
+.. data:: WEIGHT_NAME
+
+    Weight of word in name of topic.
+
+.. data:: WEIGHT_NOTE
+
+    Weight of word in note of fact.
+
+.. data:: WEIGHT_SUMMARY
+
+    Weight of word in summary of topic.
+
+.. data:: WEIGHT_TITLE
+
+    Weight of word in title of topic.
+"""
+import bisect
+import concurrent.futures as CF
+import logging
+import math
+import re
+import threading
+import typing
+
+import factsheet.abc_types.abc_stalefile as ABC_STALE
+import factsheet.control.format_sheet as CFORMAT
+import factsheet.model.sheet as MSHEET
+import factsheet.model.topic as MTOPIC
+
+logger = logging.getLogger('Main.search_sheets')
+
+KeyDoc = typing.Tuple[MSHEET.TagSheet, MTOPIC.TagTopic]
+HitSearch = typing.Tuple[MSHEET.TagSheet, MTOPIC.TagTopic, float]
+TextsDoc = typing.List[typing.Tuple[float, str]]
+
+MARK_PREFIX = '*'
+WEIGHT_NAME = 3.0
+WEIGHT_NOTE = 1.0
+WEIGHT_SUMMARY = 1.0
+WEIGHT_TITLE = 2.0
+
+_RE_MARKUP = re.compile(r'<[^>]*>')
+_RE_WORD = re.compile(r'\w+')
+
+
+class EngineSearch:
+    """Ranked full-text index of topics in open factsheets.
+
+    Methods are for use on the main loop.  A search returns results
+    for documents indexed so far.  The background thread may still be
+    indexing a factsheet added recently (see :meth:`wait`).  The
+    engine follows edits while the index contains at least one
+    factsheet.
+
+    :param p_executor: executor to tokenize text.  Default is a thread
+        pool with one worker.  The executor must run tasks in the order
+        submitted.
+    """
+
+    def __init__(self, p_executor: typing.Optional[CF.Executor] = None
+                 ) -> None:
+        if p_executor is None:
+            p_executor = CF.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='SearchSheet')
+        self._executor = p_executor
+        self._lock = threading.Lock()
+        self._postings: typing.Dict[str, typing.Dict[KeyDoc, float]] = (
+            dict())
+        self._terms_doc: typing.Dict[KeyDoc, typing.Dict[str, float]] = (
+            dict())
+        self._terms_sorted: typing.Optional[typing.List[str]] = None
+        self._sheets: typing.Dict[MSHEET.TagSheet, MSHEET.Sheet] = dict()
+        self._sheets_stale: typing.Set[MSHEET.TagSheet] = set()
+        self._topics: typing.Dict[KeyDoc, MTOPIC.Topic] = dict()
+        self._topics_stale: typing.Set[KeyDoc] = set()
+        self._sources: typing.Dict[int, typing.Tuple[
+            typing.Any, typing.Optional[KeyDoc]]] = dict()
+
+    def add_sheet(self, p_sheet: MSHEET.Sheet) -> None:
+        """Add topics of factsheet to index.
+
+        Engine reads topic text immediately and indexes the text in the
+        background.
+
+        :param p_sheet: factsheet to add.
+        """
+        self.start_updates()
+        self._sheets[p_sheet.tag] = p_sheet
+        self._sources[id(p_sheet)] = (p_sheet, None)
+        batch = list()
+        for topic in p_sheet.topics():
+            batch.append(self._add_topic(p_sheet.tag, topic))
+        _ = self._executor.submit(self._index_docs, batch)
+
+    def _add_topic(self, p_tag_sheet: MSHEET.TagSheet,
+                   p_topic: MTOPIC.Topic
+                   ) -> typing.Tuple[KeyDoc, TextsDoc]:
+        """Track topic and return document key and text for topic.
+
+        :param p_tag_sheet: factsheet of topic.
+        :param p_topic: topic to track.
+        """
+        key = (p_tag_sheet, p_topic.tag)
+        self._topics[key] = p_topic
+        self._sources[id(p_topic)] = (p_topic, key)
+        for _weight, source in sources_topic(p_topic):
+            self._sources[id(source)] = (source, key)
+        return key, texts_topic(p_topic)
+
+    def _index_docs(self, p_batch: typing.Sequence[
+            typing.Tuple[KeyDoc, typing.Optional[TextsDoc]]]) -> None:
+        """Replace documents in index.  Runs on background thread.
+
+        :param p_batch: document keys, each with text of document or
+            None to remove document.
+        """
+        for key, texts in p_batch:
+            terms: typing.Dict[str, float] = dict()
+            for weight, text in texts or ():
+                for word in tokenize(text):
+                    terms[word] = terms.get(word, 0.0) + weight
+            with self._lock:
+                self._remove_doc(key)
+                if texts is None:
+                    continue
+
+                self._terms_doc[key] = terms
+                for word, weight in terms.items():
+                    try:
+                        self._postings[word][key] = weight
+                    except KeyError:
+                        self._postings[word] = {key: weight}
+                        self._terms_sorted = None
+
+    def _match_word(self, p_word: str) -> typing.Dict[KeyDoc, float]:
+        """Return score of each document that matches query word.
+
+        Call with lock held.
+
+        :param p_word: query word, which may end with
+            :data:`MARK_PREFIX`.
+        """
+        if p_word.endswith(MARK_PREFIX):
+            prefix = p_word[:-len(MARK_PREFIX)]
+            terms = self._terms_prefix(prefix)
+        else:
+            terms = [p_word]
+        n_docs = len(self._terms_doc)
+        scores: typing.Dict[KeyDoc, float] = dict()
+        for term in terms:
+            posting = self._postings.get(term, dict())
+            if not posting:
+                continue
+
+            idf = math.log(1.0 + n_docs / len(posting))
+            for key, weight in posting.items():
+                scores[key] = scores.get(key, 0.0) + weight * idf
+        return scores
+
+    def on_body(self, p_topic: MTOPIC.Topic) -> None:
+        """Mark topic for update when its body loads from file.
+
+        The body of a topic may load on a background thread.  See
+        :func:`.notify_body`.
+
+        :param p_topic: topic that is no longer lazy.
+        """
+        self.on_stale(p_topic)
+
+    def on_stale(self, p_source: ABC_STALE.InterfaceStaleFile) -> None:
+        """Mark topic or factsheet for update when its text or topics
+        outline changes.
+
+        Engine ignores other model components.  See
+        :func:`.notify_stale`.
+
+        :param p_source: model component that changed.
+        """
+        try:
+            source, key = self._sources[id(p_source)]
+        except KeyError:
+            return
+
+        if key is None:
+            self._sheets_stale.add(source.tag)
+        else:
+            self._topics_stale.add(key)
+
+    def remove_sheet(self, p_sheet: MSHEET.Sheet) -> None:
+        """Remove topics of factsheet from index.
+
+        :param p_sheet: factsheet to remove.
+        """
+        tag_sheet = p_sheet.tag
+        if self._sheets.pop(tag_sheet, None) is None:
+            return
+
+        _ = self._sources.pop(id(p_sheet), None)
+        self._sheets_stale.discard(tag_sheet)
+        keys = [k for k in self._topics if k[0] == tag_sheet]
+        for key in keys:
+            self._remove_topic(key)
+        _ = self._executor.submit(
+            self._index_docs, [(k, None) for k in keys])
+        if not self._sheets:
+            self.stop_updates()
+
+    def _remove_doc(self, p_key: KeyDoc) -> None:
+        """Remove document from index.  Call with lock held.
+
+        :param p_key: document to remove.
+        """
+        terms = self._terms_doc.pop(p_key, None)
+        if terms is None:
+            return
+
+        for word in terms:
+            posting = self._postings[word]
+            del posting[p_key]
+            if not posting:
+                del self._postings[word]
+                self._terms_sorted = None
+
+    def _remove_topic(self, p_key: KeyDoc) -> None:
+        """Stop tracking topic.
+
+        :param p_key: document key of topic.
+        """
+        topic = self._topics.pop(p_key)
+        self._topics_stale.discard(p_key)
+        _ = self._sources.pop(id(topic), None)
+        for _weight, source in sources_topic(topic):
+            _ = self._sources.pop(id(source), None)
+
+    def search(self, p_query: str, p_n_max: int = 50
+               ) -> typing.List[HitSearch]:
+        """Return best results for query, best first.
+
+        Call from main loop.  Method first submits updates for topics
+        and factsheets that changed since the last search.
+
+        :param p_query: words to find (see :mod:`.search_sheets`).
+        :param p_n_max: maximum number of results.
+        """
+        self.sync()
+        words = parse_query(p_query)
+        if not words:
+            return list()
+
+        with self._lock:
+            scores = self._match_word(words[0])
+            for word in words[1:]:
+                if not scores:
+                    break
+
+                scores_word = self._match_word(word)
+                scores = {k: s + scores_word[k] for k, s in scores.items()
+                          if k in scores_word}
+        ranked = sorted(scores.items(), key=lambda ks: (-ks[1], ks[0]))
+        return [(k[0], k[1], s) for k, s in ranked[:p_n_max]]
+
+    def shutdown(self) -> None:
+        """Stop following edits and stop background thread."""
+        self.stop_updates()
+        self._executor.shutdown(wait=True)
+
+    def start_updates(self) -> None:
+        """Follow edits to factsheets and loads of topic bodies.  See
+        :data:`.g_hooks_stale` and :data:`.g_hooks_body`.
+        """
+        if self.on_stale not in ABC_STALE.g_hooks_stale:
+            ABC_STALE.g_hooks_stale.append(self.on_stale)
+        if self.on_body not in CFORMAT.g_hooks_body:
+            CFORMAT.g_hooks_body.append(self.on_body)
+
+    def stop_updates(self) -> None:
+        """Stop following edits to factsheets and loads of topic
+        bodies.
+        """
+        try:
+            ABC_STALE.g_hooks_stale.remove(self.on_stale)
+        except ValueError:
+            pass
+        try:
+            CFORMAT.g_hooks_body.remove(self.on_body)
+        except ValueError:
+            pass
+
+    def sync(self) -> None:
+        """Submit updates for topics and factsheets that changed."""
+        batch: typing.List[typing.Tuple[
+            KeyDoc, typing.Optional[TextsDoc]]] = list()
+        for tag_sheet in self._sheets_stale:
+            sheet = self._sheets[tag_sheet]
+            topics = {t.tag: t for t in sheet.topics()}
+            for key in [k for k in self._topics if k[0] == tag_sheet]:
+                if key[1] not in topics:
+                    self._remove_topic(key)
+                    batch.append((key, None))
+            for tag_topic, topic in topics.items():
+                if (tag_sheet, tag_topic) not in self._topics:
+                    batch.append(self._add_topic(tag_sheet, topic))
+        self._sheets_stale.clear()
+        while self._topics_stale:
+            key = self._topics_stale.pop()
+            batch.append(self._add_topic(key[0], self._topics[key]))
+        if batch:
+            _ = self._executor.submit(self._index_docs, batch)
+
+    def _terms_prefix(self, p_prefix: str) -> typing.List[str]:
+        """Return words in index that begin with prefix.
+
+        Call with lock held.
+
+        :param p_prefix: beginning of words.
+        """
+        if self._terms_sorted is None:
+            self._terms_sorted = sorted(self._postings)
+        terms = self._terms_sorted
+        i = bisect.bisect_left(terms, p_prefix)
+        matches = list()
+        while i < len(terms) and terms[i].startswith(p_prefix):
+            matches.append(terms[i])
+            i += 1
+        return matches
+
+    def wait(self) -> None:
+        """Wait until background thread indexes all text submitted."""
+        self._executor.submit(lambda: None).result()
+
+
+def facts_topic(p_topic: MTOPIC.Topic) -> typing.List[typing.Any]:
+    """Return facts of topic in memory.
+
+    Return no facts for a lazy topic, so that indexing does not load the
+    topic body (see :class:`.TopicLazy`).
+
+    :param p_topic: topic of facts.
+    """
+    if isinstance(p_topic, CFORMAT.TopicLazy):
+        return list()
+
+    return list(p_topic.iter_facts())
+
+
+def parse_query(p_query: str) -> typing.List[str]:
+    """Return query words in lower case.
+
+    A word keeps :data:`MARK_PREFIX` when the query word ends with the
+    mark.
+
+    :param p_query: words to find.
+    """
+    words = list()
+    for part in p_query.split():
+        tokens = tokenize(part)
+        if tokens and part.endswith(MARK_PREFIX):
+            tokens[-1] += MARK_PREFIX
+        words.extend(tokens)
+    return words
+
+
+def sources_topic(p_topic: MTOPIC.Topic
+                  ) -> typing.List[typing.Tuple[float, typing.Any]]:
+    """Return text models of topic and of its facts, each with weight.
+
+    :param p_topic: topic to index.
+    """
+    sources = [(WEIGHT_NAME, p_topic.name),
+               (WEIGHT_SUMMARY, p_topic.summary),
+               (WEIGHT_TITLE, p_topic.title)]
+    for fact in facts_topic(p_topic):
+        sources.append((WEIGHT_NOTE, fact.note))
+    return sources
+
+
+def texts_topic(p_topic: MTOPIC.Topic) -> TextsDoc:
+    """Return text of topic and of its facts, each with weight.
+
+    :param p_topic: topic to index.
+    """
+    return [(w, s.text) for w, s in sources_topic(p_topic)]
+
+
+def tokenize(p_text: str) -> typing.List[str]:
+    """Return words of text in lower case, ignoring markup.
+
+    :param p_text: text to split.
+    """
+    return _RE_WORD.findall(_RE_MARKUP.sub(' ', p_text).lower())
+
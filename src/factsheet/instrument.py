@@ -0,0 +1,265 @@
+"""
+Defines named timers and counters for hot paths of Factsheet.
+
+Components report to :data:`g_instruments`.  A timer records the number
+of runs, total seconds, and longest run of a named block of code (see
+:meth:`.Instruments.timer` and :func:`timed`).  A counter records the
+number of a named event (see :meth:`.Instruments.count`).  A run longer
+than :data:`SECONDS_SLOW` logs a warning, so the log names the code
+that was running when a window froze.  The application logs a summary
+of timers and counters at shutdown.
+
+Instruments also capture an optional profile of the main thread with
+:mod:`cProfile` (see :meth:`.Instruments.toggle_profile`).
+
+.. data:: g_instruments
+
+    Timers, counters, and profile for the Factsheet session.
+
+.. data:: N_LINES_PROFILE
+
+    Number of functions in profile report.
+
+.. data:: PATH_PROFILE
+
+    Default location of profile statistics (see :mod:`pstats`).
+
+.. data:: SECONDS_SLOW
+
+    Duration of a timed run that logs a warning.
+"""
+import contextlib
+import cProfile
+import functools
+import io
+import logging
+from pathlib import Path
+import pstats
+import threading
+import time
+import typing
+
+logger = logging.getLogger('Main.instrument')
+
+N_LINES_PROFILE = 25
+PATH_PROFILE = Path('factsheet.prof')
+SECONDS_SLOW = 0.1
+
+CallableAny = typing.TypeVar('CallableAny', bound=typing.Callable)
+
+
+class StatsTimer:
+    """Running statistics for runs of a named timer."""
+
+    def __init__(self) -> None:
+        self.n_runs = 0
+        self.seconds_max = 0.0
+        self.seconds_total = 0.0
+
+    def add(self, p_seconds: float) -> None:
+        """Include run of given duration in statistics.
+
+        :param p_seconds: duration of run.
+        """
+        self.n_runs += 1
+        self.seconds_total += p_seconds
+        if self.seconds_max < p_seconds:
+            self.seconds_max = p_seconds
+
+
+class Instruments:
+    """Named timers and counters with optional profile capture.
+
+    Methods are safe to call from any thread.  For example, a factsheet
+    saves on a background thread (see :mod:`.scheduler_save`).  A
+    profile captures only the thread that starts it.
+    """
+
+    def __init__(self) -> None:
+        self._counters: typing.Dict[str, int] = dict()
+        self._lock = threading.Lock()
+        self._profile: typing.Optional[cProfile.Profile] = None
+        self._timers: typing.Dict[str, StatsTimer] = dict()
+
+    def clear(self) -> None:
+        """Reset all timers and counters."""
+        with self._lock:
+            self._counters.clear()
+            self._timers.clear()
+
+    def count(self, p_name: str, p_n: int = 1) -> None:
+        """Add to named counter.
+
+        :param p_name: name of counter.
+        :param p_n: amount to add.
+        """
+        with self._lock:
+            self._counters[p_name] = self._counters.get(p_name, 0) + p_n
+
+    def is_profiling(self) -> bool:
+        """Return True when a profile capture is in progress."""
+        return self._profile is not None
+
+    def log_summary(self) -> None:
+        """Log summary of timers and counters for the session."""
+        lines = self.summary()
+        if not lines:
+            logger.info('Session summary: no timed runs or counts.')
+            return
+
+        logger.info('Session summary:\n    {}'.format('\n    '.join(lines)))
+
+    def record(self, p_name: str, p_seconds: float) -> None:
+        """Add run of given duration to named timer.
+
+        Log a warning when the run is slow.
+
+        :param p_name: name of timer.
+        :param p_seconds: duration of run.
+        """
+        with self._lock:
+            stats = self._timers.get(p_name)
+            if stats is None:
+                stats = StatsTimer()
+                self._timers[p_name] = stats
+            stats.add(p_seconds)
+        if SECONDS_SLOW <= p_seconds:
+            logger.warning('Slow run of {}: {:.3f}s'.format(
+                p_name, p_seconds))
+
+    def start_profile(self) -> None:
+        """Start profile capture of the current thread.
+
+        Do nothing when a capture is in progress.
+        """
+        if self._profile is not None:
+            return
+
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+        logger.info('Profile started.')
+
+    def stop_profile(self, p_path: Path = PATH_PROFILE
+                     ) -> typing.Optional[Path]:
+        """Stop profile capture, save statistics, and log report.
+
+        Return location of statistics file or None when there is no
+        capture in progress or when statistics cannot be saved.
+
+        :param p_path: location for statistics file.
+        """
+        if self._profile is None:
+            return None
+
+        profile = self._profile
+        self._profile = None
+        profile.disable()
+        io_report = io.StringIO()
+        stats = pstats.Stats(profile, stream=io_report)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(
+            N_LINES_PROFILE)
+        logger.info('Profile stopped.\n{}'.format(io_report.getvalue()))
+        try:
+            stats.dump_stats(str(p_path))
+        except OSError as err:
+            logger.error('Could not save profile to {}: {}'.format(
+                p_path, err))
+            return None
+
+        return p_path
+
+    def summary(self) -> typing.List[str]:
+        """Return line of text for each timer and counter.
+
+        Timers appear first, from most to least total time.  Counters
+        follow in order of name.
+        """
+        with self._lock:
+            timers = sorted(self._timers.items(),
+                            key=lambda p: (-p[1].seconds_total, p[0]))
+            counters = sorted(self._counters.items())
+        lines = list()
+        for name, stats in timers:
+            lines.append(
+                '{}: {} runs, {:.3f}s total, {:.3f}ms mean, {:.3f}ms max'
+                ''.format(name, stats.n_runs, stats.seconds_total,
+                          1000 * stats.seconds_total / stats.n_runs,
+                          1000 * stats.seconds_max))
+        for name, n in counters:
+            lines.append('{}: {}'.format(name, n))
+        return lines
+
+    @contextlib.contextmanager
+    def timer(self, p_name: str) -> typing.Iterator[None]:
+        """Return context that times its block with named timer.
+
+        The timer records the run even when the block raises an
+        exception.
+
+        :param p_name: name of timer.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(p_name, time.perf_counter() - start)
+
+    def toggle_profile(self) -> bool:
+        """Start profile capture or stop capture in progress.
+
+        Return True when capture is in progress after toggle.
+        """
+        if self._profile is None:
+            self.start_profile()
+        else:
+            _ = self.stop_profile()
+        return self.is_profiling()
+
+
+def time_signal(p_source: typing.Any, p_signal: str, p_name: str
+                ) -> None:
+    """Time each emission of signal with named timer of
+    :data:`g_instruments`.
+
+    The timer covers handlers connected after the call, along with the
+    default handler.  For example, time each search of a tree view by
+    timing the ``changed`` signal of the search entry before the view
+    connects to the entry.  A whole search then counts as one run
+    rather than one run for each row.
+
+    :param p_source: object that emits signal (for example, a
+        `GObject.Object`).
+    :param p_signal: name of signal.
+    :param p_name: name of timer.
+    """
+    starts: typing.List[float] = list()
+
+    def on_start(*_args: typing.Any) -> None:
+        starts.append(time.perf_counter())
+
+    def on_stop(*_args: typing.Any) -> None:
+        if starts:
+            g_instruments.record(p_name, time.perf_counter() - starts.pop())
+
+    _ = p_source.connect(p_signal, on_start)
+    _ = p_source.connect_after(p_signal, on_stop)
+
+
+def timed(p_name: str) -> typing.Callable[[CallableAny], CallableAny]:
+    """Return decorator that times each call with named timer of
+    :data:`g_instruments`.
+
+    :param p_name: name of timer.
+    """
+    def decorate(p_function: CallableAny) -> CallableAny:
+        @functools.wraps(p_function)
+        def wrapper(*args, **kwargs):
+            with g_instruments.timer(p_name):
+                return p_function(*args, **kwargs)
+
+        return typing.cast(CallableAny, wrapper)
+
+    return decorate
+
+
+g_instruments = Instruments()
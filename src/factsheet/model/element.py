@@ -59,10 +59,27 @@ class ElementOpaque(typing.Generic[MemberOpaque]):
     (label).  For consistency, the terms "indexed element" and
     "element" refer to a member-index pair.
 
+    An element holds only its member and index.  Style dispatch is a
+    class-level table of method names, so an element takes tens of
+    bytes.
+
+    .. data:: NAMES_STYLE
+
+        Map from style identifier to name of method for the style.
+
     :param member: member of new element.
     :param index: index of new element.
     """
 
+    __slots__ = ('_index', '_member')
+
+    NAMES_STYLE: typing.Mapping[str, str] = {
+        'Label': 'style_label',
+        'Element': 'style_element',
+        'Index': 'style_index',
+        'Member': 'style_member',
+        'Plain': 'style_plain',
+        }
     STYLE_DEFAULT = 'Plain'
 
     def __eq__(self, p_other: typing.Any) -> bool:
@@ -84,17 +101,40 @@ class ElementOpaque(typing.Generic[MemberOpaque]):
 
         return True
 
+    def __getstate__(self) -> typing.Dict:
+        """Return element in form pickle can persist.
+
+        Persistent form of element is a dictionary with member and
+        index, which is compatible with elements stored before
+        elements declared slots.
+        """
+        return dict(_member=self._member, _index=self._index)
+
     def __init__(
             self, p_member: MemberOpaque, p_index: IndexElement) -> None:
         self._member = p_member
         self._index = p_index
-        self._apply_style: typing.Mapping[str, typing.Callable[[str], str]] = {
-            'Label': self.style_label,
-            'Element': self.style_element,
-            'Index': self.style_index,
-            'Member': self.style_member,
-            'Plain': self.style_plain,
-            }
+
+    def __setstate__(self, p_state: typing.Any) -> None:
+        """Reconstruct element from state pickle loads.
+
+        State may be a dictionary of attributes, which may include
+        attributes of earlier releases (for example, a table of style
+        methods).  State may also be a pair of dictionaries, as pickle
+        stores for slotted objects by default.  Method keeps only member
+        and index.
+
+        :param p_state: unpickled state of stored element.
+        """
+        if isinstance(p_state, tuple):
+            state = dict()
+            for part in p_state:
+                if part:
+                    state.update(part)
+        else:
+            state = p_state
+        self._member = state['_member']
+        self._index = state['_index']
 
     def format(self, p_id_style: IdStyle,
                p_symbol: str = 'a') -> str:
@@ -110,10 +150,10 @@ class ElementOpaque(typing.Generic[MemberOpaque]):
         :param p_symbol: symbol to use in label.
         """
         try:
-            text = self._apply_style[p_id_style](p_symbol)
+            name = self.NAMES_STYLE[p_id_style]
         except KeyError:
-            text = self._apply_style[self.STYLE_DEFAULT](p_symbol)
-        return text
+            name = self.NAMES_STYLE[self.STYLE_DEFAULT]
+        return getattr(self, name)(p_symbol)
 
     @property
     def index(self):
@@ -127,7 +167,7 @@ class ElementOpaque(typing.Generic[MemberOpaque]):
 
     def ids_style(self) -> typing.Iterator[IdStyle]:
         """Return iterator over identifiers of styles the element supports."""
-        for id_style in self._apply_style:
+        for id_style in self.NAMES_STYLE:
             yield IdStyle(id_style)
 
     def style_element(self, p_symbol: str = 'a') -> str:
@@ -7,9 +7,13 @@ factsheet, topic, and fact layers.  Module ``fact`` defines
 the base class representing the model of a fact.  Additional classes
 specialize the model for facts about sets, operations, and so on.
 """
+import collections as COL
 import enum
+import sys
+import threading
 import typing
 
+import factsheet.instrument as INSTR
 import factsheet.model.aspect as MASPECT
 import factsheet.model.idcore as MIDCORE
 
@@ -43,6 +47,126 @@ AspectValuePlain = MASPECT.AspectPlain
 
 TopicOpaque = typing.TypeVar('TopicOpaque')
 
+GenerationCheck = typing.NewType('GenerationCheck', int)
+KeyOutcome = typing.Tuple[type, typing.Hashable]
+OutcomeCheck = typing.Tuple['StatusOfFact', typing.Any]
+
+
+class CacheOutcome:
+    """Least-recently-used cache of outcomes of fact checks.
+
+    Each key combines a fact class with a fingerprint of the fact's
+    topic content (see :meth:`.Topic.fingerprint`).  The cache evicts
+    least-recently-used outcomes when the estimated size of cached
+    values exceeds a memory cap or the number of outcomes exceeds a
+    limit.  The cache is safe to use from worker threads.
+
+    :param p_size_max: memory cap in bytes.
+    :param p_n_max: maximum number of outcomes.
+    """
+
+    def __init__(self, p_size_max: int = 64 * 2**20,
+                 p_n_max: int = 4096) -> None:
+        self._entries: typing.MutableMapping[
+            KeyOutcome, typing.Tuple[OutcomeCheck, int]] = COL.OrderedDict()
+        self._lock = threading.Lock()
+        self._n_hits = 0
+        self._n_max = p_n_max
+        self._n_misses = 0
+        self._size = 0
+        self._size_max = p_size_max
+
+    def __len__(self) -> int:
+        """Return number of cached outcomes."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all outcomes and reset hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._n_hits = 0
+            self._n_misses = 0
+            self._size = 0
+
+    def get(self, p_key: KeyOutcome) -> typing.Optional[OutcomeCheck]:
+        """Return cached outcome for key or None when cache has no
+        outcome for key.
+
+        :param p_key: fact class and topic fingerprint.
+        """
+        with self._lock:
+            try:
+                outcome, _size = self._entries[p_key]
+            except KeyError:
+                self._n_misses += 1
+                return None
+
+            self._entries.move_to_end(p_key)
+            self._n_hits += 1
+            return outcome
+
+    @property
+    def n_hits(self) -> int:
+        """Return number of lookups that found an outcome."""
+        return self._n_hits
+
+    @property
+    def n_misses(self) -> int:
+        """Return number of lookups that found no outcome."""
+        return self._n_misses
+
+    def put(self, p_key: KeyOutcome, p_outcome: OutcomeCheck) -> None:
+        """Add outcome to cache, evicting outcomes as needed.
+
+        The cache does not keep an outcome larger than the memory cap.
+
+        :param p_key: fact class and topic fingerprint.
+        :param p_outcome: status and value from fact check.
+        """
+        _status, value = p_outcome
+        size = size_of(value)
+        with self._lock:
+            try:
+                _outcome, size_old = self._entries.pop(p_key)
+                self._size -= size_old
+            except KeyError:
+                pass
+            if self._size_max < size:
+                return
+
+            self._entries[p_key] = (p_outcome, size)
+            self._size += size
+            while (self._size_max < self._size
+                   or self._n_max < len(self._entries)):
+                _key, (_outcome, size_old) = self._entries.popitem(
+                    last=False)
+                self._size -= size_old
+
+    @property
+    def size(self) -> int:
+        """Return estimated size in bytes of cached values."""
+        return self._size
+
+
+def size_of(p_value: typing.Any) -> int:
+    """Return estimated size in bytes of value.
+
+    The estimate includes the value and the objects it refers to
+    directly, but not objects further down.
+
+    :param p_value: value to measure.
+    """
+    size = sys.getsizeof(p_value)
+    contents = getattr(p_value, '__dict__', None)
+    if isinstance(p_value, dict):
+        contents = p_value
+    if isinstance(contents, dict):
+        for key, item in contents.items():
+            size += sys.getsizeof(key) + sys.getsizeof(item)
+    elif isinstance(p_value, (frozenset, list, set, tuple)):
+        size += sum(sys.getsizeof(item) for item in p_value)
+    return size
+
 
 class StatusOfFact(enum.Enum):
     """Indicates whether user has checked fact and outcome of check.
@@ -56,6 +180,10 @@ class StatusOfFact(enum.Enum):
 
         User checked fact and its value is defined.
 
+    .. attribute:: PENDING
+
+        User requested fact check and check is in progress.
+
     .. attribute:: UNCHECKED
 
         User has not checked fact and its value is unknown.
@@ -66,6 +194,7 @@ class StatusOfFact(enum.Enum):
     """
     BLOCKED = enum.auto()
     DEFINED = enum.auto()
+    PENDING = enum.auto()
     UNCHECKED = enum.auto()
     UNDEFINED = enum.auto()
 
@@ -136,6 +265,9 @@ class Fact(typing.Generic[TopicOpaque, ValueOpaque],
         """
         state = super().__getstate__()
         del state['_tag']
+        del state['_generation']
+        if state['_status'] is StatusOfFact.PENDING:
+            state['_status'] = StatusOfFact.UNCHECKED
         return state
 
     def __init__(self, *, p_name: str, p_summary: str, p_title: str,
@@ -165,6 +297,7 @@ class Fact(typing.Generic[TopicOpaque, ValueOpaque],
         self._aspect_tag.set_presentation(p_subject=self._tag)
         self._topic = p_topic
         self._value: typing.Optional[ValueOpaque] = None
+        self._generation = GenerationCheck(0)
         self.add_aspect_value(p_name='Plain', p_aspect=AspectValuePlain())
 
     def __setstate__(self, p_state: typing.Dict) -> None:
@@ -176,6 +309,7 @@ class Fact(typing.Generic[TopicOpaque, ValueOpaque],
         """
         super().__setstate__(p_state)
         self._tag = TagFact(id(self))
+        self._generation = GenerationCheck(0)
 
     def add_aspect_value(
             self, p_name: str, p_aspect: MASPECT.Aspect[ValueOpaque]):
@@ -187,30 +321,92 @@ class Fact(typing.Generic[TopicOpaque, ValueOpaque],
         self._aspects[p_name] = p_aspect
         self._names_aspects.insert_before(p_item=p_name)
 
-    def check(self) -> StatusOfFact:
-        """Mark fact stale and sync each presentation with fact value.
+    def apply_outcome(self, p_status: StatusOfFact,
+                      p_value: typing.Optional[ValueOpaque]) -> None:
+        """Mark fact stale, set status and value, and sync each
+        presentation with fact.
 
-        Subclasses must extend :meth:`~.Fact.check` method.  A subclass
-        should determine fact value, set status accordingly, and then
-        call base class method.
+        :param p_status: status from fact check.
+        :param p_value: value from fact check.
         """
         self.set_stale()
+        self._status = p_status
+        self._value = p_value
+        self._aspect_status.set_presentation(p_subject=self._status.name)
         for aspect in self._aspects.values():
             aspect.set_presentation(self._value)
+
+    @INSTR.timed('Fact.check')
+    def check(self) -> StatusOfFact:
+        """Mark fact stale and sync each presentation with fact value.
+
+        The method determines status and value with :meth:`compute`
+        unless the outcome of an equivalent check is in the outcome
+        cache (see :data:`g_cache_outcome`).  A subclass should
+        override :meth:`compute` so that :class:`.SchedulerCheck` can
+        check the fact off the main loop.  Alternatively, a subclass
+        may extend :meth:`~.Fact.check`.  The subclass should determine
+        fact value, set status accordingly, and then call base class
+        method.
+
+        Timer ``Fact.check`` times each check and counter
+        ``Fact.check.cached`` counts checks answered from the cache (see
+        :mod:`.instrument`).
+        """
+        outcome = self.outcome_cached()
+        if outcome is None:
+            outcome = self.compute_cached()
+        else:
+            INSTR.g_instruments.count('Fact.check.cached')
+        status, value = outcome
+        self.apply_outcome(status, value)
         return self._status
 
+    @INSTR.timed('Fact.clear')
     def clear(self) -> StatusOfFact:
         """Mark fact as stale and clear fact value and presentations.
 
         Subclasses must extend :meth:`~.Fact.check` method.  A subclass
-        should set fact status and call base class method.
+        should set fact status and call base class method.  Clearing a
+        fact discards the outcome of any check in progress.
         """
         self.set_stale()
+        self._generation = GenerationCheck(self._generation + 1)
+        if self._status is StatusOfFact.PENDING:
+            self._status = StatusOfFact.UNCHECKED
         self._value = None
+        self._aspect_status.set_presentation(p_subject=self._status.name)
         for aspect in self._aspects.values():
             aspect.clear_presentation()
         return self._status
 
+    def compute(self) -> typing.Tuple[
+            StatusOfFact, typing.Optional[ValueOpaque]]:
+        """Return status and value from a check of the fact.
+
+        The method must not change the fact or its topic, so that
+        :class:`.SchedulerCheck` may call it from a worker.  The
+        default returns current status and value.
+        """
+        return self._status, self._value
+
+    def compute_cached(self) -> OutcomeCheck:
+        """Return outcome from :meth:`compute` and add outcome to
+        outcome cache when fact has a cache key.
+        """
+        outcome = self.compute()
+        key = self.key_outcome()
+        if key is not None:
+            g_cache_outcome.put(key, outcome)
+        return outcome
+
+    @property
+    def generation(self) -> GenerationCheck:
+        """Return count of clears, which identifies checks in progress
+        that predate latest clear.
+        """
+        return self._generation
+
     def is_stale(self) -> bool:
         """Return True when there is at least one unsaved change to fact."""
         if super().is_stale():
@@ -229,6 +425,34 @@ class Fact(typing.Generic[TopicOpaque, ValueOpaque],
         title = TitleFact()
         return name, summary, title
 
+    def key_outcome(self) -> typing.Optional[KeyOutcome]:
+        """Return key for fact in outcome cache or None when outcome of
+        fact check cannot be cached.
+
+        Only an outcome from an override of :meth:`compute` can be
+        cached.  The topic must provide a fingerprint of its content.
+        """
+        if type(self).compute is Fact.compute:
+            return None
+
+        fingerprint = getattr(self._topic, 'fingerprint', None)
+        if fingerprint is None:
+            return None
+
+        fingerprint_topic = fingerprint()
+        if fingerprint_topic is None:
+            return None
+
+        return type(self), fingerprint_topic
+
+    def mark_pending(self) -> GenerationCheck:
+        """Set status to show check in progress and return generation
+        that identifies the check.
+        """
+        self._status = StatusOfFact.PENDING
+        self._aspect_status.set_presentation(p_subject=self._status.name)
+        return self._generation
+
     def new_view_aspect(self, p_name_aspect: str) -> BUI.ViewAny:
         """Return view of aspect with given name or placeholder if name
         not found.
@@ -254,6 +478,16 @@ class Fact(typing.Generic[TopicOpaque, ValueOpaque],
         """Return view of fact's tag."""
         return self._aspect_tag.new_view()
 
+    def outcome_cached(self) -> typing.Optional[OutcomeCheck]:
+        """Return outcome of equivalent check from outcome cache or
+        None when cache has no such outcome.
+        """
+        key = self.key_outcome()
+        if key is None:
+            return None
+
+        return g_cache_outcome.get(key)
+
     @property
     def note(self) -> NoteFact:
         """Return user note for fact."""
@@ -278,3 +512,6 @@ class Fact(typing.Generic[TopicOpaque, ValueOpaque],
     def value(self) -> typing.Optional[ValueOpaque]:
         """Return fact value."""
         return self._value
+
+
+g_cache_outcome = CacheOutcome()
@@ -28,7 +28,7 @@ ModelTitle = typing.TypeVar(
     'ModelTitle', BUI.x_b_t_ModelTextMarkup, BUI.ModelTextStyled)
 
 
-class IdCore(ABC_STALE.InterfaceStaleFile,
+class IdCore(ABC_STALE.PartStale, ABC_STALE.InterfaceStaleOwner,
              typing.Generic[ModelName, ModelSummary, ModelTitle]):
     """Defines identity attributes common to Factsheet model components.
 
@@ -41,6 +41,11 @@ class IdCore(ABC_STALE.InterfaceStaleFile,
         title.
 
         *Title:* one-line description of component.
+
+    A component owns its identity attributes and keeps the set of those
+    that are stale (see :mod:`.abc_stalefile`).  Change state queries
+    cost constant time, and marking a component fresh visits only stale
+    parts.
     """
 
     _name: ModelName
@@ -73,6 +78,8 @@ class IdCore(ABC_STALE.InterfaceStaleFile,
         """
         state = self.__dict__.copy()
         del state['_stale']
+        del state['_parts_stale']
+        _ = state.pop('_owners_stale', None)
         return state
 
     def __init__(self, **kwargs: typing.Any) -> None:
@@ -93,7 +100,8 @@ class IdCore(ABC_STALE.InterfaceStaleFile,
                     '{}: IdCore subclasses must define {} attribute '
                     'with type {} and then call super().__init__()'
                     ''.format(self.__class__.__name__, name, hint))
-        self._stale: bool
+        self._stale = False
+        self._track_parts()
         self.set_fresh()
 
     def __setstate__(self, px_state: typing.Dict) -> None:
@@ -104,6 +112,8 @@ class IdCore(ABC_STALE.InterfaceStaleFile,
         :param px_state: unpickled state of stored identity.
         """
         self.__dict__.update(px_state)
+        self._stale = False
+        self._track_parts()
         self.set_fresh()
 
     def has_not_changed(self) -> bool:
@@ -114,38 +124,61 @@ class IdCore(ABC_STALE.InterfaceStaleFile,
         """Return True when there is at least one unsaved change to
         identity.
         """
-        if self._stale:
-            return True
-
-        if self._name.is_stale():
-            self._stale = True
-            return True
-
-        if self._summary.is_stale():
-            self._stale = True
-            return True
-
-        if self._title.is_stale():
-            self._stale = True
-            return True
-
-        return False
+        return self._stale or bool(self._parts_stale)
 
     @property
     def name(self) -> ModelName:
         """Return name model."""
         return self._name
 
+    def on_fresh_part(self, p_part: ABC_STALE.PartStale) -> None:
+        """Forget part that became consistent with file contents.
+
+        Report to owners when identity becomes fresh as a result.
+
+        :param p_part: part that became fresh.
+        """
+        if self._parts_stale.pop(id(p_part), None) is None:
+            return
+
+        if not self.is_stale():
+            self._notify_fresh()
+
+    def on_stale_part(self, p_part: ABC_STALE.PartStale) -> None:
+        """Record part that changed from file contents.
+
+        Report to owners when identity becomes stale as a result.
+
+        :param p_part: part that became stale.
+        """
+        was_stale = self.is_stale()
+        self._parts_stale[id(p_part)] = p_part
+        if not was_stale:
+            self._notify_stale()
+
+    def _parts(self) -> typing.Iterator[ABC_STALE.PartStale]:
+        """Return iterator over parts that track change state."""
+        yield self._name
+        yield self._summary
+        yield self._title
+
     def set_fresh(self) -> None:
         """Mark identity in memory consistent with file contents."""
         self._stale = False
-        self._name.set_fresh()
-        self._summary.set_fresh()
-        self._title.set_fresh()
+        for part in list(self._parts_stale.values()):
+            part.set_fresh()
+        self._parts_stale.clear()
+        self._notify_fresh()
 
     def set_stale(self):
-        """Mark identity in memory changed from file contents."""
+        """Mark identity in memory changed from file contents and notify
+        stale hooks (see :func:`.notify_stale`).
+        """
+        was_stale = self.is_stale()
         self._stale = True
+        if not was_stale:
+            self._notify_stale()
+        ABC_STALE.notify_stale(self)
 
     @property
     def summary(self) -> ModelSummary:
@@ -156,3 +189,9 @@ class IdCore(ABC_STALE.InterfaceStaleFile,
     def title(self) -> ModelTitle:
         """Return title model."""
         return self._title
+
+    def _track_parts(self) -> None:
+        """Start tracking change state of each part."""
+        self._parts_stale: typing.Dict[int, ABC_STALE.PartStale] = dict()
+        for part in self._parts():
+            part.add_owner_stale(self)
@@ -0,0 +1,303 @@
+"""
+Defines class for subsets of an indexed set stored as bits.  See
+:mod:`.setindexed`.
+
+A bit subset holds one bit for each index of its parent set.  Union,
+intersection, difference, and containment of subsets of the same
+parent each take a single operation on Python integers, which process
+many elements per machine word.
+"""
+import collections as COL
+import typing
+
+from factsheet.model.element import ElementOpaque
+from factsheet.model.element import IndexElement
+from factsheet.model.setindexed import SetIndexed
+from factsheet.model.setindexed import SetIndexedRange
+
+
+class SubsetBits(COL.abc.Set):
+    """Subset of an indexed set with one bit for each index.
+
+    Bit *i* of a subset is set when the subset contains the element of
+    the parent set with index *i*.  A subset iterates over elements in
+    order of index.  Length is the number of bits set (population
+    count).
+
+    Set algebra (``&``, ``|``, ``^``, ``-``) and comparisons between
+    subsets of the same parent use bitwise operations.  Combining
+    subsets of different parents raises ``ValueError``.  Operations
+    with other sets fall back to element-by-element methods and return
+    an indexed set.
+
+    .. admonition:: About Equality
+
+        Two bit subsets are equivalent when they have the same parent
+        and the same bits.  To compare a bit subset with an indexed
+        set, compare the indexed set from :meth:`to_set`.
+
+    :param p_parent: set that contains subset.
+    :param p_bits: bits of subset.  Default is an empty subset.
+    :raises ValueError: when bits include an index not in parent.
+    """
+
+    def __and__(self, p_other: typing.Any) -> typing.Any:
+        """Return intersection of subsets.
+
+        :param p_other: subset to intersect.
+        """
+        if not isinstance(p_other, SubsetBits):
+            return super().__and__(p_other)
+
+        return self._new(self._bits & self._check_parent(p_other))
+
+    def __contains__(self, p_other: typing.Any) -> bool:
+        """Return True when object is indexed element in subset.
+
+        :param p_other: object to test.
+        """
+        try:
+            index = p_other.index
+        except AttributeError:
+            return False
+
+        if not self._has_bit(index):
+            return False
+
+        return p_other in self._parent
+
+    def __eq__(self, p_other: typing.Any) -> bool:
+        """Return True if other is set with same elements, or False
+        otherwise.
+
+        :param p_other: object to test for equality.
+        """
+        if isinstance(p_other, SubsetBits) and self._is_sibling(p_other):
+            return self._bits == p_other._bits
+
+        return super().__eq__(p_other)
+
+    def __ge__(self, p_other: typing.Any) -> bool:
+        if isinstance(p_other, SubsetBits) and self._is_sibling(p_other):
+            return p_other._bits & ~self._bits == 0
+
+        return super().__ge__(p_other)
+
+    def __gt__(self, p_other: typing.Any) -> bool:
+        if isinstance(p_other, SubsetBits) and self._is_sibling(p_other):
+            return self >= p_other and self._bits != p_other._bits
+
+        return super().__gt__(p_other)
+
+    def __init__(self, p_parent: SetIndexed[typing.Any],
+                 p_bits: int = 0) -> None:
+        self._parent = p_parent
+        self._bits = p_bits
+        if p_bits < 0 or p_bits & ~self._mask_parent():
+            raise ValueError('Bits {:#x} include index not in parent.'
+                             ''.format(p_bits))
+
+    def __iter__(self) -> typing.Iterator[ElementOpaque]:
+        """Return iterator over elements in order of index."""
+        for index in self.indices():
+            yield self._parent.find_element(p_index=index)
+
+    def __le__(self, p_other: typing.Any) -> bool:
+        if isinstance(p_other, SubsetBits) and self._is_sibling(p_other):
+            return self._bits & ~p_other._bits == 0
+
+        return super().__le__(p_other)
+
+    def __len__(self) -> int:
+        """Return number of elements in subset."""
+        return bin(self._bits).count('1')
+
+    def __lt__(self, p_other: typing.Any) -> bool:
+        if isinstance(p_other, SubsetBits) and self._is_sibling(p_other):
+            return self <= p_other and self._bits != p_other._bits
+
+        return super().__lt__(p_other)
+
+    def __or__(self, p_other: typing.Any) -> typing.Any:
+        """Return union of subsets.
+
+        :param p_other: subset to join.
+        """
+        if not isinstance(p_other, SubsetBits):
+            return super().__or__(p_other)
+
+        return self._new(self._bits | self._check_parent(p_other))
+
+    def __str__(self) -> str:
+        """Return printable representation of subset."""
+        return '<SubsetBits: {}>'.format(list(self.indices()))
+
+    def __sub__(self, p_other: typing.Any) -> typing.Any:
+        """Return elements of subset not in other subset.
+
+        :param p_other: subset to remove.
+        """
+        if not isinstance(p_other, SubsetBits):
+            return super().__sub__(p_other)
+
+        return self._new(self._bits & ~self._check_parent(p_other))
+
+    def __xor__(self, p_other: typing.Any) -> typing.Any:
+        """Return elements in exactly one of the subsets.
+
+        :param p_other: subset to compare.
+        """
+        if not isinstance(p_other, SubsetBits):
+            return super().__xor__(p_other)
+
+        return self._new(self._bits ^ self._check_parent(p_other))
+
+    @property
+    def bits(self) -> int:
+        """Return bits of subset."""
+        return self._bits
+
+    def _check_parent(self, p_other: 'SubsetBits') -> int:
+        """Return bits of other subset.
+
+        :param p_other: subset to combine with this subset.
+        :raises ValueError: when subsets have different parents.
+        """
+        if not self._is_sibling(p_other):
+            raise ValueError('Subsets have different parent sets.')
+
+        return p_other._bits
+
+    def complement(self) -> 'SubsetBits':
+        """Return elements of parent set not in subset."""
+        return self._new(self._mask_parent() & ~self._bits)
+
+    @classmethod
+    def _from_bits(cls, p_parent: SetIndexed[typing.Any],
+                   p_bits: int) -> 'SubsetBits':
+        """Return subset with given bits without check against parent.
+
+        :param p_parent: set that contains subset.
+        :param p_bits: bits of subset, all of which parent contains.
+        """
+        subset = cls.__new__(cls)
+        subset._parent = p_parent
+        subset._bits = p_bits
+        return subset
+
+    @classmethod
+    def _from_iterable(cls, p_elements: typing.Iterable[ElementOpaque]
+                       ) -> SetIndexed[typing.Any]:
+        """Return indexed set of given elements.
+
+        Set operations with a set other than a sibling subset return an
+        indexed set.
+
+        :param p_elements: elements of new set.
+        """
+        return SetIndexed.new_from_elements(p_elements)
+
+    def _has_bit(self, p_index: typing.Any) -> bool:
+        """Return True when subset bit for index is set.
+
+        :param p_index: index to test.
+        """
+        if not isinstance(p_index, int) or p_index < 0:
+            return False
+
+        return bool(self._bits >> p_index & 1)
+
+    def indices(self) -> typing.Iterator[IndexElement]:
+        """Return iterator over indices of elements in increasing
+        order.
+        """
+        bits = self._bits
+        while bits:
+            bit_low = bits & -bits
+            yield IndexElement(bit_low.bit_length() - 1)
+            bits ^= bit_low
+
+    def _is_sibling(self, p_other: 'SubsetBits') -> bool:
+        """Return True when other subset has the same parent set.
+
+        :param p_other: subset to test.
+        """
+        parent = p_other._parent
+        return self._parent is parent or self._parent == parent
+
+    def _mask_parent(self) -> int:
+        """Return bits of all indices in parent set."""
+        return mask_of(self._parent)
+
+    def _new(self, p_bits: int) -> 'SubsetBits':
+        """Return sibling subset with given bits.
+
+        :param p_bits: bits of new subset.
+        """
+        return self._from_bits(self._parent, p_bits)
+
+    @classmethod
+    def new_from_indices(cls, p_parent: SetIndexed[typing.Any],
+                         p_indices: typing.Iterable[int]) -> 'SubsetBits':
+        """Return subset of elements of parent with given indices.
+
+        :param p_parent: set that contains subset.
+        :param p_indices: indices of elements of subset.
+        :raises ValueError: when an index is not in parent.
+        """
+        bits = 0
+        for index in p_indices:
+            if index < 0:
+                raise ValueError(
+                    'Index {} is not in parent.'.format(index))
+            bits |= 1 << index
+        return cls(p_parent, bits)
+
+    @classmethod
+    def new_from_set(cls, p_parent: SetIndexed[typing.Any],
+                     p_set: typing.Iterable[ElementOpaque]
+                     ) -> 'SubsetBits':
+        """Return subset of parent with elements of given set.
+
+        :param p_parent: set that contains subset.
+        :param p_set: elements of subset (for example, an indexed set).
+        :raises ValueError: when parent does not contain an element.
+        """
+        bits = 0
+        for element in p_set:
+            if element not in p_parent:
+                raise ValueError('Element with index {} is not in parent.'
+                                 ''.format(element.index))
+            bits |= 1 << element.index
+        return cls._from_bits(p_parent, bits)
+
+    @property
+    def parent(self) -> SetIndexed[typing.Any]:
+        """Return set that contains subset."""
+        return self._parent
+
+    def to_set(self) -> SetIndexed[typing.Any]:
+        """Return indexed set with elements of subset.
+
+        Elements keep their indices from the parent set (see
+        :meth:`.SetIndexed.new_from_elements`).
+        """
+        return SetIndexed.new_from_elements(self)
+
+
+def mask_of(p_set: SetIndexed[typing.Any]) -> int:
+    """Return bits of all indices in indexed set.
+
+    :param p_set: set to summarize.
+    :raises ValueError: when set contains a negative index.
+    """
+    if isinstance(p_set, SetIndexedRange):
+        return (1 << p_set.bound) - 1
+
+    mask = 0
+    for element in p_set:
+        if element.index < 0:
+            raise ValueError(
+                'Index {} has no bit.'.format(element.index))
+        mask |= 1 << element.index
+    return mask
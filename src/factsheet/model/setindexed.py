@@ -2,10 +2,15 @@
 Defines classes for Factsheet-specific implementation of set-like type.
 
 The classes support a set whose elements are indexed (that is, labeled).
+Range-backed, product, and subset sets compute each element from its
+index on demand, so they take memory in proportion to their components
+rather than to their number of elements.
 """
 
 import collections as COL
 # import dataclasses as DC
+import functools
+import operator
 import typing
 
 # from factsheet.model import element as MELEMENT
@@ -63,10 +68,26 @@ class SetIndexed(COL.abc.Set, typing.Generic[MemberOpaque]):
         Class ``SetIndexed`` uses indexes, in part, to work around this
         limit.  There are other alternatives. See Issue #124.
 
+    .. admonition:: About Member Search
+
+        An indexed set keeps a search index from member to index, so
+        member lookup takes constant time and construction takes time
+        linear in the number of members.  Unhashable members fall back
+        to a linear search.
+
+    .. admonition:: About Element Cache
+
+        An indexed set creates its elements on first iteration and
+        keeps them in a list, so later iterations create no objects.
+        Sets that compute elements on demand (for example,
+        :class:`.SetIndexedRange`) do not cache elements.
+
     :param p_members: unlabeled values for elements of the set.  Default
        is an empty set.
     """
 
+    _CACHE_ELEMENTS = True
+
     def __contains__(self, p_other: typing.Any) -> bool:
         """Return True when object is indexed element in set.
 
@@ -105,9 +126,25 @@ class SetIndexed(COL.abc.Set, typing.Generic[MemberOpaque]):
 
         return self._elements == p_other._elements
 
+    def __getstate__(self) -> typing.Dict:
+        """Return indexed set in form pickle can persist.
+
+        Persistent form of indexed set excludes member search index,
+        element cache, and fingerprint.
+        """
+        state = self.__dict__.copy()
+        del state['_indices']
+        del state['_indices_unhashable']
+        state.pop('_cache_elements', None)
+        state.pop('_fingerprint', None)
+        return state
+
     def __init__(
             self, p_members: typing.Iterable[MemberOpaque] = None) -> None:
         self._elements: typing.Dict[IndexElement, MemberOpaque] = dict()
+        self._indices: typing.Dict[MemberOpaque, IndexElement] = dict()
+        self._indices_unhashable: typing.List[
+            typing.Tuple[MemberOpaque, IndexElement]] = list()
         if p_members is None:
             return
 
@@ -115,30 +152,126 @@ class SetIndexed(COL.abc.Set, typing.Generic[MemberOpaque]):
         for member in p_members:
             if member is None:
                 continue
-            if member in self._elements.values():
-                continue
-            self._elements[IndexElement(index_next)] = member
-            index_next += 1
+            if self._add_element(IndexElement(index_next), member):
+                index_next += 1
 
     def __iter__(self) -> typing.Iterator[ElementOpaque]:
         """Return iterator over indexed elements in set."""
-        for i, m in self._elements.items():
-            element = ElementOpaque[MemberOpaque](p_member=m, p_index=i)
-            yield element
+        if not self._CACHE_ELEMENTS:
+            return (ElementOpaque(p_member=m, p_index=i)
+                    for i, m in self._elements.items())
+
+        return iter(self._get_cache_elements())
 
     def __len__(self) -> int:
         """Return number of elements in set."""
         return len(self._elements)
 
+    def __setstate__(self, p_state: typing.Dict) -> None:
+        """Reconstruct indexed set from state pickle loads.
+
+        Rebuild member search index from elements.
+
+        :param p_state: unpickled state of stored indexed set.
+        """
+        self.__dict__.update(p_state)
+        self._indices = dict()
+        self._indices_unhashable = list()
+        for index, member in self._elements.items():
+            _ = self._add_element(index, member)
+
     def __str__(self) -> str:
         """Return printable representation of set."""
         return '<SetIndexed: ' + str(sorted(self._elements.items())) + '>'
 
+    def _add_element(
+            self, p_index: IndexElement, p_member: MemberOpaque) -> bool:
+        """Add element to set and return True or, when set contains the
+        member already, return False and leave set unchanged.
+
+        The member search index holds hashable members.  Unhashable
+        members fall back to a list that method searches linearly.
+
+        :param p_index: index of new element.
+        :param p_member: member of new element.
+        """
+        self.__dict__.pop('_cache_elements', None)
+        try:
+            if p_member in self._indices:
+                return False
+            self._indices[p_member] = p_index
+        except TypeError:
+            if self._find_index_unhashable(p_member) is not None:
+                return False
+            self._indices_unhashable.append((p_member, p_index))
+        self._elements[p_index] = p_member
+        return True
+
 #     def indices(self) -> typing.Iterator[MELEMENT.IndexElement]:
 #         """Return iterator over indices of elements in the set."""
 #         for i in self._elements.keys():
 #             yield i
 
+    def _element_at(self, p_index: IndexElement
+                    ) -> typing.Optional[ElementOpaque[MemberOpaque]]:
+        """Return element with given index or None when set contains no
+        such element.
+
+        :param p_index: index of desired element.
+        """
+        member = self._elements.get(p_index)
+        if member is None:
+            return None
+
+        return ElementOpaque(p_member=member, p_index=p_index)
+
+    def _find_index(
+            self, p_member: MemberOpaque) -> typing.Optional[IndexElement]:
+        """Return index of element with given member or None when set
+        does not contain member.
+
+        :param p_member: member of desired element.
+        """
+        try:
+            return self._indices.get(p_member)
+        except TypeError:
+            return self._find_index_unhashable(p_member)
+
+    def _find_index_unhashable(
+            self, p_member: MemberOpaque) -> typing.Optional[IndexElement]:
+        """Return index of element with given unhashable member or None
+        when set does not contain member.
+
+        :param p_member: unhashable member of desired element.
+        """
+        for member, index in self._indices_unhashable:
+            if member == p_member:
+                return index
+
+        return None
+
+    def fingerprint(self) -> typing.Optional[typing.Hashable]:
+        """Return summary of set contents or None when set contains an
+        unhashable member.
+
+        Sets with equal fingerprints have the same elements.  Sets with
+        different fingerprints may still have the same elements (for
+        example, a range-backed set and an indexed set of the same
+        integers).  The set computes its fingerprint once, since the set
+        does not change after construction.
+        """
+        try:
+            return self._fingerprint
+        except AttributeError:
+            pass
+
+        try:
+            self._fingerprint: typing.Optional[typing.Hashable] = (
+                frozenset(self._elements.items()))
+        except TypeError:
+            self._fingerprint = None
+        return self._fingerprint
+
     def find_element(self, *, p_index: IndexElement = None,
                      p_member: MemberOpaque = None
                      ) -> typing.Optional[ElementOpaque[MemberOpaque]]:
@@ -153,29 +286,38 @@ class SetIndexed(COL.abc.Set, typing.Generic[MemberOpaque]):
             if p_member is None:
                 return None
 
-            for index, member in self._elements.items():
-                if member == p_member:
-                    element = ElementOpaque[MemberOpaque](
-                        p_member=member, p_index=index)
-                    return element
+            index = self._find_index(p_member)
+            if index is None:
+                return None
 
-            return None
+            return self._element_at(index)
 
-        try:
-            member = self._elements[p_index]
-        except KeyError:
+        element = self._element_at(p_index)
+        if element is None:
             return None
 
-        element = ElementOpaque[MemberOpaque](
-            p_member=member, p_index=p_index)
         if p_member is None:
             return element
 
-        if member == p_member:
+        if element.member == p_member:
             return element
 
         return None
 
+    def _get_cache_elements(self) -> typing.List[ElementOpaque[MemberOpaque]]:
+        """Return elements in index order, creating elements on first
+        call.
+        """
+        try:
+            return self._cache_elements
+        except AttributeError:
+            pass
+
+        self._cache_elements: typing.List[ElementOpaque[MemberOpaque]] = [
+            ElementOpaque(p_member=m, p_index=i)
+            for i, m in self._elements.items()]
+        return self._cache_elements
+
     @classmethod
     def new_from_elements(cls, p_elements: typing.Iterable[
             ElementOpaque[MemberOpaque]] = []
@@ -196,27 +338,22 @@ class SetIndexed(COL.abc.Set, typing.Generic[MemberOpaque]):
                 continue
             if index in new_set._elements:
                 continue
-            if member in new_set._elements.values():
-                continue
-            new_set._elements[index] = member
+            _ = new_set._add_element(index, member)
         return new_set
 
-#     @classmethod
-#     def new_product_set(cls, px_components):
-#         raise NotImplementedError
-#         """Return product set with the given components.
+    @classmethod
+    def new_product_set(cls, p_components: typing.Sequence[
+            'SetIndexed[typing.Any]']) -> 'SetIndexedProduct':
+        """Return product set with the given components.
 
-#         Methos new_product_set does not check elements of individual
-#         components.  The order of components in the product is the same
-#         as the order of presentation.
+        The product set computes each element on demand (see
+        :class:`.SetIndexedProduct`).  Method does not check elements of
+        individual components.  The order of components in the product
+        is the same as the order of presentation.
 
-#         Formal Parameters
-#             px_components: component sets
-#         """
-#         if 0 == len(px_components):
-#             return TaggedSet()
-#         else:
-#             return TaggedSet(IT.product(*px_components))
+        :param p_components: component sets.
+        """
+        return SetIndexedProduct(p_components)
 
 #     def values(self) -> typing.AbstractSet[Value]:
 #         """Return dictionary view of set values."""
@@ -231,26 +368,717 @@ class SetIndexed(COL.abc.Set, typing.Generic[MemberOpaque]):
 #         return self._elements.get(p_tag)
 
 
-# def subsets_size_n(p_set: TaggedSet, p_n: int) -> typing.Iterator:
-#     raise NotImplementedError
-#     """Return iterator to subsets of given size.
+class ElementsRange(COL.abc.Mapping):
+    """Mapping from index to member for a range-backed indexed set.
 
-#     Formal Parameters
-#         p_set: source set of elements.
-#         p_n: size of subset.
-#     """
-#     subsets = IT.combinations(p_set, p_n)
-#     for s in subsets:
-#         yield TaggedSet.new_from_elements(s)
+    Class ``ElementsRange`` computes each element on demand.  Both the
+    members and the indices are the integers in [0, `bound`), and each
+    element has equal member and index.
 
+    :param p_bound: upper bound of range.
+    """
 
-# def subsets_all(p_set: TaggedSet) -> typing.Iterator:
-#     raise NotImplementedError
-#     """Return iterator to all subsets.
+    def __eq__(self, p_other: typing.Any) -> bool:
+        """Return True if other is mapping with same items, or False
+        otherwise.
 
-#     Formal Parameters
-#         p_set: source set of elements.
-#     """
-#     for n in range((1 + len(p_set))):
-#         for ts in subsets_size_n(p_set, n):
-#             yield ts
+        The comparison takes constant time when other is range-backed
+        and avoids materializing elements otherwise.
+
+        :param p_other: object to test for equality.
+        """
+        if isinstance(p_other, ElementsRange):
+            return self._bound == p_other._bound
+
+        if not isinstance(p_other, COL.abc.Mapping):
+            return NotImplemented
+
+        if len(p_other) != self._bound:
+            return False
+
+        missing = object()
+        for index in range(self._bound):
+            if p_other.get(index, missing) != index:
+                return False
+
+        return True
+
+    def __getitem__(self, p_index: typing.Any) -> int:
+        index = self.to_index(p_index)
+        if index is None:
+            raise KeyError(p_index)
+
+        return index
+
+    def __init__(self, p_bound: int) -> None:
+        self._bound = max(0, p_bound)
+
+    def __iter__(self) -> typing.Iterator[IndexElement]:
+        return map(IndexElement, range(self._bound))
+
+    def __len__(self) -> int:
+        return self._bound
+
+    @property
+    def bound(self) -> int:
+        """Return upper bound of range."""
+        return self._bound
+
+    def to_index(self, p_value: typing.Any) -> typing.Optional[IndexElement]:
+        """Return index equal to given value or None when range contains
+        no such index.
+
+        :param p_value: value to convert.
+        """
+        try:
+            index = int(p_value)
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+        if index != p_value:
+            return None
+
+        if not 0 <= index < self._bound:
+            return None
+
+        return IndexElement(index)
+
+
+class SetIndexedRange(SetIndexed[int]):
+    """Indexed set of integers in [0, `bound`).
+
+    Class ``SetIndexedRange`` is a compact form of
+    ``SetIndexed(range(bound))``.  The set computes elements on demand
+    and so takes constant memory.  Containment and length take constant
+    time.
+
+    .. admonition:: About Equality
+
+        A range-backed set equals an indexed set with the same
+        elements, whether or not the other set is range-backed.
+
+    :param p_bound: upper bound of range.  A negative bound gives an
+        empty set.
+    """
+
+    _CACHE_ELEMENTS = False
+
+    def __getstate__(self) -> typing.Dict:
+        """Return range-backed set in form pickle can persist.
+
+        Persistent form of range-backed set is just the bound.
+        """
+        return dict(_bound=self._elements.bound)
+
+    def __init__(self, p_bound: int) -> None:
+        self._elements: ElementsRange = ElementsRange(p_bound)
+
+    def __setstate__(self, p_state: typing.Dict) -> None:
+        """Reconstruct range-backed set from state pickle loads.
+
+        :param p_state: unpickled state of stored range-backed set.
+        """
+        self._elements = ElementsRange(p_state['_bound'])
+
+    def __str__(self) -> str:
+        """Return printable representation of set."""
+        return '<SetIndexedRange: {}>'.format(self._elements.bound)
+
+    def _find_index(self, p_member: int) -> typing.Optional[IndexElement]:
+        """Return index of element with given member or None when set
+        does not contain member.
+
+        :param p_member: member of desired element.
+        """
+        return self._elements.to_index(p_member)
+
+    def fingerprint(self) -> typing.Hashable:
+        """Return summary of set contents.
+
+        The fingerprint of a range-backed set depends only on the
+        bound.  It differs from the fingerprint of an indexed set with
+        the same elements.
+        """
+        return ('range', self._elements.bound)
+
+    @property
+    def bound(self) -> int:
+        """Return upper bound of range."""
+        return self._elements.bound
+
+
+class PositionsSet:
+    """Positional access to elements of an indexed set.
+
+    Position is the order in which the set iterates over its elements.
+    Product and subset sets use positions to compute elements
+    arithmetically.  Positions of a range-backed set are its indices,
+    so access takes constant memory.  Positions of other indexed sets
+    take memory linear in the size of the set.
+
+    :param p_set: indexed set to access.
+    """
+
+    def __init__(self, p_set: SetIndexed[typing.Any]) -> None:
+        self._set = p_set
+        self._elements: typing.List[ElementOpaque] = list()
+        self._positions: typing.Dict[IndexElement, int] = dict()
+        if not isinstance(p_set, SetIndexedRange):
+            self._elements = list(p_set)
+            self._positions = {e.index: i
+                               for i, e in enumerate(self._elements)}
+
+    def __len__(self) -> int:
+        return len(self._set)
+
+    def element_at(self, p_position: int) -> ElementOpaque:
+        """Return element at given position.
+
+        :param p_position: position in [0, size of set).
+        """
+        if isinstance(self._set, SetIndexedRange):
+            return ElementOpaque[int](p_member=p_position,
+                                      p_index=IndexElement(p_position))
+
+        return self._elements[p_position]
+
+    def key(self) -> typing.Optional[typing.Hashable]:
+        """Return summary of elements in order of position or None when
+        set contains an unhashable member.
+        """
+        if isinstance(self._set, SetIndexedRange):
+            return self._set.fingerprint()
+
+        key = tuple((e.index, e.member) for e in self._elements)
+        try:
+            _ = hash(key)
+        except TypeError:
+            return None
+
+        return key
+
+    def position_of(self, p_member: typing.Any) -> typing.Optional[int]:
+        """Return position of element with given member or None when set
+        does not contain member.
+
+        :param p_member: member of desired element.
+        """
+        index = self._set._find_index(p_member)
+        if index is None:
+            return None
+
+        if isinstance(self._set, SetIndexedRange):
+            return index
+
+        return self._positions[index]
+
+
+class ElementsProduct(COL.abc.Mapping):
+    """Mapping from index to member for a product set.
+
+    Class ``ElementsProduct`` computes each element on demand.  Each
+    member is a tuple with one member from each component.  Indices are
+    the integers in [0, `len`), and index order is the order of
+    :func:`itertools.product`.  The mapping converts between an index
+    and the positions of component members as digits of a mixed-radix
+    number, with the last component as least significant digit.
+
+    :param p_components: component sets.
+    """
+
+    def __eq__(self, p_other: typing.Any) -> bool:
+        """Return True if other is mapping with same items, or False
+        otherwise.
+
+        The comparison avoids materializing elements when other is a
+        product mapping.
+
+        :param p_other: object to test for equality.
+        """
+        if isinstance(p_other, ElementsProduct):
+            if self._len != p_other._len:
+                return False
+
+            key_self = self.key()
+            if not self._len or (
+                    key_self is not None and key_self == p_other.key()):
+                return True
+
+            return ([list(a._set) for a in self._axes]
+                    == [list(a._set) for a in p_other._axes])
+
+        if not isinstance(p_other, COL.abc.Mapping):
+            return NotImplemented
+
+        if len(p_other) != self._len:
+            return False
+
+        missing = object()
+        for index, member in self.items():
+            if p_other.get(index, missing) != member:
+                return False
+
+        return True
+
+    def __getitem__(self, p_index: typing.Any) -> typing.Tuple:
+        if not self._is_index(p_index):
+            raise KeyError(p_index)
+
+        positions = list()
+        rest = p_index
+        for axis in reversed(self._axes):
+            rest, position = divmod(rest, len(axis))
+            positions.append(position)
+        return tuple(axis.element_at(position).member for axis, position
+                     in zip(self._axes, reversed(positions)))
+
+    def __init__(self, p_components: typing.Sequence[
+            SetIndexed[typing.Any]]) -> None:
+        self._axes = [PositionsSet(c) for c in p_components]
+        self._len = 0
+        if self._axes:
+            self._len = functools.reduce(
+                operator.mul, (len(a) for a in self._axes), 1)
+
+    def __iter__(self) -> typing.Iterator[IndexElement]:
+        return map(IndexElement, range(self._len))
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def size(self) -> int:
+        """Return number of elements.
+
+        Size may exceed the largest length ``len`` allows.
+        """
+        return self._len
+
+    def _is_index(self, p_index: typing.Any) -> bool:
+        """Return True when value is an index of the mapping.
+
+        :param p_index: value to test.
+        """
+        return isinstance(p_index, int) and 0 <= p_index < self._len
+
+    def key(self) -> typing.Optional[typing.Hashable]:
+        """Return summary of product or None when a component contains
+        an unhashable member.
+        """
+        keys = tuple(a.key() for a in self._axes)
+        if any(k is None for k in keys):
+            return None
+
+        return ('product', keys)
+
+    def to_index(self, p_member: typing.Any) -> typing.Optional[IndexElement]:
+        """Return index of given member or None when product contains no
+        such member.
+
+        :param p_member: member to convert.
+        """
+        if not self._len:
+            return None
+
+        try:
+            if len(p_member) != len(self._axes):
+                return None
+        except TypeError:
+            return None
+
+        index = 0
+        for axis, member in zip(self._axes, p_member):
+            position = axis.position_of(member)
+            if position is None:
+                return None
+
+            index = index * len(axis) + position
+        return IndexElement(index)
+
+
+class SetIndexedProduct(SetIndexed[typing.Tuple]):
+    """Indexed set of tuples in the product of component sets.
+
+    Class ``SetIndexedProduct`` is a compact form of
+    ``SetIndexed(itertools.product(*members))``, where ``members`` are
+    the members of each component.  The set computes elements on demand
+    (see :class:`.ElementsProduct`).  Length takes constant time and
+    containment takes time linear in the number of components.  A
+    product with no components is empty.
+
+    .. admonition:: About Equality
+
+        A product set equals an indexed set with the same elements,
+        whether or not the other set is a product.
+
+    :param p_components: component sets.
+    """
+
+    _CACHE_ELEMENTS = False
+
+    def __getstate__(self) -> typing.Dict:
+        """Return product set in form pickle can persist.
+
+        Persistent form of product set is just the components.
+        """
+        return dict(_components=self._components)
+
+    def __init__(self, p_components: typing.Sequence[
+            SetIndexed[typing.Any]]) -> None:
+        self._components = list(p_components)
+        self._elements: ElementsProduct = ElementsProduct(self._components)
+
+    def __setstate__(self, p_state: typing.Dict) -> None:
+        """Reconstruct product set from state pickle loads.
+
+        :param p_state: unpickled state of stored product set.
+        """
+        self.__init__(p_state['_components'])  # type: ignore[misc]
+
+    def __str__(self) -> str:
+        """Return printable representation of set."""
+        return '<SetIndexedProduct: {}>'.format(
+            ' x '.join(str(len(c)) for c in self._components))
+
+    def _find_index(self, p_member: typing.Tuple
+                    ) -> typing.Optional[IndexElement]:
+        """Return index of element with given member or None when set
+        does not contain member.
+
+        :param p_member: member of desired element.
+        """
+        return self._elements.to_index(p_member)
+
+    def fingerprint(self) -> typing.Optional[typing.Hashable]:
+        """Return summary of set contents or None when a component
+        contains an unhashable member.
+
+        The fingerprint of a product set depends only on its components.
+        Equal fingerprints imply equal sets, but not conversely.
+        """
+        return self._elements.key()
+
+    @property
+    def components(self) -> typing.Sequence[SetIndexed[typing.Any]]:
+        """Return component sets."""
+        return tuple(self._components)
+
+    @property
+    def size(self) -> int:
+        """Return number of elements.
+
+        Size may exceed the largest length ``len`` allows.
+        """
+        return self._elements.size
+
+
+class ElementsSubsets(COL.abc.Mapping):
+    """Mapping from index to member for a set of subsets.
+
+    Class ``ElementsSubsets`` computes each element on demand.  Each
+    member is an indexed set that contains elements of the source set.
+    Indices are the integers in [0, `len`).  Subsets appear in order of
+    size and, within a size, in the order of
+    :func:`itertools.combinations`.  The mapping converts between an
+    index and the positions of subset elements by combinatorial ranking
+    and unranking.
+
+    :param p_source: set of elements for subsets.
+    :param p_size: size of each subset.  Default is subsets of all
+        sizes.
+    """
+
+    def __eq__(self, p_other: typing.Any) -> bool:
+        """Return True if other is mapping with same items, or False
+        otherwise.
+
+        The comparison avoids materializing elements when other is a
+        subset mapping.
+
+        :param p_other: object to test for equality.
+        """
+        if isinstance(p_other, ElementsSubsets):
+            if (self._size, self._len) != (p_other._size, p_other._len):
+                return False
+
+            key_self = self._axis.key()
+            if key_self is not None and key_self == p_other._axis.key():
+                return True
+
+            return list(self._axis._set) == list(p_other._axis._set)
+
+        if not isinstance(p_other, COL.abc.Mapping):
+            return NotImplemented
+
+        if len(p_other) != self._len:
+            return False
+
+        missing = object()
+        for index, member in self.items():
+            if p_other.get(index, missing) != member:
+                return False
+
+        return True
+
+    def __getitem__(self, p_index: typing.Any) -> SetIndexed[typing.Any]:
+        if not (isinstance(p_index, int) and 0 <= p_index < self._len):
+            raise KeyError(p_index)
+
+        size = self._size
+        rank = p_index
+        if size is None:
+            size, rank = self._split_rank(p_index)
+        positions = unrank_combination(len(self._axis), size, rank)
+        return SetIndexed.new_from_elements(
+            self._axis.element_at(p) for p in positions)
+
+    def __init__(self, p_source: SetIndexed[typing.Any],
+                 p_size: typing.Optional[int] = None) -> None:
+        self._axis = PositionsSet(p_source)
+        self._size = p_size
+        n = len(self._axis)
+        if p_size is None:
+            self._len = 2**n
+        else:
+            self._len = binomial(n, p_size)
+
+    def __iter__(self) -> typing.Iterator[IndexElement]:
+        return map(IndexElement, range(self._len))
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def size(self) -> int:
+        """Return number of elements.
+
+        Size may exceed the largest length ``len`` allows.
+        """
+        return self._len
+
+    def _split_rank(self, p_index: int) -> typing.Tuple[int, int]:
+        """Return size of subset at index along with rank of subset
+        among subsets of that size.
+
+        :param p_index: index of subset among subsets of all sizes.
+        """
+        n = len(self._axis)
+        rank = p_index
+        size = 0
+        n_size = 1
+        while n_size <= rank:
+            rank -= n_size
+            n_size = n_size * (n - size) // (size + 1)
+            size += 1
+        return size, rank
+
+    def key(self) -> typing.Optional[typing.Hashable]:
+        """Return summary of subsets or None when source set contains an
+        unhashable member.
+        """
+        key = self._axis.key()
+        if key is None:
+            return None
+
+        return ('subsets', self._size, key)
+
+    def to_index(self, p_member: typing.Any) -> typing.Optional[IndexElement]:
+        """Return index of given member or None when mapping contains no
+        such member.
+
+        :param p_member: subset to convert.
+        """
+        try:
+            elements = list(p_member)
+        except TypeError:
+            return None
+
+        if self._size is not None and len(elements) != self._size:
+            return None
+
+        positions = set()
+        for element in elements:
+            try:
+                position = self._axis.position_of(element.member)
+            except AttributeError:
+                return None
+
+            if position is None:
+                return None
+
+            if self._axis.element_at(position).index != element.index:
+                return None
+
+            positions.add(position)
+        if len(positions) != len(elements):
+            return None
+
+        n = len(self._axis)
+        index = rank_combination(n, sorted(positions))
+        if self._size is None:
+            index += sum(binomial(n, k) for k in range(len(positions)))
+        return IndexElement(index)
+
+
+class SetIndexedSubsets(SetIndexed[SetIndexed[typing.Any]]):
+    """Indexed set of subsets of a source set.
+
+    Class ``SetIndexedSubsets`` is a compact form of the set of all
+    subsets, or of all subsets of a given size, of the source set.  The
+    set computes elements on demand (see :class:`.ElementsSubsets`).
+    Each member is an indexed set whose elements have the indices of the
+    source set.  Length takes constant time and containment takes time
+    linear in the size of the source set.
+
+    .. admonition:: About Equality
+
+        A subset set equals an indexed set with the same elements,
+        whether or not the other set is a subset set.
+
+    :param p_source: set of elements for subsets.
+    :param p_size: size of each subset.  Default is subsets of all
+        sizes.
+    :raises ValueError: when size is negative.
+    """
+
+    _CACHE_ELEMENTS = False
+
+    def __getstate__(self) -> typing.Dict:
+        """Return subset set in form pickle can persist.
+
+        Persistent form of subset set is just the source and size.
+        """
+        return dict(_source=self._source, _size=self._size)
+
+    def __init__(self, p_source: SetIndexed[typing.Any],
+                 p_size: typing.Optional[int] = None) -> None:
+        if p_size is not None and p_size < 0:
+            raise ValueError('Subset size {} is negative.'.format(p_size))
+
+        self._source = p_source
+        self._size = p_size
+        self._elements: ElementsSubsets = ElementsSubsets(p_source, p_size)
+
+    def __setstate__(self, p_state: typing.Dict) -> None:
+        """Reconstruct subset set from state pickle loads.
+
+        :param p_state: unpickled state of stored subset set.
+        """
+        self.__init__(  # type: ignore[misc]
+            p_state['_source'], p_state['_size'])
+
+    def __str__(self) -> str:
+        """Return printable representation of set."""
+        size = 'all' if self._size is None else self._size
+        return '<SetIndexedSubsets: {} of {}>'.format(
+            size, len(self._source))
+
+    def _find_index(self, p_member: SetIndexed[typing.Any]
+                    ) -> typing.Optional[IndexElement]:
+        """Return index of element with given member or None when set
+        does not contain member.
+
+        :param p_member: subset of desired element.
+        """
+        return self._elements.to_index(p_member)
+
+    def fingerprint(self) -> typing.Optional[typing.Hashable]:
+        """Return summary of set contents or None when source set
+        contains an unhashable member.
+
+        The fingerprint of a subset set depends only on source and size.
+        Equal fingerprints imply equal sets, but not conversely.
+        """
+        return self._elements.key()
+
+    @property
+    def size(self) -> int:
+        """Return number of elements.
+
+        Size may exceed the largest length ``len`` allows.
+        """
+        return self._elements.size
+
+    @property
+    def source(self) -> SetIndexed[typing.Any]:
+        """Return source set of subsets."""
+        return self._source
+
+
+def binomial(p_n: int, p_k: int) -> int:
+    """Return number of ways to choose k items from n items.
+
+    :param p_n: number of items.
+    :param p_k: number to choose.
+    """
+    if not 0 <= p_k <= p_n:
+        return 0
+
+    k = min(p_k, p_n - p_k)
+    result = 1
+    for i in range(k):
+        result = result * (p_n - i) // (i + 1)
+    return result
+
+
+def rank_combination(p_n: int, p_positions: typing.Sequence[int]) -> int:
+    """Return rank of combination in the order of
+    :func:`itertools.combinations`.
+
+    :param p_n: number of items to choose from.
+    :param p_positions: positions of chosen items in increasing order.
+    """
+    k = len(p_positions)
+    rank = 0
+    first = 0
+    for i, position in enumerate(p_positions):
+        # Count combinations that choose an earlier item at place i.
+        rank += (binomial(p_n - first, k - i)
+                 - binomial(p_n - position, k - i))
+        first = position + 1
+    return rank
+
+
+def subsets_all(p_set: SetIndexed[MemberOpaque]) -> SetIndexedSubsets:
+    """Return set of all subsets of given set.
+
+    :param p_set: source set of elements.
+    """
+    return SetIndexedSubsets(p_set)
+
+
+def subsets_size_n(p_set: SetIndexed[MemberOpaque], p_n: int
+                   ) -> SetIndexedSubsets:
+    """Return set of subsets of given size.
+
+    :param p_set: source set of elements.
+    :param p_n: size of subset.
+    :raises ValueError: when size is negative.
+    """
+    return SetIndexedSubsets(p_set, p_n)
+
+
+def unrank_combination(p_n: int, p_k: int, p_rank: int) -> typing.List[int]:
+    """Return positions of combination with given rank in the order of
+    :func:`itertools.combinations`.
+
+    :param p_n: number of items to choose from.
+    :param p_k: number of items to choose.
+    :param p_rank: rank in [0, `binomial(n, k)`).
+    """
+    positions = list()
+    rank = p_rank
+    position = 0
+    for i in range(p_k):
+        r = p_k - i - 1
+        m = p_n - position - 1
+        n_rest = binomial(m, r)
+        while n_rest <= rank:
+            # Skip combinations that choose item at position.
+            rank -= n_rest
+            n_rest = n_rest * (m - r) // m
+            m -= 1
+            position += 1
+        positions.append(position)
+        position += 1
+    return positions
@@ -31,6 +31,7 @@ class representing the model of a factsheet.
 import logging
 import typing
 
+import factsheet.abc_types.abc_stalefile as ABC_STALE
 import factsheet.bridge_ui as BUI
 import factsheet.model.idcore as MIDCORE
 import factsheet.model.topic as MTOPIC
@@ -52,6 +53,10 @@ class Sheet(MIDCORE.IdCore[Name, Summary, Title]):
     information (see :class:`.IdCore`). Each topic represents a
     collection of facts about a specific subject.
 
+    A factsheet tracks change state of its topics along with its
+    identity attributes (see :class:`.IdCore`).  Checking whether a
+    factsheet is stale does not visit each topic.
+
     .. admonition:: About Equality
 
         Each factsheet model has persistent identification information
@@ -98,8 +103,36 @@ class Sheet(MIDCORE.IdCore[Name, Summary, Title]):
     def clear(self) -> None:
         """Mark topics outline stale and remove all topics from outline."""
         self.set_stale()
+        for topic in self._topics.items():
+            if topic is not None:
+                topic.remove_owner_stale(self)
         self._topics.clear()
 
+    def extend_topics(self, p_preorder: typing.Iterable[
+                          typing.Tuple[int, typing.Optional[MTOPIC.Topic]]],
+                      p_line: BUI.LineOutline = None
+                      ) -> typing.List[BUI.LineOutline]:
+        """Mark topics outline stale and add section of topics as
+        children of topic at given line.
+
+        Each entry of the preorder list is depth and topic of a new line
+        in depth-first order.  Depth 0 is a child of given line.  See
+        :meth:`.ModelOutlineMulti.extend_section`.
+
+        :param p_preorder: depth and topic of each new line.
+        :param p_line: line of parent topic for section.  Default is top
+            level.
+        :returns: lines at top of section.
+        :raises ValueError: when a line is deeper than any possible
+            parent.  Method adds no topics in that case.
+        """
+        self.set_stale()
+        preorder = list(p_preorder)
+        lines_top = self._topics.extend_section(preorder, p_line)
+        for _depth, topic in preorder:
+            self._track_topic(topic)
+        return lines_top
+
     def get_tag(self, p_line: BUI.LineOutline) -> MTOPIC.TagTopic:
         """Return tag of topic at given line in topics outline.
 
@@ -123,6 +156,7 @@ class Sheet(MIDCORE.IdCore[Name, Summary, Title]):
         :returns: line of newly-added topic.
         """
         self.set_stale()
+        self._track_topic(p_topic)
         return self._topics.insert_after(p_topic, p_line)
 
     def insert_topic_before(self, p_topic: MTOPIC.Topic,
@@ -136,6 +170,7 @@ class Sheet(MIDCORE.IdCore[Name, Summary, Title]):
         :returns: line of newly-added topic.
         """
         self.set_stale()
+        self._track_topic(p_topic)
         return self._topics.insert_before(p_topic, p_line)
 
     def insert_topic_child(self, p_topic: MTOPIC.Topic,
@@ -150,37 +185,25 @@ class Sheet(MIDCORE.IdCore[Name, Summary, Title]):
         :returns: line of newly-added topic.
         """
         self.set_stale()
+        self._track_topic(p_topic)
         return self._topics.insert_child(p_topic, p_line)
 
     def has_not_changed(self) -> bool:
         """Return True when there are no unsaved changes to factsheet."""
         return not self.is_stale()
 
-    def is_stale(self) -> bool:
-        """Return True when there is at least one unsaved change to
-        factsheet.
-
-        Log warning when a topic is missing from the topics outline.
-        """
-        if super().is_stale():
-            return True
-
-        for topic in self._topics.items():
-            if topic is None:
-                logger.warning(
-                    'Topics outline contains line with no topic ({}.{})'
-                    ''.format(self.__class__.__name__, self.is_stale.__name__))
-            elif topic.is_stale():
-                self._stale = True
-                return True
-
-        return False
-
     @property
     def outline_topics(self) -> OutlineTopics:
         """Return topics outline."""
         return self._topics
 
+    def _parts(self) -> typing.Iterator[ABC_STALE.PartStale]:
+        """Return iterator over identity attributes and topics."""
+        yield from super()._parts()
+        for topic in self._topics.items():
+            if topic is not None:
+                yield topic
+
     def remove_topic(self, p_line: BUI.LineOutline) -> None:
         """Mark topics outline stale and remove topic from outline.
 
@@ -189,19 +212,26 @@ class Sheet(MIDCORE.IdCore[Name, Summary, Title]):
         :param p_line: line of topic to remove.  If line is None or
             invalid, remove no topics but mark sheet as stale nonetheless.
         """
-        self.set_stale()
-        self._topics.remove(p_line)
+        self.remove_topics([p_line])
 
-    def set_fresh(self) -> None:
-        """Mark factsheet in memory consistent with file contents."""
-        super().set_fresh()
-        for topic in self._topics.items():
-            if topic is None:
-                logger.warning('Topics outline contains line with no '
-                               'topic ({}.{})'.format(self.__class__.__name__,
-                                                      self.set_fresh.__name__))
-            else:
-                topic.set_fresh()
+    def remove_topics(self, p_lines: typing.Iterable[BUI.LineOutline]
+                      ) -> None:
+        """Mark topics outline stale and remove topics from outline.
+
+        Removes each topic and all its descendents in one bulk removal
+        from the outline (see :meth:`.ModelOutlineMulti.remove_many`).
+
+        :param p_lines: lines of topics to remove.  Method skips a line
+            that is None or invalid but marks sheet as stale nonetheless.
+        """
+        self.set_stale()
+        lines = list(p_lines)
+        for line in lines:
+            if self._topics.is_valid(line):
+                for topic in self._topics.items_section(line):
+                    if topic is not None:
+                        topic.remove_owner_stale(self)
+        self._topics.remove_many(lines)
 
     @property
     def tag(self) -> TagSheet:
@@ -227,3 +257,11 @@ class Sheet(MIDCORE.IdCore[Name, Summary, Title]):
                     ''.format(self.__class__.__name__, self.topics.__name__))
             else:
                 yield topic
+
+    def _track_topic(self, p_topic: typing.Optional[MTOPIC.Topic]) -> None:
+        """Start tracking change state of topic new to topics outline.
+
+        :param p_topic: topic to track.  Method ignores None.
+        """
+        if p_topic is not None:
+            p_topic.add_owner_stale(self)
@@ -13,6 +13,7 @@ import factsheet.bridge_ui as BUI
 # import factsheet.model.fact as MFACT
 import factsheet.model.idcore as MIDCORE
 
+FingerprintTopic = typing.Hashable
 TagTopic = typing.NewType('TagTopic', int)
 LineOutline = BUI.LineOutline
 # OutlineFacts = BUI.BridgeOutlineColumnar[MFACT.Fact]
@@ -181,6 +182,17 @@ class Topic(MIDCORE.IdCore[Name, Summary, Title]):
         raise NotImplementedError
         return self._facts
 
+    def fingerprint(self) -> typing.Optional[FingerprintTopic]:
+        """Return summary of topic content or None when topic has no
+        summary.
+
+        Topics with equal fingerprints give equal outcomes for each
+        check of a fact (see :class:`.CacheOutcome`).  Identity
+        information is not part of topic content.  The base topic has
+        no fingerprint, and so checks of its facts are not cached.
+        """
+        return None
+
     @property
     def tag(self) -> TagTopic:
         """Return unique identifier of topic."""
@@ -200,6 +212,14 @@ class Topic(MIDCORE.IdCore[Name, Summary, Title]):
 
         return False
 
+    def iter_facts(self) -> typing.Iterator[typing.Any]:
+        """Return iterator over facts of topic.
+
+        The base topic has no facts, and so the iterator is empty.
+        Topics that hold facts extend this method.
+        """
+        return iter(())
+
     def set_fresh(self) -> None:
         """Mark topic in memory consistent with file contents."""
         super().set_fresh()
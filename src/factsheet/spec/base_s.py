@@ -9,6 +9,7 @@ import typing
 import factsheet.bridge_ui as BUI
 import factsheet.control.control_sheet as CSHEET
 import factsheet.control.control_topic as CTOPIC
+import factsheet.instrument as INSTR
 import factsheet.view.outline_id as VOUTLINE_ID
 import factsheet.view.ui as UI
 import factsheet.view.view_markup as VMARKUP
@@ -111,10 +112,14 @@ class Base:
         The user completes fields in the specification to create a topic.
         The user may confirm or cancel the topic.
 
+        Timer ``Spec.launch`` times construction of the assistant up to
+        the point the user sees it (see :mod:`.instrument`).
+
         :param p_control_sheet: sheet in which to place new topic.
         """
-        assist = self.new_assistant()
-        self.add_pages(assist, p_control_sheet)
+        with INSTR.g_instruments.timer('Spec.launch'):
+            assist = self.new_assistant()
+            self.add_pages(assist, p_control_sheet)
         self.run_assistant(p_assistant=assist)
         # construct topic (or exit)
         # place topic (or exit)
@@ -68,7 +68,7 @@ class BlockFact(ABC_FACT.InterfaceBlockFact[ValueOpaque]):
         self._value: typing.Optional[ValueOpaque] = None
         self._control = p_control
 
-        builder = Gtk.Builder.new_from_file(self.NAME_FILE_FACT_UI)
+        builder = UI.new_builder(self.NAME_FILE_FACT_UI)
         get_object = builder.get_object
 
         self._infoid = VINFOID.ViewInfoId(get_object)
@@ -33,7 +33,6 @@ import factsheet.bridge_ui as BUI
 import factsheet.control.control_sheet as CSHEET
 import factsheet.view.id as VID
 import factsheet.view.outline_id as VOUTLINE_ID
-import factsheet.view.select_spec as VSELECT_SPEC
 import factsheet.view.view_stack as VSTACK
 import factsheet.view.view_topic as VTOPIC
 import factsheet.view.ui as UI
@@ -305,6 +304,9 @@ class EditorTopics:
         :param _action: user activated this action (unused).
         :param _target: parameter GTK provides with activation (unused).
         """
+        # Import on first request so that specs load only when needed.
+        import factsheet.view.select_spec as VSELECT_SPEC
+
         parent = self.ui_view.get_toplevel()
         select_spec = VSELECT_SPEC.SelectSpec(parent)
         spec = select_spec()
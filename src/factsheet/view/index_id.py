@@ -0,0 +1,262 @@
+"""
+Defines search index over identity fields of items: Name, Summary, and
+Title.
+
+An index records, for each field, the trigrams of each item's text.  A
+search for a key of at least three characters intersects the trigram
+lookups for the key and confirms each candidate with a substring test.
+A search for a shorter key tests the text of each item, narrowing the
+result of the previous search when the previous key is part of the new
+one.  The index follows edits to item text through stale hooks (see
+:func:`.notify_stale`), so a search does not read text from text
+models.
+
+Constants and Type Hints
+========================
+
+.. data:: FIELDS_INDEXED
+
+    Identity fields in index along with attribute name of each field's
+    text model.
+
+.. data:: IdItem
+
+    Type hint for identifier of item in index.
+
+.. data:: ItemId
+
+    Type hint for item with identity fields (see :class:`.IdCore`).
+
+.. data:: N_GRAM
+
+    Length of each n-gram in index.
+
+.. data:: Posting
+
+    Type hint for identifiers of items that contain an n-gram.
+
+Classes and Functions
+=====================
+"""
+import typing
+
+import factsheet.abc_types.abc_stalefile as ABC_STALE
+import factsheet.view.id as VID
+
+IdItem = int
+ItemId = typing.Any
+
+FIELDS_INDEXED = ((VID.FieldsId.NAME, 'name'),
+                  (VID.FieldsId.SUMMARY, 'summary'),
+                  (VID.FieldsId.TITLE, 'title'),
+                  )
+N_GRAM = 3
+
+Posting = typing.Set[IdItem]
+
+
+class IndexId:
+    """Inverted index of trigrams in identity fields of items.
+
+    Index identifies each item by :func:`id` and holds a reference to
+    each item in index, so that identifiers are not reused while an
+    item is in index.  Text matching is case sensitive.
+
+    Method :meth:`find` caches the result of the most recent search.
+    A search function called for each line of an outline (see
+    :class:`.InitSearchOutlineId`) checks each line in constant time.
+    """
+
+    def __init__(self) -> None:
+        self._items: typing.Dict[IdItem, ItemId] = dict()
+        self._keys_source: typing.Dict[IdItem, typing.List[int]] = dict()
+        self._postings: typing.Dict[
+            VID.FieldsId, typing.Dict[str, Posting]] = {
+                field: dict() for field, _ in FIELDS_INDEXED}
+        self._sources: typing.Dict[
+            int, typing.Tuple[typing.Any, IdItem, VID.FieldsId]] = dict()
+        self._texts: typing.Dict[
+            VID.FieldsId, typing.Dict[IdItem, str]] = {
+                field: dict() for field, _ in FIELDS_INDEXED}
+        self._cache: typing.Optional[typing.Tuple[
+            str, VID.FieldsId, typing.FrozenSet[IdItem]]] = None
+
+    def __contains__(self, p_item: typing.Any) -> bool:
+        """Return True when item is in index.
+
+        :param p_item: item to check.
+        """
+        return id(p_item) in self._items
+
+    def __len__(self) -> int:
+        """Return number of items in index."""
+        return len(self._items)
+
+    def add(self, p_item: ItemId) -> None:
+        """Add item to index or refresh item already in index.
+
+        :param p_item: item to add.
+        """
+        self.remove(p_item)
+        id_item = id(p_item)
+        self._items[id_item] = p_item
+        keys_source = self._keys_source.setdefault(id_item, list())
+        for field, name in FIELDS_INDEXED:
+            text = getattr(p_item, name)
+            self._sources[id(text)] = (text, id_item, field)
+            keys_source.append(id(text))
+            self._add_text(id_item, field, text.text)
+
+    def _add_text(self, p_id_item: IdItem, p_field: VID.FieldsId,
+                  p_text: str) -> None:
+        """Add trigrams of item field text to index.
+
+        :param p_id_item: identifies item.
+        :param p_field: identifies field.
+        :param p_text: content of field.
+        """
+        self._texts[p_field][p_id_item] = p_text
+        postings = self._postings[p_field]
+        for gram in new_grams(p_text):
+            try:
+                postings[gram].add(p_id_item)
+            except KeyError:
+                postings[gram] = {p_id_item}
+        self._cache = None
+
+    def clear(self) -> None:
+        """Remove all items from index."""
+        self._items.clear()
+        self._keys_source.clear()
+        for postings in self._postings.values():
+            postings.clear()
+        self._sources.clear()
+        for texts in self._texts.values():
+            texts.clear()
+        self._cache = None
+
+    def find(self, p_key: str, p_scope: VID.FieldsId
+             ) -> typing.FrozenSet[IdItem]:
+        """Return identifiers of items that contain key in at least one
+        field in scope.
+
+        :param p_key: text to find.
+        :param p_scope: fields to search.
+        """
+        candidates: typing.Optional[typing.FrozenSet[IdItem]] = None
+        if self._cache is not None:
+            key, scope, found = self._cache
+            if scope == p_scope:
+                if key == p_key:
+                    return found
+
+                if key in p_key:
+                    candidates = found
+
+        found_fields: Posting = set()
+        for field, _name in FIELDS_INDEXED:
+            if field & p_scope:
+                found_fields |= self._find_field(p_key, field, candidates)
+        found = frozenset(found_fields)
+        self._cache = (p_key, p_scope, found)
+        return found
+
+    def _find_field(self, p_key: str, p_field: VID.FieldsId,
+                    p_candidates: typing.Optional[typing.AbstractSet[IdItem]]
+                    ) -> Posting:
+        """Return identifiers of items that contain key in given field.
+
+        :param p_key: text to find.
+        :param p_field: field to search.
+        :param p_candidates: identifiers of all items that might contain
+            key or None when any item in index might contain key.
+        """
+        texts = self._texts[p_field]
+        if len(p_key) < N_GRAM:
+            if p_candidates is None:
+                return {i for i, t in texts.items() if p_key in t}
+
+            return {i for i in p_candidates if p_key in texts[i]}
+
+        postings = self._postings[p_field]
+        grams = new_grams(p_key)
+        candidates = sorted((postings.get(g, set()) for g in grams), key=len)
+        found = set(candidates[0]).intersection(*candidates[1:])
+        return {i for i in found if p_key in texts[i]}
+
+    def is_match(self, p_item: ItemId, p_key: str,
+                 p_scope: VID.FieldsId) -> bool:
+        """Return True when item contains key in at least one field in
+        scope.
+
+        :param p_item: item to check.
+        :param p_key: text to find.
+        :param p_scope: fields to search.
+        """
+        return id(p_item) in self.find(p_key, p_scope)
+
+    def on_stale(self, p_source: ABC_STALE.InterfaceStaleFile) -> None:
+        """Refresh index entry for changed text model of item in index.
+
+        Method ignores model components that are not item fields in
+        index.  See :func:`.notify_stale`.
+
+        :param p_source: model component that changed.
+        """
+        try:
+            text, id_item, field = self._sources[id(p_source)]
+        except KeyError:
+            return
+
+        self._remove_text(id_item, field)
+        self._add_text(id_item, field, text.text)
+
+    def remove(self, p_item: ItemId) -> None:
+        """Remove item from index.  Ignore item not in index.
+
+        :param p_item: item to remove.
+        """
+        id_item = id(p_item)
+        if self._items.pop(id_item, None) is None:
+            return
+
+        for field, _name in FIELDS_INDEXED:
+            self._remove_text(id_item, field)
+        for key in self._keys_source.pop(id_item):
+            _ = self._sources.pop(key, None)
+
+    def _remove_text(self, p_id_item: IdItem, p_field: VID.FieldsId
+                     ) -> None:
+        """Remove trigrams of item field text from index.
+
+        :param p_id_item: identifies item.
+        :param p_field: identifies field.
+        """
+        text = self._texts[p_field].pop(p_id_item, '')
+        postings = self._postings[p_field]
+        for gram in new_grams(text):
+            posting = postings[gram]
+            posting.discard(p_id_item)
+            if not posting:
+                del postings[gram]
+        self._cache = None
+
+    def start_updates(self) -> None:
+        """Follow edits to item text.  See :data:`.g_hooks_stale`."""
+        if self.on_stale not in ABC_STALE.g_hooks_stale:
+            ABC_STALE.g_hooks_stale.append(self.on_stale)
+
+    def stop_updates(self) -> None:
+        """Stop following edits to item text."""
+        try:
+            ABC_STALE.g_hooks_stale.remove(self.on_stale)
+        except ValueError:
+            pass
+
+
+def new_grams(p_text: str) -> typing.Set[str]:
+    """Return set of n-grams of length :data:`N_GRAM` in text.
+
+    :param p_text: source of n-grams.
+    """
+    return {p_text[i:i + N_GRAM] for i in range(len(p_text) - N_GRAM + 1)}
@@ -35,7 +35,9 @@ from pathlib import Path
 import typing
 
 import factsheet.bridge_ui as BUI
+import factsheet.instrument as INSTR
 import factsheet.view.id as VID
+import factsheet.view.index_id as VINDEX
 import factsheet.view.ui as UI
 
 import factsheet.model.idcore as MIDCORE
@@ -73,6 +75,12 @@ class InitColumnsOutlineId:
         Each column supports `Pango markup`_.  Optional action cycles
         through showing name column, title column, or both columns.
 
+        Columns have fixed width and the visual element uses
+        fixed-height mode.  The visual element then formats only the
+        rows on screen and finds the children of a line only when the
+        user expands the line, so it stays responsive for outlines of
+        any size.
+
     .. _Pango markup:
         https://developer.gnome.org/pygtk/stable/pango-markup-language.html
 
@@ -80,11 +88,13 @@ class InitColumnsOutlineId:
         :param p_action_group: add column switch action to this group
             (optional).
         """
-        self._column_name = UI.new_column_stock('Name', self._markup_cell_name)
+        self._column_name = UI.new_column_fixed('Name', self._markup_cell_name)
         p_ui_view_outline.append_column(self._column_name)
-        self._column_title = UI.new_column_stock(
+        self._column_title = UI.new_column_fixed(
             'Title', self._markup_cell_title)
+        self._column_title.set_expand(True)
         p_ui_view_outline.append_column(self._column_title)
+        p_ui_view_outline.set_fixed_height_mode(True)
         if p_action_group is not None:
             UI.new_action_active(
                 p_action_group, 'cycle-columns', self.cycle_columns)
@@ -718,7 +728,12 @@ class SelectorItem:
 
 
 class InitSearchOutlineId:
-    """Search bar for the visual element of an outline of identity items."""
+    """Search bar for the visual element of an outline of identity items.
+
+    Search matches lines through an index of item names, summaries, and
+    titles (see :class:`.IndexId`) rather than by reading text of each
+    line for each key stroke.
+    """
 
     _UI_TEXT = """
         <?xml version="1.0" encoding="UTF-8"?>
@@ -825,9 +840,17 @@ class InitSearchOutlineId:
         C_FIRST = 0
         p_ui_view_outline.set_search_column(C_FIRST)
         entry_search = get_ui_element('ui_search_entry')
+        INSTR.time_signal(
+            entry_search, 'changed', 'InitSearchOutlineId.search')
         p_ui_view_outline.set_search_entry(entry_search)
         p_ui_view_outline.set_search_equal_func(
             self._match_spec_ne, p_ui_view_outline)
+        self._index = VINDEX.IndexId()
+        self._index.start_updates()
+        BUI.g_hooks_removed_outline.append(self.on_removed_items)
+        self._stale_index = True
+        self._ui_model_index: typing.Optional[Gtk.TreeModel] = None
+        _ = p_ui_view_outline.connect('destroy', self.on_destroy)
 
         button_name = get_ui_element('ui_search_name')
         _ = button_name.connect(
@@ -841,6 +864,50 @@ class InitSearchOutlineId:
         _ = button_title.connect(
             'toggled', self.on_changed_search_scope, VID.FieldsId.TITLE)
 
+    def _get_index(self, p_ui_model: Gtk.TreeModel) -> VINDEX.IndexId:
+        """Return search index of items in storage for outline.
+
+        Method builds index from all lines of storage when storage
+        changes.  After that, index follows inserted, changed, and
+        removed lines.  Storage that does not report removed items (see
+        :data:`.g_hooks_removed`) marks index for rebuild when it
+        removes lines.
+
+        :param p_ui_model: storage for outline visual element.
+        """
+        if p_ui_model is not self._ui_model_index:
+            self._ui_model_index = p_ui_model
+            _ = p_ui_model.connect('row-changed', self.on_changed_row)
+            if not isinstance(p_ui_model, BUI.UiModelOutlineMulti):
+                _ = p_ui_model.connect('row-deleted', self.on_deleted_row)
+            _ = p_ui_model.connect('row-inserted', self.on_inserted_row)
+            self._stale_index = True
+        if self._stale_index:
+            self._index.clear()
+            p_ui_model.foreach(self._index_line)
+            self._stale_index = False
+        return self._index
+
+    def _index_line(self, p_ui_model: Gtk.TreeModel, _path: Gtk.TreePath,
+                    p_line: BUI.LineOutline) -> bool:
+        """Add item at line to search index and return False to continue
+        through outline.
+
+        Implements `Gtk.TreeModelForeachFunc`_.
+
+        :param p_ui_model: storage for outline visual element.
+        :param _path: path of line (unused).
+        :param p_line: line of item to add.
+
+        .. _`Gtk.TreeModelForeachFunc`::
+            https://lazka.github.io/pgi-docs/Gtk-3.0/callbacks.html#
+            Gtk.TreeModelForeachFunc
+        """
+        item = ModelOutline.get_item_direct(p_ui_model, p_line)
+        if item is not None:
+            self._index.add(item)
+        return False
+
     def _match_spec_ne(self, p_ui_model: Gtk.TreeModel, _n_column: int,
                        p_match_key: str, p_line: BUI.LineOutline,
                        p_ui_view_outline: UiDisplayOutlineId) -> bool:
@@ -870,22 +937,30 @@ class InitSearchOutlineId:
                                      self._match_spec_ne.__name__))
             return True
 
-        if (self._scope_search & VID.FieldsId.NAME):
-            if p_match_key in item.name.text:
-                return False
-
-        if (self._scope_search & VID.FieldsId.SUMMARY):
-            if p_match_key in item.summary.text:
-                return False
-
-        if (self._scope_search & VID.FieldsId.TITLE):
-            if p_match_key in item.title.text:
-                return False
+        index = self._get_index(p_ui_model)
+        if index.is_match(item, p_match_key, self._scope_search):
+            return False
 
         path = p_ui_model.get_path(p_line)
         _ = p_ui_view_outline.expand_row(path, False)
         return True
 
+    def on_changed_row(self, p_ui_model: Gtk.TreeModel,
+                       _path: Gtk.TreePath, p_line: BUI.LineOutline
+                       ) -> None:
+        """Refresh item at changed line in search index.
+
+        :param p_ui_model: storage for outline visual element.
+        :param _path: path of changed line (unused).
+        :param p_line: changed line.
+        """
+        if p_ui_model is not self._ui_model_index or self._stale_index:
+            return
+
+        item = ModelOutline.get_item_direct(p_ui_model, p_line)
+        if item is not None:
+            self._index.add(item)
+
     def on_changed_search_scope(
             self, p_button: UiButtonSearchScope, p_field: VID.FieldsId
             ) -> None:
@@ -899,6 +974,74 @@ class InitSearchOutlineId:
         else:
             self._scope_search &= ~p_field
 
+    def on_deleted_row(self, p_ui_model: Gtk.TreeModel, *_args) -> None:
+        """Mark search index stale when storage removes lines but does
+        not report removed items.
+
+        :param p_ui_model: storage for outline visual element.
+        :param _args: path of removed line (unused).
+        """
+        if p_ui_model is self._ui_model_index:
+            self._stale_index = True
+
+    def on_destroy(self, _view: UiDisplayOutlineId) -> None:
+        """Stop updates to search index when outline view is destroyed.
+
+        :param _view: outline visual element (unused).
+        """
+        self._index.stop_updates()
+        try:
+            BUI.g_hooks_removed_outline.remove(self.on_removed_items)
+        except ValueError:
+            pass
+
+    def on_inserted_row(self, p_ui_model: Gtk.TreeModel,
+                        _path: Gtk.TreePath, p_line: BUI.LineOutline
+                        ) -> None:
+        """Add item at new line and items of its descendants to search
+        index.
+
+        A view learns only of the top line of a section added in one
+        step (see :meth:`.ModelOutlineMulti.extend_section`), so method
+        indexes each line under the new line too.
+
+        :param p_ui_model: storage for outline visual element.
+        :param _path: path of new line (unused).
+        :param p_line: new line.
+        """
+        if p_ui_model is not self._ui_model_index or self._stale_index:
+            return
+
+        lines = [p_line]
+        while lines:
+            line = lines.pop()
+            item = ModelOutline.get_item_direct(p_ui_model, line)
+            if item is None:
+                self._stale_index = True
+                return
+
+            self._index.add(item)
+            child = p_ui_model.iter_children(line)
+            while child is not None:
+                lines.append(child)
+                child = p_ui_model.iter_next(child)
+
+    def on_removed_items(self, p_ui_model: Gtk.TreeModel,
+                         p_items: typing.List[typing.Any]) -> None:
+        """Remove items of removed lines from search index.
+
+        Method is a hook for :data:`.g_hooks_removed`, so removal of
+        topics updates index without a walk over the outline.
+
+        :param p_ui_model: storage from which items were removed.
+        :param p_items: removed items.
+        """
+        if p_ui_model is not self._ui_model_index or self._stale_index:
+            return
+
+        for item in p_items:
+            self._index.remove(item)
+
 
 class InitSummaryOutlineId:
     """Summary of item selected in outline of identity items.
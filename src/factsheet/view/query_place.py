@@ -78,7 +78,7 @@ class QueryPlace:
 
     def __init__(self, p_parent: Gtk.Window, p_view_topics:
                  VTYPES.ViewOutlineTopics) -> None:
-        builder = Gtk.Builder.new_from_file(self.NAME_FILE_QUERY_UI)
+        builder = UI.new_builder(self.NAME_FILE_QUERY_UI)
         get_object = builder.get_object
         self._dialog = get_object('ui_dialog_query_place')
         self._dialog.set_transient_for(p_parent)
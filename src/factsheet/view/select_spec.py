@@ -20,6 +20,7 @@ from pathlib import Path
 import typing
 
 import factsheet.bridge_ui as BUI
+import factsheet.instrument as INSTR
 import factsheet.spec as SPECS
 import factsheet.spec.base_s as SBASE
 import factsheet.view.id as VID
@@ -178,6 +179,7 @@ class SelectSpec:
         C_FIRST = 0
         self._ui_outline_specs.set_search_column(C_FIRST)
         entry_search = p_get_ui_element('ui_search_entry')
+        INSTR.time_signal(entry_search, 'changed', 'SelectSpec.search')
         self._ui_outline_specs.set_search_entry(entry_search)
         self._ui_outline_specs.set_search_equal_func(
             self._match_spec_ne, None)
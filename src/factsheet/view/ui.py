@@ -37,7 +37,8 @@ Exceptions
 
 Sheet Dialogs
 -------------
-All factsheet pages share guidance dialogs.
+All factsheet pages share guidance dialogs.  Module constructs each
+dialog on first access (see :func:`.get_guide`).
 
 .. data:: ABOUT_APP
 
@@ -108,7 +109,8 @@ Supporting deinitions for user interface elements for topics.
 
 Topic Dialogs
 -------------
-All topic forms share guidance dialogs.
+All topic forms share guidance dialogs.  Module constructs each
+dialog on first access (see :func:`.get_guide`).
 
 .. data:: HELP_TOPIC
 
@@ -169,6 +171,7 @@ implementation-specific details.
 
 """
 import abc
+import functools
 import logging
 import typing
 
@@ -203,49 +206,33 @@ DIR_UI = Path(__file__).parent / 'ui'
 
 # Application/Sheet dialogs
 NAME_FILE_GUIDE_SHEET_UI = str(DIR_UI / 'guide_sheet.ui')
-builder_guide_sheet = Gtk.Builder.new_from_file(NAME_FILE_GUIDE_SHEET_UI)
-get_object_guide_sheet = builder_guide_sheet.get_object
-
-ABOUT_APP = get_object_guide_sheet('ui_about_app')
-ABOUT_APP.set_version(FS.__version__)
-HELP_APP = get_object_guide_sheet('ui_help_app')
-INTRO_APP = get_object_guide_sheet('ui_intro_app')
-
-HELP_SHEET = get_object_guide_sheet('ui_help_sheet')
-# HELP_SHEET_DISPLAY = get_object_guide_sheet('ui_help_sheet_display')
-# HELP_SHEET_FILE = get_object_guide_sheet('ui_help_sheet_file')
-# HELP_SHEET_TOPICS = get_object_guide_sheet('ui_help_sheet_topics')
-
-del get_object_guide_sheet
-del builder_guide_sheet
 
 # Topic-level definitions
 
 # Topic-level guidance dialogs
 NAME_FILE_GUIDE_TOPIC_UI = str(DIR_UI / 'guide_topic.ui')
-builder_guide_topic = Gtk.Builder.new_from_file(NAME_FILE_GUIDE_TOPIC_UI)
-get_object_guide_topic = builder_guide_topic.get_object
-
-HELP_TOPIC = get_object_guide_topic('ui_help_topic')
-HELP_TOPIC_DISPLAY = get_object_guide_topic('ui_help_topic_display')
 
-del get_object_guide_topic
-del builder_guide_topic
+_GUIDES = dict(
+    ABOUT_APP=(NAME_FILE_GUIDE_SHEET_UI, 'ui_about_app'),
+    HELP_APP=(NAME_FILE_GUIDE_SHEET_UI, 'ui_help_app'),
+    INTRO_APP=(NAME_FILE_GUIDE_SHEET_UI, 'ui_intro_app'),
+    HELP_SHEET=(NAME_FILE_GUIDE_SHEET_UI, 'ui_help_sheet'),
+    # HELP_SHEET_DISPLAY=(NAME_FILE_GUIDE_SHEET_UI, 'ui_help_sheet_display'),
+    # HELP_SHEET_FILE=(NAME_FILE_GUIDE_SHEET_UI, 'ui_help_sheet_file'),
+    # HELP_SHEET_TOPICS=(NAME_FILE_GUIDE_SHEET_UI, 'ui_help_sheet_topics'),
+    HELP_TOPIC=(NAME_FILE_GUIDE_TOPIC_UI, 'ui_help_topic'),
+    HELP_TOPIC_DISPLAY=(NAME_FILE_GUIDE_TOPIC_UI, 'ui_help_topic_display'),
+    )
 
 
 # Fact-level definitions
 
 # # Fact dialogs
 # NAME_FILE_GUIDE_FACT_UI = str(DIR_UI / 'guide_fact.ui')
-# builder_guide_fact = Gtk.Builder.new_from_file(NAME_FILE_GUIDE_FACT_UI)
-# get_object_guide_fact = builder_guide_fact.get_object
 #
-# HELP_FACT = get_object_guide_fact('ui_help_fact')
-# HELP_FACT_DISPLAY = get_object_guide_fact('ui_help_fact_display')
-# HELP_FACT_VALUE = get_object_guide_fact('ui_help_fact_value')
-#
-# del builder_guide_fact
-# del get_object_guide_fact
+# HELP_FACT = (NAME_FILE_GUIDE_FACT_UI, 'ui_help_fact')
+# HELP_FACT_DISPLAY = (NAME_FILE_GUIDE_FACT_UI, 'ui_help_fact_display')
+# HELP_FACT_VALUE = (NAME_FILE_GUIDE_FACT_UI, 'ui_help_fact_value')
 
 # Fact Types
 # Not defined yet.
@@ -334,20 +321,16 @@ class GetUiElementByPath(GetUiElement):
     def __init__(self, *, p_path_ui: Path, **kwargs) -> None:
         """Initialize underlying builder and log source of description.
 
+        Builder reads description file once per session (see
+        :func:`.new_builder`).
+
         :param p_path_ui: location of user interface description file.
         :raises UiDescriptionError: when user interface description is
             missing or inaccessible.
         """
         super().__init__(**kwargs)
         logger.debug('... from file {}.'.format(str(p_path_ui)))
-        try:    # Reduce potential for new_from_file() abort.
-            with p_path_ui.open() as _io_none:
-                pass
-        except Exception as err_access:
-            MESSAGE = ('Could not access description file "{}".'
-                       ''.format(p_path_ui.name))
-            raise UiDescriptionError(MESSAGE) from err_access
-        self._builder = Gtk.Builder.new_from_file(str(p_path_ui))
+        self._builder = new_builder(p_path_ui)
 
 
 class GetUiElementByStr(GetUiElement):
@@ -377,6 +360,84 @@ class GetUiElementByStr(GetUiElement):
         return ui_object
 
 
+def __getattr__(p_name: str) -> typing.Any:
+    """Return shared guidance dialog, constructing dialog on first use.
+
+    Module constructs guidance dialogs (for example, :data:`HELP_APP`)
+    when a view first asks for them rather than when application
+    starts.
+
+    :param p_name: name of guidance dialog.
+    :raises AttributeError: when module defines no item with name.
+    """
+    try:
+        name_file, id_ui = _GUIDES[p_name]
+    except KeyError:
+        MESSAGE = "module '{}' has no attribute '{}'".format(
+            __name__, p_name)
+        raise AttributeError(MESSAGE) from None
+
+    dialog = get_guide(name_file)(id_ui)
+    if 'ABOUT_APP' == p_name:
+        dialog.set_version(FS.__version__)
+    globals()[p_name] = dialog
+    return dialog
+
+
+@functools.lru_cache(maxsize=None)
+def get_guide(p_name_file: str) -> GetUiElementByPath:
+    """Return source of guidance dialogs in description file.
+
+    All dialogs in a description file share one builder.
+
+    :param p_name_file: location of guidance description file.
+    """
+    return GetUiElementByPath(p_path_ui=Path(p_name_file))
+
+
+def new_builder(p_path: typing.Union[Path, str]) -> Gtk.Builder:
+    """Return builder for user interface description file.
+
+    Every view and dialog builds from a description file through this
+    function, so each file is read once per session (see
+    :func:`.read_description`).  A builder constructs new objects for
+    each view, so each call parses the cached description.
+
+    :param p_path: location of user interface description file.
+    :raises UiDescriptionError: when user interface description is
+        missing or inaccessible.
+    """
+    path = Path(p_path)
+    try:    # Reduce potential for new_from_string() abort.
+        description = read_description(path)
+    except Exception as err_access:
+        MESSAGE = ('Could not access description file "{}".'
+                   ''.format(path.name))
+        raise UiDescriptionError(MESSAGE) from err_access
+    ALL = -1
+    return Gtk.Builder.new_from_string(description, ALL)
+
+
+def new_column_fixed(p_title: str, p_data_func,  # : 'Gtk.TreeCellDataFunc'
+                     p_width: int = 160) -> Gtk.TreeViewColumn:
+    """Return column with stock properties and fixed width.
+
+    A view draws rows of a fixed-width column without measuring each
+    row.  When every column of a view has fixed width, the view may
+    use fixed-height mode, which keeps scrolling and expansion smooth
+    regardless of the number of rows.  The user may resize the column.
+
+    :param p_title: title for column.
+    :param p_data_func: function to format column contents.
+    :param p_width: initial width of column.
+    """
+    column = new_column_stock(p_title, p_data_func)
+    column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
+    column.set_fixed_width(p_width)
+    column.set_resizable(True)
+    return column
+
+
 def new_column_stock(p_title: str, p_data_func  # : 'Gtk.TreeCellDataFunc'
                      ) -> Gtk.TreeViewColumn:
     """Return column with stock properties.
@@ -394,3 +455,16 @@ def new_column_stock(p_title: str, p_data_func  # : 'Gtk.TreeCellDataFunc'
     column.set_reorderable(True)
     column.set_sizing(Gtk.TreeViewColumnSizing.AUTOSIZE)
     return column
+
+
+@functools.lru_cache(maxsize=None)
+def read_description(p_path: Path) -> str:
+    """Return user interface description from file.
+
+    Function caches each description.  Each window or dialog that
+    uses a description file builds from the cached text rather than
+    from the file.
+
+    :param p_path: location of user interface description file.
+    """
+    return p_path.read_text(encoding='utf-8')
@@ -9,6 +9,8 @@ import typing
 
 import factsheet.bridge_ui as BUI
 import factsheet.control.control_sheet as CSHEET
+import factsheet.control.scheduler_check as CSCHEDULE
+import factsheet.instrument as INSTR
 # from factsheet.view import query_place as QPLACE
 # from factsheet.view import query_template as QTEMPLATE
 import factsheet.view.editor_topics as VTOPICS
@@ -20,9 +22,6 @@ import factsheet.view.view_markup as VMARKUP
 import factsheet.view.ui as UI
 from factsheet.control.control_sheet import g_control_app
 
-# Issue #249 stub
-import factsheet.spec.base_s as SBASE
-
 gi.require_version('Gdk', '3.0')
 from gi.repository import Gdk   # noqa: E402
 from gi.repository import Gio   # noqa: E402
@@ -76,7 +75,14 @@ class AppFactsheet(Gtk.Application):
         _view = ViewSheet(p_control=control_sheet)
 
     def do_shutdown(self) -> None:
-        """Application teardown. """
+        """Application teardown.
+
+        Stop any profile capture and log session summary of timers and
+        counters (see :mod:`.instrument`).
+        """
+        CSCHEDULE.g_scheduler_check.shutdown()
+        _ = INSTR.g_instruments.stop_profile()
+        INSTR.g_instruments.log_summary()
         Gtk.Application.do_shutdown(self)
         logger.info('AppFactsheet application shutdown.')
 
@@ -266,7 +272,7 @@ class ViewSheet(CSHEET.ObserverControlSheet):
         """
         self._control = p_control
         self._control.add_view(self)
-        builder = Gtk.Builder.new_from_file(self.NAME_FILE_SHEET_UI)
+        builder = UI.new_builder(self.NAME_FILE_SHEET_UI)
         get_object = builder.get_object
         self._window = get_object('ui_sheet')
         global g_app
@@ -356,6 +362,8 @@ class ViewSheet(CSHEET.ObserverControlSheet):
             self._window, 'show-help-app', self.on_show_dialog, UI.HELP_APP)
         UI.new_action_active_dialog(
             self._window, 'show-about-app', self.on_show_dialog, UI.ABOUT_APP)
+        UI.new_action_active(
+            self._window, 'toggle-profile', self.on_toggle_profile)
 
     def _init_factsheet_menu(self):
         """Initialize factsheet menu.
@@ -621,6 +629,15 @@ class ViewSheet(CSHEET.ObserverControlSheet):
         p_dialog.hide()
         p_dialog.set_transient_for(None)
 
+    def on_toggle_profile(self, _action: Gio.SimpleAction,
+                          _target: GLib.Variant) -> None:
+        """Start profile capture or stop capture in progress.
+
+        Stopping a capture logs a profile report and saves profile
+        statistics (see :meth:`.Instruments.toggle_profile`).
+        """
+        _ = INSTR.g_instruments.toggle_profile()
+
     def on_toggle_search_field(self, px_button: Gtk.ToggleButton, p_field
                                ) -> None:
         # ASHEET.FieldsTopic) -> None:
@@ -34,7 +34,7 @@ class ViewTopic:
         :param p_control: control for topic the view presents.
         """
         self._control = p_control
-        builder = Gtk.Builder.new_from_file(self.NAME_FILE_TOPIC_UI)
+        builder = UI.new_builder(self.NAME_FILE_TOPIC_UI)
         get_object = builder.get_object
 
         # Components
@@ -0,0 +1,3 @@
+"""
+Benchmarks for Factsheet.  Each benchmark module runs as a script.
+"""
@@ -0,0 +1,114 @@
+"""
+Benchmark search of identity fields.  See :mod:`.index_id`.
+
+Run from the test directory with, for example,
+``PYTHONPATH=../src python -m factsheet_bench.bench_index_id``.
+The benchmark compares a substring test of each item, in the style of
+the former ``InitSearchOutlineId._match_spec_ne``, with
+:class:`.IndexId` for items with 100,000 names, summaries, and titles.
+Each search visits every item as a search function for an outline
+does.  The benchmark also times change to one item's text.
+"""
+import random
+import time
+import typing
+
+import factsheet.abc_types.abc_stalefile as ABC_STALE
+import factsheet.view.id as VID
+import factsheet.view.index_id as VINDEX
+
+N_ITEMS = 100000
+KEYS = ['7', 'c 4', 'Topic 12345', 'about 9876', 'zebra']
+SCOPE = VID.FieldsId.NAME | VID.FieldsId.TITLE
+
+
+class Text:
+    """Text model that notifies stale hooks on change."""
+
+    def __init__(self, p_text: str) -> None:
+        self._text = p_text
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @text.setter
+    def text(self, p_text: str) -> None:
+        self._text = p_text
+        ABC_STALE.notify_stale(self)
+
+
+class Item:
+    """Item with identity fields."""
+
+    def __init__(self, p_n: int) -> None:
+        self.name = Text('Topic {}'.format(p_n))
+        self.summary = Text('This topic is about {} and {}.'.format(
+            p_n, random.randrange(N_ITEMS)))
+        self.title = Text('Title of topic {}'.format(p_n))
+
+
+def match_scan(p_item: Item, p_key: str, p_scope: VID.FieldsId) -> bool:
+    """Return True when item contains key in a field in scope.
+
+    :param p_item: item to check.
+    :param p_key: text to find.
+    :param p_scope: fields to search.
+    """
+    if p_scope & VID.FieldsId.NAME and p_key in p_item.name.text:
+        return True
+
+    if p_scope & VID.FieldsId.SUMMARY and p_key in p_item.summary.text:
+        return True
+
+    return bool(p_scope & VID.FieldsId.TITLE and p_key in p_item.title.text)
+
+
+def time_search(p_match: typing.Callable[[Item, str, VID.FieldsId], bool],
+                p_items: typing.Sequence[Item], p_key: str) -> float:
+    """Return seconds to check every item for key.
+
+    :param p_match: check to time.
+    :param p_items: items to check.
+    :param p_key: text to find.
+    """
+    start = time.perf_counter()
+    for item in p_items:
+        _ = p_match(item, p_key, SCOPE)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run benchmarks."""
+    random.seed(0)
+    items = [Item(i) for i in range(N_ITEMS)]
+    index = VINDEX.IndexId()
+    start = time.perf_counter()
+    for item in items:
+        index.add(item)
+    print('Index {} items: {:.2f}s'.format(
+        N_ITEMS, time.perf_counter() - start))
+    print('Search for key (scan, index lookup, index per line)')
+    for key in KEYS:
+        expect = {id(i) for i in items if match_scan(i, key, SCOPE)}
+        assert expect == index.find(key, SCOPE)
+        seconds_scan = time_search(match_scan, items, key)
+        index._cache = None
+        start = time.perf_counter()
+        _ = index.find(key, SCOPE)
+        seconds_find = time.perf_counter() - start
+        seconds_line = time_search(index.is_match, items, key)
+        print('    {:<12s} {:7d} found: {:8.4f}s {:8.4f}s {:8.4f}s'.format(
+            repr(key), len(expect), seconds_scan, seconds_find,
+            seconds_line))
+    index.start_updates()
+    start = time.perf_counter()
+    items[N_ITEMS // 2].name.text = 'Topic renamed'
+    seconds = time.perf_counter() - start
+    index.stop_updates()
+    assert index.is_match(items[N_ITEMS // 2], 'renamed', SCOPE)
+    print('Update one name: {:.6f}s'.format(seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark traversal of a multi-level outline.  See :mod:`.store_outline`.
+
+Run from the test directory with, for example,
+``PYTHONPATH=../src python -m factsheet_bench.bench_outline``.
+The benchmark compares a recursive traversal in the style of the former
+``ModelOutlineMulti.lines_section`` with the iterative traversals of
+:class:`.StoreOutline`.  Each traversal produces depth, line, and item
+for every line of an outline of 100,000 lines nested 20 deep.
+"""
+import time
+import typing
+
+import factsheet.bridge_gtk.store_outline as BSTORE
+
+N_LINES = 100000
+DEPTH = 20
+
+Walk = typing.Iterator[typing.Tuple[int, BSTORE.LineStore, typing.Any]]
+
+
+def new_store() -> BSTORE.StoreOutline[int]:
+    """Return outline of chains of lines, each chain DEPTH lines deep."""
+    store = BSTORE.StoreOutline[int]()
+    line = None
+    for i in range(N_LINES):
+        if 0 == i % DEPTH:
+            line = None
+        line = store.insert_child(i, line)
+    return store
+
+
+def walk_depth(p_store: BSTORE.StoreOutline) -> Walk:
+    """Return traversal with depth computed separately for each line.
+
+    :param p_store: outline to traverse.
+    """
+    for line in p_store.lines_section():
+        yield p_store.depth(line), line, p_store.get_item(line)
+
+
+def walk_recursive(p_store: BSTORE.StoreOutline,
+                   p_line: typing.Optional[BSTORE.LineStore] = None,
+                   p_depth: int = -1) -> Walk:
+    """Return traversal with generator for each line.
+
+    :param p_store: outline to traverse.
+    :param p_line: root line of section.
+    :param p_depth: depth of root line.
+    """
+    if p_line is not None:
+        yield p_depth, p_line, p_store.get_item(p_line)
+    line = p_store.child_first(p_line)
+    while line is not None:
+        yield from walk_recursive(p_store, line, p_depth + 1)
+        line = p_store.next(line)
+
+
+def time_walk(p_walk: typing.Callable[[BSTORE.StoreOutline], Walk],
+              p_store: BSTORE.StoreOutline) -> float:
+    """Return seconds to traverse outline.
+
+    :param p_walk: traversal to time.
+    :param p_store: outline to traverse.
+    """
+    start = time.perf_counter()
+    for _ in p_walk(p_store):
+        pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run benchmarks."""
+    store = new_store()
+    assert (list(walk_recursive(store)) == list(walk_depth(store))
+            == list(store.walk()))
+    print('Traverse {} lines, {} deep'.format(N_LINES, DEPTH))
+    seconds_base = None
+    for name, walk in [('Recursive', walk_recursive),
+                       ('Iterative with depth()', walk_depth),
+                       ('StoreOutline.walk', BSTORE.StoreOutline.walk)]:
+        seconds = min(time_walk(walk, store) for _ in range(5))
+        if seconds_base is None:
+            seconds_base = seconds
+        print('    {:<24s}: {:9.4f}s x{:.2f}'.format(
+            name, seconds, seconds / seconds_base))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark construction of indexed sets.  See :mod:`.setindexed`.
+
+Run from the test directory with, for example,
+``PYTHONPATH=../src python -m factsheet_bench.bench_setindexed``.
+Construction time should grow linearly with set size, so each ten-fold
+increase in size should take about ten times as long.
+"""
+import time
+import typing
+
+import factsheet.content.sets.int.topic_segint as XSEGINT
+import factsheet.model.setindexed as MSET
+
+BOUNDS = [10**3, 10**4, 10**5, 10**6]
+
+
+def time_segint(p_bound: int) -> float:
+    """Return seconds to construct initial segment topic.
+
+    :param p_bound: upper bound of segment.
+    """
+    start = time.perf_counter()
+    _ = XSEGINT.SegInt(
+        p_bound=p_bound, p_name='', p_summary='', p_title='')
+    return time.perf_counter() - start
+
+
+def time_setindexed(p_bound: int) -> float:
+    """Return seconds to construct indexed set of integers.
+
+    :param p_bound: number of members.
+    """
+    start = time.perf_counter()
+    _ = MSET.SetIndexed[int](range(p_bound))
+    return time.perf_counter() - start
+
+
+def report(p_name: str, p_timer: typing.Callable[[int], float]) -> None:
+    """Print construction times and growth ratios for each bound.
+
+    :param p_name: name of construction.
+    :param p_timer: function to time construction for a bound.
+    """
+    print(p_name)
+    seconds_prev = None
+    for bound in BOUNDS:
+        seconds = p_timer(bound)
+        ratio = ''
+        if seconds_prev:
+            ratio = 'x{:.1f}'.format(seconds / seconds_prev)
+        print('    {:>9d}: {:9.4f}s {}'.format(bound, seconds, ratio))
+        seconds_prev = seconds
+
+
+def main() -> None:
+    """Run benchmarks."""
+    report('SetIndexed', time_setindexed)
+    report('SegInt', time_segint)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark application startup.  See :mod:`.app`.
+
+Run from the test directory with, for example,
+``PYTHONPATH=../src python -m factsheet_bench.bench_startup``.
+Each measurement runs in a fresh interpreter, so every import is cold.
+The benchmark reports the best of several runs for:
+
+* import of the modules the application loads at startup, along with
+  the number of Factsheet modules loaded and whether specs loaded;
+* import of specs and content templates, which load on the first New
+  Topic action; and
+* time from interpreter start to first window on screen.
+
+Time to first window requires a display and runs the application.
+Close any running Factsheet application first, since a second instance
+hands its request to the first and exits.
+"""
+import os
+import subprocess
+import sys
+import typing
+
+N_RUNS = 5
+
+MODULES_LAZY = ['factsheet.spec', 'factsheet.content.man_content']
+MODULE_STARTUP = 'factsheet.view.view_sheet'
+
+SCRIPT_IMPORT = """
+import sys
+import time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+n_modules = sum(1 for m in sys.modules if m.startswith('factsheet'))
+print(seconds, n_modules, 'factsheet.spec' in sys.modules)
+"""
+
+SCRIPT_WINDOW = """
+import time
+start = time.perf_counter()
+import factsheet.view.view_sheet as VSHEET
+from gi.repository import GLib
+
+def on_window_added(p_app, p_window):
+    def on_draw(*_args):
+        p_window.disconnect(id_draw)
+        print(time.perf_counter() - start)
+        GLib.idle_add(p_app.quit)
+        return False
+
+    id_draw = p_window.connect('draw', on_draw)
+
+VSHEET.g_app.connect('window-added', on_window_added)
+VSHEET.g_app.run([])
+"""
+
+
+def run_script(p_script: str) -> typing.List[str]:
+    """Return fields of last line script prints in fresh interpreter.
+
+    :param p_script: Python source to run.
+    """
+    result = subprocess.run(
+        [sys.executable, '-c', p_script], stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL, env=os.environ.copy(), check=True,
+        universal_newlines=True)
+    return result.stdout.strip().splitlines()[-1].split()
+
+
+def report_import(p_module: str) -> None:
+    """Print best time to import module with count of modules loaded.
+
+    :param p_module: name of module to import.
+    """
+    runs = [run_script(SCRIPT_IMPORT.format(module=p_module))
+            for _ in range(N_RUNS)]
+    seconds = min(float(r[0]) for r in runs)
+    _, n_modules, has_specs = runs[0]
+    print('    {:<32s}: {:8.4f}s  {:>4s} modules  specs loaded: {}'.format(
+        p_module, seconds, n_modules, has_specs))
+
+
+def report_window() -> None:
+    """Print best time from interpreter start to first window drawn."""
+    try:
+        seconds = min(float(run_script(SCRIPT_WINDOW)[0])
+                      for _ in range(N_RUNS))
+    except (subprocess.CalledProcessError, IndexError, ValueError):
+        print('    First window: not measured (no display?)')
+        return
+
+    print('    First window: {:8.4f}s'.format(seconds))
+
+
+def main() -> None:
+    """Run benchmarks."""
+    print('Startup imports (best of {})'.format(N_RUNS))
+    report_import(MODULE_STARTUP)
+    print('Imports on first New Topic')
+    for module in MODULES_LAZY:
+        report_import(module)
+    print('Time to first window')
+    report_window()
+
+
+if __name__ == '__main__':
+    main()
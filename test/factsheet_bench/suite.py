@@ -0,0 +1,431 @@
+"""
+Benchmark suite for model, outline, persistence, and fact engines.
+
+Run from the test directory with, for example,
+``PYTHONPATH=../src python -m factsheet_bench.suite``.
+The suite times each case in :data:`CASES` over the case's sizes and
+reports the best of several repeats.  With option ``--save``, the suite
+records the results as the baseline (by default,
+``factsheet_bench/baseline.json``).  Otherwise, the suite compares the
+results with the baseline and reports each regression.  Exit status is
+1 when there is at least one regression and 0 otherwise.
+
+Timings depend on the machine, so record a baseline on the machine
+that runs the comparison.  Use option ``--case`` to run only the cases
+with names that contain given text.
+
+.. data:: CASES
+
+    Mapping from name of benchmark case to sizes for the case and
+    factory for the code to time.  The factory takes a size, sets up
+    the case untimed, and returns a function to time.
+
+.. data:: PATH_BASELINE
+
+    Default location of baseline results.
+
+.. data:: Results
+
+    Type hint for benchmark results: a mapping from case name to
+    mapping from size (as text, for JSON) to seconds.
+"""
+import argparse
+import json
+from pathlib import Path
+import platform
+import random
+import sys
+import tempfile
+import time
+import typing
+
+import factsheet.bridge_gtk.bridge_outline as BOUTLINE
+import factsheet.content.ops.facts_op as XFACTS_OP
+import factsheet.content.ops.int.topic_plusmodn as XPLUS_N
+import factsheet.control.control_sheet as CSHEET
+import factsheet.control.format_sheet as CFORMAT
+import factsheet.model.fact as MFACT
+import factsheet.model.setindexed as MSET
+import factsheet.model.sheet as MSHEET
+import factsheet.model.topic as MTOPIC
+
+Run = typing.Callable[[], typing.Any]
+NewRun = typing.Callable[[int], Run]
+Results = typing.Dict[str, typing.Dict[str, float]]
+
+DEPTH_OUTLINE = 20
+N_LOOKUPS = 1000
+N_STALE_CHECKS = 1000
+PATH_BASELINE = Path(__file__).parent / 'baseline.json'
+SIZES_MODEL = [10**3, 10**4, 10**5]
+SIZES_OP = [10, 30, 100]
+SIZES_SHEET = [10, 100, 1000]
+
+
+def new_closed_check(p_size: int) -> Run:
+    """Return check of Closed fact for modular addition on set of size.
+
+    Setup clears the fact outcome cache so that check computes the
+    operation table.
+
+    :param p_size: number of members and modulus.
+    """
+    operation = XPLUS_N.PlusModN(
+        p_set=MSET.SetIndexed[int](range(p_size)), p_modulus=p_size)
+    fact = XFACTS_OP.Closed(p_topic=operation)
+    MFACT.g_cache_outcome.clear()
+    return fact.check
+
+
+def new_control(p_size: int, p_path: typing.Optional[Path] = None
+                ) -> CSHEET.ControlSheet:
+    """Return factsheet control with topics outline of given size.
+
+    :param p_size: number of topics.
+    :param p_path: location of file for factsheet.
+    """
+    control = CSHEET.ControlSheet(p_path=p_path)
+    line = None
+    for i in range(p_size):
+        if 0 == i % DEPTH_OUTLINE:
+            line = None
+        topic = MTOPIC.Topic(
+            p_name='Topic {}'.format(i),
+            p_summary='Summary of topic {}.'.format(i),
+            p_title='Title of topic {}'.format(i))
+        line = control.insert_topic_child(topic, line)
+    return control
+
+
+def new_outline(p_size: int) -> BOUTLINE.ModelOutlineMulti[int]:
+    """Return outline of chains of lines, each chain DEPTH_OUTLINE lines
+    deep.
+
+    :param p_size: number of lines.
+    """
+    outline = BOUTLINE.ModelOutlineMulti[int]()
+    insert_chains(outline, p_size)
+    return outline
+
+
+def new_outline_extend(p_size: int) -> Run:
+    """Return bulk insert of chains of lines into empty outline.
+
+    :param p_size: number of lines.
+    """
+    preorder = [(i % DEPTH_OUTLINE, i) for i in range(p_size)]
+    outline = BOUTLINE.ModelOutlineMulti[int]()
+    return lambda: outline.extend_section(preorder)
+
+
+def new_outline_insert(p_size: int) -> Run:
+    """Return insert of lines into empty outline.
+
+    :param p_size: number of lines.
+    """
+    outline = BOUTLINE.ModelOutlineMulti[int]()
+    return lambda: insert_chains(outline, p_size)
+
+
+def new_outline_set_persist(p_size: int) -> Run:
+    """Return fill of empty outline from persistent form of outline.
+
+    :param p_size: number of lines.
+    """
+    persist = new_outline(p_size)._get_persist()
+    outline = BOUTLINE.ModelOutlineMulti[int]()
+    return lambda: outline._set_persist(persist)
+
+
+def new_outline_walk(p_size: int) -> Run:
+    """Return traversal of every line of outline.
+
+    :param p_size: number of lines.
+    """
+    outline = new_outline(p_size)
+
+    def run() -> None:
+        for _ in outline.walk():
+            pass
+
+    return run
+
+
+def new_plusmodn_new(p_size: int) -> Run:
+    """Return construction of modular addition on set of size.
+
+    :param p_size: number of members and modulus.
+    """
+    set_int = MSET.SetIndexed[int](range(p_size))
+    return lambda: XPLUS_N.PlusModN(p_set=set_int, p_modulus=p_size)
+
+
+def new_setindexed_find(p_size: int) -> Run:
+    """Return :data:`N_LOOKUPS` searches of indexed set by member and by
+    index.
+
+    :param p_size: number of members.
+    """
+    set_int = MSET.SetIndexed[int](range(p_size))
+    members = [random.randrange(p_size) for _ in range(N_LOOKUPS)]
+    indices = [e.index for e in (
+        set_int.find_element(p_member=m) for m in members)]
+
+    def run() -> None:
+        for member in members:
+            _ = set_int.find_element(p_member=member)
+        for index in indices:
+            _ = set_int.find_element(p_index=index)
+
+    return run
+
+
+def new_setindexed_new(p_size: int) -> Run:
+    """Return construction of indexed set of integers.
+
+    :param p_size: number of members.
+    """
+    return lambda: MSET.SetIndexed[int](range(p_size))
+
+
+def new_sheet_is_stale(p_size: int) -> Run:
+    """Return :data:`N_STALE_CHECKS` change checks of fresh factsheet.
+
+    :param p_size: number of topics.
+    """
+    sheet = MSHEET.Sheet()
+    line = None
+    for i in range(p_size):
+        if 0 == i % DEPTH_OUTLINE:
+            line = None
+        topic = MTOPIC.Topic(p_name='Topic {}'.format(i),
+                             p_summary='', p_title='')
+        line = sheet.insert_topic_child(topic, line)
+    sheet.set_fresh()
+
+    def run() -> None:
+        for _ in range(N_STALE_CHECKS):
+            _ = sheet.is_stale()
+
+    return run
+
+
+def new_sheet_load(p_size: int) -> Run:
+    """Return eager load of factsheet model from file.
+
+    Each run opens the file, loads the outline and every topic body,
+    and closes the file.  A lazy load would time only the outline.
+
+    :param p_size: number of topics.
+    """
+    dir_temp = tempfile.TemporaryDirectory()
+    path = Path(dir_temp.name) / 'bench.fsg'
+    control = new_control(p_size, path)
+    control.save(p_backup=False)
+
+    def run() -> None:
+        _ = dir_temp
+        with path.open(mode='rb') as io_in:
+            _ = CFORMAT.load_sheet(io_in)
+
+    return run
+
+
+def new_sheet_save(p_size: int) -> Run:
+    """Return full save of factsheet to new file.
+
+    :param p_size: number of topics.
+    """
+    dir_temp = tempfile.TemporaryDirectory()
+    path = Path(dir_temp.name) / 'bench.fsg'
+    control = new_control(p_size, path)
+
+    def run() -> None:
+        _ = dir_temp
+        control.save(p_backup=False)
+
+    return run
+
+
+CASES: typing.Dict[str, typing.Tuple[typing.Sequence[int], NewRun]] = dict(
+    setindexed_new=(SIZES_MODEL, new_setindexed_new),
+    setindexed_find=(SIZES_MODEL, new_setindexed_find),
+    plusmodn_new=(SIZES_OP, new_plusmodn_new),
+    closed_check=(SIZES_OP, new_closed_check),
+    outline_insert=(SIZES_MODEL, new_outline_insert),
+    outline_extend=(SIZES_MODEL, new_outline_extend),
+    outline_walk=(SIZES_MODEL, new_outline_walk),
+    outline_set_persist=(SIZES_MODEL, new_outline_set_persist),
+    sheet_save=(SIZES_SHEET, new_sheet_save),
+    sheet_load=(SIZES_SHEET, new_sheet_load),
+    sheet_is_stale=(SIZES_SHEET, new_sheet_is_stale),
+    )
+
+
+def compare(p_results: Results, p_baseline: Results, p_tolerance: float,
+            p_floor: float) -> typing.List[typing.Tuple[str, str]]:
+    """Print results beside baseline and return regressions.
+
+    A result is a regression when it exceeds its baseline by more than
+    the tolerance fraction and by more than the floor.  The floor keeps
+    timer noise in very short cases from counting as a regression.
+
+    :param p_results: results of current run.
+    :param p_baseline: results of baseline run.
+    :param p_tolerance: fraction of baseline allowed as slowdown.
+    :param p_floor: seconds of slowdown always allowed.
+    :returns: case name and size of each regression.
+    """
+    regressions = list()
+    for name, seconds_size in p_results.items():
+        print(name)
+        baseline_size = p_baseline.get(name, dict())
+        for size, seconds in seconds_size.items():
+            base = baseline_size.get(size)
+            if base is None:
+                print('    {:>9s}: {:9.4f}s  (no baseline)'.format(
+                    size, seconds))
+                continue
+
+            flag = ''
+            if (seconds > base * (1.0 + p_tolerance)
+                    and seconds - base > p_floor):
+                flag = '  REGRESSION'
+                regressions.append((name, size))
+            print('    {:>9s}: {:9.4f}s  baseline {:9.4f}s  x{:.2f}{}'
+                  ''.format(size, seconds, base,
+                            seconds / base if base else float('inf'),
+                            flag))
+    return regressions
+
+
+def insert_chains(p_outline: BOUTLINE.ModelOutlineMulti[int],
+                  p_size: int) -> None:
+    """Insert lines into outline as chains DEPTH_OUTLINE lines deep.
+
+    :param p_outline: outline for lines.
+    :param p_size: number of lines.
+    """
+    line = None
+    for i in range(p_size):
+        if 0 == i % DEPTH_OUTLINE:
+            line = None
+        line = p_outline.insert_child(i, line)
+
+
+def load_baseline(p_path: Path) -> Results:
+    """Return baseline results from file or empty results when there is
+    no file.
+
+    :param p_path: location of baseline file.
+    """
+    try:
+        with p_path.open() as io_in:
+            return json.load(io_in)['results']
+    except FileNotFoundError:
+        return dict()
+
+
+def main(p_argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    """Run benchmarks and return exit status.
+
+    :param p_argv: command-line arguments.  Default is
+        :data:`sys.argv`.
+    """
+    args = new_parser().parse_args(p_argv)
+    random.seed(0)
+    names = [n for n in CASES if args.case in n]
+    results = run_cases(names, args.repeat)
+    if args.save:
+        baseline = load_baseline(args.baseline)
+        baseline.update(results)
+        save_baseline(args.baseline, baseline)
+        print('Saved baseline to {}'.format(args.baseline))
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if not baseline:
+        print('No baseline at {}.  Run with --save to record one.'
+              ''.format(args.baseline))
+    regressions = compare(results, baseline, args.tolerance, args.floor)
+    if regressions:
+        print('{} regression(s): {}'.format(len(regressions), ', '.join(
+            '{}[{}]'.format(n, s) for n, s in regressions)))
+        return 1
+
+    return 0
+
+
+def new_parser() -> argparse.ArgumentParser:
+    """Return parser for command-line arguments."""
+    parser = argparse.ArgumentParser(
+        prog='factsheet_bench.suite',
+        description='Time model, outline, persistence, and fact engines'
+                    ' and compare with baseline.')
+    parser.add_argument(
+        '--baseline', type=Path, default=PATH_BASELINE,
+        help='file of baseline results (default: %(default)s)')
+    parser.add_argument(
+        '--case', default='',
+        help='run only cases with names that contain text')
+    parser.add_argument(
+        '--floor', type=float, default=0.001,
+        help='seconds of slowdown always allowed (default: %(default)s)')
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='runs of each case and size (default: %(default)s)')
+    parser.add_argument(
+        '--save', action='store_true',
+        help='record results as baseline instead of comparing')
+    parser.add_argument(
+        '--tolerance', type=float, default=0.25,
+        help='fraction of baseline allowed as slowdown'
+             ' (default: %(default)s)')
+    return parser
+
+
+def run_cases(p_names: typing.Iterable[str], p_repeat: int) -> Results:
+    """Return best time of each named case for each of case's sizes.
+
+    Each repeat sets up the case anew, so cases that change their
+    setup (for example, insert into an outline) start the same way
+    every time.
+
+    :param p_names: names of cases to run.
+    :param p_repeat: number of runs of each case and size.
+    """
+    results: Results = dict()
+    for name in p_names:
+        sizes, new_run = CASES[name]
+        results[name] = dict()
+        for size in sizes:
+            results[name][str(size)] = min(
+                time_run(new_run(size)) for _ in range(p_repeat))
+    return results
+
+
+def save_baseline(p_path: Path, p_results: Results) -> None:
+    """Write results to baseline file along with Python version.
+
+    :param p_path: location of baseline file.
+    :param p_results: results to record.
+    """
+    content = dict(python=platform.python_version(),
+                   machine=platform.machine(), results=p_results)
+    with p_path.open(mode='w') as io_out:
+        json.dump(content, io_out, indent=2, sort_keys=True)
+        io_out.write('\n')
+
+
+def time_run(p_run: Run) -> float:
+    """Return seconds to run function.
+
+    :param p_run: function to time.
+    """
+    start = time.perf_counter()
+    _ = p_run()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,7 +1,10 @@
 """
 Unit tests for interface to track file against model.  See
 :mod:`.abc_stale`.
+
+.. include:: /test/refs_include_pytest.txt
 """
+import factsheet.abc_types.abc_stalefile as ABC_STALE
 
 
 class TestInterfaceStaleFile:
@@ -13,3 +16,138 @@ class TestInterfaceStaleFile:
     """
 
     pass
+
+
+class PatchOwner(ABC_STALE.InterfaceStaleOwner):
+    """Stub owner that records reports of change state."""
+
+    def __init__(self):
+        self.reports = list()
+
+    def on_fresh_part(self, p_part):
+        self.reports.append(('fresh', p_part))
+
+    def on_stale_part(self, p_part):
+        self.reports.append(('stale', p_part))
+
+
+class PatchPart(ABC_STALE.PartStale):
+    """Stub part with change state."""
+
+    def __init__(self, p_stale=False):
+        self.stale = p_stale
+
+    def has_not_changed(self):
+        return not self.stale
+
+    def is_stale(self):
+        return self.stale
+
+    def set_fresh(self):
+        self.stale = False
+        self._notify_fresh()
+
+    def set_stale(self):
+        self.stale = True
+        self._notify_stale()
+
+
+class TestPartStale:
+    """Unit tests for reports of change state to owners.  See
+    :class:`.PartStale`.
+    """
+
+    def test_add_owner_stale(self):
+        """| Confirm owner added once.
+        | Case: part fresh and part stale.
+        """
+        # Setup
+        target = PatchPart()
+        owner = PatchOwner()
+        target_stale = PatchPart(p_stale=True)
+        owner_stale = PatchOwner()
+        # Test
+        target.add_owner_stale(owner)
+        target.add_owner_stale(owner)
+        assert [owner] == target._owners_stale
+        assert not owner.reports
+        target_stale.add_owner_stale(owner_stale)
+        assert [('stale', target_stale)] == owner_stale.reports
+
+    def test_add_owner_stale_again(self):
+        """| Confirm owner added once.
+        | Case: stale part reports again to existing owner.
+        """
+        # Setup
+        target = PatchPart(p_stale=True)
+        owner = PatchOwner()
+        target.add_owner_stale(owner)
+        # Test
+        target.add_owner_stale(owner)
+        assert [owner] == target._owners_stale
+        assert [('stale', target), ('stale', target)] == owner.reports
+
+    def test_notify(self):
+        """Confirm each owner learns of change state."""
+        # Setup
+        target = PatchPart()
+        owners = [PatchOwner(), PatchOwner()]
+        for owner in owners:
+            target.add_owner_stale(owner)
+        # Test
+        target.set_stale()
+        target.set_fresh()
+        for owner in owners:
+            assert [('stale', target), ('fresh', target)] == owner.reports
+
+    def test_notify_no_owner(self):
+        """| Confirm notification without owners.
+        | Case: part never had an owner.
+        """
+        # Setup
+        target = PatchPart()
+        # Test
+        target.set_stale()
+        target.set_fresh()
+        assert '_owners_stale' not in target.__dict__
+
+    def test_remove_owner_stale(self):
+        """Confirm owner removed and owner forgets part."""
+        # Setup
+        target = PatchPart(p_stale=True)
+        owner = PatchOwner()
+        owner_keep = PatchOwner()
+        target.add_owner_stale(owner)
+        target.add_owner_stale(owner_keep)
+        # Test
+        target.remove_owner_stale(owner)
+        assert [owner_keep] == target._owners_stale
+        assert ('fresh', target) == owner.reports[-1]
+        target.set_fresh()
+        assert [('stale', target)] == owner.reports[:1]
+        assert 2 == len(owner.reports)
+
+
+class TestModule:
+    """Unit tests for module-level components of :mod:`.abc_stalefile`."""
+
+    def test_notify_stale(self, monkeypatch):
+        """Confirm notification calls each hook with stale component.
+
+        :param monkeypatch: built-in fixture `Pytest monkeypatch`_.
+        """
+        # Setup
+        calls = list()
+        monkeypatch.setattr(ABC_STALE, 'g_hooks_stale', [
+            lambda p_source: calls.append(('a', p_source)),
+            lambda p_source: calls.append(('b', p_source))])
+        SOURCE = 'Parrot'
+        # Test
+        ABC_STALE.notify_stale(SOURCE)
+        assert [('a', SOURCE), ('b', SOURCE)] == calls
+
+    def test_globals(self):
+        """Confirm global definitions."""
+        # Setup
+        # Test
+        assert isinstance(ABC_STALE.g_hooks_stale, list)
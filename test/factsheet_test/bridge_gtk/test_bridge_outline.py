@@ -10,6 +10,7 @@ import pytest
 import typing
 
 import factsheet.bridge_gtk.bridge_outline as BOUTLINE
+import factsheet.bridge_gtk.store_outline as BSTORE
 
 gi.require_version('Gtk', '3.0')
 from gi.repository import GObject as GO  # noqa: E402
@@ -96,6 +97,19 @@ class TestViewChooserOutline:
         assert view.get_model() is outline.ui_model
 
 
+def append_multi(p_model, p_line, p_item):
+    """Append item to :class:`.UiModelOutlineMulti` and return line of
+    item.
+
+    :param p_model: model in which to append item.
+    :param p_line: parent line for item.  None appends item at end of
+        model.
+    :param p_item: item to append.
+    """
+    line = p_model.store.insert_child(p_item, p_model.line_from_iter(p_line))
+    return p_model.iter_from_line(line)
+
+
 def gtk_model_to_names(p_model):
     """Return dictionary of names in a `Gtk.TreeModel`_ indexed by line.
 
@@ -149,11 +163,11 @@ def insert_snippet_children(p_model, p_path) -> BOUTLINE.LineOutline:
     if p_path is not None:
         line = p_model.get_iter_from_string(p_path)
     item = PatchItem('Item cxx', 'Children')
-    i_cxx = p_model.append(line, [item])
+    i_cxx = append_multi(p_model, line, item)
     item = PatchItem('Item cax', 'Children')
-    _i_cax = p_model.append(i_cxx, [item])
+    _i_cax = append_multi(p_model, i_cxx, item)
     item = PatchItem('Item cbx', 'Children')
-    _i_cbx = p_model.append(i_cxx, [item])
+    _i_cbx = append_multi(p_model, i_cxx, item)
     return i_cxx
 
 
@@ -179,13 +193,13 @@ def insert_snippet_multiple(p_model, p_path) -> BOUTLINE.LineOutline:
     if p_path is not None:
         line = p_model.get_iter_from_string(p_path)
     item = PatchItem('Item mxx', 'Multiple')
-    i_mxx = p_model.append(line, [item])
+    i_mxx = append_multi(p_model, line, item)
     item = PatchItem('Item max', 'Multiple')
-    i_max = p_model.append(i_mxx, [item])
+    i_max = append_multi(p_model, i_mxx, item)
     item = PatchItem('Item maa', 'Multiple')
-    _i_maa = p_model.append(i_max, [item])
+    _i_maa = append_multi(p_model, i_max, item)
     item = PatchItem('Item mab', 'Multiple')
-    _i_mab = p_model.append(i_max, [item])
+    _i_mab = append_multi(p_model, i_max, item)
     return i_mxx
 
 
@@ -208,7 +222,7 @@ def insert_snippet_single(p_model, p_path) -> BOUTLINE.LineOutline:
     if p_path is not None:
         line = p_model.get_iter_from_string(p_path)
     item = PatchItem('Item sxx', 'Single')
-    i_sxx = p_model.append(line, [item])
+    i_sxx = append_multi(p_model, line, item)
     return i_sxx
 
 
@@ -229,7 +243,7 @@ def NAMES(request, new_names_model_multi, new_names_model_single):
 
 @pytest.fixture
 def new_gtk_model_multi():
-    """Pytest fixture: Return `Gtk.TreeStore`_ model factory.
+    """Pytest fixture: Return :class:`.UiModelOutlineMulti` model factory.
 
     The structure of each model is as shown below.
 
@@ -245,32 +259,29 @@ def new_gtk_model_multi():
         |         Item 112
 
     :param factory p_tag: identifies model (default is 'Target').
-
-    .. _`Gtk.TreeStore`:
-        https://lazka.github.io/pgi-docs/#Gtk-3.0/classes/TreeStore.html
     """
     def new_model(p_tag='Target'):
-        model = Gtk.TreeStore(GO.TYPE_PYOBJECT)
+        model = BOUTLINE.UiModelOutlineMulti()
         item = PatchItem('Item 0xx', p_tag)
-        i_0xx = model.append(None, [item])
+        i_0xx = append_multi(model, None, item)
         item = PatchItem('Item 00x', p_tag)
-        i_00x = model.append(i_0xx, [item])
+        i_00x = append_multi(model, i_0xx, item)
         item = PatchItem('Item 000', p_tag)
-        _i_000 = model.append(i_00x, [item])
+        _i_000 = append_multi(model, i_00x, item)
         item = PatchItem('Item 01x', p_tag)
-        i_0xx = model.append(i_0xx, [item])
+        i_0xx = append_multi(model, i_0xx, item)
         item = PatchItem('Item 1xx', p_tag)
-        i_1xx = model.append(None, [item])
+        i_1xx = append_multi(model, None, item)
         item = PatchItem('Item 10x', p_tag)
-        _i_10x = model.append(i_1xx, [item])
+        _i_10x = append_multi(model, i_1xx, item)
         item = PatchItem('Item 11x', p_tag)
-        i_11x = model.append(i_1xx, [item])
+        i_11x = append_multi(model, i_1xx, item)
         item = PatchItem('Item 110', p_tag)
-        _i_110 = model.append(i_11x, [item])
+        _i_110 = append_multi(model, i_11x, item)
         item = PatchItem('Item 111', p_tag)
-        _i_111 = model.append(i_11x, [item])
+        _i_111 = append_multi(model, i_11x, item)
         item = PatchItem('Item 112', p_tag)
-        _i_112 = model.append(i_11x, [item])
+        _i_112 = append_multi(model, i_11x, item)
         return model
 
     return new_model
@@ -617,6 +628,76 @@ class TestModelOutline:
 class TestModelOutlineMulti:
     """Unit tests for :class:`.ModelOutlineMulti`."""
 
+    def test_depth(self, new_patch_multi, new_names_model_multi):
+        """Confirm depth of each line.
+
+        :param new_patch_multi: fixture :func:`.new_patch_multi`.
+        :param new_names_model_multi: fixture
+            :func:`.new_names_model_multi`.
+        """
+        # Setup
+        target = new_patch_multi()
+        model = target._ui_model
+        # Test
+        for path_str in new_names_model_multi():
+            line = model.get_iter_from_string(path_str)
+            assert path_str.count(':') == target.depth(line)
+
+    def test_extend_section(self, new_patch_multi):
+        """| Confirm section added from preorder list.
+        | Case: views learn of lines at top of section only.
+
+        :param new_patch_multi: fixture :func:`.new_patch_multi`.
+        """
+        # Setup
+        target = new_patch_multi()
+        model = target._ui_model
+        inserted = list()
+        _ = model.connect('row-inserted',
+                          lambda _m, p_path, _i: inserted.append(str(p_path)))
+        toggled = list()
+        _ = model.connect('row-has-child-toggled',
+                          lambda _m, p_path, _i: toggled.append(str(p_path)))
+        line_parent = model.get_iter_from_string('1:0')
+        PREORDER = [(0, PatchItem('A')), (1, PatchItem('AA')),
+                    (0, PatchItem('B'))]
+        # Test
+        lines_top = target.extend_section(PREORDER, line_parent)
+        assert ['1:0:0', '1:0:1'] == [
+            model.get_string_from_iter(line) for line in lines_top]
+        assert 'AA' == target.get_item(
+            model.get_iter_from_string('1:0:0:0')).name
+        assert ['1:0:0', '1:0:1'] == inserted
+        assert ['1:0:0', '1:0'] == toggled
+
+    def test_extend_section_depth(self, new_patch_multi):
+        """| Confirm section added from preorder list.
+        | Case: line deeper than any possible parent.
+
+        :param new_patch_multi: fixture :func:`.new_patch_multi`.
+        """
+        # Setup
+        target = new_patch_multi()
+        expect = target._get_persist()
+        PREORDER = [(0, PatchItem('A')), (2, PatchItem('AAA'))]
+        # Test
+        with pytest.raises(ValueError):
+            _ = target.extend_section(PREORDER)
+        assert expect == target._get_persist()
+
+    def test_get_item_removed(self, new_patch_multi):
+        """| Confirm item at line.
+        | Case: line removed from outline.
+
+        :param new_patch_multi: fixture :func:`.new_patch_multi`.
+        """
+        # Setup
+        target = new_patch_multi()
+        line = target._ui_model.get_iter_from_string('1:1')
+        target.remove(line)
+        # Test
+        assert target.get_item(line) is None
+
     @pytest.mark.parametrize('METHOD, PATH, POSITION, PATH_NEW', [
             ('insert_after', None, 0, '0'),
             ('insert_after', '0', 4, '1'),
@@ -659,6 +740,31 @@ class TestModelOutlineMulti:
         assert PATH_NEW == model.get_string_from_iter(line_new)
         assert names == [item.name for item in target.items()]
 
+    @pytest.mark.parametrize('PATH, PATHS_NEW', [
+        (None, ['2', '3']),
+        ('0:1', ['0:1:0', '0:1:1']),
+        ])
+    def test_insert_many(self, new_patch_multi, PATH, PATHS_NEW):
+        """| Confirm items added as children of line.
+        | Case: at top level and under line without children.
+
+        :param new_patch_multi: fixture :func:`.new_patch_multi`.
+        :param PATH: path to parent line or None for top level.
+        :param PATHS_NEW: paths of new lines.
+        """
+        # Setup
+        target = new_patch_multi()
+        model = target._ui_model
+        ITEMS = [PatchItem('Item A'), PatchItem('Item B')]
+        line = None
+        if PATH is not None:
+            line = model.get_iter_from_string(PATH)
+        # Test
+        lines_new = target.insert_many(ITEMS, line)
+        assert PATHS_NEW == [
+            model.get_string_from_iter(line) for line in lines_new]
+        assert ITEMS == [target.get_item(line) for line in lines_new]
+
     @pytest.mark.parametrize('SNIPPET, PATH_SOURCE, PATH_TARGET', [
         (insert_snippet_children, '0:0:0', None),
         (insert_snippet_multiple, '1', '1:0'),
@@ -712,6 +818,41 @@ class TestModelOutlineMulti:
         target.insert_section(source, line_parent, line_section)
         assert expect._get_persist() == target._get_persist()
 
+    def test_is_valid(self, new_patch_multi):
+        """| Confirm check of line.
+        | Case: line in outline, removed, and None.
+
+        :param new_patch_multi: fixture :func:`.new_patch_multi`.
+        """
+        # Setup
+        target = new_patch_multi()
+        line_keep = target._ui_model.get_iter_from_string('1:0')
+        line_remove = target._ui_model.get_iter_from_string('1:1')
+        target.remove(line_remove)
+        # Test
+        assert target.is_valid(line_keep)
+        assert not target.is_valid(line_remove)
+        assert not target.is_valid(None)
+
+    def test_is_valid_stale(self, new_patch_multi):
+        """| Confirm check of line.
+        | Case: line removed before insertion of another line.
+
+        :param new_patch_multi: fixture :func:`.new_patch_multi`.
+        """
+        # Setup
+        target = new_patch_multi()
+        line_stale = target.insert_child(PatchItem('a'))
+        target.remove(line_stale)
+        line_new = target.insert_child(PatchItem('c'))
+        N_LINES = len(list(target.lines()))
+        # Test
+        assert not target.is_valid(line_stale)
+        assert target.get_item(line_stale) is None
+        target.remove(line_stale)
+        assert N_LINES == len(list(target.lines()))
+        assert 'c' == target.get_item(line_new).name
+
     @pytest.mark.parametrize('ROOT, BEGIN, END', [
         (None, 0, 11),
         ('1', 4, 11),
@@ -738,6 +879,93 @@ class TestModelOutlineMulti:
                           for l in target.lines_section(root)]
         assert paths_str_section == paths_str_line
 
+    def test_remove_signals(self, new_patch_multi):
+        """Confirm views learn of removal.
+
+        :param new_patch_multi: fixture :func:`.new_patch_multi`.
+        """
+        # Setup
+        target = new_patch_multi()
+        model = target._ui_model
+        deleted = list()
+        _ = model.connect(
+            'row-deleted', lambda _m, p_path: deleted.append(str(p_path)))
+        toggled = list()
+        _ = model.connect('row-has-child-toggled',
+                          lambda _m, p_path, _i: toggled.append(str(p_path)))
+        # Test
+        target.remove(model.get_iter_from_string('0:0:0'))
+        assert ['0:0:0'] == deleted
+        assert ['0:0'] == toggled
+        target.clear()
+        assert ['0:0:0', '1', '0'] == deleted
+        assert 0 == len(model)
+
+    def test_remove_many(self, new_patch_multi):
+        """| Confirm removal of lines.
+        | Case: None, line within removed section, and removed line.
+
+        :param new_patch_multi: fixture :func:`.new_patch_multi`.
+        """
+        # Setup
+        target = new_patch_multi()
+        model = target._ui_model
+        line_section = model.get_iter_from_string('1')
+        line_within = model.get_iter_from_string('1:1:0')
+        line_removed = model.get_iter_from_string('0:1')
+        target.remove(line_removed)
+        LINES = [None, line_section, line_within, line_removed]
+        NAMES = ['Item 0xx', 'Item 00x', 'Item 000']
+        # Test
+        target.remove_many(LINES)
+        assert NAMES == [item.name for item in target.items()]
+
+    def test_remove_many_signals(self, new_patch_multi):
+        """| Confirm views learn of removal.
+        | Case: one signal for each line at top of removed section.
+
+        :param new_patch_multi: fixture :func:`.new_patch_multi`.
+        """
+        # Setup
+        target = new_patch_multi()
+        model = target._ui_model
+        LINES = [model.get_iter_from_string(p)
+                 for p in ['0:0', '0:0:0', '0:1', '1:1:1']]
+        deleted = list()
+        _ = model.connect(
+            'row-deleted', lambda _m, p_path: deleted.append(str(p_path)))
+        toggled = list()
+        _ = model.connect('row-has-child-toggled',
+                          lambda _m, p_path, _i: toggled.append(str(p_path)))
+        # Test
+        target.remove_many(LINES)
+        assert ['1:1:1', '0:1', '0:0'] == deleted
+        assert ['0'] == toggled
+        assert 6 == len(list(target.lines()))
+
+    def test_remove_hooks(self, monkeypatch, new_patch_multi):
+        """| Confirm hooks learn of removed items.
+        | Case: remove many lines and clear outline.
+
+        :param monkeypatch: built-in fixture `Pytest monkeypatch`_.
+        :param new_patch_multi: fixture :func:`.new_patch_multi`.
+        """
+        # Setup
+        target = new_patch_multi()
+        model = target._ui_model
+        calls = list()
+        monkeypatch.setattr(BOUTLINE, 'g_hooks_removed', [
+            lambda p_model, p_items: calls.append(
+                (p_model, [i.name for i in p_items]))])
+        LINES = [model.get_iter_from_string(p) for p in ['0:0', '1:1:1']]
+        # Test
+        target.remove_many(LINES)
+        assert [(model, ['Item 00x', 'Item 000', 'Item 111'])] == calls
+        calls.clear()
+        target.clear()
+        assert [(model, ['Item 0xx', 'Item 01x', 'Item 1xx', 'Item 10x',
+                         'Item 11x', 'Item 110', 'Item 112'])] == calls
+
     def test_set_persist(self, new_patch_multi):
         """Confirm import from persistent form.
 
@@ -751,6 +979,213 @@ class TestModelOutlineMulti:
         target._set_persist(persist)
         assert persist == target._get_persist()
 
+    @pytest.mark.parametrize('ROOT, BEGIN, END', [
+        (None, 0, 11),
+        ('1', 4, 11),
+        ('0:0', 1, 3),
+        ('1:1:0', 7, 8),
+        ])
+    def test_walk(self, new_patch_multi, new_names_model_multi,
+                  ROOT, BEGIN, END):
+        """Confirm iterator over depth, line, and item in section.
+
+        :param ROOT: path to root line of section.
+        :param END: slice [BEGIN:END) contains names of lines in section.
+        """
+        # Setup
+        target = new_patch_multi()
+        model = target._ui_model
+        root = None
+        if ROOT is not None:
+            root = model.get_iter_from_string(ROOT)
+        names = new_names_model_multi()
+        expect = [(p, p.count(':'), names[p])
+                  for p in list(names.keys())[BEGIN:END]]
+        # Test
+        walk = [(model.get_string_from_iter(l), d, i.name)
+                for d, l, i in target.walk(root)]
+        assert expect == walk
+
+
+class TestUiModelOutlineMulti:
+    """Unit tests for :class:`.UiModelOutlineMulti`."""
+
+    def test_init(self):
+        """| Confirm initialization.
+        | Case: default store and given store.
+        """
+        # Setup
+        STORE = BSTORE.StoreOutline()
+        # Test
+        target = BOUTLINE.UiModelOutlineMulti()
+        assert isinstance(target, Gtk.TreeModel)
+        assert isinstance(target.store, BSTORE.StoreOutline)
+        assert 0 == len(target.store)
+        assert 1 == target.get_n_columns()
+        assert GO.TYPE_PYOBJECT == target.get_column_type(0)
+        assert Gtk.TreeModelFlags.ITERS_PERSIST == target.get_flags()
+        target_store = BOUTLINE.UiModelOutlineMulti(p_store=STORE)
+        assert target_store.store is STORE
+        assert target._stamp != target_store._stamp
+
+    def test_emit_deleted_many(self, new_gtk_model_multi):
+        """Confirm views learn of removed lines and of childless parent.
+
+        :param new_gtk_model_multi: fixture :func:`.new_gtk_model_multi`.
+        """
+        # Setup
+        target = new_gtk_model_multi()
+        deleted = list()
+        _ = target.connect(
+            'row-deleted', lambda _m, p_path: deleted.append(str(p_path)))
+        toggled = list()
+        _ = target.connect('row-has-child-toggled',
+                           lambda _m, p_path, _i: toggled.append(str(p_path)))
+        store = target.store
+        lines = [target.line_from_iter(target.get_iter_from_string(p))
+                 for p in ['0:0', '0:1', '1:1:2']]
+        # Test
+        target.emit_deleted_many(store.remove_many(lines))
+        assert ['1:1:2', '0:1', '0:0'] == deleted
+        assert ['0'] == toggled
+
+    def test_emit_inserted(self, new_gtk_model_multi):
+        """Confirm views learn of new line and of parent's first child.
+
+        :param new_gtk_model_multi: fixture :func:`.new_gtk_model_multi`.
+        """
+        # Setup
+        target = new_gtk_model_multi()
+        inserted = list()
+        _ = target.connect('row-inserted',
+                           lambda _m, p_path, _i: inserted.append(str(p_path)))
+        toggled = list()
+        _ = target.connect('row-has-child-toggled',
+                           lambda _m, p_path, _i: toggled.append(str(p_path)))
+        store = target.store
+        line_parent = target.line_from_iter(
+            target.get_iter_from_string('1:0'))
+        ITEMS = [PatchItem('Item 100'), PatchItem('Item 101')]
+        # Test
+        for item in ITEMS:
+            line = store.insert_child(item, line_parent)
+            line_new = target.emit_inserted(line)
+            assert item is target.get_value(line_new, 0)
+        assert ['1:0:0', '1:0:1'] == inserted
+        assert ['1:0'] == toggled
+
+    def test_emit_inserted_section(self, new_gtk_model_multi):
+        """| Confirm views learn of new sibling lines and of parent's first
+          child.
+        | Case: no lines and lines with and without children.
+
+        :param new_gtk_model_multi: fixture :func:`.new_gtk_model_multi`.
+        """
+        # Setup
+        target = new_gtk_model_multi()
+        inserted = list()
+        _ = target.connect('row-inserted',
+                           lambda _m, p_path, _i: inserted.append(str(p_path)))
+        toggled = list()
+        _ = target.connect('row-has-child-toggled',
+                           lambda _m, p_path, _i: toggled.append(str(p_path)))
+        store = target.store
+        line_parent = target.line_from_iter(
+            target.get_iter_from_string('0:1'))
+        PREORDER = [(0, PatchItem('Item 010')), (1, PatchItem('Item 0100')),
+                    (0, PatchItem('Item 011'))]
+        lines = store.extend(PREORDER, line_parent)
+        # Test
+        assert not target.emit_inserted_section(list())
+        iters = target.emit_inserted_section(lines)
+        assert ['Item 010', 'Item 011'] == [
+            target.get_value(i, 0).name for i in iters]
+        assert ['0:1:0', '0:1:1'] == inserted
+        assert ['0:1:0', '0:1'] == toggled
+
+    def test_get_iter(self, new_gtk_model_multi, new_names_model_multi):
+        """| Confirm iter for path.
+        | Case: path identifies line or not.
+
+        :param new_gtk_model_multi: fixture :func:`.new_gtk_model_multi`.
+        :param new_names_model_multi: fixture
+            :func:`.new_names_model_multi`.
+        """
+        # Setup
+        target = new_gtk_model_multi()
+        # Test
+        for path_str, name in new_names_model_multi().items():
+            line = target.get_iter_from_string(path_str)
+            assert name == target.get_value(line, 0).name
+            assert path_str == target.get_string_from_iter(line)
+        for path_str in ['2', '0:2', '1:1:0:0']:
+            with pytest.raises(ValueError):
+                _ = target.get_iter_from_string(path_str)
+
+    def test_iter_navigation(self, new_gtk_model_multi):
+        """Confirm moves among children, siblings, and parents.
+
+        :param new_gtk_model_multi: fixture :func:`.new_gtk_model_multi`.
+        """
+        # Setup
+        target = new_gtk_model_multi()
+        line_1 = target.get_iter_from_string('1')
+        # Test
+        line_11 = target.iter_nth_child(line_1, 1)
+        assert '1:1' == target.get_string_from_iter(line_11)
+        assert target.iter_nth_child(line_1, 2) is None
+        assert target.iter_has_child(line_11)
+        assert 3 == target.iter_n_children(line_11)
+        assert 2 == target.iter_n_children(None)
+        line_110 = target.iter_children(line_11)
+        assert '1:1:0' == target.get_string_from_iter(line_110)
+        assert not target.iter_has_child(line_110)
+        assert target.iter_children(line_110) is None
+        line_parent = target.iter_parent(line_11)
+        assert '1' == target.get_string_from_iter(line_parent)
+        assert target.iter_parent(line_1) is None
+        line_10 = target.iter_previous(line_11)
+        assert '1:0' == target.get_string_from_iter(line_10)
+        assert target.iter_previous(line_10) is None
+        line_next = target.iter_next(line_10)
+        assert '1:1' == target.get_string_from_iter(line_next)
+        assert target.iter_next(line_11) is None
+
+    def test_line_from_iter(self):
+        """Confirm conversion between iters and store lines."""
+        # Setup
+        target = BOUTLINE.UiModelOutlineMulti()
+        line = target.store.insert_child(PatchItem('Item 0'))
+        # Test
+        line_iter = target.iter_from_line(line)
+        assert target._stamp == line_iter.stamp
+        assert line == target.line_from_iter(line_iter)
+        assert target.line_from_iter(None) is None
+
+    def test_line_from_iter_invalid(self, new_gtk_model_multi):
+        """| Confirm conversion between iters and store lines.
+        | Case: iter of removed line or from another adapter.
+
+        :param new_gtk_model_multi: fixture :func:`.new_gtk_model_multi`.
+        """
+        # Setup
+        target = new_gtk_model_multi()
+        line = target.store.child_first()
+        it_stale = target.iter_from_line(line)
+        target.store.remove(line)
+        _ = target.store.insert_child(PatchItem('Something different'))
+        other = BOUTLINE.UiModelOutlineMulti()
+        it_other = other.iter_from_line(other.store.insert_child(
+            PatchItem('Item 0')))
+        # Test
+        for it_bad in [it_stale, it_other]:
+            assert not target.has_line(it_bad)
+            with pytest.raises(ValueError):
+                _ = target.line_from_iter(it_bad)
+            assert not target.iter_has_child(it_bad)
+            assert 0 == target.iter_n_children(it_bad)
+            assert target.iter_parent(it_bad) is None
+
 
 class TestModelOutlineSingle:
     """Unit tests for :class:`.ModelOutlineSingle`."""
@@ -901,7 +1336,6 @@ class TestBridgeOutlineTypes:
         (type(BOUTLINE.UiModelOutline), typing.TypeVar),
         (BOUTLINE.UiModelOutline.__constraints__, (
             BOUTLINE.UiModelOutlineMulti, BOUTLINE.UiModelOutlineSingle)),
-        (BOUTLINE.UiModelOutlineMulti, Gtk.TreeStore),
         (BOUTLINE.UiModelOutlineSingle, Gtk.ListStore),
         (BOUTLINE.ViewOutline, Gtk.TreeView),
         ])
@@ -12,6 +12,7 @@ import typing
 
 from pathlib import Path
 
+import factsheet.abc_types.abc_stalefile as ABC_STALE
 import factsheet.bridge_gtk.bridge_text as BTEXT
 # import factsheet.bridge_ui as BUI
 import factsheet.bridge_gtk.bridge_base as BBASE
@@ -24,6 +25,19 @@ from gi.repository import Gtk   # noqa: E402
 from gi.repository import Pango   # noqa: E402
 
 
+class PatchOwner(ABC_STALE.InterfaceStaleOwner):
+    """Stub owner that records reports of change state."""
+
+    def __init__(self):
+        self.reports = list()
+
+    def on_fresh_part(self, p_part):
+        self.reports.append(('fresh', p_part))
+
+    def on_stale_part(self, p_part):
+        self.reports.append(('stale', p_part))
+
+
 class PatchModelText(BTEXT.ModelText[typing.Any]):
     """:class:`.ModelText` subclass with stub text property.
 
@@ -393,6 +407,7 @@ class TestModelText:
         TEXT = 'The Parrot Sketch'
         source._set_persist(TEXT)
         source._stale = True
+        source.add_owner_stale(PatchOwner())
         # Test
         with PATH.open(mode='wb') as io_out:
             pickle.dump(source, io_out)
@@ -400,6 +415,7 @@ class TestModelText:
             target = pickle.load(io_in)
         assert source._get_persist() == target._get_persist()
         assert not target._stale
+        assert '_owners_stale' not in target.__dict__
 
     def test_init(self):
         """| Confirm initialization.
@@ -456,22 +472,37 @@ class TestModelText:
         assert target.is_stale()
 
     def test_set_freah(self):
-        """Confirm attribute marked fresh. """
+        """Confirm attribute marked fresh and owner informed. """
         # Setup
         target = PatchModelText()
         target._stale = True
+        owner = PatchOwner()
+        target.add_owner_stale(owner)
         # Test
         target.set_fresh()
         assert not target._stale
+        assert [('stale', target), ('fresh', target)] == owner.reports
 
-    def test_set_stale(self):
-        """Confirm attribute marked stale. """
+    def test_set_stale(self, monkeypatch):
+        """Confirm attribute marked stale and stale hooks notified.
+
+        :param monkeypatch: built-in fixture `Pytest monkeypatch`_.
+        """
         # Setup
+        sources = list()
+        monkeypatch.setattr(ABC_STALE, 'g_hooks_stale', [sources.append])
         target = PatchModelText()
         target._stale = False
+        owner = PatchOwner()
+        target.add_owner_stale(owner)
         # Test
         target.set_stale()
         assert target._stale
+        assert [target] == sources
+        assert [('stale', target)] == owner.reports
+        target.set_stale()
+        assert [target, target] == sources
+        assert [('stale', target)] == owner.reports
 
     def test_text(self):
         """Confirm access limits of text property."""
@@ -0,0 +1,428 @@
+"""
+Unit tests for storage of a multi-level outline in plain Python.  See
+:mod:`.store_outline`.
+
+.. include:: /test/refs_include_pytest.txt
+"""
+import pytest   # type: ignore[import]
+
+import factsheet.bridge_gtk.store_outline as BSTORE
+
+
+@pytest.fixture
+def new_store():
+    """Pytest fixture: Return factory for store and its lines by path.
+
+    The structure of each store is as shown below.
+
+        | Item 0xx
+        |     Item 00x
+        |         Item 000
+        |     Item 01x
+        | Item 1xx
+        |     Item 10x
+        |     Item 11x
+        |         Item 110
+        |         Item 111
+        |         Item 112
+    """
+    def new():
+        store = BSTORE.StoreOutline[str]()
+        lines = dict()
+        for path, name in PATHS_NAMES.items():
+            parent = None
+            if ':' in path:
+                parent = lines[path.rsplit(':', 1)[0]]
+            lines[path] = store.insert_child(name, parent)
+        return store, lines
+
+    return new
+
+
+PATHS_NAMES = {
+    '0': 'Item 0xx',
+    '0:0': 'Item 00x',
+    '0:0:0': 'Item 000',
+    '0:1': 'Item 01x',
+    '1': 'Item 1xx',
+    '1:0': 'Item 10x',
+    '1:1': 'Item 11x',
+    '1:1:0': 'Item 110',
+    '1:1:1': 'Item 111',
+    '1:1:2': 'Item 112',
+    }
+
+
+class TestStoreOutline:
+    """Unit tests for :class:`.StoreOutline`."""
+
+    def test_eq(self, new_store):
+        """| Confirm equality comparison.
+        | Case: equivalent, different structure, different item, and
+          different type.
+        """
+        # Setup
+        source, _ = new_store()
+        target, lines = new_store()
+        other_structure, lines_structure = new_store()
+        other_structure.remove(lines_structure['1:1:2'])
+        _ = other_structure.insert_child('Item 112', lines_structure['1:1:1'])
+        other_item, lines_item = new_store()
+        other_item.set_item(lines_item['0:1'], 'Something different')
+        # Test
+        assert source == target
+        assert not source != target
+        assert source != other_structure
+        assert source != other_item
+        assert source != PATHS_NAMES
+
+    def test_init(self):
+        """Confirm initialization."""
+        # Setup
+        # Test
+        target = BSTORE.StoreOutline()
+        assert 0 == len(target)
+        assert [None] == target._items
+        for links in [target._parent, target._first, target._last,
+                      target._next, target._prev]:
+            assert [BSTORE.NO_LINE] == links
+        assert target.child_first() is None
+        assert not list(target.lines_section())
+
+    def test_children(self, new_store):
+        """Confirm access to children of a line and of top level."""
+        # Setup
+        target, lines = new_store()
+        # Test
+        assert lines['0'] == target.child_first()
+        assert lines['1'] == target.child_last()
+        assert lines['1:1:0'] == target.child_first(lines['1:1'])
+        assert lines['1:1:2'] == target.child_last(lines['1:1'])
+        assert target.child_first(lines['1:0']) is None
+        assert target.child_last(lines['1:0']) is None
+        assert lines['1:1:1'] == target.child_nth(lines['1:1'], 1)
+        assert lines['1'] == target.child_nth(None, 1)
+        assert target.child_nth(lines['1:1'], 3) is None
+        assert target.child_nth(lines['1:1'], -1) is None
+        assert 3 == target.n_children(lines['1:1'])
+        assert 2 == target.n_children()
+        assert 0 == target.n_children(lines['0:0:0'])
+
+    def test_clear(self, new_store):
+        """Confirm all lines removed."""
+        # Setup
+        target, lines = new_store()
+        # Test
+        target.clear()
+        assert BSTORE.StoreOutline() == target
+        assert 0 == len(target)
+        assert not list(target.lines_section())
+        line_new = target.insert_child('Something completely different')
+        for line in lines.values():
+            assert not target.is_valid(line)
+            assert line_new != line
+
+    def test_depth(self, new_store):
+        """Confirm depth of each line."""
+        # Setup
+        target, lines = new_store()
+        # Test
+        for path, line in lines.items():
+            assert path.count(':') == target.depth(line)
+
+    @pytest.mark.parametrize('PARENT', [None, '1:0'])
+    def test_extend(self, new_store, PARENT):
+        """| Confirm section added from preorder list.
+        | Case: at top level and under line without children.
+
+        :param PARENT: path to parent of section or None for top level.
+        """
+        # Setup
+        target, lines = new_store()
+        expect, lines_expect = new_store()
+        line_parent = None if PARENT is None else lines[PARENT]
+        parent_expect = None if PARENT is None else lines_expect[PARENT]
+        PREORDER = [(0, 'A'), (1, 'AA'), (2, 'AAA'), (1, 'AB'), (0, 'B')]
+        line_a = expect.insert_child('A', parent_expect)
+        line_aa = expect.insert_child('AA', line_a)
+        _ = expect.insert_child('AAA', line_aa)
+        _ = expect.insert_child('AB', line_a)
+        _ = expect.insert_child('B', parent_expect)
+        # Test
+        lines_top = target.extend(PREORDER, line_parent)
+        assert expect == target
+        assert ['A', 'B'] == [target.get_item(line) for line in lines_top]
+        assert len(PATHS_NAMES) + len(PREORDER) == len(target)
+
+    @pytest.mark.parametrize('PREORDER', [
+        [(0, 'A'), (2, 'AAA')],
+        [(1, 'AA')],
+        [(-1, 'Oops')],
+        ])
+    def test_extend_depth(self, PREORDER):
+        """| Confirm section added from preorder list.
+        | Case: line deeper than any possible parent leaves store
+          unchanged.
+
+        :param PREORDER: depth and item of each new line.
+        """
+        # Setup
+        target = BSTORE.StoreOutline[str]()
+        # Test
+        with pytest.raises(ValueError):
+            target.extend(PREORDER)
+        assert 0 == len(target)
+
+    def test_get_item(self, new_store):
+        """Confirm item at each line."""
+        # Setup
+        target, lines = new_store()
+        # Test
+        for path, line in lines.items():
+            assert PATHS_NAMES[path] == target.get_item(line)
+
+    @pytest.mark.parametrize('METHOD, PATH, POSITION, PATH_NEW', [
+            ('insert_after', None, 0, (0,)),
+            ('insert_after', '0', 4, (1,)),
+            ('insert_after', '1:0', 6, (1, 1)),
+            ('insert_after', '1:1:2', 10, (1, 1, 3)),
+            ('insert_before', '0',  0, (0,)),
+            ('insert_before', '0:1',  3, (0, 1)),
+            ('insert_before', '1:1:0', 7,  (1, 1, 0)),
+            ('insert_before', None, 10, (2,)),
+            ('insert_child', '0',  4, (0, 2)),
+            ('insert_child', '0:0',  3, (0, 0, 1)),
+            ('insert_child', '1:1:1',  9, (1, 1, 1, 0)),
+            ('insert_child', None, 10, (2,)),
+            ])
+    def test_insert(self, new_store, METHOD, PATH, POSITION, PATH_NEW):
+        """Confirm item insertion.
+
+        :param METHOD: insert method under test.
+        :param PATH: path for line at which to insert item.
+        :param POSITION: position of new item in list of items.
+        :param PATH_NEW: path for line containing new item.
+        """
+        # Setup
+        target, lines = new_store()
+        insert_target = getattr(target, METHOD)
+        ITEM_NEW = 'Item New'
+        names = list(PATHS_NAMES.values())
+        names.insert(POSITION, ITEM_NEW)
+        line = None if PATH is None else lines[PATH]
+        # Test
+        line_new = insert_target(ITEM_NEW, line)
+        assert ITEM_NEW == target.get_item(line_new)
+        assert PATH_NEW == target.path(line_new)
+        assert names == list(target.items_section())
+        assert len(names) == len(target)
+
+    def test_is_valid(self, new_store):
+        """| Confirm check of line.
+        | Case: line in outline, removed, out of range, or not a line.
+        """
+        # Setup
+        target, lines = new_store()
+        target.remove(lines['1:1'])
+        # Test
+        assert target.is_valid(lines['1:0'])
+        assert not target.is_valid(lines['1:1'])
+        assert not target.is_valid(lines['1:1:2'])
+        assert not target.is_valid(BSTORE.NO_LINE)
+        assert not target.is_valid(None)
+        assert not target.is_valid(len(target._items))
+        assert not target.is_valid('1:0')
+
+    def test_is_valid_stale(self):
+        """| Confirm check of line.
+        | Case: line removed before insertion of another line.
+        """
+        # Setup
+        target = BSTORE.StoreOutline[str]()
+        line_stale = target.insert_child('a')
+        target.remove(line_stale)
+        # Test
+        line_new = target.insert_child('c')
+        assert line_new != line_stale
+        assert not target.is_valid(line_stale)
+        assert target.get_item(line_stale) is None
+        assert 'c' == target.get_item(line_new)
+
+    @pytest.mark.parametrize('ROOT, BEGIN, END', [
+        (None, 0, 10),
+        ('1', 4, 10),
+        ('0:0', 1, 3),
+        ('1:1:0', 7, 8),
+        ])
+    def test_lines_section(self, new_store, ROOT, BEGIN, END):
+        """Confirm iteration over lines and items in section.
+
+        :param ROOT: path to root line of section.
+        :param BEGIN: slice [BEGIN:END) contains lines in section.
+        :param END: slice [BEGIN:END) contains lines in section.
+        """
+        # Setup
+        target, lines = new_store()
+        root = None if ROOT is None else lines[ROOT]
+        paths = list(PATHS_NAMES)[BEGIN:END]
+        # Test
+        assert ([lines[p] for p in paths]
+                == list(target.lines_section(root)))
+        assert ([PATHS_NAMES[p] for p in paths]
+                == list(target.items_section(root)))
+
+    def test_lines_section_deep(self):
+        """Confirm iteration is not limited by recursion depth."""
+        # Setup
+        target = BSTORE.StoreOutline()
+        N_LINES = 5000
+        line = None
+        for i in range(N_LINES):
+            line = target.insert_child(i, line)
+        # Test
+        assert list(range(N_LINES)) == list(target.items_section())
+        assert N_LINES - 1 == target.depth(line)
+
+    def test_parent_siblings(self, new_store):
+        """Confirm access to parent and siblings of a line."""
+        # Setup
+        target, lines = new_store()
+        # Test
+        assert lines['1:1'] == target.parent(lines['1:1:2'])
+        assert target.parent(lines['1']) is None
+        assert lines['1:1:1'] == target.next(lines['1:1:0'])
+        assert target.next(lines['1:1:2']) is None
+        assert lines['1:1:0'] == target.prev(lines['1:1:1'])
+        assert lines['0'] == target.prev(lines['1'])
+        assert target.prev(lines['0']) is None
+
+    def test_path(self, new_store):
+        """Confirm path of each line."""
+        # Setup
+        target, lines = new_store()
+        # Test
+        for path, line in lines.items():
+            expect = tuple(int(i) for i in path.split(':'))
+            assert expect == target.path(line)
+
+    @pytest.mark.parametrize('PATH, BEGIN, END', [
+        ('0', 0, 4),
+        ('0:0', 1, 3),
+        ('0:1', 3, 4),
+        ('1:1:1', 8, 9),
+        ('1', 4, 10),
+        ])
+    def test_remove(self, new_store, PATH, BEGIN, END):
+        """Confirm section removal.  Removed lines are not reused.
+
+        :param PATH: path for line to remove.
+        :param BEGIN: slice [BEGIN:END) contains names of lines removed.
+        :param END: slice [BEGIN:END) contains names of lines removed.
+        """
+        # Setup
+        target, lines = new_store()
+        names = list(PATHS_NAMES.values())
+        names_after = names[:BEGIN] + names[END:]
+        N_ITEMS = len(target._items)
+        # Test
+        target.remove(lines[PATH])
+        assert names_after == list(target.items_section())
+        assert len(names_after) == len(target)
+        for name in names[BEGIN:END]:
+            line_new = target.insert_child(name)
+            assert N_ITEMS <= line_new
+        assert names_after + names[BEGIN:END] == list(target.items_section())
+        for path in list(PATHS_NAMES)[BEGIN:END]:
+            assert not target.is_valid(lines[path])
+
+    def test_remove_many(self, new_store):
+        """| Confirm removal of many sections.
+        | Case: sibling lines, None, line within removed section,
+          duplicate line, and removed line.
+        """
+        # Setup
+        target, lines = new_store()
+        line_removed = lines['0:0:0']
+        target.remove(line_removed)
+        LINES = [lines['1:1:0'], None, lines['1:1:2'], lines['0:1'],
+                 lines['0:1'], line_removed]
+        EXPECT = [((1, 1, 2), lines['1:1']), ((1, 1, 0), lines['1:1']),
+                  ((0, 1), lines['0'])]
+        NAMES = ['Item 0xx', 'Item 00x', 'Item 1xx', 'Item 10x',
+                 'Item 11x', 'Item 111']
+        # Test
+        assert EXPECT == target.remove_many(LINES)
+        assert NAMES == list(target.items_section())
+        assert len(NAMES) == len(target)
+        for path in ['0:1', '1:1:0', '1:1:2']:
+            assert not target.is_valid(lines[path])
+
+    def test_remove_many_nested(self, new_store):
+        """| Confirm removal of many sections.
+        | Case: line at top level and line within its section.
+        """
+        # Setup
+        target, lines = new_store()
+        LINES = [lines['1:1:1'], lines['1'], lines['0:0']]
+        EXPECT = [((1,), None), ((0, 0), lines['0'])]
+        # Test
+        assert EXPECT == target.remove_many(LINES)
+        assert ['Item 0xx', 'Item 01x'] == list(target.items_section())
+        assert 2 == len(target)
+
+    def test_set_item(self, new_store):
+        """Confirm item replacement."""
+        # Setup
+        target, lines = new_store()
+        ITEM = 'Something completely different'
+        # Test
+        target.set_item(lines['1:1'], ITEM)
+        assert ITEM == target.get_item(lines['1:1'])
+
+    @pytest.mark.parametrize('ROOT, BEGIN, END', [
+        (None, 0, 10),
+        ('1', 4, 10),
+        ('0:0', 1, 3),
+        ('1:1:0', 7, 8),
+        ])
+    def test_walk(self, new_store, ROOT, BEGIN, END):
+        """Confirm iteration over depth, line, and item in section.
+
+        :param ROOT: path to root line of section.
+        :param BEGIN: slice [BEGIN:END) contains lines in section.
+        :param END: slice [BEGIN:END) contains lines in section.
+        """
+        # Setup
+        target, lines = new_store()
+        root = None if ROOT is None else lines[ROOT]
+        paths = list(PATHS_NAMES)[BEGIN:END]
+        expect = [(p.count(':'), lines[p], PATHS_NAMES[p]) for p in paths]
+        # Test
+        assert expect == list(target.walk(root))
+
+    def test_walk_deep(self):
+        """Confirm walk is not limited by recursion depth."""
+        # Setup
+        target = BSTORE.StoreOutline()
+        N_LINES = 5000
+        line = None
+        for i in range(N_LINES):
+            line = target.insert_child(i, line)
+        _ = target.insert_child(N_LINES)
+        expect = [(i, i) for i in range(N_LINES)] + [(0, N_LINES)]
+        # Test
+        assert expect == [(d, i) for d, _, i in target.walk()]
+
+
+class TestStoreOutlineTypes:
+    """Unit tests for definitions of constants and type hints in
+    :mod:`.store_outline`.
+    """
+
+    def test_types(self):
+        """Confirm constant and type hint definitions."""
+        # Setup
+        # Test
+        assert BSTORE.LineStore.__supertype__ is int
+        assert 0 == BSTORE.NO_LINE
+        assert BSTORE._FREE < BSTORE.NO_LINE
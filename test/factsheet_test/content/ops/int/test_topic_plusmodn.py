@@ -3,8 +3,10 @@ Unit tests for class defining modular arithmetic operation topics.
 See :mod:`~.topic_plusmodn`.
 """
 import collections as COL
+import numpy as NP   # type: ignore[import]
 import pytest   # type: ignore[import]
 
+from factsheet.content.ops import table_op as XTABLE
 from factsheet.content.ops.int import topic_plusmodn as XPLUS_N
 from factsheet.content.sets.int import topic_segint as XSEGINT
 from factsheet.content.sets.int import topic_setint as XSETINT
@@ -105,6 +107,23 @@ class TestPlusModN:
     #     # Test
     #     assert not reference.__eq__(OTHER)
 
+    def test_fingerprint(self, patch_new_segment):
+        """Confirm fingerprint reflects modulus and set content."""
+        # Setup
+        MODULUS = 4
+        target = XPLUS_N.PlusModN(
+            p_set=patch_new_segment(6), p_modulus=MODULUS)
+        same = XPLUS_N.PlusModN(
+            p_set=patch_new_segment(6), p_modulus=MODULUS)
+        other_modulus = XPLUS_N.PlusModN(
+            p_set=patch_new_segment(6), p_modulus=MODULUS + 1)
+        other_set = XPLUS_N.PlusModN(
+            p_set=patch_new_segment(7), p_modulus=MODULUS)
+        # Test
+        assert same.fingerprint() == target.fingerprint()
+        assert other_modulus.fingerprint() != target.fingerprint()
+        assert other_set.fingerprint() != target.fingerprint()
+
     def test_init(self, patch_new_segment):
         """| Confirm initialization.
         | Case: nominal.
@@ -119,7 +138,7 @@ class TestPlusModN:
         assert not target._forms
         assert SET == target._set_op
         assert target._set_op is SET
-        assert target._op is not None
+        assert target.op is not None
         assert MODULUS == target._modulus
         assert target._reps is not None
 
@@ -193,7 +212,7 @@ class TestPlusModN:
         MODULUS = 5
         target = XPLUS_N.PlusModN(p_set=SET, p_modulus=MODULUS)
         # Test
-        assert RESULT == target._op(LEFT, RIGHT)
+        assert RESULT == target.op(LEFT, RIGHT)
 
     def test_op_partial(self, patch_new_segment):
         """| Confirm modular addition.
@@ -207,7 +226,7 @@ class TestPlusModN:
         LEFT = Element(p_member=1, p_index=IE(1))
         RIGHT = Element(p_member=2, p_index=IE(2))
         # Test
-        assert target._op(LEFT, RIGHT) is None
+        assert target.op(LEFT, RIGHT) is None
 
     @pytest.mark.parametrize('SIZE_SET, MODULUS', [
         (3, 5),  # [0, 1, 2]
@@ -242,3 +261,37 @@ class TestPlusModN:
         reps_target = target._reduce_reps(SET)
         assert isinstance(reps_target, dict)
         assert not reps_target
+
+    @pytest.mark.parametrize('SIZE_SET, MODULUS', [
+        (3, 5),
+        (5, 5),
+        (7, 5),
+        (12, 4),
+        (6, 2**30),
+        (6, 2**63),
+        ])
+    def test_table(self, patch_new_segment, SIZE_SET, MODULUS):
+        """| Confirm vectorized operation table.
+        | Case: table matches pair-by-pair construction.
+        """
+        # Setup
+        SET = patch_new_segment(SIZE_SET)
+        target = XPLUS_N.PlusModN(p_set=SET, p_modulus=MODULUS)
+        reference = XTABLE.TableOp.new_from_op(SET.elements, target.op)
+        # Test
+        table = target.table()
+        assert reference.indices == table.indices
+        assert NP.array_equal(reference.results, table.results)
+
+    def test_table_empty(self):
+        """| Confirm vectorized operation table.
+        | Case: empty set.
+        """
+        # Setup
+        SET = XSETINT.SetInt()
+        MODULUS = 5
+        target = XPLUS_N.PlusModN(p_set=SET, p_modulus=MODULUS)
+        # Test
+        table = target.table()
+        assert 0 == table.size
+        assert table.is_closed()
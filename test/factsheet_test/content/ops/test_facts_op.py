@@ -27,6 +27,37 @@ def patch_topic_closed():
     return new_topic
 
 
+@pytest.fixture
+def patch_topic_table():
+    """Pytest fixture returns factory for operation topic defined by
+    table of members.  Table entry None marks an undefined pair.
+    """
+    class OpTable(XOP.Operation[int]):
+        def __init__(self, p_table, **kwargs):
+            super().__init__(**kwargs)
+            self._table_members = p_table
+
+        def op(self, a, b):
+            member = self._table_members[a.member][b.member]
+            if member is None:
+                return None
+            return self._set_op.elements.find_element(p_member=member)
+
+    def new_topic(p_table):
+        topic_set = XSET.Set(p_members=range(len(p_table)))
+        topic = OpTable(p_table, p_set=topic_set)
+        topic.init_identity(p_name='Dinsdale')
+        return topic
+
+    return new_topic
+
+
+TABLE_KLEIN = [[0, 1, 2, 3], [1, 0, 3, 2], [2, 3, 0, 1], [3, 2, 1, 0]]
+TABLE_MAX = [[0, 1, 2], [1, 1, 2], [2, 2, 2]]
+TABLE_MINUS = [[0, 2, 1], [1, 0, 2], [2, 1, 0]]
+TABLE_PARTIAL = [[0, 1], [1, None]]
+
+
 class TestClosed:
     """Unit tests for :class:`.Closed`."""
 
@@ -50,8 +81,6 @@ class TestClosed:
         assert not target._stale
         assert isinstance(target._blocks, dict)
         assert not target._blocks
-        assert target._op == TOPIC.op
-        assert target._set_op == TOPIC.set_op
 
     def test_check_false(self, patch_class_block_fact):
         """| Confirm default check.
@@ -124,3 +153,110 @@ class TestClosed:
         assert block.called_update
         assert target._value is None
         assert target._status is MFACT.StatusOfFact.UNCHECKED
+
+
+class TestFactsTable:
+    """Unit tests for facts derived from operation table.
+
+    Facts include :class:`.Associative`, :class:`.Commutative`,
+    :class:`.IdentityElement`, :class:`.Idempotents`,
+    :class:`.Inverses`, and :class:`.LatinSquare`.
+    """
+
+    @pytest.mark.parametrize('CLASS, TABLE, VALUE', [
+        (XFACTS_OP.Associative, TABLE_KLEIN, True),
+        (XFACTS_OP.Associative, TABLE_MINUS, False),
+        (XFACTS_OP.Commutative, TABLE_KLEIN, True),
+        (XFACTS_OP.Commutative, TABLE_MINUS, False),
+        (XFACTS_OP.Commutative, TABLE_PARTIAL, True),
+        (XFACTS_OP.Inverses, TABLE_KLEIN, True),
+        (XFACTS_OP.Inverses, TABLE_MAX, False),
+        (XFACTS_OP.LatinSquare, TABLE_MINUS, True),
+        (XFACTS_OP.LatinSquare, TABLE_MAX, False),
+        (XFACTS_OP.LatinSquare, TABLE_PARTIAL, False),
+        ])
+    def test_check_bool(self, patch_topic_table, CLASS, TABLE, VALUE):
+        """| Confirm check of facts with boolean value.
+        | Case: value defined.
+        """
+        # Setup
+        TOPIC = patch_topic_table(TABLE)
+        target = CLASS(p_topic=TOPIC)
+        # Test
+        result = target.check()
+        assert VALUE == target._value
+        assert target._status is MFACT.StatusOfFact.DEFINED
+        assert result is MFACT.StatusOfFact.DEFINED
+
+    @pytest.mark.parametrize('CLASS, TABLE', [
+        (XFACTS_OP.Associative, TABLE_PARTIAL),
+        (XFACTS_OP.IdentityElement, TABLE_MINUS),
+        (XFACTS_OP.Inverses, TABLE_PARTIAL),
+        (XFACTS_OP.Inverses, TABLE_MINUS),
+        ])
+    def test_check_undefined(self, patch_topic_table, CLASS, TABLE):
+        """| Confirm check of facts.
+        | Case: value undefined.
+        """
+        # Setup
+        TOPIC = patch_topic_table(TABLE)
+        target = CLASS(p_topic=TOPIC)
+        # Test
+        result = target.check()
+        assert target._value is None
+        assert target._status is MFACT.StatusOfFact.UNDEFINED
+        assert result is MFACT.StatusOfFact.UNDEFINED
+
+    def test_check_identity(self, patch_topic_table):
+        """| Confirm check of identity element.
+        | Case: identity exists.
+        """
+        # Setup
+        TOPIC = patch_topic_table(TABLE_MAX)
+        target = XFACTS_OP.IdentityElement(p_topic=TOPIC)
+        # Test
+        result = target.check()
+        assert 0 == target._value.member
+        assert result is MFACT.StatusOfFact.DEFINED
+
+    def test_check_idempotents(self, patch_topic_table):
+        """Confirm check of idempotent elements."""
+        # Setup
+        TOPIC = patch_topic_table(TABLE_MAX)
+        target = XFACTS_OP.Idempotents(p_topic=TOPIC)
+        # Test
+        result = target.check()
+        assert TOPIC.set_op.elements == target._value
+        assert result is MFACT.StatusOfFact.DEFINED
+
+    def test_check_shared_table(self, patch_topic_table):
+        """Confirm facts share topic's cached table."""
+        # Setup
+        TOPIC = patch_topic_table(TABLE_KLEIN)
+        table = TOPIC.table()
+        CLASSES = [XFACTS_OP.Associative, XFACTS_OP.Commutative,
+                   XFACTS_OP.IdentityElement, XFACTS_OP.Idempotents,
+                   XFACTS_OP.Inverses, XFACTS_OP.LatinSquare]
+        # Test
+        for fact_class in CLASSES:
+            fact_class(p_topic=TOPIC).check()
+            assert TOPIC._table is table
+
+    @pytest.mark.parametrize('CLASS', [
+        XFACTS_OP.Associative,
+        XFACTS_OP.Commutative,
+        XFACTS_OP.IdentityElement,
+        XFACTS_OP.Idempotents,
+        XFACTS_OP.Inverses,
+        XFACTS_OP.LatinSquare,
+        ])
+    def test_clear(self, patch_topic_table, CLASS):
+        """Confirm clear."""
+        # Setup
+        TOPIC = patch_topic_table(TABLE_KLEIN)
+        target = CLASS(p_topic=TOPIC)
+        target.check()
+        # Test
+        target.clear()
+        assert target._value is None
+        assert target._status is MFACT.StatusOfFact.UNCHECKED
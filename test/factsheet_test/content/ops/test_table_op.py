@@ -0,0 +1,279 @@
+"""
+Unit tests for class defining operation tables.  See :mod:`.table_op`.
+"""
+import numpy as NP   # type: ignore[import]
+import pytest   # type: ignore[import]
+
+from factsheet.content.ops import table_op as XTABLE
+from factsheet.model import element as MELEMENT
+from factsheet.model import setindexed as MSET
+
+UNDEFINED = XTABLE.UNDEFINED
+
+# Z_2 x Z_2 (Klein four-group)
+TABLE_KLEIN = [[0, 1, 2, 3],
+               [1, 0, 3, 2],
+               [2, 3, 0, 1],
+               [3, 2, 1, 0]]
+# Left zero semigroup: a op b is a
+TABLE_LEFT_ZERO = [[0, 0, 0],
+                   [1, 1, 1],
+                   [2, 2, 2]]
+# Rock-paper-scissors: winner of pair
+TABLE_RPS = [[0, 1, 0],
+             [1, 1, 2],
+             [0, 2, 2]]
+# Subtraction modulo 3
+TABLE_MINUS = [[0, 2, 1],
+               [1, 0, 2],
+               [2, 1, 0]]
+# Max on {0, 1, 2}
+TABLE_MAX = [[0, 1, 2],
+             [1, 1, 2],
+             [2, 2, 2]]
+
+
+@pytest.fixture
+def patch_op_mod():
+    """Pytest fixture returns factory for modular addition on a set."""
+    def new_op(p_set, p_modulus):
+        def op(p_left, p_right):
+            key = (p_left.member + p_right.member) % p_modulus
+            return p_set.find_element(p_member=key)
+
+        return op
+
+    return new_op
+
+
+@pytest.fixture
+def patch_table():
+    """Pytest fixture returns factory for table from nested lists."""
+    def new_table(p_results):
+        results = NP.array(p_results, dtype=NP.int32)
+        return XTABLE.TableOp(list(range(len(p_results))), results)
+
+    return new_table
+
+
+class TestTableOp:
+    """Unit tests for :class:`.TableOp`."""
+
+    @pytest.mark.parametrize('SIZE, DTYPE', [
+        (0, NP.int32),
+        (2000, NP.int32),
+        (2**31, NP.int64),
+        ])
+    def test_dtype(self, SIZE, DTYPE):
+        """Confirm type of table entries."""
+        # Setup
+        # Test
+        assert NP.dtype(DTYPE) == XTABLE.TableOp.dtype(SIZE)
+
+    @pytest.mark.parametrize('RESULTS, IDENTITY, EXPECT', [
+        (TABLE_KLEIN, 0, True),
+        (TABLE_MAX, 0, False),
+        ([[0, 1], [1, UNDEFINED]], 0, False),
+        ])
+    def test_has_inverses(self, patch_table, RESULTS, IDENTITY, EXPECT):
+        """Confirm check for two-sided inverses."""
+        # Setup
+        target = patch_table(RESULTS)
+        # Test
+        assert target.has_inverses(IDENTITY) is EXPECT
+
+    @pytest.mark.parametrize('RESULTS, EXPECT', [
+        (TABLE_KLEIN, 0),
+        (TABLE_MAX, 0),
+        (TABLE_LEFT_ZERO, None),
+        (TABLE_MINUS, None),
+        ([[1, 0], [0, 1]], 1),
+        ([[0, 1], [1, UNDEFINED]], 0),
+        ([], None),
+        ])
+    def test_identity(self, patch_table, RESULTS, EXPECT):
+        """Confirm search for identity element."""
+        # Setup
+        target = patch_table(RESULTS)
+        # Test
+        assert EXPECT == target.identity()
+
+    @pytest.mark.parametrize('RESULTS, EXPECT', [
+        (TABLE_KLEIN, [0]),
+        (TABLE_MAX, [0, 1, 2]),
+        (TABLE_MINUS, [0]),
+        ([[1, 0], [0, UNDEFINED]], []),
+        ])
+    def test_idempotents(self, patch_table, RESULTS, EXPECT):
+        """Confirm search for idempotent elements."""
+        # Setup
+        target = patch_table(RESULTS)
+        # Test
+        assert EXPECT == target.idempotents()
+
+    def test_init(self):
+        """Confirm initialization."""
+        # Setup
+        INDICES = [MELEMENT.IndexElement(i) for i in (3, 1)]
+        RESULTS = NP.array([[0, 1], [1, UNDEFINED]])
+        # Test
+        target = XTABLE.TableOp(INDICES, RESULTS)
+        assert target._indices is INDICES
+        assert target._results is RESULTS
+        assert INDICES == target.indices
+        assert RESULTS is target.results
+        assert 2 == target.size
+        assert 1 == target.index_of(1)
+
+    @pytest.mark.parametrize('RESULTS, EXPECT', [
+        ([[0, 1], [1, 0]], True),
+        ([[0, 1], [1, UNDEFINED]], False),
+        (NP.empty((0, 0)), True),
+        ])
+    def test_is_closed(self, RESULTS, EXPECT):
+        """Confirm closure check."""
+        # Setup
+        target = XTABLE.TableOp([0, 1], NP.array(RESULTS))
+        # Test
+        assert target.is_closed() is EXPECT
+
+    @pytest.mark.parametrize('RESULTS, EXPECT', [
+        (TABLE_KLEIN, True),
+        (TABLE_LEFT_ZERO, True),
+        (TABLE_MAX, True),
+        (TABLE_RPS, False),
+        (TABLE_MINUS, False),
+        ([], True),
+        ])
+    def test_is_associative(self, patch_table, RESULTS, EXPECT):
+        """| Confirm associativity check.
+        | Case: small tables.
+        """
+        # Setup
+        target = patch_table(RESULTS)
+        # Test
+        assert target.is_associative() is EXPECT
+
+    @pytest.mark.parametrize('SIZE_BLOCK', [1, 16, 1 << 22])
+    def test_is_associative_blocks(self, monkeypatch, SIZE_BLOCK):
+        """| Confirm associativity check.
+        | Case: blocks of various sizes find single failure.
+        """
+        # Setup
+        monkeypatch.setattr(XTABLE, 'SIZE_BLOCK', SIZE_BLOCK)
+        SIZE = 12
+        positions = NP.arange(SIZE)
+        results = (positions[:, NP.newaxis] + positions[NP.newaxis, :]
+                   ) % SIZE
+        target = XTABLE.TableOp(list(positions), results)
+        assert target.is_associative()
+        results[SIZE - 1, SIZE - 2] = 0
+        # Test
+        assert not target.is_associative()
+
+    @pytest.mark.parametrize('RESULTS, EXPECT', [
+        (TABLE_KLEIN, True),
+        (TABLE_LEFT_ZERO, False),
+        (TABLE_MINUS, False),
+        ([[0, UNDEFINED], [UNDEFINED, 0]], True),
+        ([[0, UNDEFINED], [1, 0]], False),
+        ])
+    def test_is_commutative(self, patch_table, RESULTS, EXPECT):
+        """Confirm commutativity check."""
+        # Setup
+        target = patch_table(RESULTS)
+        # Test
+        assert target.is_commutative() is EXPECT
+
+    @pytest.mark.parametrize('RESULTS, EXPECT', [
+        (TABLE_KLEIN, True),
+        (TABLE_MINUS, True),
+        (TABLE_MAX, False),
+        (TABLE_LEFT_ZERO, False),
+        ([[0, 2, 1], [1, 0, 2], [1, 2, 0]], False),
+        ([[0, 1], [1, UNDEFINED]], False),
+        ])
+    def test_is_latin_square(self, patch_table, RESULTS, EXPECT):
+        """Confirm Latin square check."""
+        # Setup
+        target = patch_table(RESULTS)
+        # Test
+        assert target.is_latin_square() is EXPECT
+
+    def test_new_from_op(self, patch_op_mod):
+        """| Confirm construction pair by pair.
+        | Case: positions differ from indices.
+        """
+        # Setup
+        MEMBERS = [2, 0, 1]
+        SET = MSET.SetIndexed[int](MEMBERS)
+        OP = patch_op_mod(SET, 3)
+        EXPECT = NP.array([[2, 0, 1], [0, 1, 2], [1, 2, 0]])
+        # Test
+        target = XTABLE.TableOp.new_from_op(SET, OP)
+        assert [0, 1, 2] == target.indices
+        assert NP.array_equal(EXPECT, target.results)
+        assert target.is_closed()
+
+    def test_new_from_op_partial(self, patch_op_mod):
+        """| Confirm construction pair by pair.
+        | Case: operation is partial.
+        """
+        # Setup
+        SET = MSET.SetIndexed[int](range(3))
+        OP = patch_op_mod(SET, 4)
+        EXPECT = NP.array([[0, 1, 2], [1, 2, UNDEFINED], [2, UNDEFINED, 0]])
+        # Test
+        target = XTABLE.TableOp.new_from_op(SET, OP)
+        assert NP.array_equal(EXPECT, target.results)
+        assert not target.is_closed()
+
+    def test_new_from_op_outside(self):
+        """| Confirm construction pair by pair.
+        | Case: operation result outside set.
+        """
+        # Setup
+        Element = MELEMENT.ElementOpaque[int]
+        SET = MSET.SetIndexed[int](range(2))
+
+        def op(_left, _right):
+            return Element(p_member=5, p_index=MELEMENT.IndexElement(0))
+
+        # Test
+        target = XTABLE.TableOp.new_from_op(SET, op)
+        assert NP.all(UNDEFINED == target.results)
+
+    @pytest.mark.parametrize('BOUND_KEYS', [None, 5, 2**30])
+    def test_new_from_reps(self, BOUND_KEYS):
+        """| Confirm construction from image keys.
+        | Case: last element in position order represents key.
+        """
+        # Setup
+        INDICES = [MELEMENT.IndexElement(i) for i in range(4)]
+        KEYS = NP.array([0, 1, 3, 1])
+        IMAGE_KEYS = NP.array([[0, 1, 2, 3],
+                               [1, 2, 3, 4],
+                               [3, 4, 0, 1],
+                               [1, 2, 3, 4]])
+        EXPECT = NP.array([[0, 3, UNDEFINED, 2],
+                           [3, UNDEFINED, 2, UNDEFINED],
+                           [2, UNDEFINED, 0, 3],
+                           [3, UNDEFINED, 2, UNDEFINED]])
+        # Test
+        target = XTABLE.TableOp.new_from_reps(
+            INDICES, KEYS, IMAGE_KEYS, p_bound_keys=BOUND_KEYS)
+        assert INDICES == target.indices
+        assert NP.array_equal(EXPECT, target.results)
+        assert NP.dtype(NP.int32) == target.results.dtype
+
+    def test_new_from_reps_empty(self):
+        """| Confirm construction from image keys.
+        | Case: no elements.
+        """
+        # Setup
+        KEYS = NP.empty(0, dtype=NP.int64)
+        IMAGE_KEYS = NP.empty((0, 0), dtype=NP.int64)
+        # Test
+        target = XTABLE.TableOp.new_from_reps([], KEYS, IMAGE_KEYS)
+        assert 0 == target.size
+        assert target.is_closed()
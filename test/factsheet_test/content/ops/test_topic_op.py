@@ -3,7 +3,11 @@ Unit tests for ancestor class for binary operation topics.  See
 :mod:`~.topic_op`.
 """
 import dataclasses as DC
+from pathlib import Path
+import pickle
 import pytest  # type: ignore[import]
+import threading
+import time
 import factsheet.content.ops.topic_op as XOP
 import factsheet.content.sets.topic_set as XSET
 
@@ -88,6 +92,99 @@ class TestOperation:
         assert target._set_op is SET
         assert target.op(None, None) is None
 
+    def test_get_set_state(self, tmp_path):
+        """Confirm conversion to and from pickle format.
+
+        :param tmp_path: built-in fixture `Pytest tmp_path`_.
+        """
+        # Setup
+        path = Path(str(tmp_path / 'get_set.fsg'))
+        SET = XSET.Set[int](p_members=[1, 2, 3])
+        source = XOP.Operation[int](p_set=SET)
+        _ = source.table()
+        # Test
+        with path.open(mode='wb') as io_out:
+            pickle.dump(source, io_out)
+        with path.open(mode='rb') as io_in:
+            target = pickle.load(io_in)
+        assert source._table is not None
+        assert target._table is None
+        assert target._table_source is None
+        assert isinstance(target._lock_table, type(threading.Lock()))
+        assert source.set_op.elements == target.set_op.elements
+
+    def test_invalidate_table(self):
+        """Confirm cached table discarded."""
+        # Setup
+        SET = XSET.Set[int](p_members=[1, 2, 3])
+        target = XOP.Operation[int](p_set=SET)
+        table = target.table()
+        # Test
+        target.invalidate_table()
+        assert target._table is None
+        assert target._table_source is None
+        assert target.table() is not table
+
+    def test_table(self):
+        """| Confirm operation table.
+        | Case: table cached while set is unchanged.
+        """
+        # Setup
+        SET = XSET.Set[int](p_members=[1, 2, 3])
+        target = XOP.Operation[int](p_set=SET)
+        # Test
+        table = target.table()
+        assert 3 == table.size
+        assert not table.is_closed()
+        assert table is target.table()
+        assert target._table_source is SET.elements
+
+    def test_table_threads(self, monkeypatch):
+        """| Confirm operation table.
+        | Case: threads that ask for table at once share one build.
+
+        :param monkeypatch: built-in fixture `Pytest monkeypatch`_.
+        """
+        # Setup
+        SET = XSET.Set[int](p_members=[1, 2, 3])
+        target = XOP.Operation[int](p_set=SET)
+        new_table = target._new_table
+        calls = list()
+
+        def patch_new_table():
+            calls.append(None)
+            time.sleep(0.01)
+            return new_table()
+
+        monkeypatch.setattr(target, '_new_table', patch_new_table)
+        N_THREADS = 8
+        tables = list()
+        threads = [threading.Thread(
+            target=lambda: tables.append(target.table()))
+            for _ in range(N_THREADS)]
+        # Test
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert 1 == len(calls)
+        assert N_THREADS == len(tables)
+        assert all(table is tables[0] for table in tables)
+
+    def test_table_set_change(self):
+        """| Confirm operation table.
+        | Case: table rebuilt when set changes.
+        """
+        # Setup
+        SET = XSET.Set[int](p_members=[1, 2, 3])
+        target = XOP.Operation[int](p_set=SET)
+        table = target.table()
+        target._set_op = XSET.Set[int](p_members=[1, 2])
+        # Test
+        table_new = target.table()
+        assert table_new is not table
+        assert 2 == table_new.size
+
     # def test_init_default(self):
     #     """Confirm initialization with default arguments."""
     #     # Setup
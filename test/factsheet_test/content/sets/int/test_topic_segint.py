@@ -39,6 +39,7 @@ class TestSegInt:
         target = XSEGINT.SegInt(p_bound=BOUND)
         assert isinstance(target, XSETINT.SetInt)
         assert ELEMENTS == target.elements
+        assert isinstance(target.elements, MSET.SetIndexedRange)
 
     @pytest.mark.parametrize('BOUND_RAW, BOUND', [
         (5, 5),
@@ -102,6 +102,25 @@ class TestSet:
         assert not target._forms
         assert reference == target._elements
 
+    def test_fingerprint(self, patch_members):
+        """Confirm fingerprint matches fingerprint of indexed set."""
+        # Setup
+        target = XSET.Set[str](p_members=patch_members)
+        other = XSET.Set[str](p_members=list(patch_members))
+        # Test
+        assert target._elements.fingerprint() == target.fingerprint()
+        assert other.fingerprint() == target.fingerprint()
+
+    def test_init_indexed(self):
+        """| Confirm initialization.
+        | Case: members given as indexed set.
+        """
+        # Setup
+        MEMBERS = MSET.SetIndexedRange(3)
+        # Test
+        target = XSET.Set[int](p_members=MEMBERS)
+        assert target._elements is MEMBERS
+
     def test_iter(self, patch_members):
         """| Confirm iterator.
         | Case: topic set non-empty.
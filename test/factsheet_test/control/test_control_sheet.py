@@ -10,9 +10,13 @@ from pathlib import Path
 import pickle
 import pytest
 
+import factsheet.abc_types.abc_stalefile as ABC_STALE
 import factsheet.bridge_ui as BUI
 import factsheet.control.control_sheet as CSHEET
 import factsheet.control.control_topic as CTOPIC
+import factsheet.control.format_sheet as CFORMAT
+import factsheet.control.journal_sheet as CJOURNAL
+import factsheet.control.search_sheets as CSEARCH
 import factsheet.model.sheet as MSHEET
 import factsheet.model.topic as MTOPIC
 
@@ -34,6 +38,22 @@ class PatchObserverControlSheet(CSHEET.ObserverControlSheet):
         self.called_present = True
 
 
+class PatchScheduler:
+    """Stub for save scheduler that runs each task immediately."""
+
+    def submit(self, p_task, p_on_done=None):
+        p_task()
+
+
+@pytest.fixture
+def patch_journal(monkeypatch):
+    """Pytest fixture: isolate journal from main loop and save thread."""
+    monkeypatch.setattr(ABC_STALE, 'g_hooks_stale', list())
+    monkeypatch.setattr(CSHEET.CSAVE, 'g_scheduler_save', PatchScheduler())
+    monkeypatch.setattr(CJOURNAL.GLib, 'timeout_add', lambda *_a: 1)
+    monkeypatch.setattr(CJOURNAL.GLib, 'source_remove', lambda *_a: True)
+
+
 @pytest.fixture
 def patch_g_control_app():
     """Pytest fixture with teardown: Reset :data:`.g_control_app`."""
@@ -52,6 +72,7 @@ class TestControlApp:
         target = CSHEET.ControlApp()
         assert isinstance(target._roster_sheets, dict)
         assert not target._roster_sheets
+        assert isinstance(target._engine_search, CSEARCH.EngineSearch)
 
     def test_close_factsheet(self, patch_g_control_app):
         """| Confirm tracking stops for given sheet with views removed.
@@ -178,6 +199,8 @@ class TestControlApp:
         assert len(items) == len(target._roster_sheets)
         for key, control in items:
             assert target._roster_sheets[key] is control
+        assert id_removed not in target._engine_search._sheets
+        assert len(items) == len(target._engine_search._sheets)
 
     def test_remove_factsheet_warn(self, caplog):
         """| Confirm tracking stops for given sheet.
@@ -213,6 +236,32 @@ class TestControlApp:
         assert log_message == record.message
         assert 'WARNING' == record.levelname
 
+    def test_search(self, patch_journal):
+        """Confirm search across topics of open factsheets.
+
+        :param patch_journal: fixture :func:`.patch_journal`.
+        """
+        # Setup
+        target = CSHEET.ControlApp()
+        controls = list()
+        for name in ['Integers', 'Groups']:
+            control = target.open_factsheet(
+                p_path=None, p_time=BUI.TIME_EVENT_CURRENT)
+            topic = MTOPIC.Topic(
+                p_name=name, p_summary='Summary', p_title='Title')
+            control.insert_topic_child(topic, None)
+            controls.append((control, topic))
+        control_int, topic_int = controls[0]
+        # Test
+        _ = target.search('integers')
+        target._engine_search.wait()
+        hits = target.search('integers')
+        assert [(control_int.tag, topic_int.tag)] == [
+            (s, t) for s, t, _score in hits]
+        assert 2 == len(target.search('summary'))
+        target.remove_factsheet(control_int)
+        assert not target.search('integers')
+
 
 class TestControlSheet:
     """Unit tests for :class:`~.ControlSheet`."""
@@ -226,6 +275,9 @@ class TestControlSheet:
         # Test
         target = CSHEET.ControlSheet(p_path=None)
         assert target._path is None
+        assert not target._autosave
+        assert target._journal is None
+        assert target._size_journal is None
         assert MODEL_DEFAULT == target._model
         model_name = target._model.name
         model_summary = target._model.summary
@@ -286,6 +338,36 @@ class TestControlSheet:
                         control in target._roster_topics.values()}
         assert names_source == names_target
 
+    def test_init_autosave(self, patch_journal, tmp_path):
+        """| Confirm initialization.
+        | Case: replay journal left by earlier session and extend journal.
+
+        :param patch_journal: fixture :func:`patch_journal`.
+        :param tmp_path: built-in fixture `Pytest tmp_path`_.
+        """
+        # Setup
+        PATH = Path(tmp_path / 'saved_factsheet.fsg')
+        source = CSHEET.ControlSheet(p_path=None, p_autosave=True)
+        assert source._journal is None
+        topic = MTOPIC.Topic(p_name='Parrot', p_summary='', p_title='')
+        _ = source.insert_topic_before(topic, None)
+        source.save(p_path=PATH)
+        NAME = 'Something completely different'
+        topic.name.text = NAME
+        source._journal.flush()
+        SIZE = source._journal.size
+        # Test
+        target = CSHEET.ControlSheet(p_path=PATH, p_autosave=True)
+        assert target._autosave
+        assert target._model.is_stale()
+        names_target = {control.name for
+                        control in target._roster_topics.values()}
+        assert {NAME} == names_target
+        assert target._journal is not None
+        assert CJOURNAL.path_journal(PATH) == target._journal.path
+        assert SIZE == target._journal.size
+        assert target._size_journal is None
+
     def test_add_view(self):
         """| Confirm tracking of given sheet view.
         | Case: view not tracked
@@ -495,6 +577,53 @@ class TestControlSheet:
         assert model == target._model
         assert target._model.has_not_changed()
 
+    def test_model_from_path_lazy(self, tmp_path):
+        """| Confirm model creation.
+        | Case: topic bodies load on first access.
+
+        :param tmp_path: built-in fixture `Pytest tmp_path`_.
+        """
+        # Setup
+        PATH = Path(tmp_path / 'saved_factsheet.fsg')
+        source = CSHEET.ControlSheet(p_path=None)
+        for i in range(3):
+            topic = MTOPIC.Topic(
+                p_name='Topic {}'.format(i), p_summary='', p_title='')
+            _ = source.insert_topic_before(topic, None)
+        source.save(p_path=PATH)
+        target = CSHEET.ControlSheet(p_path=None)
+        # Test
+        model = target._model_from_path(p_path=PATH)
+        topics = list(model.topics())
+        for topic in topics:
+            assert isinstance(topic, CFORMAT.TopicLazy)
+        for topic in topics:
+            _ = topic.load_body()
+            assert type(topic) is MTOPIC.Topic
+        assert model == source._model
+        assert model.has_not_changed()
+
+    def test_model_from_path_legacy(self, tmp_path):
+        """| Confirm model creation.
+        | Case: file at path location contains pickle of entire model.
+
+        :param tmp_path: built-in fixture `Pytest tmp_path`_.
+        """
+        # Setup
+        PATH = Path(tmp_path / 'saved_factsheet.fsg')
+        source = MSHEET.Sheet(p_name='Parrot')
+        for i in range(3):
+            topic = MTOPIC.Topic(
+                p_name='Topic {}'.format(i), p_summary='', p_title='')
+            _ = source.insert_topic_before(topic, None)
+        with PATH.open(mode='wb') as io_out:
+            pickle.dump(source, io_out)
+        target = CSHEET.ControlSheet(p_path=None)
+        # Test
+        model = target._model_from_path(p_path=PATH)
+        assert source == model
+        assert model.has_not_changed()
+
     def test_model_from_path_empty(self, tmp_path):
         """| Confirm model creation.
         | Case: no file at path location.
@@ -546,6 +675,34 @@ class TestControlSheet:
         assert model is not None
         assert MESSAGE == model.summary.text.splitlines()[FIRST]
 
+    def test_model_from_path_journal(self, caplog, tmp_path):
+        """| Confirm model creation.
+        | Case: journal for file cannot be replayed.
+
+        :param caplog: built-in fixture `Pytest caplog`_.
+        :param tmp_path: built-in fixture `Pytest tmp_path`_.
+        """
+        # Setup
+        PATH = Path(tmp_path / 'saved_factsheet.fsg')
+        source = CSHEET.ControlSheet(p_path=None)
+        source.save(p_path=PATH)
+        PATH_JOURNAL = CJOURNAL.path_journal(PATH)
+        BYTES = b'Something completely different'
+        PATH_JOURNAL.write_bytes(BYTES)
+        target = CSHEET.ControlSheet(p_path=None)
+        N_LOGS = 1
+        LAST = -1
+        # Test
+        model = target._model_from_path(p_path=PATH)
+        assert source._model == model
+        assert N_LOGS == len(caplog.records)
+        record = caplog.records[LAST]
+        assert record.message.startswith('Journal not replayed:')
+        assert 'ERROR' == record.levelname
+        assert not PATH_JOURNAL.exists()
+        path_kept = PATH_JOURNAL.with_name(PATH_JOURNAL.name + '~')
+        assert BYTES == path_kept.read_bytes()
+
     def test_model_from_path_none(self):
         """| Confirm model creation.
         | Case: no path.
@@ -559,80 +716,44 @@ class TestControlSheet:
 
     def test_open_file_save(self, tmp_path):
         """| Confirm file open.
-        | Case: file does not exist.
+        | Case: temporary file beside factsheet file.
 
         :param tmp_path: built-in fixture `Pytest tmp_path`_
         """
         # Setup
-        MODE = 'xb'
         target = CSHEET.ControlSheet(p_path=None)
         PATH = Path(tmp_path / 'saved_factsheet.fsg')
         target._path = PATH
         # Test
-        with target._open_file_save() as io_out:
+        io_out, path_temp = target._open_file_save()
+        with io_out:
             assert isinstance(io_out, io.BufferedWriter)
-            assert MODE == io_out.mode
-
-    @pytest.mark.parametrize('PATCH_EXC, REPLACE, RAISE, I_EXC', [
-        ((ValueError('Error open'), Exception('Oops!'), Exception('Replace')),
-            False, pytest.raises(CSHEET.OpenFileError), 0),
-        ((FileExistsError('Oops!'), Exception('Error reopen'),
-            Exception('Replace')), False,
-            pytest.raises(CSHEET.OpenFileError), 1),
-        ((FileExistsError('Oops!'), Exception('Oops'), Exception('Replace')),
-            True, pytest.raises(CSHEET.BackupFileError), 2),
-        ])
-    def test_open_file_save_except(
-            self, PATCH_EXC, REPLACE, RAISE, I_EXC, monkeypatch, tmp_path):
+            assert 'wb' == io_out.mode
+        assert PATH.parent == path_temp.parent
+        assert path_temp.name.startswith('.' + PATH.name)
+        assert path_temp.exists()
+        assert not PATH.exists()
+
+    def test_open_file_save_except(self, monkeypatch, tmp_path):
         """| Confirm file open.
-        | Case: open raises unanticipated exception.
+        | Case: temporary file cannot be created.
 
-        :param PATCH_EXE: exceptions to raise in patched methods.
-        :param REPLACE: when True, raise exception in`replace` patch.
-        :param RAISE: expected exception.
-        :param I_EXC: index in PATCH_EXE of expected exception cause.
         :param monkeypatch: built-in fixture `Pytest monkeypatch`_.
         :param tmp_path: built-in fixture `Pytest tmp_path`_.
         """
         # Setup
-        I_EXC_OPEN = 0
-        I_EXC_REOPEN = 1
-        I_EXC_REPLACE = 2
-
-        class PatchPath:
-            def __init__(self): self.called = 0
-
-            def open(self, **_kwa):
-                if I_EXC_OPEN == self.called:
-                    self.called += 1
-                    raise PATCH_EXC[I_EXC_OPEN]
-                elif I_EXC_REOPEN == self.called:
-                    self.called += 1
-                    raise PATCH_EXC[I_EXC_REOPEN]
-                else:
-                    self.called += 1
-                    return None
-
-            def replace(self, _target):
-                if REPLACE:
-                    raise PATCH_EXC[I_EXC_REPLACE]
-                return None
-
-        patch_path = PatchPath()
-
-        monkeypatch.setattr(Path, 'open', patch_path.open)
-        monkeypatch.setattr(Path, 'replace', patch_path.replace)
-        PATH = Path(tmp_path / 'saved_factsheet.fsg')
+        ERROR = PermissionError('Oops!')
+
+        def patch_mkstemp(**_kwargs):
+            raise ERROR
+
+        monkeypatch.setattr(CSHEET.tempfile, 'mkstemp', patch_mkstemp)
         target = CSHEET.ControlSheet(p_path=None)
-        target._path = PATH
+        target._path = Path(tmp_path / 'saved_factsheet.fsg')
         # Test
-        with RAISE as exc_info:
-            with target._open_file_save() as _io_out:
-                pass
-        cause = exc_info.value.__cause__
-        assert isinstance(cause, type(PATCH_EXC[I_EXC]))
-        assert PATCH_EXC[I_EXC].args == cause.args
-        assert str(PATCH_EXC[I_EXC]) == str(cause)
+        with pytest.raises(CSHEET.OpenFileError) as exc_info:
+            _ = target._open_file_save()
+        assert exc_info.value.__cause__ is ERROR
 
     def test_open_file_save_exists(self, tmp_path):
         """| Confirm file open.
@@ -644,19 +765,15 @@ class TestControlSheet:
         TEXT = 'What, the curtains?'
         with PATH.open(mode='w') as io_out:
             io_out.write(TEXT)
-        MODE = 'xb'
         target = CSHEET.ControlSheet(p_path=None)
         target._path = PATH
         BACKUP = PATH.with_name(PATH.name + '~')
-        assert not BACKUP.exists()
         # Test
-        with target._open_file_save() as io_out:
-            assert isinstance(io_out, io.BufferedWriter)
-            assert MODE == io_out.mode
-            assert BACKUP.exists()
-            with BACKUP.open(mode='r') as io_in:
-                backup_text = io_in.read()
-            assert TEXT == backup_text
+        io_out, _path_temp = target._open_file_save()
+        io_out.close()
+        assert not BACKUP.exists()
+        with PATH.open(mode='r') as io_in:
+            assert TEXT == io_in.read()
 
     def test_open_file_save_no_path(self):
         """| Confirm file open.
@@ -828,6 +945,35 @@ class TestControlSheet:
         tags_model = {topic.tag for topic in target._model.topics()}
         assert tags_model == tags_after
 
+    def test_remove_topics(self, factory_control_sheet):
+        """| Confirm method removes controls and relays request to model.
+        | Case: line within another section, None, and separate lines.
+
+        :param factory_control_sheet: fixture :func:`factory_control_sheet`.
+        """
+        # Setup
+        target = factory_control_sheet()
+        tags_before = [t.tag for t in target._model.topics()]
+        lines = list(target._model._topics.lines())
+        I_REMOVE = [1, 2, 4]
+        tags_after = {tags_before[i] for i in [0, 3, 5]}
+        N_REMOVE_MANY = 0
+
+        def patch_remove_many(p_lines):
+            nonlocal N_REMOVE_MANY
+            N_REMOVE_MANY += 1
+            remove_many(p_lines)
+
+        remove_many = target._model._topics.remove_many
+        target._model._topics.remove_many = patch_remove_many
+        # Test
+        target.remove_topics([lines[i] for i in I_REMOVE] + [None])
+        assert 1 == N_REMOVE_MANY
+        tags_control = target._roster_topics.keys()
+        assert tags_control == tags_after
+        tags_model = {topic.tag for topic in target._model.topics()}
+        assert tags_model == tags_after
+
     def test_remove_topic_none(self, factory_control_sheet):
         """Confirm topics and controls unchanged when line is None.
 
@@ -962,7 +1108,8 @@ class TestControlSheet:
         assert target._model.has_not_changed()
         assert PATH.exists()
         with PATH.open(mode='rb') as io_in:
-            model_disk = pickle.load(io_in)
+            assert CFORMAT.is_format(io_in)
+            model_disk = CFORMAT.load_sheet(io_in)
         assert model_disk is not None
         assert target._model == model_disk
 
@@ -976,10 +1123,10 @@ class TestControlSheet:
         # Setup
         ERROR = 'Random Error'
 
-        def patch_dump(_object, _file):
+        def patch_dump(_self, _sheet, _file):
             raise pickle.PicklingError(ERROR)
 
-        monkeypatch.setattr(pickle, 'dump', patch_dump)
+        monkeypatch.setattr(CFORMAT.WriterSheet, 'dump_full', patch_dump)
         target = CSHEET.ControlSheet(p_path=None)
         PATH = Path(tmp_path / 'saved_factsheet.fsg')
         target._path = PATH
@@ -993,6 +1140,235 @@ class TestControlSheet:
         assert (ERROR,) == cause.args
         assert ERROR == str(cause)
 
+    def test_save_backup(self, tmp_path):
+        """| Confirm write to file.
+        | Case: file exists and save keeps backup or not.
+
+        :param tmp_path: built-in fixture `Pytest tmp_path`_
+        """
+        # Setup
+        PATH = Path(tmp_path / 'saved_factsheet.fsg')
+        BACKUP = PATH.with_name(PATH.name + '~')
+        TEXT = 'What, the curtains?'
+        with PATH.open(mode='w') as io_out:
+            io_out.write(TEXT)
+        target = CSHEET.ControlSheet(p_path=None)
+        target._path = PATH
+        # Test
+        target.save(p_backup=False)
+        assert not BACKUP.exists()
+        PATH.write_text(TEXT)
+        target._writer.detach()
+        target.save()
+        assert TEXT == BACKUP.read_text()
+        assert [PATH.name, BACKUP.name] == sorted(
+            p.name for p in tmp_path.iterdir())
+        with PATH.open(mode='rb') as io_in:
+            assert target._model == CFORMAT.load_sheet(io_in)
+
+    def test_save_backup_except(self, monkeypatch, tmp_path):
+        """| Confirm write to file.
+        | Case: backup fails.
+
+        :param monkeypatch: built-in fixture `Pytest monkeypatch`_.
+        :param tmp_path: built-in fixture `Pytest tmp_path`_
+        """
+        # Setup
+        ERROR = OSError('Oops!')
+
+        def patch_backup(*_args):
+            raise ERROR
+
+        monkeypatch.setattr(CSHEET.os, 'link', patch_backup)
+        monkeypatch.setattr(CSHEET.shutil, 'copy2', patch_backup)
+        PATH = Path(tmp_path / 'saved_factsheet.fsg')
+        TEXT = 'What, the curtains?'
+        PATH.write_text(TEXT)
+        target = CSHEET.ControlSheet(p_path=None)
+        target._path = PATH
+        target._model.set_stale()
+        # Test
+        with pytest.raises(CSHEET.BackupFileError) as exc_info:
+            target.save()
+        assert exc_info.value.__cause__ is ERROR
+        assert target._model.is_stale()
+        assert not target._writer.can_append()
+        assert TEXT == PATH.read_text()
+        assert [PATH.name] == [p.name for p in tmp_path.iterdir()]
+
+    def test_save_background(self, monkeypatch, tmp_path):
+        """| Confirm write to file.
+        | Case: save finishes on background thread.
+
+        :param monkeypatch: built-in fixture `Pytest monkeypatch`_.
+        :param tmp_path: built-in fixture `Pytest tmp_path`_
+        """
+        # Setup
+        calls = list()
+        monkeypatch.setattr(CSHEET.CSAVE.GLib, 'idle_add',
+                            lambda *p_call: calls.append(p_call))
+        errors = list()
+        PATH = Path(tmp_path / 'saved_factsheet.fsg')
+        target = CSHEET.ControlSheet(p_path=None)
+        target._model.set_stale()
+        # Test
+        target.save_background(p_path=PATH, p_on_done=errors.append)
+        assert target._model.has_not_changed()
+        _ = CSHEET.CF.wait([target._future_save])
+        for function, *args in calls:
+            assert function(*args) is False
+        assert [None] == errors
+        with PATH.open(mode='rb') as io_in:
+            assert target._model == CFORMAT.load_sheet(io_in)
+
+    def test_save_background_except(self, monkeypatch, tmp_path):
+        """| Confirm write to file.
+        | Case: save fails on background thread.
+
+        :param monkeypatch: built-in fixture `Pytest monkeypatch`_.
+        :param tmp_path: built-in fixture `Pytest tmp_path`_
+        """
+        # Setup
+        calls = list()
+        monkeypatch.setattr(CSHEET.CSAVE.GLib, 'idle_add',
+                            lambda *p_call: calls.append(p_call))
+        ERROR = OSError('Oops!')
+
+        def patch_replace(*_args):
+            raise ERROR
+
+        monkeypatch.setattr(CSHEET.os, 'replace', patch_replace)
+        errors = list()
+        PATH = Path(tmp_path / 'saved_factsheet.fsg')
+        target = CSHEET.ControlSheet(p_path=None)
+        target._model.set_stale()
+        # Test
+        target.save_background(p_path=PATH, p_on_done=errors.append)
+        _ = CSHEET.CF.wait([target._future_save])
+        for function, *args in calls:
+            assert function(*args) is False
+        assert 1 == len(errors)
+        assert isinstance(errors[0], CSHEET.OpenFileError)
+        assert target._model.is_stale()
+        assert not target._writer.can_append()
+        assert not list(tmp_path.iterdir())
+
+    def test_save_autosave(self, patch_journal, tmp_path):
+        """| Confirm write to file.
+        | Case: save starts journal, restarts journal, and moves journal
+          with file.
+
+        :param patch_journal: fixture :func:`patch_journal`.
+        :param tmp_path: built-in fixture `Pytest tmp_path`_
+        """
+        # Setup
+        target = CSHEET.ControlSheet(p_path=None, p_autosave=True)
+        PATH = Path(tmp_path / 'saved_factsheet.fsg')
+        PATH_NEW = Path(tmp_path / 'renamed_factsheet.fsg')
+        # Test
+        target.save(p_path=PATH)
+        journal = target._journal
+        assert CJOURNAL.path_journal(PATH).exists()
+        target._model.name.text = 'Something completely different'
+        journal.flush()
+        target.save()
+        assert journal is target._journal
+        assert CJOURNAL._STRUCT_HEADER.size == journal.size
+        target.save(p_path=PATH_NEW)
+        assert journal is not target._journal
+        assert not CJOURNAL.path_journal(PATH).exists()
+        assert CJOURNAL.path_journal(PATH_NEW).exists()
+
+    def test_save_crash(self, monkeypatch, tmp_path):
+        """| Confirm write to file.
+        | Case: dump fails while file exists.
+
+        :param monkeypatch: built-in fixture `Pytest monkeypatch`_.
+        :param tmp_path: built-in fixture `Pytest tmp_path`_
+        """
+        # Setup
+        def patch_dump(_self, _sheet, p_io):
+            p_io.write(b'Incomplete')
+            raise pickle.PicklingError('Oops!')
+
+        monkeypatch.setattr(CFORMAT.WriterSheet, 'dump_full', patch_dump)
+        PATH = Path(tmp_path / 'saved_factsheet.fsg')
+        TEXT = 'What, the curtains?'
+        PATH.write_text(TEXT)
+        target = CSHEET.ControlSheet(p_path=None)
+        target._path = PATH
+        # Test
+        with pytest.raises(CSHEET.DumpFileError):
+            target.save()
+        assert TEXT == PATH.read_text()
+        assert [PATH.name] == [p.name for p in tmp_path.iterdir()]
+
+    def test_save_incremental(self, tmp_path):
+        """| Confirm write to file.
+        | Case: file from previous save is current.
+
+        :param tmp_path: built-in fixture `Pytest tmp_path`_
+        """
+        # Setup
+        PATH = Path(tmp_path / 'saved_factsheet.fsg')
+        source = CSHEET.ControlSheet(p_path=None)
+        TOPIC = MTOPIC.Topic(p_name='Parrot', p_summary='', p_title='')
+        _ = source.insert_topic_before(TOPIC, None)
+        source.save(p_path=PATH)
+        target = CSHEET.ControlSheet(p_path=PATH)
+        topic = next(target._model.topics())
+        TITLE = 'The Parrot Sketch'
+        topic.title.text = TITLE
+        SIZE_SAVED = PATH.stat().st_size
+        # Test
+        target.save()
+        assert isinstance(topic, CFORMAT.TopicLazy)
+        assert not Path(str(PATH) + '~').exists()
+        assert SIZE_SAVED < PATH.stat().st_size
+        assert target._model.has_not_changed()
+        with PATH.open(mode='rb') as io_in:
+            model_disk = CFORMAT.load_sheet(io_in)
+        topic_disk = next(model_disk.topics())
+        assert TITLE == topic_disk.title.text
+
+    def test_save_incremental_no_backup(self, tmp_path):
+        """| Confirm write to file.
+        | Case: file from previous save is current and save keeps no
+          backup.
+
+        :param tmp_path: built-in fixture `Pytest tmp_path`_
+        """
+        # Setup
+        PATH = Path(tmp_path / 'saved_factsheet.fsg')
+        target = CSHEET.ControlSheet(p_path=None)
+        target.save(p_path=PATH)
+        target._model.name.text = 'Something completely different'
+        SIZE_SAVED = PATH.stat().st_size
+        # Test
+        target.save(p_backup=False)
+        assert SIZE_SAVED < PATH.stat().st_size
+        assert [PATH.name] == [p.name for p in tmp_path.iterdir()]
+
+    def test_save_incremental_missing(self, tmp_path):
+        """| Confirm write to file.
+        | Case: file from previous save was removed.
+
+        :param tmp_path: built-in fixture `Pytest tmp_path`_
+        """
+        # Setup
+        PATH = Path(tmp_path / 'saved_factsheet.fsg')
+        target = CSHEET.ControlSheet(p_path=None)
+        target.save(p_path=PATH)
+        PATH.unlink()
+        target._model.set_stale()
+        # Test
+        target.save()
+        assert PATH.exists()
+        assert target._model.has_not_changed()
+        with PATH.open(mode='rb') as io_in:
+            model_disk = CFORMAT.load_sheet(io_in)
+        assert target._model == model_disk
+
     def test_save_new_path(self, tmp_path):
         """| Confirm write to file.
         | Case: replace path to save file.
@@ -8,9 +8,25 @@ import pytest
 
 # import factsheet.bridge_ui as BUI
 import factsheet.control.control_topic as CTOPIC
+import factsheet.control.scheduler_check as CSCHEDULE
+import factsheet.model.fact as MFACT
 import factsheet.model.topic as MTOPIC
 
 
+class PatchScheduler:
+    """Stub for :class:`.SchedulerCheck` that records requests."""
+
+    def __init__(self):
+        self.checked = list()
+        self.cancelled = list()
+
+    def cancel(self, p_fact):
+        self.cancelled.append(p_fact)
+
+    def check(self, p_fact):
+        self.checked.append(p_fact)
+
+
 class TestControlTopic:
     """Unit tests for :class:`~.control_topic.ControlTopic`."""
 
@@ -51,11 +67,80 @@ class TestControlTopic:
         assert isinstance(factory_editor_title, MTOPIC.FactoryEditorTitle)
         assert factory_editor_title._ui_model is model_title._ui_model
 
+        assert target._scheduler is CSCHEDULE.g_scheduler_check
+
         # assert isinstance(target._controls_fact, dict)
         # assert len(facts) == len(target._controls_fact)
         # for fact in facts:
         #     assert target._controls_fact[fact.tag]._fact is fact
 
+    def test_init_scheduler(self, new_model_topic):
+        """| Confirm initialization.
+        | Case: given scheduler.
+
+        :param new_model_topic: fixture :func:`.new_model_topic`.
+        """
+        # Setup
+        MODEL = new_model_topic(0)
+        SCHEDULER = PatchScheduler()
+        # Test
+        target = CTOPIC.ControlTopic(p_model=MODEL, p_scheduler=SCHEDULER)
+        assert target._scheduler is SCHEDULER
+
+    def test_check_fact(self, new_model_topic):
+        """Confirm control passes fact check to scheduler.
+
+        :param new_model_topic: fixture :func:`.new_model_topic`.
+        """
+        # Setup
+        MODEL = new_model_topic(0)
+        SCHEDULER = PatchScheduler()
+        target = CTOPIC.ControlTopic(p_model=MODEL, p_scheduler=SCHEDULER)
+        FACT = MFACT.Fact(p_name='Parrot', p_summary='', p_title='',
+                          p_topic=MODEL)
+        # Test
+        target.check_fact(FACT)
+        assert [FACT] == SCHEDULER.checked
+
+    def test_clear_all(self, new_model_topic, monkeypatch):
+        """| Confirm control clears each fact of topic.
+        | Case: topic with facts and topic without facts.
+
+        :param new_model_topic: fixture :func:`.new_model_topic`.
+        :param monkeypatch: built-in fixture `Pytest monkeypatch`_.
+        """
+        # Setup
+        MODEL = new_model_topic(0)
+        SCHEDULER = PatchScheduler()
+        target = CTOPIC.ControlTopic(p_model=MODEL, p_scheduler=SCHEDULER)
+        FACTS = [MFACT.Fact(p_name=name, p_summary='', p_title='',
+                            p_topic=MODEL) for name in ['Parrot', 'Cheese']]
+        # Test: topic without facts.
+        target.clear_all()
+        assert not SCHEDULER.cancelled
+        # Test: topic with facts.
+        monkeypatch.setattr(MODEL, 'iter_facts', lambda: iter(FACTS))
+        target.clear_all()
+        assert FACTS == SCHEDULER.cancelled
+
+    def test_clear_fact(self, new_model_topic):
+        """Confirm control cancels check in progress and clears fact.
+
+        :param new_model_topic: fixture :func:`.new_model_topic`.
+        """
+        # Setup
+        MODEL = new_model_topic(0)
+        SCHEDULER = PatchScheduler()
+        target = CTOPIC.ControlTopic(p_model=MODEL, p_scheduler=SCHEDULER)
+        FACT = MFACT.Fact(p_name='Parrot', p_summary='', p_title='',
+                          p_topic=MODEL)
+        generation = FACT.mark_pending()
+        # Test
+        target.clear_fact(FACT)
+        assert [FACT] == SCHEDULER.cancelled
+        assert generation < FACT.generation
+        assert FACT.status is MFACT.StatusOfFact.UNCHECKED
+
     @pytest.mark.parametrize('NAME_ATTR, NAME_PROP', [
         ('_factory_display_name', 'new_display_name'),
         ('_factory_editor_name', 'new_editor_name'),
@@ -0,0 +1,838 @@
+"""
+Unit tests for factsheet file format.  See :mod:`~.format_sheet`.
+
+.. include:: /test/refs_include_pytest.txt
+"""
+import io
+import pickle
+import pytest   # type: ignore[import]
+import struct
+
+import factsheet.control.format_sheet as CFORMAT
+import factsheet.model.sheet as MSHEET
+import factsheet.model.topic as MTOPIC
+
+
+class PatchTopic(MTOPIC.Topic):
+    """Stub for topic that may refer to another topic."""
+
+    def __init__(self, p_name, p_ref=None):
+        super().__init__(p_name=p_name, p_summary='', p_title='')
+        self.ref = p_ref
+
+
+@pytest.fixture
+def new_sheet():
+    """Pytest fixture: Return factory for sheet with topics outline.
+
+    Outline structure::
+
+        Topic 0
+            Topic 00
+                Topic 000 (refers to Topic 1)
+            Topic 01
+        Topic 1
+    """
+    def new():
+        sheet = MSHEET.Sheet(p_name='Parrot', p_title='The Parrot Sketch')
+        topic_1 = PatchTopic('Topic 1')
+        line_0 = sheet.insert_topic_child(PatchTopic('Topic 0'), None)
+        line_00 = sheet.insert_topic_child(PatchTopic('Topic 00'), line_0)
+        _ = sheet.insert_topic_child(
+            PatchTopic('Topic 000', topic_1), line_00)
+        _ = sheet.insert_topic_child(PatchTopic('Topic 01'), line_0)
+        _ = sheet.insert_topic_child(topic_1, None)
+        return sheet
+
+    return new
+
+
+def kinds_records(p_io, p_offset=CFORMAT._STRUCT_HEADER.size):
+    """Return kinds of records in file in order through end record.
+
+    :param p_io: file to examine.
+    :param p_offset: location of first record to examine.
+    """
+    _ = p_io.seek(p_offset)
+    kinds = list()
+    while True:
+        kind, length = CFORMAT._STRUCT_RECORD.unpack(
+            p_io.read(CFORMAT._STRUCT_RECORD.size))
+        kinds.append(kind)
+        if CFORMAT.KindRecord.END == kind:
+            return kinds
+        _ = p_io.seek(length, io.SEEK_CUR)
+
+
+class TestReaderSheet:
+    """Unit tests for :class:`.ReaderSheet`."""
+
+    def test_init(self, new_sheet):
+        """Confirm initialization locates records."""
+        # Setup
+        buffer = io.BytesIO()
+        CFORMAT.dump_sheet(new_sheet(), buffer)
+        _ = buffer.seek(0)
+        # Test
+        target = CFORMAT.ReaderSheet(buffer)
+        assert target._io is buffer
+        assert not target._close
+        assert CFORMAT.VERSION == target.version
+        assert CFORMAT.KindRecord.SHEET in target._spans
+        assert CFORMAT.KindRecord.OUTLINE in target._spans
+        for kind in [CFORMAT.KindRecord.TOPIC_HEAD,
+                     CFORMAT.KindRecord.TOPIC]:
+            assert set(range(5)) == set(target._spans_keyed[kind])
+        assert not target._topics
+        assert 0 == target._n_lazy
+
+    def test_close(self):
+        """| Confirm reader closes file.
+        | Case: reader owns file or not.
+        """
+        # Setup
+        buffer_own = io.BytesIO()
+        CFORMAT.dump_sheet(MSHEET.Sheet(), buffer_own)
+        buffer_other = io.BytesIO(buffer_own.getvalue())
+        _ = buffer_own.seek(0)
+        target_own = CFORMAT.ReaderSheet(buffer_own, p_close=True)
+        target_other = CFORMAT.ReaderSheet(buffer_other)
+        # Test
+        target_own.close()
+        assert buffer_own.closed
+        target_other.close()
+        assert not buffer_other.closed
+
+    def test_load_sheet(self, new_sheet):
+        """| Confirm factsheet load.
+        | Case: topics and outline structure match source.
+        """
+        # Setup
+        source = new_sheet()
+        buffer = io.BytesIO()
+        CFORMAT.dump_sheet(source, buffer)
+        _ = buffer.seek(0)
+        target = CFORMAT.ReaderSheet(buffer)
+        # Test
+        sheet = target.load_sheet(p_lazy=False)
+        assert source == sheet
+        assert sheet.has_not_changed()
+        for topic in sheet.topics():
+            assert type(topic) is PatchTopic
+        outline = sheet.outline_topics
+        depths = [outline.depth(line) for line in outline.lines()]
+        assert [0, 1, 2, 1, 0] == depths
+        names = [topic.name.text for topic in sheet.topics()]
+        assert ['Topic 0', 'Topic 00', 'Topic 000', 'Topic 01',
+                'Topic 1'] == names
+
+    def test_load_sheet_lazy(self, new_sheet):
+        """| Confirm factsheet load.
+        | Case: topic bodies load on first access.
+        """
+        # Setup
+        source = new_sheet()
+        buffer = io.BytesIO()
+        CFORMAT.dump_sheet(source, buffer)
+        _ = buffer.seek(0)
+        target = CFORMAT.ReaderSheet(buffer, p_close=True)
+        # Test
+        sheet = target.load_sheet()
+        assert sheet.has_not_changed()
+        topics = list(sheet.topics())
+        assert 5 == target._n_lazy
+        for topic, topic_source in zip(topics, source.topics()):
+            assert type(topic) is CFORMAT.TopicLazy
+            assert topic_source.name == topic.name
+            assert topic_source.summary == topic.summary
+            assert topic_source.title == topic.title
+        assert not buffer.closed
+        topic = topics[2]
+        tag = topic.tag
+        assert topics[4] is topic.ref
+        assert type(topic) is PatchTopic
+        assert tag == topic.tag
+        assert type(topics[4]) is CFORMAT.TopicLazy
+        assert 4 == target._n_lazy
+        assert sheet.has_not_changed()
+        for topic in topics:
+            target.load_body(topic)
+        assert 0 == target._n_lazy
+        assert buffer.closed
+        assert sheet == source
+
+    def test_load_sheet_lazy_stale(self, new_sheet):
+        """| Confirm factsheet load.
+        | Case: identity edit before topic body loads remains stale.
+        """
+        # Setup
+        buffer = io.BytesIO()
+        CFORMAT.dump_sheet(new_sheet(), buffer)
+        _ = buffer.seek(0)
+        target = CFORMAT.ReaderSheet(buffer)
+        sheet = target.load_sheet()
+        topic = next(sheet.topics())
+        topic.set_stale()
+        # Test
+        assert topic.ref is None
+        assert type(topic) is PatchTopic
+        assert topic.is_stale()
+        assert sheet.is_stale()
+
+    def test_load_sheet_lazy_track(self, new_sheet):
+        """| Confirm factsheet load.
+        | Case: factsheet tracks change state of topics before and after
+          topic bodies load.
+        """
+        # Setup
+        buffer = io.BytesIO()
+        CFORMAT.dump_sheet(new_sheet(), buffer)
+        _ = buffer.seek(0)
+        target = CFORMAT.ReaderSheet(buffer)
+        sheet = target.load_sheet()
+        topic = next(sheet.topics())
+        # Test
+        topic.name.set_stale()
+        assert sheet.is_stale()
+        sheet.set_fresh()
+        assert topic.name.has_not_changed()
+        _ = topic.load_body()
+        assert type(topic) is PatchTopic
+        assert sheet.has_not_changed()
+        topic.title.set_stale()
+        assert sheet.is_stale()
+
+    def test_load_sheet_lazy_edit_save(self, new_sheet):
+        """| Confirm factsheet load.
+        | Case: edit to topic name before body loads reaches each save.
+        """
+        # Setup
+        buffer = io.BytesIO()
+        CFORMAT.dump_sheet(new_sheet(), buffer)
+        _ = buffer.seek(0)
+        reader = CFORMAT.ReaderSheet(buffer)
+        sheet = reader.load_sheet()
+        writer = CFORMAT.WriterSheet(p_reader=reader)
+        topic = next(sheet.topics())
+        topic.name.text = 'Norwegian Blue'
+        _ = topic.load_body()
+        # Test
+        assert sheet.is_stale()
+        writer.dump_stale(sheet, buffer)
+        sheet.set_fresh()
+        assert topic.name.has_not_changed()
+        topic.name.text = 'Ex-parrot'
+        assert sheet.is_stale()
+        writer.dump_stale(sheet, buffer)
+        sheet.set_fresh()
+        _ = buffer.seek(0)
+        load = CFORMAT.load_sheet(buffer)
+        assert 'Ex-parrot' == next(load.topics()).name.text
+
+    def test_load_body_missing(self, new_sheet):
+        """| Confirm topic body load.
+        | Case: file contains no body for topic.
+        """
+        # Setup
+        buffer = io.BytesIO()
+        CFORMAT.dump_sheet(new_sheet(), buffer)
+        _ = buffer.seek(0)
+        target = CFORMAT.ReaderSheet(buffer)
+        sheet = target.load_sheet()
+        topic = next(sheet.topics())
+        del target._spans_keyed[CFORMAT.KindRecord.TOPIC][topic._key]
+        # Test
+        with pytest.raises(CFORMAT.FormatError):
+            topic.load_body()
+
+    def test_load_sheet_cycle(self):
+        """| Confirm factsheet load.
+        | Case: topics refer to each other in a cycle.
+        """
+        # Setup
+        source = MSHEET.Sheet()
+        topic_a = PatchTopic('A')
+        topic_b = PatchTopic('B', topic_a)
+        topic_a.ref = topic_b
+        _ = source.insert_topic_child(topic_a, None)
+        _ = source.insert_topic_child(topic_b, None)
+        buffer = io.BytesIO()
+        CFORMAT.dump_sheet(source, buffer)
+        _ = buffer.seek(0)
+        target = CFORMAT.ReaderSheet(buffer)
+        # Test
+        sheet = target.load_sheet(p_lazy=False)
+        load_a, load_b = sheet.topics()
+        assert load_b is load_a.ref
+        assert load_a is load_b.ref
+
+    def test_load_sheet_depth(self):
+        """| Confirm factsheet load.
+        | Case: outline line deeper than any possible parent.
+        """
+        # Setup
+        buffer = io.BytesIO()
+        buffer.write(CFORMAT._STRUCT_HEADER.pack(
+            CFORMAT.MAGIC, CFORMAT.VERSION))
+        state = MSHEET.Sheet().__getstate__()
+        del state['_topics']
+        CFORMAT.write_record(
+            buffer, CFORMAT.KindRecord.SHEET, pickle.dumps(state))
+        KEY_NONE = CFORMAT._KEY_NONE
+        CFORMAT.write_record(buffer, CFORMAT.KindRecord.OUTLINE,
+                             struct.pack('>HQHQ', 0, KEY_NONE, 2, KEY_NONE))
+        CFORMAT.write_record(buffer, CFORMAT.KindRecord.END, b'')
+        _ = buffer.seek(0)
+        target = CFORMAT.ReaderSheet(buffer)
+        # Test
+        with pytest.raises(CFORMAT.FormatError):
+            _ = target.load_sheet()
+
+    @pytest.mark.parametrize('KIND', [
+        CFORMAT.KindRecord.SHEET,
+        CFORMAT.KindRecord.OUTLINE,
+        ])
+    def test_load_sheet_missing(self, KIND):
+        """| Confirm factsheet load.
+        | Case: required record missing.
+
+        :param KIND: kind of missing record.
+        """
+        # Setup
+        buffer = io.BytesIO()
+        buffer.write(CFORMAT._STRUCT_HEADER.pack(
+            CFORMAT.MAGIC, CFORMAT.VERSION))
+        if CFORMAT.KindRecord.SHEET != KIND:
+            state = MSHEET.Sheet().__getstate__()
+            del state['_topics']
+            CFORMAT.write_record(
+                buffer, CFORMAT.KindRecord.SHEET, pickle.dumps(state))
+        if CFORMAT.KindRecord.OUTLINE != KIND:
+            CFORMAT.write_record(buffer, CFORMAT.KindRecord.OUTLINE, b'')
+        CFORMAT.write_record(buffer, CFORMAT.KindRecord.END, b'')
+        _ = buffer.seek(0)
+        target = CFORMAT.ReaderSheet(buffer)
+        # Test
+        with pytest.raises(CFORMAT.FormatError):
+            _ = target.load_sheet()
+
+    def test_read_payload_short(self, new_sheet):
+        """| Confirm record read.
+        | Case: file ends within record.
+        """
+        # Setup
+        buffer = io.BytesIO()
+        CFORMAT.dump_sheet(new_sheet(), buffer)
+        _ = buffer.seek(0)
+        target = CFORMAT.ReaderSheet(buffer)
+        end = len(buffer.getvalue())
+        # Test
+        with pytest.raises(CFORMAT.FormatError):
+            _ = target._read_payload(end - 4, 8)
+
+    def test_scan_truncated(self, new_sheet):
+        """| Confirm record scan.
+        | Case: file ends before end record.
+        """
+        # Setup
+        buffer = io.BytesIO()
+        CFORMAT.dump_sheet(new_sheet(), buffer)
+        content = buffer.getvalue()
+        SIZE_END = CFORMAT._STRUCT_RECORD.size
+        # Test
+        with pytest.raises(CFORMAT.FormatError):
+            _ = CFORMAT.ReaderSheet(io.BytesIO(content[:-SIZE_END]))
+
+    def test_scan_sessions(self, new_sheet):
+        """| Confirm record scan.
+        | Case: later session replaces records and reader ignores
+          records after last end record.
+        """
+        # Setup
+        source = new_sheet()
+        buffer = io.BytesIO()
+        writer = CFORMAT.WriterSheet()
+        writer.dump_full(source, buffer)
+        topic = next(source.topics())
+        NAME = 'Dead Parrot'
+        topic.name.text = NAME
+        writer.dump_stale(source, buffer)
+        SIZE_COMMITTED = len(buffer.getvalue())
+        topic.name.text = 'Ex-Parrot'
+        topic.set_stale()
+        writer.dump_stale(source, buffer)
+        content = buffer.getvalue()
+        SIZE_END = CFORMAT._STRUCT_RECORD.size
+        # Test
+        target = CFORMAT.ReaderSheet(io.BytesIO(content[:-SIZE_END]))
+        assert SIZE_COMMITTED == target._offset_end
+        sheet = target.load_sheet()
+        assert NAME == next(sheet.topics()).name.text
+
+    def test_scan_unknown(self, new_sheet):
+        """| Confirm record scan.
+        | Case: reader skips record of unknown kind.
+        """
+        # Setup
+        buffer = io.BytesIO()
+        CFORMAT.dump_sheet(new_sheet(), buffer)
+        content = buffer.getvalue()
+        SIZE_END = CFORMAT._STRUCT_RECORD.size
+        KIND_UNKNOWN = 42
+        buffer = io.BytesIO()
+        buffer.write(content[:-SIZE_END])
+        buffer.write(CFORMAT._STRUCT_RECORD.pack(KIND_UNKNOWN, 3))
+        buffer.write(b'abc')
+        CFORMAT.write_record(buffer, CFORMAT.KindRecord.END, b'')
+        _ = buffer.seek(0)
+        # Test
+        target = CFORMAT.ReaderSheet(buffer)
+        assert KIND_UNKNOWN not in target._spans
+        assert new_sheet() == target.load_sheet(p_lazy=False)
+
+
+class TestWriterSheet:
+    """Unit tests for :class:`.WriterSheet`."""
+
+    def test_init(self):
+        """| Confirm initialization.
+        | Case: writer with no file.
+        """
+        # Setup
+        # Test
+        target = CFORMAT.WriterSheet()
+        assert not target._keys
+        assert not target._keys_unsaved
+        assert not target._topics
+        assert 0 == target._key_next
+        assert target.mark is None
+        assert target._offset_end is None
+        assert not target._sizes
+        assert 0 == target._size_fixed
+        assert not target.can_append()
+
+    def test_init_reader(self, new_sheet):
+        """| Confirm initialization.
+        | Case: writer appends to file of reader.
+        """
+        # Setup
+        buffer = io.BytesIO()
+        CFORMAT.dump_sheet(new_sheet(), buffer)
+        _ = buffer.seek(0)
+        reader = CFORMAT.ReaderSheet(buffer)
+        sheet = reader.load_sheet()
+        # Test
+        target = CFORMAT.WriterSheet(p_reader=reader)
+        assert len(buffer.getvalue()) == target._offset_end
+        assert reader.mark == target.mark
+        assert CFORMAT._SIZE_MARK == len(target.mark)
+        assert not target._keys_unsaved
+        assert 5 == target._key_next
+        for key, topic in enumerate(sheet.topics()):
+            assert key == target._keys[id(topic)]
+            assert topic is target._topics[key]
+        size_live = target._size_fixed + sum(target._sizes.values())
+        assert len(buffer.getvalue()) == size_live
+        assert target.can_append()
+
+    @pytest.mark.parametrize('SIZE_DEAD, EXPECT', [
+        (0, True),
+        (CFORMAT.SIZE_COMPACT_MIN, True),
+        (CFORMAT.SIZE_COMPACT_MIN + 1, False),
+        ])
+    def test_can_append(self, SIZE_DEAD, EXPECT):
+        """| Confirm check for compaction.
+        | Case: file with live records and varying replaced records.
+
+        :param SIZE_DEAD: size of replaced records.
+        :param EXPECT: expected result.
+        """
+        # Setup
+        target = CFORMAT.WriterSheet()
+        SIZE_LIVE = CFORMAT.SIZE_COMPACT_MIN
+        target._size_fixed = SIZE_LIVE
+        target._offset_end = SIZE_LIVE + SIZE_DEAD
+        # Test
+        assert EXPECT is target.can_append()
+
+    def test_detach(self):
+        """Confirm writer forgets file."""
+        # Setup
+        target = CFORMAT.WriterSheet()
+        target.dump_full(MSHEET.Sheet(), io.BytesIO())
+        assert target.can_append()
+        # Test
+        target.detach()
+        assert not target.can_append()
+        with pytest.raises(CFORMAT.FormatError):
+            target.dump_stale(MSHEET.Sheet(), io.BytesIO())
+
+    def test_dump_full_keys(self, new_sheet):
+        """| Confirm full save.
+        | Case: topics keep keys and removed topics release keys.
+        """
+        # Setup
+        source = new_sheet()
+        target = CFORMAT.WriterSheet()
+        target.dump_full(source, io.BytesIO())
+        keys = dict(target._keys)
+        line_last = list(source.outline_topics.lines())[-1]
+        topic_last = source.outline_topics.get_item(line_last)
+        source.remove_topic(line_last)
+        # Test
+        buffer = io.BytesIO()
+        target.dump_full(source, buffer)
+        assert id(topic_last) not in target._keys
+        for topic in source.topics():
+            assert keys[id(topic)] == target._keys[id(topic)]
+        _ = buffer.seek(0)
+        assert source == CFORMAT.load_sheet(buffer)
+
+    def test_dump_stale(self, new_sheet):
+        """| Confirm incremental save.
+        | Case: writer appends only stale topics.
+        """
+        # Setup
+        source = new_sheet()
+        buffer = io.BytesIO()
+        target = CFORMAT.WriterSheet()
+        target.dump_full(source, buffer)
+        source.set_fresh()
+        SIZE_FULL = len(buffer.getvalue())
+        topic = list(source.topics())[2]
+        topic.title.text = 'Dead Parrot'
+        KIND = CFORMAT.KindRecord
+        # Test
+        target.dump_stale(source, buffer)
+        kinds = kinds_records(buffer, SIZE_FULL)
+        assert [KIND.TOPIC_HEAD, KIND.TOPIC,
+                KIND.SHEET, KIND.OUTLINE, KIND.MARK, KIND.END] == kinds
+        _ = buffer.seek(0)
+        sheet = CFORMAT.load_sheet(buffer)
+        assert source == sheet
+        topic_ref = list(sheet.topics())[2].ref
+        assert topic_ref is list(sheet.topics())[4]
+
+    def test_dump_stale_lazy(self, new_sheet):
+        """| Confirm incremental save.
+        | Case: stale topic with body not loaded.
+        """
+        # Setup
+        buffer = io.BytesIO()
+        CFORMAT.dump_sheet(new_sheet(), buffer)
+        _ = buffer.seek(0)
+        reader = CFORMAT.ReaderSheet(buffer)
+        source = reader.load_sheet()
+        target = CFORMAT.WriterSheet(p_reader=reader)
+        topic = next(source.topics())
+        SUMMARY = 'Pining for the fjords.'
+        topic.summary.text = SUMMARY
+        SIZE_FULL = len(buffer.getvalue())
+        KIND = CFORMAT.KindRecord
+        # Test
+        target.dump_stale(source, buffer)
+        assert isinstance(topic, CFORMAT.TopicLazy)
+        assert [KIND.TOPIC_HEAD, KIND.SHEET, KIND.OUTLINE, KIND.MARK,
+                KIND.END] == kinds_records(buffer, SIZE_FULL)
+        _ = buffer.seek(0)
+        sheet = CFORMAT.load_sheet(buffer)
+        assert SUMMARY == next(sheet.topics()).summary.text
+
+    def test_dump_stale_outline(self, new_sheet):
+        """| Confirm incremental save.
+        | Case: topics added and removed.
+        """
+        # Setup
+        source = new_sheet()
+        buffer = io.BytesIO()
+        target = CFORMAT.WriterSheet()
+        target.dump_full(source, buffer)
+        source.set_fresh()
+        line_first = next(iter(source.outline_topics.lines()))
+        topic_first = source.outline_topics.get_item(line_first)
+        source.remove_topic(line_first)
+        _ = source.insert_topic_child(PatchTopic('Topic 2'), None)
+        # Test
+        target.dump_stale(source, buffer)
+        assert 6 == target._key_next
+        assert id(topic_first) in target._keys
+        assert not any(key == target._keys[id(topic_first)]
+                       for _kind, key in target._sizes)
+        _ = buffer.seek(0)
+        assert source == CFORMAT.load_sheet(buffer)
+
+    def test_dump_stale_tail(self, new_sheet):
+        """| Confirm incremental save.
+        | Case: writer replaces records after end of previous save.
+        """
+        # Setup
+        source = new_sheet()
+        buffer = io.BytesIO()
+        target = CFORMAT.WriterSheet()
+        target.dump_full(source, buffer)
+        SIZE_FULL = len(buffer.getvalue())
+        buffer.write(b'Incomplete session')
+        # Test
+        target.dump_stale(source, buffer)
+        content = buffer.getvalue()
+        assert b'Incomplete' not in content[SIZE_FULL:]
+        _ = buffer.seek(0)
+        assert source == CFORMAT.load_sheet(buffer)
+
+    def test_adopt(self, new_sheet):
+        """Confirm writer adopts topic with given key."""
+        # Setup
+        source = new_sheet()
+        target = CFORMAT.WriterSheet()
+        target.dump_full(source, io.BytesIO())
+        KEY = 3
+        topic_old = target._topics[KEY]
+        topic_new = PatchTopic('Topic 3')
+        KEY_NEW = 7
+        topic_extra = PatchTopic('Topic 7')
+        # Test
+        target.adopt(KEY, topic_new)
+        target.adopt(KEY_NEW, topic_extra)
+        assert id(topic_old) not in target._keys
+        assert KEY == target.key(topic_new)
+        assert topic_new is target._topics[KEY]
+        assert KEY_NEW == target.key(topic_extra)
+        assert {KEY, KEY_NEW} == target._keys_unsaved
+        assert KEY_NEW + 1 == target._key_next
+
+    def test_key(self, new_sheet):
+        """| Confirm key assignment.
+        | Case: topic with key and topic new to writer.
+        """
+        # Setup
+        source = new_sheet()
+        target = CFORMAT.WriterSheet()
+        target.dump_full(source, io.BytesIO())
+        topic = next(source.topics())
+        topic_new = PatchTopic('Topic 2')
+        # Test
+        assert 0 == target.key(topic)
+        assert not target._keys_unsaved
+        assert 5 == target.key(topic_new)
+        assert 5 == target.key(topic_new)
+        assert {5} == target._keys_unsaved
+        assert 6 == target._key_next
+
+    def test_key_lazy(self, new_sheet):
+        """| Confirm key assignment.
+        | Case: lazy topic from another file loads body.
+        """
+        # Setup
+        buffer = io.BytesIO()
+        CFORMAT.dump_sheet(new_sheet(), buffer)
+        _ = buffer.seek(0)
+        source = CFORMAT.ReaderSheet(buffer).load_sheet()
+        topic = next(source.topics())
+        target = CFORMAT.WriterSheet()
+        # Test
+        key = target.key(topic)
+        assert 0 == key
+        assert type(topic) is PatchTopic
+        assert key == target._keys[id(topic)]
+        assert topic is target._topics[key]
+
+    def test_mark(self, new_sheet):
+        """Confirm each session has a new mark."""
+        # Setup
+        source = new_sheet()
+        buffer = io.BytesIO()
+        target = CFORMAT.WriterSheet()
+        target.dump_full(source, buffer)
+        mark_full = target.mark
+        # Test
+        target.dump_stale(source, buffer)
+        assert mark_full != target.mark
+        _ = buffer.seek(0)
+        assert target.mark == CFORMAT.ReaderSheet(buffer).mark
+
+
+class TestFormatSheet:
+    """Unit tests for module-level functions of :mod:`.format_sheet`."""
+
+    def test_dump_sheet(self, new_sheet):
+        """Confirm factsheet written as header and records."""
+        # Setup
+        source = new_sheet()
+        buffer = io.BytesIO()
+        KIND = CFORMAT.KindRecord
+        # Test
+        CFORMAT.dump_sheet(source, buffer)
+        _ = buffer.seek(0)
+        assert CFORMAT.VERSION == CFORMAT.read_header(buffer)
+        kinds = kinds_records(buffer)
+        assert [KIND.TOPIC_HEAD, KIND.TOPIC] * 5 == kinds[:-4]
+        assert [KIND.SHEET, KIND.OUTLINE, KIND.MARK, KIND.END
+                ] == kinds[-4:]
+
+    def test_dump_sheet_lazy(self, new_sheet):
+        """| Confirm factsheet written as header and records.
+        | Case: factsheet contains topics with bodies not loaded.
+        """
+        # Setup
+        source = new_sheet()
+        buffer = io.BytesIO()
+        CFORMAT.dump_sheet(source, buffer)
+        _ = buffer.seek(0)
+        sheet = CFORMAT.ReaderSheet(buffer).load_sheet()
+        buffer_lazy = io.BytesIO()
+        # Test
+        CFORMAT.dump_sheet(sheet, buffer_lazy)
+        _ = buffer_lazy.seek(0)
+        assert CFORMAT.load_sheet(buffer_lazy) == source
+
+    def test_decode_outline(self, new_sheet):
+        """Confirm outline payload decodes to depth and key of lines."""
+        # Setup
+        source = new_sheet()
+        writer = CFORMAT.WriterSheet()
+        # Test
+        lines = list(CFORMAT.decode_outline(writer.encode_outline(source)))
+        assert [(0, 0), (1, 1), (2, 2), (1, 3), (0, 4)] == lines
+
+    def test_dump_sheet_empty(self):
+        """| Confirm factsheet written as header and records.
+        | Case: factsheet without topics.
+        """
+        # Setup
+        source = MSHEET.Sheet()
+        buffer = io.BytesIO()
+        # Test
+        CFORMAT.dump_sheet(source, buffer)
+        _ = buffer.seek(0)
+        assert source == CFORMAT.load_sheet(buffer)
+
+    def test_insert_outline(self, new_sheet):
+        """| Confirm lines added to topics outline.
+        | Case: lines consistent.
+        """
+        # Setup
+        source = new_sheet()
+        topics = list(source.topics())
+        LINES = [(0, 4), (0, 0), (1, 2)]
+        target = MSHEET.Sheet()
+        # Test
+        CFORMAT.insert_outline(target, LINES, topics.__getitem__)
+        outline = target.outline_topics
+        assert [topics[4], topics[0], topics[2]] == list(target.topics())
+        assert [0, 0, 1] == [outline.depth(line)
+                             for line in outline.lines()]
+
+    def test_insert_outline_depth(self, new_sheet):
+        """| Confirm lines added to topics outline.
+        | Case: line deeper than any possible parent.
+        """
+        # Setup
+        source = new_sheet()
+        topics = list(source.topics())
+        LINES = [(0, 0), (2, 1)]
+        target = MSHEET.Sheet()
+        # Test
+        with pytest.raises(CFORMAT.FormatError):
+            CFORMAT.insert_outline(target, LINES, topics.__getitem__)
+        assert not list(target.topics())
+
+    @pytest.mark.parametrize('CONTENT, EXPECT', [
+        (CFORMAT.MAGIC + b'\x00\x01', True),
+        (pickle.dumps('Something completely different'), False),
+        (b'', False),
+        ])
+    def test_is_format(self, CONTENT, EXPECT):
+        """Confirm format detection leaves file position unchanged.
+
+        :param CONTENT: file content.
+        :param EXPECT: expected result.
+        """
+        # Setup
+        buffer = io.BytesIO(CONTENT)
+        # Test
+        assert EXPECT is CFORMAT.is_format(buffer)
+        assert 0 == buffer.tell()
+
+    def test_iter_sessions(self):
+        """| Confirm iteration over sessions of records.
+        | Case: incomplete session at end is ignored.
+        """
+        # Setup
+        buffer = io.BytesIO()
+        TEXT = CFORMAT.KindRecord.TEXT
+        END = CFORMAT.KindRecord.END
+        _ = CFORMAT.write_record(buffer, TEXT, b'Norwegian')
+        _ = CFORMAT.write_record(buffer, END, b'')
+        _ = CFORMAT.write_record(buffer, END, b'')
+        _ = CFORMAT.write_record(buffer, TEXT, b'Blue')
+        _ = CFORMAT.write_record(buffer, END, b'')
+        size = len(buffer.getvalue())
+        _ = CFORMAT.write_record(buffer, TEXT, b'Pining')
+        _ = buffer.truncate(len(buffer.getvalue()) - 2)
+        _ = buffer.seek(0)
+        # Test
+        sessions = list(CFORMAT.iter_sessions(buffer))
+        assert [[(TEXT, b'Norwegian')], [], [(TEXT, b'Blue')]] == sessions
+        assert size < buffer.tell()
+
+    def test_load_sheet(self, new_sheet):
+        """Confirm factsheet load."""
+        # Setup
+        source = new_sheet()
+        buffer = io.BytesIO()
+        CFORMAT.dump_sheet(source, buffer)
+        _ = buffer.seek(0)
+        # Test
+        sheet = CFORMAT.load_sheet(buffer)
+        assert source == sheet
+        for topic in sheet.topics():
+            assert type(topic) is PatchTopic
+
+    @pytest.mark.parametrize('CONTENT', [
+        CFORMAT.MAGIC[:4],
+        b'Not a sheet',
+        struct.pack('>8sH', CFORMAT.MAGIC, CFORMAT.VERSION - 1),
+        struct.pack('>8sH', CFORMAT.MAGIC, CFORMAT.VERSION + 1),
+        ])
+    def test_read_header_error(self, CONTENT):
+        """| Confirm header check.
+        | Case: header short, magic wrong, or version not supported.
+
+        :param CONTENT: file content.
+        """
+        # Setup
+        buffer = io.BytesIO(CONTENT)
+        # Test
+        with pytest.raises(CFORMAT.FormatError):
+            _ = CFORMAT.read_header(buffer)
+
+    def test_split_key(self):
+        """Confirm topic key separated from topic record payload."""
+        # Setup
+        KEY = 42
+        REST = b'Dead Parrot'
+        # Test
+        assert (KEY, REST) == CFORMAT.split_key(
+            struct.pack('>Q', KEY) + REST)
+
+    def test_write_record(self):
+        """Confirm record layout."""
+        # Setup
+        buffer = io.BytesIO()
+        PAYLOAD = b'Norwegian Blue'
+        # Test
+        size = CFORMAT.write_record(
+            buffer, CFORMAT.KindRecord.TOPIC, PAYLOAD)
+        assert len(buffer.getvalue()) == size
+        assert (struct.pack('>BQ', CFORMAT.KindRecord.TOPIC, len(PAYLOAD))
+                + PAYLOAD) == buffer.getvalue()
+
+    def test_types(self):
+        """Confirm exception and type definitions."""
+        # Setup
+        # Test
+        assert issubclass(CFORMAT.FormatError, Exception)
+        assert CFORMAT.KeyTopic.__supertype__ is int
+        assert 8 == len(CFORMAT.MAGIC)
+        assert 0 < CFORMAT.RATIO_DEAD_MAX < 1
+        assert 0 < CFORMAT.SIZE_COMPACT_MIN
@@ -0,0 +1,420 @@
+"""
+Unit tests for autosave journal of factsheet edits.  See
+:mod:`~.journal_sheet`.
+
+.. include:: /test/refs_include_pytest.txt
+"""
+import io
+from pathlib import Path
+import pickle
+import pytest   # type: ignore[import]
+import struct
+
+import factsheet.abc_types.abc_stalefile as ABC_STALE
+import factsheet.control.format_sheet as CFORMAT
+import factsheet.control.journal_sheet as CJOURNAL
+import factsheet.model.sheet as MSHEET
+import factsheet.model.topic as MTOPIC
+
+
+class PatchScheduler:
+    """Stub for save scheduler that runs each task immediately."""
+
+    def __init__(self):
+        self.n_tasks = 0
+
+    def submit(self, p_task, p_on_done=None):
+        self.n_tasks += 1
+        p_task()
+
+
+@pytest.fixture
+def patch_journal(monkeypatch):
+    """Pytest fixture: isolate journal from main loop and save thread.
+
+    Fixture replaces stale hooks with an empty list, runs file tasks
+    immediately, and collects callbacks passed to GLib.timeout_add.
+    """
+    monkeypatch.setattr(ABC_STALE, 'g_hooks_stale', list())
+    monkeypatch.setattr(CJOURNAL.CSAVE, 'g_scheduler_save', PatchScheduler())
+    timeouts = list()
+
+    def timeout_add(p_delay, p_function):
+        timeouts.append(p_function)
+        return len(timeouts)
+
+    def source_remove(p_id):
+        return True
+
+    monkeypatch.setattr(CJOURNAL.GLib, 'timeout_add', timeout_add)
+    monkeypatch.setattr(CJOURNAL.GLib, 'source_remove', source_remove)
+    return timeouts
+
+
+@pytest.fixture
+def new_saved(tmp_path):
+    """Pytest fixture: Return factory for factsheet saved to file.
+
+    Factory returns factsheet, writer of factsheet file, and location
+    of file.  Outline structure::
+
+        Topic 0
+            Topic 00
+        Topic 1
+    """
+    def new():
+        sheet = MSHEET.Sheet(p_name='Parrot', p_title='The Parrot Sketch')
+        line_0 = sheet.insert_topic_child(new_topic('Topic 0'), None)
+        _ = sheet.insert_topic_child(new_topic('Topic 00'), line_0)
+        _ = sheet.insert_topic_child(new_topic('Topic 1'), None)
+        path = tmp_path / 'sheet.fsg'
+        writer = CFORMAT.WriterSheet()
+        with path.open(mode='wb') as io_out:
+            writer.dump_full(sheet, io_out)
+        sheet.set_fresh()
+        return sheet, writer, path
+
+    return new
+
+
+def new_topic(p_name):
+    """Return topic with given name."""
+    return MTOPIC.Topic(p_name=p_name, p_summary='', p_title='')
+
+
+def open_saved(p_path):
+    """Return factsheet and writer from file with journal replayed, and
+    size of journal.
+
+    :param p_path: location of factsheet file.
+    """
+    reader = CFORMAT.ReaderSheet(p_path.open(mode='rb'), p_close=True)
+    sheet = reader.load_sheet(p_lazy=True)
+    writer = CFORMAT.WriterSheet(p_reader=reader)
+    with CJOURNAL.path_journal(p_path).open(mode='rb') as io_journal:
+        size = CJOURNAL.replay(io_journal, reader, sheet, writer)
+    return sheet, writer, size
+
+
+class TestJournalSheet:
+    """Unit tests for :class:`.JournalSheet`."""
+
+    def test_init(self, patch_journal, new_saved):
+        """| Confirm initialization.
+        | Case: new journal.
+        """
+        # Setup
+        sheet, writer, path = new_saved()
+        PATH = CJOURNAL.path_journal(path)
+        # Test
+        target = CJOURNAL.JournalSheet(PATH, sheet, writer)
+        assert PATH == target.path
+        assert sheet is target._sheet
+        assert writer is target._writer
+        assert target._on_full is None
+        assert 4 * (1 + len(CJOURNAL._NAMES_TEXT)) == len(target._owners)
+        assert not target._dirty
+        assert not target._keys_journaled
+        assert target._id_flush is None
+        header = PATH.read_bytes()
+        assert CJOURNAL._STRUCT_HEADER.size == target.size
+        assert (CJOURNAL.MAGIC_JOURNAL, CJOURNAL.VERSION_JOURNAL,
+                writer.mark) == CJOURNAL._STRUCT_HEADER.unpack(header)
+        assert [target._on_stale] == ABC_STALE.g_hooks_stale
+
+    def test_init_size(self, patch_journal, new_saved):
+        """| Confirm initialization.
+        | Case: extend journal after replay.
+        """
+        # Setup
+        sheet, writer, path = new_saved()
+        PATH = CJOURNAL.path_journal(path)
+        journal = CJOURNAL.JournalSheet(PATH, sheet, writer)
+        _ = sheet.insert_topic_child(new_topic('Topic 2'), None)
+        journal.flush()
+        SIZE = journal.size
+        with PATH.open(mode='ab') as io_out:
+            io_out.write(b'Incomplete session')
+        sheet, writer, size = open_saved(path)
+        # Test
+        target = CJOURNAL.JournalSheet(PATH, sheet, writer, p_size=size)
+        assert SIZE == target.size
+        assert SIZE == len(PATH.read_bytes())
+        assert {3} == target._keys_journaled
+
+    def test_flush(self, patch_journal, new_saved):
+        """| Confirm journal session.
+        | Case: text edits to factsheet and topic.
+        """
+        # Setup
+        sheet, writer, path = new_saved()
+        target = CJOURNAL.JournalSheet(
+            CJOURNAL.path_journal(path), sheet, writer)
+        topic = list(sheet.topics())[1]
+        NAME = 'Something completely different'
+        TITLE = 'The Dead Parrot'
+        # Test
+        topic.name.text = NAME
+        sheet.title.text = TITLE
+        assert 2 == len(target._dirty)
+        target.flush()
+        assert not target._dirty
+        assert target._id_flush is None
+        assert len(target.path.read_bytes()) == target.size
+        sheet_replay, _, _ = open_saved(path)
+        assert NAME == list(sheet_replay.topics())[1].name.text
+        assert TITLE == sheet_replay.title.text
+        assert sheet_replay.is_stale()
+
+    def test_flush_empty(self, patch_journal, new_saved):
+        """| Confirm journal session.
+        | Case: no edits since previous session.
+        """
+        # Setup
+        sheet, writer, path = new_saved()
+        target = CJOURNAL.JournalSheet(
+            CJOURNAL.path_journal(path), sheet, writer)
+        SIZE = target.size
+        # Test
+        target.flush()
+        assert SIZE == target.size
+        assert SIZE == len(target.path.read_bytes())
+
+    def test_flush_full(self, patch_journal, new_saved, monkeypatch):
+        """| Confirm journal session.
+        | Case: journal grows larger than limit.
+        """
+        # Setup
+        sheet, writer, path = new_saved()
+        calls = list()
+        target = CJOURNAL.JournalSheet(
+            CJOURNAL.path_journal(path), sheet, writer,
+            p_on_full=lambda: calls.append(True))
+        monkeypatch.setattr(CJOURNAL, 'SIZE_JOURNAL_MAX', target.size)
+        # Test
+        sheet.name.text = 'Something completely different'
+        target.flush()
+        assert [True] == calls
+
+    def test_flush_outline(self, patch_journal, new_saved):
+        """| Confirm journal session.
+        | Case: topic added, topic removed, and new topic edited.
+        """
+        # Setup
+        sheet, writer, path = new_saved()
+        target = CJOURNAL.JournalSheet(
+            CJOURNAL.path_journal(path), sheet, writer)
+        outline = sheet.outline_topics
+        line_0 = next(outline.lines())
+        topic_new = new_topic('Topic 2')
+        NAME = 'Something completely different'
+        # Test
+        _ = sheet.insert_topic_child(topic_new, line_0)
+        sheet.remove_topic(list(outline.lines())[1])
+        target.flush()
+        assert {3} == target._keys_journaled
+        topic_new.name.text = NAME
+        target.flush()
+        sheet_replay, writer_replay, _ = open_saved(path)
+        names = [t.name.text for t in sheet_replay.topics()]
+        assert ['Topic 0', NAME, 'Topic 1'] == names
+        outline_replay = sheet_replay.outline_topics
+        assert ([outline.depth(line) for line in outline.lines()]
+                == [outline_replay.depth(line)
+                    for line in outline_replay.lines()])
+        assert 3 in writer_replay.topics_unsaved()
+
+    def test_on_stale(self, patch_journal, new_saved):
+        """| Confirm journal notes edits.
+        | Case: edits to tracked and untracked components.
+        """
+        # Setup
+        sheet, writer, path = new_saved()
+        target = CJOURNAL.JournalSheet(
+            CJOURNAL.path_journal(path), sheet, writer)
+        topic = next(sheet.topics())
+        # Test
+        new_topic('Topic 2').name.text = 'Not in outline'
+        assert not target._dirty
+        assert not patch_journal
+        topic.name.text = 'Something completely different'
+        topic.set_stale()
+        assert {id(topic.name), id(topic)} == set(target._dirty)
+        assert [target._on_timeout] == patch_journal
+        assert 1 == target._id_flush
+
+    def test_on_timeout(self, patch_journal, new_saved):
+        """Confirm journal session from main loop."""
+        # Setup
+        sheet, writer, path = new_saved()
+        target = CJOURNAL.JournalSheet(
+            CJOURNAL.path_journal(path), sheet, writer)
+        SIZE = target.size
+        sheet.name.text = 'Something completely different'
+        # Test
+        assert target._on_timeout() is False
+        assert target._id_flush is None
+        assert SIZE < target.size
+
+    def test_reset(self, patch_journal, new_saved):
+        """Confirm journal starts over after save."""
+        # Setup
+        sheet, writer, path = new_saved()
+        target = CJOURNAL.JournalSheet(
+            CJOURNAL.path_journal(path), sheet, writer)
+        _ = sheet.insert_topic_child(new_topic('Topic 2'), None)
+        target.flush()
+        sheet.name.text = 'Something completely different'
+        with path.open(mode='r+b') as io_out:
+            _ = io_out.seek(0, io.SEEK_END)
+            writer.dump_stale(sheet, io_out)
+        # Test
+        target.reset()
+        assert not target._dirty
+        assert not target._keys_journaled
+        assert target._id_flush is None
+        assert CJOURNAL._STRUCT_HEADER.size == target.size
+        _, _, mark = CJOURNAL._STRUCT_HEADER.unpack(
+            target.path.read_bytes())
+        assert writer.mark == mark
+
+    def test_stop(self, patch_journal, new_saved):
+        """| Confirm journal stops and removes file.
+        | Case: stop more than once.
+        """
+        # Setup
+        sheet, writer, path = new_saved()
+        target = CJOURNAL.JournalSheet(
+            CJOURNAL.path_journal(path), sheet, writer)
+        sheet.name.text = 'Something completely different'
+        scheduler = CJOURNAL.CSAVE.g_scheduler_save
+        # Test
+        target.stop()
+        assert not ABC_STALE.g_hooks_stale
+        assert not target._dirty
+        assert not target._owners
+        assert not target.path.exists()
+        n_tasks = scheduler.n_tasks
+        target.stop()
+        assert n_tasks == scheduler.n_tasks
+
+
+class TestJournalModule:
+    """Unit tests for module-level functions of :mod:`.journal_sheet`."""
+
+    def test_path_journal(self):
+        """Confirm location of journal beside factsheet file."""
+        # Setup
+        PATH = Path('/home/parrot/sketch.fsg')
+        # Test
+        assert (Path('/home/parrot/sketch.fsg.journal')
+                == CJOURNAL.path_journal(PATH))
+
+    def test_replay_empty(self, patch_journal, new_saved):
+        """| Confirm journal replay.
+        | Case: journal header and no sessions.
+        """
+        # Setup
+        sheet, writer, path = new_saved()
+        _ = CJOURNAL.JournalSheet(CJOURNAL.path_journal(path), sheet, writer)
+        # Test
+        sheet_replay, _, size = open_saved(path)
+        assert CJOURNAL._STRUCT_HEADER.size == size
+        assert sheet == sheet_replay
+        assert not sheet_replay.is_stale()
+
+    def test_replay_mark(self, patch_journal, new_saved):
+        """| Confirm journal replay.
+        | Case: journal for a different save session.
+        """
+        # Setup
+        sheet, writer, path = new_saved()
+        target = CJOURNAL.JournalSheet(
+            CJOURNAL.path_journal(path), sheet, writer)
+        sheet.name.text = 'Something completely different'
+        target.flush()
+        with path.open(mode='wb') as io_out:
+            CFORMAT.dump_sheet(MSHEET.Sheet(), io_out)
+        # Test
+        sheet_replay, _, size = open_saved(path)
+        assert size is None
+        assert 'Unnamed' == sheet_replay.name.text
+
+    def test_replay_short(self, new_saved):
+        """| Confirm journal replay.
+        | Case: journal too short for header.
+        """
+        # Setup
+        _, _, path = new_saved()
+        CJOURNAL.path_journal(path).write_bytes(CJOURNAL.MAGIC_JOURNAL)
+        # Test
+        _, _, size = open_saved(path)
+        assert size is None
+
+    def test_replay_tail(self, patch_journal, new_saved):
+        """| Confirm journal replay.
+        | Case: incomplete session at end of journal.
+        """
+        # Setup
+        sheet, writer, path = new_saved()
+        target = CJOURNAL.JournalSheet(
+            CJOURNAL.path_journal(path), sheet, writer)
+        NAME = 'Something completely different'
+        sheet.name.text = NAME
+        target.flush()
+        SIZE = target.size
+        sheet.name.text = 'Pining for the fjords'
+        target.flush()
+        content = target.path.read_bytes()
+        target.path.write_bytes(content[:-2])
+        # Test
+        sheet_replay, _, size = open_saved(path)
+        assert SIZE == size
+        assert NAME == sheet_replay.name.text
+
+    @pytest.mark.parametrize('MAGIC, VERSION', [
+        (b'Not a jr', CJOURNAL.VERSION_JOURNAL),
+        (CJOURNAL.MAGIC_JOURNAL, CJOURNAL.VERSION_JOURNAL + 1),
+        ])
+    def test_replay_error(self, new_saved, MAGIC, VERSION):
+        """| Confirm journal replay.
+        | Case: magic wrong or version newer.
+
+        :param MAGIC: first bytes of journal.
+        :param VERSION: version of journal.
+        """
+        # Setup
+        _, writer, path = new_saved()
+        CJOURNAL.path_journal(path).write_bytes(
+            CJOURNAL._STRUCT_HEADER.pack(MAGIC, VERSION, writer.mark))
+        # Test
+        with pytest.raises(CFORMAT.FormatError):
+            _ = open_saved(path)
+
+    def test_replay_missing(self, new_saved):
+        """| Confirm journal replay.
+        | Case: text edit names topic missing from file.
+        """
+        # Setup
+        _, writer, path = new_saved()
+        session = io.BytesIO()
+        text = pickle.dumps((7, '_name', 'Oops!'))
+        _ = CFORMAT.write_record(session, CFORMAT.KindRecord.TEXT, text)
+        _ = CFORMAT.write_record(session, CFORMAT.KindRecord.END, b'')
+        CJOURNAL.path_journal(path).write_bytes(
+            CJOURNAL._STRUCT_HEADER.pack(
+                CJOURNAL.MAGIC_JOURNAL, CJOURNAL.VERSION_JOURNAL,
+                writer.mark) + session.getvalue())
+        # Test
+        with pytest.raises(CFORMAT.FormatError):
+            _ = open_saved(path)
+
+    def test_globals(self):
+        """Confirm global definitions."""
+        # Setup
+        # Test
+        assert 0 < CJOURNAL.DELAY_FLUSH
+        assert 8 == len(CJOURNAL.MAGIC_JOURNAL)
+        assert 0 < CJOURNAL.SIZE_JOURNAL_MAX
+        assert isinstance(CJOURNAL.VERSION_JOURNAL, int)
+        assert struct.calcsize('>8sH8s') == CJOURNAL._STRUCT_HEADER.size
@@ -0,0 +1,255 @@
+"""
+Unit tests for scheduler to check facts off the main loop.  See
+:mod:`~.scheduler_check`.
+"""
+import concurrent.futures as CF
+import pytest   # type: ignore[import]
+import threading
+import typing
+
+import factsheet.control.scheduler_check as CSCHEDULE
+import factsheet.model.fact as MFACT
+
+
+class PatchFact(MFACT.Fact[typing.Any, int]):
+    """Stub for fact with computation that waits on event."""
+
+    def __init__(self, **kwargs):
+        super().__init__(p_name='Parrot', p_summary='A Norwegian Blue.',
+                         p_title='The Parrot Sketch', p_topic=None,
+                         **kwargs)
+        self.event = threading.Event()
+        self.error = None
+
+    def compute(self):
+        self.event.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        return MFACT.StatusOfFact.DEFINED, 42
+
+
+@pytest.fixture
+def patch_idle(monkeypatch):
+    """Pytest fixture: collect callbacks passed to GLib.idle_add.
+
+    Call :func:`run_idle` to run collected callbacks as the main loop
+    would.
+    """
+    calls = list()
+
+    def idle_add(p_function, *p_args):
+        calls.append((p_function, p_args))
+
+    monkeypatch.setattr(CSCHEDULE.GLib, 'idle_add', idle_add)
+    return calls
+
+
+def run_idle(p_calls):
+    """Run callbacks collected by :func:`patch_idle`."""
+    while p_calls:
+        function, args = p_calls.pop(0)
+        assert function(*args) is False
+
+
+class TestSchedulerCheck:
+    """Unit tests for :class:`.SchedulerCheck`."""
+
+    def test_init(self):
+        """| Confirm initialization.
+        | Case: default executor.
+        """
+        # Setup
+        # Test
+        target = CSCHEDULE.SchedulerCheck()
+        assert isinstance(target._executor, CF.ThreadPoolExecutor)
+        assert isinstance(target._pending, dict)
+        assert not target._pending
+        target.shutdown()
+
+    def test_init_executor(self):
+        """| Confirm initialization.
+        | Case: given executor.
+        """
+        # Setup
+        EXECUTOR = CF.ThreadPoolExecutor(max_workers=1)
+        # Test
+        target = CSCHEDULE.SchedulerCheck(p_executor=EXECUTOR)
+        assert target._executor is EXECUTOR
+        target.shutdown()
+
+    def test_check(self, patch_idle):
+        """| Confirm check runs off main loop.
+        | Case: outcome applied on main loop.
+        """
+        # Setup
+        target = CSCHEDULE.SchedulerCheck()
+        fact = PatchFact()
+        # Test
+        target.check(fact)
+        assert fact.status is MFACT.StatusOfFact.PENDING
+        assert target.is_pending(fact)
+        _, future = target._pending[fact.tag]
+        fact.event.set()
+        _ = CF.wait([future])
+        assert fact.status is MFACT.StatusOfFact.PENDING
+        run_idle(patch_idle)
+        assert fact.status is MFACT.StatusOfFact.DEFINED
+        assert 42 == fact.value
+        assert not target.is_pending(fact)
+        target.shutdown()
+
+    def test_check_cached(self, patch_idle, monkeypatch):
+        """| Confirm check runs off main loop.
+        | Case: outcome cache has outcome for fact.
+        """
+        # Setup
+        cache = MFACT.CacheOutcome()
+        monkeypatch.setattr(MFACT, 'g_cache_outcome', cache)
+        target = CSCHEDULE.SchedulerCheck()
+        fact = PatchFact()
+        KEY = (PatchFact, 'Parrot')
+        monkeypatch.setattr(fact, 'key_outcome', lambda: KEY)
+        VALUE = 24
+        cache.put(KEY, (MFACT.StatusOfFact.DEFINED, VALUE))
+        # Test
+        target.check(fact)
+        assert not target.is_pending(fact)
+        assert not patch_idle
+        assert fact.status is MFACT.StatusOfFact.DEFINED
+        assert VALUE == fact.value
+        target.shutdown()
+
+    def test_check_error(self, patch_idle):
+        """| Confirm check runs off main loop.
+        | Case: computation fails.
+        """
+        # Setup
+        target = CSCHEDULE.SchedulerCheck()
+        fact = PatchFact()
+        fact.error = ValueError('Oops!')
+        # Test
+        target.check(fact)
+        _, future = target._pending[fact.tag]
+        fact.event.set()
+        _ = CF.wait([future])
+        run_idle(patch_idle)
+        assert fact.status is MFACT.StatusOfFact.UNDEFINED
+        assert fact.value is None
+        target.shutdown()
+
+    def test_check_legacy(self, patch_idle):
+        """| Confirm check runs off main loop.
+        | Case: fact does not override computation.
+        """
+        # Setup
+        target = CSCHEDULE.SchedulerCheck()
+        fact = MFACT.Fact[typing.Any, int](
+            p_name='Parrot', p_summary='', p_title='', p_topic=None)
+        fact._status = MFACT.StatusOfFact.DEFINED
+        # Test
+        target.check(fact)
+        assert not target.is_pending(fact)
+        assert not patch_idle
+        assert fact.status is MFACT.StatusOfFact.DEFINED
+        target.shutdown()
+
+    def test_check_replace(self, patch_idle):
+        """| Confirm check runs off main loop.
+        | Case: new check replaces check in progress.
+        """
+        # Setup
+        target = CSCHEDULE.SchedulerCheck()
+        fact = PatchFact()
+        target.check(fact)
+        _, future_old = target._pending[fact.tag]
+        # Test
+        target.check(fact)
+        _, future_new = target._pending[fact.tag]
+        assert future_new is not future_old
+        fact.event.set()
+        _ = CF.wait([future_old, future_new])
+        run_idle(patch_idle)
+        assert fact.status is MFACT.StatusOfFact.DEFINED
+        assert not target.is_pending(fact)
+        target.shutdown()
+
+    def test_cancel(self, patch_idle):
+        """| Confirm cancellation.
+        | Case: fact cleared while check in progress.
+        """
+        # Setup
+        target = CSCHEDULE.SchedulerCheck()
+        fact = PatchFact()
+        target.check(fact)
+        _, future = target._pending[fact.tag]
+        # Test
+        target.cancel(fact)
+        fact.clear()
+        assert not target.is_pending(fact)
+        fact.event.set()
+        _ = CF.wait([future])
+        run_idle(patch_idle)
+        assert fact.status is MFACT.StatusOfFact.UNCHECKED
+        assert fact.value is None
+        target.shutdown()
+
+    def test_cancel_absent(self):
+        """| Confirm cancellation.
+        | Case: no check in progress.
+        """
+        # Setup
+        target = CSCHEDULE.SchedulerCheck()
+        fact = PatchFact()
+        # Test
+        target.cancel(fact)
+        assert not target.is_pending(fact)
+        target.shutdown()
+
+    def test_cancel_all(self, patch_idle):
+        """Confirm cancellation of all checks in progress."""
+        # Setup
+        target = CSCHEDULE.SchedulerCheck()
+        facts = [PatchFact() for _ in range(3)]
+        for fact in facts:
+            target.check(fact)
+        futures = [future for _, future in target._pending.values()]
+        # Test
+        target.cancel_all()
+        assert not target._pending
+        for fact in facts:
+            fact.event.set()
+        _ = CF.wait(futures)
+        run_idle(patch_idle)
+        for fact in facts:
+            assert fact.status is MFACT.StatusOfFact.PENDING
+        target.shutdown()
+
+    def test_clear_in_flight(self, patch_idle):
+        """| Confirm outcome discarded.
+        | Case: fact cleared directly while check in progress.
+        """
+        # Setup
+        target = CSCHEDULE.SchedulerCheck()
+        fact = PatchFact()
+        target.check(fact)
+        _, future = target._pending[fact.tag]
+        # Test
+        fact.clear()
+        fact.event.set()
+        _ = CF.wait([future])
+        run_idle(patch_idle)
+        assert fact.value is None
+        assert fact.status is MFACT.StatusOfFact.UNCHECKED
+        assert not target.is_pending(fact)
+        target.shutdown()
+
+
+class TestGlobal:
+    """Unit tests for module-level scheduler."""
+
+    def test_global(self):
+        """Confirm global scheduler."""
+        # Setup
+        # Test
+        assert isinstance(
+            CSCHEDULE.g_scheduler_check, CSCHEDULE.SchedulerCheck)
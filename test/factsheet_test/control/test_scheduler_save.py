@@ -0,0 +1,127 @@
+"""
+Unit tests for scheduler to finish saves on a background thread.  See
+:mod:`~.scheduler_save`.
+"""
+import concurrent.futures as CF
+import logging
+import pytest   # type: ignore[import]
+import threading
+
+import factsheet.control.scheduler_save as CSAVE
+
+
+@pytest.fixture
+def patch_idle(monkeypatch):
+    """Pytest fixture: collect callbacks passed to GLib.idle_add.
+
+    Call :func:`run_idle` to run collected callbacks as the main loop
+    would.
+    """
+    calls = list()
+
+    def idle_add(p_function, *p_args):
+        calls.append((p_function, p_args))
+
+    monkeypatch.setattr(CSAVE.GLib, 'idle_add', idle_add)
+    return calls
+
+
+def run_idle(p_calls):
+    """Run callbacks collected by :func:`patch_idle`."""
+    while p_calls:
+        function, args = p_calls.pop(0)
+        assert function(*args) is False
+
+
+class TestSchedulerSave:
+    """Unit tests for :class:`.SchedulerSave`."""
+
+    def test_init(self):
+        """| Confirm initialization.
+        | Case: default executor.
+        """
+        # Setup
+        # Test
+        target = CSAVE.SchedulerSave()
+        assert isinstance(target._executor, CF.ThreadPoolExecutor)
+        assert 1 == target._executor._max_workers
+        target.shutdown()
+
+    def test_init_executor(self):
+        """| Confirm initialization.
+        | Case: given executor.
+        """
+        # Setup
+        EXECUTOR = CF.ThreadPoolExecutor(max_workers=1)
+        # Test
+        target = CSAVE.SchedulerSave(p_executor=EXECUTOR)
+        assert target._executor is EXECUTOR
+        target.shutdown()
+
+    def test_submit(self, patch_idle):
+        """| Confirm task runs off main loop.
+        | Case: task succeeds.
+        """
+        # Setup
+        target = CSAVE.SchedulerSave()
+        event = threading.Event()
+        errors = list()
+        # Test
+        future = target.submit(event.wait, errors.append)
+        assert not future.done()
+        event.set()
+        _ = CF.wait([future])
+        assert not errors
+        run_idle(patch_idle)
+        assert [None] == errors
+        target.shutdown()
+
+    def test_submit_error(self, patch_idle, caplog):
+        """| Confirm task runs off main loop.
+        | Case: task fails.
+
+        :param caplog: built-in fixture `Pytest caplog`_.
+        """
+        # Setup
+        target = CSAVE.SchedulerSave()
+        ERROR = OSError('Oops!')
+
+        def task():
+            raise ERROR
+
+        errors = list()
+        # Test
+        future = target.submit(task, errors.append)
+        _ = CF.wait([future])
+        with caplog.at_level(logging.ERROR):
+            run_idle(patch_idle)
+        assert [ERROR] == errors
+        assert 1 == len(caplog.records)
+        assert 'Save failed: Oops!' in caplog.records[0].message
+        target.shutdown()
+
+    def test_submit_order(self, patch_idle):
+        """| Confirm task runs off main loop.
+        | Case: tasks run in order submitted and without completion
+          function.
+        """
+        # Setup
+        target = CSAVE.SchedulerSave()
+        order = list()
+        # Test
+        futures = [target.submit(lambda i=i: order.append(i))
+                   for i in range(5)]
+        _ = CF.wait(futures)
+        run_idle(patch_idle)
+        assert list(range(5)) == order
+        target.shutdown()
+
+
+class TestGlobal:
+    """Unit tests for module-level scheduler."""
+
+    def test_global(self):
+        """Confirm global scheduler."""
+        # Setup
+        # Test
+        assert isinstance(CSAVE.g_scheduler_save, CSAVE.SchedulerSave)
@@ -0,0 +1,367 @@
+"""
+Unit tests for full-text search across open factsheets.  See
+:mod:`.search_sheets`.
+
+.. include:: /test/refs_include_pytest.txt
+"""
+import concurrent.futures as CF
+import io
+import pytest   # type: ignore[import]
+
+import factsheet.abc_types.abc_stalefile as ABC_STALE
+import factsheet.control.format_sheet as CFORMAT
+import factsheet.control.search_sheets as CSEARCH
+import factsheet.model.sheet as MSHEET
+import factsheet.model.topic as MTOPIC
+
+
+class PatchExecutor:
+    """Stub for executor that runs each task immediately."""
+
+    def __init__(self):
+        self.n_tasks = 0
+        self.called_shutdown = False
+
+    def shutdown(self, wait=True):
+        self.called_shutdown = True
+
+    def submit(self, p_task, *p_args):
+        self.n_tasks += 1
+        future = CF.Future()
+        future.set_result(p_task(*p_args))
+        return future
+
+
+class PatchFact:
+    """Stub for fact with note."""
+
+    def __init__(self, p_note):
+        self.note = MTOPIC.Name(p_text=p_note)
+
+
+class PatchTopic(MTOPIC.Topic):
+    """Topic with iterable facts."""
+
+    def __init__(self, p_notes=(), **kwargs):
+        super().__init__(**kwargs)
+        self._facts_stub = [PatchFact(n) for n in p_notes]
+
+    def iter_facts(self):
+        return iter(self._facts_stub)
+
+
+@pytest.fixture
+def patch_hooks(monkeypatch):
+    """Pytest fixture: isolate stale hooks and body hooks."""
+    monkeypatch.setattr(ABC_STALE, 'g_hooks_stale', list())
+    monkeypatch.setattr(CFORMAT, 'g_hooks_body', list())
+
+
+def load_lazy(p_sheet):
+    """Return copy of factsheet read lazily from file.
+
+    :param p_sheet: factsheet to copy.
+    """
+    buffer = io.BytesIO()
+    CFORMAT.dump_sheet(p_sheet, buffer)
+    _ = buffer.seek(0)
+    return CFORMAT.ReaderSheet(buffer).load_sheet()
+
+
+@pytest.fixture
+def new_sheets():
+    """Pytest fixture: Return factory for two factsheets of topics."""
+    def new():
+        sheet_a = MSHEET.Sheet()
+        sheet_b = MSHEET.Sheet()
+        topics = dict(
+            integers=MTOPIC.Topic(
+                p_name='Integers', p_summary='Whole numbers and negatives.',
+                p_title='The <b>integers</b>'),
+            naturals=MTOPIC.Topic(
+                p_name='Naturals', p_summary='Counting numbers.',
+                p_title='Natural numbers'),
+            groups=PatchTopic(
+                p_name='Groups', p_summary='Sets with an operation.',
+                p_title='Group theory', p_notes=['Integers under addition']),
+            )
+        line = sheet_a.insert_topic_child(topics['integers'], None)
+        _ = sheet_a.insert_topic_child(topics['naturals'], line)
+        _ = sheet_b.insert_topic_child(topics['groups'], None)
+        return sheet_a, sheet_b, topics
+
+    return new
+
+
+class TestEngineSearch:
+    """Unit tests for :class:`.EngineSearch`."""
+
+    def test_init(self):
+        """Confirm initialization."""
+        # Setup
+        # Test
+        target = CSEARCH.EngineSearch()
+        assert isinstance(target._executor, CF.ThreadPoolExecutor)
+        assert not target._postings
+        assert not target._terms_doc
+        assert target._terms_sorted is None
+        assert not target._sheets
+        assert not target._sheets_stale
+        assert not target._topics
+        assert not target._topics_stale
+        assert not target._sources
+        target.shutdown()
+
+    def test_add_sheet(self, patch_hooks, new_sheets):
+        """Confirm engine indexes topics of factsheet."""
+        # Setup
+        sheet_a, sheet_b, topics = new_sheets()
+        target = CSEARCH.EngineSearch(p_executor=PatchExecutor())
+        # Test
+        target.add_sheet(sheet_a)
+        assert [target.on_stale] == ABC_STALE.g_hooks_stale
+        assert sheet_a is target._sheets[sheet_a.tag]
+        assert 2 == len(target._terms_doc)
+        key = (sheet_a.tag, topics['integers'].tag)
+        assert topics['integers'] is target._topics[key]
+        assert (topics['integers'].name, key) == target._sources[
+            id(topics['integers'].name)]
+        assert {key: 1.0} == target._postings['whole']
+        assert 'b' not in target._postings
+        target.add_sheet(sheet_b)
+        assert [target.on_stale] == ABC_STALE.g_hooks_stale
+        key_note = (sheet_b.tag, topics['groups'].tag)
+        note = topics['groups']._facts_stub[0].note
+        assert key_note == target._sources[id(note)][1]
+        assert {key: 3.0 + 2.0, key_note: 1.0} == target._postings[
+            'integers']
+        assert [target.on_body] == CFORMAT.g_hooks_body
+
+    def test_add_sheet_lazy(self, patch_hooks, new_sheets):
+        """| Confirm engine indexes topics of factsheet.
+        | Case: factsheet read lazily keeps topic bodies in file.
+        """
+        # Setup
+        _sheet_a, sheet_b, _topics = new_sheets()
+        sheet = load_lazy(sheet_b)
+        target = CSEARCH.EngineSearch(p_executor=PatchExecutor())
+        # Test
+        target.add_sheet(sheet)
+        for topic in sheet.topics():
+            assert isinstance(topic, CFORMAT.TopicLazy)
+        assert target.search('groups')
+        assert not target.search('addition')
+
+    def test_on_body(self, patch_hooks, new_sheets):
+        """Confirm engine indexes facts of topic once body loads."""
+        # Setup
+        _sheet_a, sheet_b, _topics = new_sheets()
+        sheet = load_lazy(sheet_b)
+        target = CSEARCH.EngineSearch(p_executor=PatchExecutor())
+        target.add_sheet(sheet)
+        topic = next(sheet.topics())
+        key = (sheet.tag, topic.tag)
+        # Test
+        _ = topic.load_body()
+        assert {key} == target._topics_stale
+        assert [key] == [(s, t) for s, t, _score
+                         in target.search('addition')]
+        note = topic._facts_stub[0].note
+        assert key == target._sources[id(note)][1]
+
+    def test_on_stale(self, patch_hooks, new_sheets):
+        """| Confirm engine marks topic or factsheet for update.
+        | Case: topic text, factsheet, and other model component.
+        """
+        # Setup
+        sheet_a, _sheet_b, topics = new_sheets()
+        target = CSEARCH.EngineSearch(p_executor=PatchExecutor())
+        target.add_sheet(sheet_a)
+        key = (sheet_a.tag, topics['naturals'].tag)
+        # Test
+        topics['naturals'].summary.set_stale()
+        assert {key} == target._topics_stale
+        sheet_a.set_stale()
+        assert {sheet_a.tag} == target._sheets_stale
+        target.on_stale(MTOPIC.Name(p_text='Other'))
+        assert {key} == target._topics_stale
+
+    def test_remove_sheet(self, patch_hooks, new_sheets):
+        """| Confirm engine removes topics of factsheet from index.
+        | Case: factsheet in index, last factsheet, and factsheet not in
+          index.
+        """
+        # Setup
+        sheet_a, sheet_b, topics = new_sheets()
+        target = CSEARCH.EngineSearch(p_executor=PatchExecutor())
+        target.add_sheet(sheet_a)
+        target.add_sheet(sheet_b)
+        # Test
+        target.remove_sheet(sheet_a)
+        assert sheet_a.tag not in target._sheets
+        assert 1 == len(target._terms_doc)
+        assert 'naturals' not in target._postings
+        assert id(topics['naturals'].name) not in target._sources
+        assert id(sheet_a) not in target._sources
+        assert [target.on_stale] == ABC_STALE.g_hooks_stale
+        target.remove_sheet(sheet_b)
+        assert not target._terms_doc
+        assert not target._postings
+        assert not target._sources
+        assert not ABC_STALE.g_hooks_stale
+        assert not CFORMAT.g_hooks_body
+        n_tasks = target._executor.n_tasks
+        target.remove_sheet(sheet_b)
+        assert n_tasks == target._executor.n_tasks
+
+    @pytest.mark.parametrize('QUERY, EXPECT', [
+        ('integers', ['integers', 'groups']),
+        ('Integers addition', ['groups']),
+        ('numbers', ['naturals', 'integers']),
+        ('NUM*', ['naturals', 'integers']),
+        ('natural*', ['naturals']),
+        ('group* integ*', ['groups']),
+        ('b', []),
+        ('sets* zebra', []),
+        ('', []),
+        ('*', []),
+        ])
+    def test_search(self, patch_hooks, new_sheets, QUERY, EXPECT):
+        """Confirm ranked results of query across factsheets.
+
+        :param QUERY: words to find.
+        :param EXPECT: names of topics found, best first.
+        """
+        # Setup
+        sheet_a, sheet_b, topics = new_sheets()
+        target = CSEARCH.EngineSearch(p_executor=PatchExecutor())
+        target.add_sheet(sheet_a)
+        target.add_sheet(sheet_b)
+        tags_sheet = {'integers': sheet_a.tag, 'naturals': sheet_a.tag,
+                      'groups': sheet_b.tag}
+        expect = [(tags_sheet[n], topics[n].tag) for n in EXPECT]
+        # Test
+        hits = target.search(QUERY)
+        assert expect == [(s, t) for s, t, _score in hits]
+        scores = [score for _s, _t, score in hits]
+        assert sorted(scores, reverse=True) == scores
+
+    def test_search_n_max(self, patch_hooks, new_sheets):
+        """Confirm search returns at most given number of results."""
+        # Setup
+        sheet_a, sheet_b, topics = new_sheets()
+        target = CSEARCH.EngineSearch(p_executor=PatchExecutor())
+        target.add_sheet(sheet_a)
+        target.add_sheet(sheet_b)
+        N_MAX = 1
+        # Test
+        hits = target.search('integers', N_MAX)
+        assert [(sheet_a.tag, topics['integers'].tag)] == [
+            (s, t) for s, t, _score in hits]
+
+    def test_sync(self, patch_hooks, new_sheets):
+        """| Confirm search follows changes to factsheets.
+        | Case: topic text changed, topic added, and topic removed.
+        """
+        # Setup
+        sheet_a, _sheet_b, topics = new_sheets()
+        target = CSEARCH.EngineSearch(p_executor=PatchExecutor())
+        target.add_sheet(sheet_a)
+        TOPIC = MTOPIC.Topic(
+            p_name='Rationals', p_summary='Ratios of integers.',
+            p_title='Rational numbers')
+        key_new = (sheet_a.tag, TOPIC.tag)
+        # Test: topic text changed
+        topics['naturals'].summary.text = 'Zero and up.'
+        assert [(sheet_a.tag, topics['naturals'].tag)] == [
+            (s, t) for s, t, _score in target.search('zero')]
+        assert not target._topics_stale
+        # Test: topic added
+        line = sheet_a.insert_topic_child(TOPIC, None)
+        assert key_new == target.search('ratio*')[0][:2]
+        assert TOPIC is target._topics[key_new]
+        assert not target._sheets_stale
+        # Test: topic removed
+        sheet_a.remove_topic(line)
+        assert not target.search('ratio*')
+        assert key_new not in target._topics
+
+    def test_wait(self, patch_hooks, new_sheets):
+        """Confirm search finds topics indexed on background thread."""
+        # Setup
+        sheet_a, sheet_b, topics = new_sheets()
+        target = CSEARCH.EngineSearch()
+        target.add_sheet(sheet_a)
+        target.add_sheet(sheet_b)
+        # Test
+        target.wait()
+        assert 3 == len(target._terms_doc)
+        assert (sheet_b.tag, topics['groups'].tag) == target.search(
+            'group')[0][:2]
+        target.shutdown()
+        assert not ABC_STALE.g_hooks_stale
+        assert not CFORMAT.g_hooks_body
+
+
+class TestSearchSheetsModule:
+    """Unit tests for module-level components of :mod:`.search_sheets`."""
+
+    def test_constants(self):
+        """Confirm constant definitions."""
+        # Setup
+        # Test
+        assert '*' == CSEARCH.MARK_PREFIX
+        assert CSEARCH.WEIGHT_TITLE < CSEARCH.WEIGHT_NAME
+        assert CSEARCH.WEIGHT_SUMMARY < CSEARCH.WEIGHT_TITLE
+        assert CSEARCH.WEIGHT_NOTE == CSEARCH.WEIGHT_SUMMARY
+
+    def test_facts_topic(self):
+        """| Confirm facts of topic.
+        | Case: topic with facts, topic without facts, and lazy topic.
+        """
+        # Setup
+        TOPIC = PatchTopic(p_name='', p_summary='', p_title='',
+                           p_notes=['a', 'b'])
+        TOPIC_BASE = MTOPIC.Topic(p_name='', p_summary='', p_title='')
+        sheet = MSHEET.Sheet()
+        _ = sheet.insert_topic_child(TOPIC, None)
+        topic_lazy = next(load_lazy(sheet).topics())
+        # Test
+        assert TOPIC._facts_stub == CSEARCH.facts_topic(TOPIC)
+        assert not CSEARCH.facts_topic(TOPIC_BASE)
+        assert not CSEARCH.facts_topic(topic_lazy)
+        assert isinstance(topic_lazy, CFORMAT.TopicLazy)
+
+    @pytest.mark.parametrize('QUERY, EXPECT', [
+        ('Alpha beta', ['alpha', 'beta']),
+        ('alp* b', ['alp*', 'b']),
+        ('x-ray*', ['x', 'ray*']),
+        ('*', []),
+        ])
+    def test_parse_query(self, QUERY, EXPECT):
+        """Confirm query words.
+
+        :param QUERY: words to find.
+        :param EXPECT: query words.
+        """
+        # Setup
+        # Test
+        assert EXPECT == CSEARCH.parse_query(QUERY)
+
+    def test_texts_topic(self):
+        """Confirm text of topic and its facts with weights."""
+        # Setup
+        TOPIC = PatchTopic(p_name='N', p_summary='S', p_title='T',
+                           p_notes=['a'])
+        EXPECT = [(CSEARCH.WEIGHT_NAME, 'N'), (CSEARCH.WEIGHT_SUMMARY, 'S'),
+                  (CSEARCH.WEIGHT_TITLE, 'T'), (CSEARCH.WEIGHT_NOTE, 'a')]
+        # Test
+        assert EXPECT == CSEARCH.texts_topic(TOPIC)
+
+    def test_tokenize(self):
+        """Confirm words of text ignore markup and case."""
+        # Setup
+        TEXT = 'The <b>Integers</b>, <span foreground="red">Z</span>.'
+        EXPECT = ['the', 'integers', 'z']
+        # Test
+        assert EXPECT == CSEARCH.tokenize(TEXT)
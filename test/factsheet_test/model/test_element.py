@@ -2,7 +2,9 @@
 Unit tests for class representing indexed element. See :mod:`.element`.
 """
 import collections.abc as ABC_COL
+import copyreg
 import dataclasses as DC
+import pickle
 import pytest   # type: ignore[import]
 
 from factsheet.model import element as MELEMENT
@@ -109,6 +111,55 @@ class TestElementOpaque:
         assert not target.__ne__(other)
         assert target.__eq__(other)
 
+    def test_get_set_state(self, patch_args_element):
+        """Confirm conversion to and from pickle format."""
+        # Setup
+        ARGS = patch_args_element
+        source = MELEMENT.ElementOpaque[int](**DC.asdict(ARGS))
+        # Test
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            target = pickle.loads(pickle.dumps(source, protocol))
+            assert source == target
+            assert not hasattr(target, '__dict__')
+
+    @pytest.mark.parametrize('STATE', [
+        dict(_member=42, _index=6),
+        (None, dict(_member=42, _index=6)),
+        (dict(_member=42), dict(_index=6)),
+        ])
+    def test_setstate(self, STATE):
+        """| Confirm reconstruction from pickle format.
+        | Case: state is dictionary or pair of dictionaries.
+        """
+        # Setup
+        target = MELEMENT.ElementOpaque.__new__(MELEMENT.ElementOpaque)
+        # Test
+        target.__setstate__(STATE)
+        assert 42 == target.member
+        assert 6 == target.index
+
+    def test_setstate_legacy(self, patch_args_element):
+        """| Confirm reconstruction from pickle format.
+        | Case: element stored before elements declared slots.
+        """
+        # Setup
+        ARGS = patch_args_element
+        source = MELEMENT.ElementOpaque[int](**DC.asdict(ARGS))
+
+        class PatchLegacy:
+            def __reduce_ex__(self, _protocol):
+                state = dict(_member=ARGS.p_member, _index=ARGS.p_index,
+                             _apply_style={'Plain': source.style_plain})
+                return (copyreg._reconstructor,
+                        (MELEMENT.ElementOpaque, object, None), state)
+
+        stored = pickle.dumps(PatchLegacy(), protocol=3)
+        # Test
+        target = pickle.loads(stored)
+        assert isinstance(target, MELEMENT.ElementOpaque)
+        assert source == target
+        assert '6: 42' == target.format('Plain')
+
     def test_init(self, patch_args_element):
         """Confirm initialization."""
         # Setup
@@ -117,6 +168,7 @@ class TestElementOpaque:
         target = MELEMENT.ElementOpaque[int](**DC.asdict(ARGS))
         assert ARGS.p_member == target._member
         assert ARGS.p_index == target._index
+        assert not hasattr(target, '__dict__')
 
     @pytest.mark.parametrize('NAME_ATTR, NAME_PROP', [
         ['_member', 'member'],
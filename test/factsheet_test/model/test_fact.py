@@ -8,6 +8,7 @@ import pytest   # type: ignore[import]
 import typing
 
 import factsheet.bridge_ui as BUI
+import factsheet.instrument as INSTR
 import factsheet.model.aspect as MASPECT
 import factsheet.model.fact as MFACT
 import factsheet.model.idcore as MIDCORE
@@ -64,6 +65,167 @@ class PatchTopic(MIDCORE.IdCore[
     def tag(self): return self._tag
 
 
+class PatchFingerprint(PatchTopic):
+    """Stub for Topic class with content fingerprint."""
+
+    def __init__(self, p_fingerprint='Parrot', **kwargs):
+        super().__init__(**kwargs)
+        self.fingerprint_topic = p_fingerprint
+
+    def fingerprint(self): return self.fingerprint_topic
+
+
+class PatchCompute(MFACT.Fact[PatchFingerprint, int]):
+    """Stub for fact that computes value and counts computations."""
+
+    def __init__(self, p_topic):
+        super().__init__(p_name='Parrot', p_summary='', p_title='',
+                         p_topic=p_topic)
+        self.n_computes = 0
+
+    def compute(self):
+        self.n_computes += 1
+        return MFACT.StatusOfFact.DEFINED, 42
+
+
+@pytest.fixture
+def patch_cache(monkeypatch):
+    """Pytest fixture: replace outcome cache with empty cache."""
+    cache = MFACT.CacheOutcome()
+    monkeypatch.setattr(MFACT, 'g_cache_outcome', cache)
+    return cache
+
+
+class TestCacheOutcome:
+    """Unit tests for :class:`.CacheOutcome`."""
+
+    def test_init(self):
+        """Confirm initialization."""
+        # Setup
+        SIZE_MAX = 1024
+        N_MAX = 8
+        # Test
+        target = MFACT.CacheOutcome(p_size_max=SIZE_MAX, p_n_max=N_MAX)
+        assert not target._entries
+        assert 0 == len(target)
+        assert 0 == target.n_hits
+        assert 0 == target.n_misses
+        assert 0 == target.size
+        assert SIZE_MAX == target._size_max
+        assert N_MAX == target._n_max
+
+    def test_clear(self):
+        """Confirm removal of outcomes and reset of counters."""
+        # Setup
+        target = MFACT.CacheOutcome()
+        target.put(('a', 1), (MFACT.StatusOfFact.DEFINED, 'a'))
+        _ = target.get(('a', 1))
+        _ = target.get(('b', 1))
+        # Test
+        target.clear()
+        assert 0 == len(target)
+        assert 0 == target.n_hits
+        assert 0 == target.n_misses
+        assert 0 == target.size
+
+    def test_get(self):
+        """| Confirm lookup.
+        | Case: hit and miss counted.
+        """
+        # Setup
+        target = MFACT.CacheOutcome()
+        KEY = ('a', 1)
+        OUTCOME = (MFACT.StatusOfFact.DEFINED, 'a')
+        target.put(KEY, OUTCOME)
+        # Test
+        assert OUTCOME == target.get(KEY)
+        assert target.get(('b', 1)) is None
+        assert 1 == target.n_hits
+        assert 1 == target.n_misses
+
+    def test_put_evict_count(self):
+        """| Confirm eviction of least-recently-used outcome.
+        | Case: number of outcomes exceeds limit.
+        """
+        # Setup
+        target = MFACT.CacheOutcome(p_n_max=2)
+        OUTCOME = (MFACT.StatusOfFact.DEFINED, 0)
+        target.put('a', OUTCOME)
+        target.put('b', OUTCOME)
+        _ = target.get('a')
+        # Test
+        target.put('c', OUTCOME)
+        assert 2 == len(target)
+        assert target.get('b') is None
+        assert OUTCOME == target.get('a')
+        assert OUTCOME == target.get('c')
+
+    def test_put_evict_size(self):
+        """| Confirm eviction of least-recently-used outcome.
+        | Case: size of values exceeds memory cap.
+        """
+        # Setup
+        VALUE = 'x' * 100
+        SIZE = MFACT.size_of(VALUE)
+        target = MFACT.CacheOutcome(p_size_max=2 * SIZE)
+        OUTCOME = (MFACT.StatusOfFact.DEFINED, VALUE)
+        target.put('a', OUTCOME)
+        target.put('b', OUTCOME)
+        assert 2 * SIZE == target.size
+        # Test
+        target.put('c', OUTCOME)
+        assert 2 == len(target)
+        assert 2 * SIZE == target.size
+        assert target.get('a') is None
+
+    def test_put_replace(self):
+        """| Confirm addition of outcome.
+        | Case: outcome replaces outcome with same key.
+        """
+        # Setup
+        target = MFACT.CacheOutcome()
+        target.put('a', (MFACT.StatusOfFact.DEFINED, 'x' * 100))
+        OUTCOME = (MFACT.StatusOfFact.DEFINED, 'y')
+        # Test
+        target.put('a', OUTCOME)
+        assert 1 == len(target)
+        assert MFACT.size_of('y') == target.size
+        assert OUTCOME == target.get('a')
+
+    def test_put_too_large(self):
+        """| Confirm addition of outcome.
+        | Case: value larger than memory cap.
+        """
+        # Setup
+        target = MFACT.CacheOutcome(p_size_max=16)
+        # Test
+        target.put('a', (MFACT.StatusOfFact.DEFINED, 'x' * 100))
+        assert 0 == len(target)
+        assert 0 == target.size
+
+    @pytest.mark.parametrize('VALUE', [
+        'Parrot',
+        [1, 2, 3],
+        {'a': 1, 'b': 2},
+        PatchFingerprint(),
+        ])
+    def test_size_of(self, VALUE):
+        """Confirm size estimate includes contents.
+
+        :param VALUE: value to measure.
+        """
+        # Setup
+        import sys
+        # Test
+        assert sys.getsizeof(VALUE) <= MFACT.size_of(VALUE)
+
+    def test_global(self):
+        """Confirm global outcome cache."""
+        # Setup
+        # Test
+        assert isinstance(MFACT.g_cache_outcome, MFACT.CacheOutcome)
+
+
 class TestFact:
     """Unit tests for :class:`~.Fact`."""
 
@@ -159,6 +321,24 @@ class TestFact:
         assert not target._stale
         assert source == target
 
+    def test_get_set_state_pending(self, tmp_path, fact_sample):
+        """| Confirm conversion to and from pickle format.
+        | Case: check in progress.
+        """
+        # Setup
+        path = Path(str(tmp_path / 'get_set.fsg'))
+        source = fact_sample()
+        source.clear()
+        _ = source.mark_pending()
+        # Test
+        with path.open(mode='wb') as io_out:
+            pickle.dump(source, io_out)
+        with path.open(mode='rb') as io_in:
+            target = pickle.load(io_in)
+        assert source._status is MFACT.StatusOfFact.PENDING
+        assert target._status is MFACT.StatusOfFact.UNCHECKED
+        assert 0 == target._generation
+
     def test_init(self):
         """Confirm initialization."""
         # Setup
@@ -200,10 +380,12 @@ class TestFact:
         view_tag.destroy()
         assert target._topic is TOPIC
         assert target._value is None
+        assert 0 == target._generation
         assert isinstance(target._aspects['Plain'], MFACT.AspectValuePlain)
         assert NAMES_ASPECTS == set(target._names_aspects.items())
 
     @pytest.mark.parametrize('NAME_ATTR, NAME_PROP', [
+        ('_generation', 'generation'),
         ('_note', 'note'),
         ('_status', 'status'),
         ('_tag', 'tag'),
@@ -234,6 +416,28 @@ class TestFact:
         assert target._aspects[NAME] is aspect
         assert set(target._names_aspects.items()) == target._aspects.keys()
 
+    def test_apply_outcome(self, fact_sample):
+        """Confirm fact takes status and value from outcome of check."""
+        # Setup
+        target = fact_sample()
+        STATUS = MFACT.StatusOfFact.DEFINED
+        VALUE = 'Something completely different.'
+        target.add_aspect_value(
+            p_name='Oops', p_aspect=MFACT.AspectValuePlain())
+        target.set_fresh()
+        # Test
+        target.apply_outcome(STATUS, VALUE)
+        assert target.is_stale()
+        assert target._status is STATUS
+        assert VALUE == target._value
+        view_status = target._aspect_status.new_view()
+        assert STATUS.name == view_status.get_text()
+        view_status.destroy()
+        for aspect in target._aspects.values():
+            view = aspect.new_view()
+            assert VALUE == view.get_text()
+            view.destroy()
+
     def test_check(self, fact_sample):
         """Confirm base fact check."""
         # Setup
@@ -255,6 +459,41 @@ class TestFact:
             assert VALUE == view.get_text()
             view.destroy()
 
+    def test_check_cached(self, patch_cache, monkeypatch):
+        """| Confirm fact check.
+        | Case: second check uses cached outcome.
+
+        :param monkeypatch: built-in fixture `Pytest monkeypatch`_.
+        """
+        # Setup
+        monkeypatch.setattr(INSTR, 'g_instruments', INSTR.Instruments())
+        topic = PatchFingerprint()
+        first = PatchCompute(p_topic=topic)
+        target = PatchCompute(p_topic=topic)
+        _ = first.check()
+        # Test
+        result = target.check()
+        assert result is MFACT.StatusOfFact.DEFINED
+        assert 42 == target.value
+        assert 0 == target.n_computes
+        assert 1 == patch_cache.n_hits
+        assert 1 == patch_cache.n_misses
+        assert 2 == INSTR.g_instruments._timers['Fact.check'].n_runs
+        assert 1 == INSTR.g_instruments._counters['Fact.check.cached']
+
+    def test_check_uncached(self, patch_cache):
+        """| Confirm fact check.
+        | Case: topic has no fingerprint.
+        """
+        # Setup
+        topic = PatchFingerprint(p_fingerprint=None)
+        target = PatchCompute(p_topic=topic)
+        # Test
+        _ = target.check()
+        _ = target.check()
+        assert 2 == target.n_computes
+        assert 0 == len(patch_cache)
+
     def test_clear(self, fact_sample):
         """Confirm base fact clear."""
         # Setup
@@ -280,6 +519,36 @@ class TestFact:
             assert BLANK == view.get_text()
             view.destroy()
 
+    def test_clear_generation(self, fact_sample):
+        """| Confirm base fact clear.
+        | Case: clear discards check in progress.
+        """
+        # Setup
+        target = fact_sample()
+        generation = target.mark_pending()
+        # Test
+        target.clear()
+        assert generation + 1 == target.generation
+        assert target._status is MFACT.StatusOfFact.UNCHECKED
+        view_status = target._aspect_status.new_view()
+        assert target._status.name == view_status.get_text()
+        view_status.destroy()
+
+    def test_compute(self, fact_sample):
+        """| Confirm base fact computation.
+        | Case: computation leaves fact unchanged.
+        """
+        # Setup
+        target = fact_sample()
+        STATUS = MFACT.StatusOfFact.DEFINED
+        target._status = STATUS
+        VALUE = 'Something completely different.'
+        target._value = VALUE
+        target.set_fresh()
+        # Test
+        assert (STATUS, VALUE) == target.compute()
+        assert not target.is_stale()
+
     def test_is_stale(self, fact_sample):
         """Confirm state test matches change mark.
 
@@ -310,6 +579,43 @@ class TestFact:
         assert not target.is_stale()
         assert not target._stale
 
+    def test_key_outcome(self):
+        """| Confirm key for outcome cache.
+        | Case: fact computes value and topic has fingerprint.
+        """
+        # Setup
+        FINGERPRINT = ('Parrot', 42)
+        topic = PatchFingerprint(p_fingerprint=FINGERPRINT)
+        target = PatchCompute(p_topic=topic)
+        # Test
+        assert (PatchCompute, FINGERPRINT) == target.key_outcome()
+
+    def test_key_outcome_none(self, fact_sample):
+        """| Confirm key for outcome cache.
+        | Case: fact does not compute value or topic has no fingerprint.
+        """
+        # Setup
+        topic = PatchFingerprint()
+        target_base = MFACT.Fact[PatchFingerprint, int](
+            p_name='', p_summary='', p_title='', p_topic=topic)
+        target_fingerprint = PatchCompute(p_topic=PatchTopic())
+        # Test
+        assert target_base.key_outcome() is None
+        assert target_fingerprint.key_outcome() is None
+
+    def test_mark_pending(self, fact_sample):
+        """Confirm fact shows check in progress."""
+        # Setup
+        target = fact_sample()
+        STATUS = MFACT.StatusOfFact.PENDING
+        # Test
+        generation = target.mark_pending()
+        assert target._generation == generation
+        assert target._status is STATUS
+        view_status = target._aspect_status.new_view()
+        assert STATUS.name == view_status.get_text()
+        view_status.destroy()
+
     def test_new_model(self, fact_sample):
         """Confirm store for identity components."""
         # Setup
@@ -428,6 +734,7 @@ class TestStatusOfFact:
         assert issubclass(MFACT.StatusOfFact, enum.Enum)
         assert MFACT.StatusOfFact.BLOCKED
         assert MFACT.StatusOfFact.DEFINED
+        assert MFACT.StatusOfFact.PENDING
         assert MFACT.StatusOfFact.UNCHECKED
         assert MFACT.StatusOfFact.UNDEFINED
 
@@ -11,6 +11,7 @@ import pytest
 import re
 import typing
 
+import factsheet.abc_types.abc_stalefile as ABC_STALE
 import factsheet.bridge_gtk.bridge_text as BTEXT
 import factsheet.bridge_ui as BUI
 import factsheet.model.idcore as MIDCORE
@@ -28,6 +29,19 @@ class PatchIdCore(MIDCORE.IdCore[BUI.x_b_t_ModelTextMarkup,
         super().__init__(**kwargs)
 
 
+class PatchOwner(ABC_STALE.InterfaceStaleOwner):
+    """Stub owner that records reports of change state."""
+
+    def __init__(self):
+        self.reports = list()
+
+    def on_fresh_part(self, p_part):
+        self.reports.append(('fresh', p_part))
+
+    def on_stale_part(self, p_part):
+        self.reports.append(('stale', p_part))
+
+
 class TestIdCore:
     """Unit tests for :class:`.IdCore`."""
 
@@ -78,6 +92,7 @@ class TestIdCore:
         TITLE = 'The Parrot Sketch'
         source = PatchIdCore(p_name=NAME, p_summary=SUMMARY, p_title=TITLE)
         source._stale = True
+        source.add_owner_stale(PatchOwner())
         # Test
         with path.open(mode='wb') as io_out:
             pickle.dump(source, io_out)
@@ -87,6 +102,10 @@ class TestIdCore:
         assert source._summary == target._summary
         assert source._title == target._title
         assert not target._stale
+        assert not target._parts_stale
+        assert '_owners_stale' not in target.__dict__
+        target._name.set_stale()
+        assert target.is_stale()
 
     def test_init(self):
         """| Confirm initialization.
@@ -208,28 +227,69 @@ class TestIdCore:
         target._summary.set_fresh()
         target._title.set_fresh()
         assert target.is_stale()
-        assert target._stale
+        assert [id(target._name)] == list(target._parts_stale)
         # Test: IdCore fresh, name fresh, summary stale, title fresh
         target._stale = False
         target._name.set_fresh()
         target._summary.set_stale()
         target._title.set_fresh()
         assert target.is_stale()
-        assert target._stale
+        assert [id(target._summary)] == list(target._parts_stale)
         # Test: IdCore fresh, name fresh, summary fresh, title stale
         target._stale = False
         target._name.set_fresh()
         target._summary.set_fresh()
         target._title.set_stale()
         assert target.is_stale()
-        assert target._stale
+        assert [id(target._title)] == list(target._parts_stale)
         # Test: IdCore fresh, name, summary and title fresh
         target._stale = False
         target._name.set_fresh()
         target._summary.set_fresh()
         target._title.set_fresh()
         assert not target.is_stale()
-        assert not target._stale
+        assert not target._parts_stale
+
+    def test_on_fresh_part(self):
+        """| Confirm identity forgets fresh part and reports to owner.
+        | Case: part stale, part unknown, and last stale part.
+        """
+        # Setup
+        NAME = 'Parrot'
+        SUMMARY = 'The parrot is a Norwegian Blue.'
+        TITLE = 'The Parrot Sketch'
+        target = PatchIdCore(p_name=NAME, p_summary=SUMMARY, p_title=TITLE)
+        target._name.set_stale()
+        target._title.set_stale()
+        owner = PatchOwner()
+        target.add_owner_stale(owner)
+        # Test
+        target.on_fresh_part(target._name)
+        assert [id(target._title)] == list(target._parts_stale)
+        target.on_fresh_part(target._summary)
+        assert [('stale', target)] == owner.reports
+        target.on_fresh_part(target._title)
+        assert not target._parts_stale
+        assert [('stale', target), ('fresh', target)] == owner.reports
+
+    def test_on_stale_part(self):
+        """| Confirm identity records stale part and reports to owner.
+        | Case: first stale part and later stale part.
+        """
+        # Setup
+        NAME = 'Parrot'
+        SUMMARY = 'The parrot is a Norwegian Blue.'
+        TITLE = 'The Parrot Sketch'
+        target = PatchIdCore(p_name=NAME, p_summary=SUMMARY, p_title=TITLE)
+        owner = PatchOwner()
+        target.add_owner_stale(owner)
+        # Test
+        target.on_stale_part(target._summary)
+        assert [id(target._summary)] == list(target._parts_stale)
+        assert [('stale', target)] == owner.reports
+        target.on_stale_part(target._name)
+        assert 2 == len(target._parts_stale)
+        assert [('stale', target)] == owner.reports
 
     @pytest.mark.parametrize('NAME_PROP, NAME_ATTR', [
         ('name', '_name'),
@@ -287,9 +347,13 @@ class TestIdCore:
         target._stale = True
         attribute = getattr(target, ATTR)
         attribute.set_stale()
+        owner = PatchOwner()
+        target.add_owner_stale(owner)
         # Test
         target.set_fresh()
         assert attribute.has_not_changed()
+        assert not target._parts_stale
+        assert ('fresh', target) == owner.reports[-1]
 
     def test_set_stale(self, monkeypatch):
         """Confirm instance marked stale and attributes unchanged.
@@ -312,10 +376,19 @@ class TestIdCore:
 
         patch = PatchAttrSetStale()
         monkeypatch.setattr(BTEXT.ModelText, 'set_stale', patch.set_stale)
+        sources = list()
+        monkeypatch.setattr(ABC_STALE, 'g_hooks_stale', [sources.append])
+        owner = PatchOwner()
+        target.add_owner_stale(owner)
         # Test
         target.set_stale()
         assert not patch.called
         assert target._stale
+        assert [target] == sources
+        assert [('stale', target)] == owner.reports
+        target.set_stale()
+        assert [target, target] == sources
+        assert [('stale', target)] == owner.reports
 
 
 class TestIdCoreTypes:
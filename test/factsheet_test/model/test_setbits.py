@@ -0,0 +1,230 @@
+"""
+Unit tests for subsets of indexed sets stored as bits.  See
+:mod:`.setbits`.
+
+.. include:: /test/refs_include_pytest.txt
+"""
+import pytest   # type: ignore[import]
+
+from factsheet.model import element as MELEMENT
+from factsheet.model import setbits as MBITS
+from factsheet.model import setindexed as MSET
+
+
+@pytest.fixture
+def new_subsets():
+    """Pytest fixture: Return factory for parent set and subsets.
+
+    Parent has members 'a' through 'f' with indices 0 through 5.  The
+    factory returns parent followed by a subset for each list of
+    indices.
+    """
+    def new(*p_indices):
+        parent = MSET.SetIndexed('abcdef')
+        subsets = [MBITS.SubsetBits.new_from_indices(parent, i)
+                   for i in p_indices]
+        return (parent, *subsets)
+
+    return new
+
+
+class TestSubsetBits:
+    """Unit tests for :class:`.SubsetBits`."""
+
+    @pytest.mark.parametrize('OPERATOR, INDICES', [
+        ('__and__', [2]),
+        ('__or__', [0, 2, 3, 4]),
+        ('__sub__', [0, 4]),
+        ('__xor__', [0, 3, 4]),
+        ])
+    def test_algebra(self, new_subsets, OPERATOR, INDICES):
+        """Confirm set algebra between subsets of same parent.
+
+        :param new_subsets: fixture :func:`.new_subsets`.
+        :param OPERATOR: operator under test.
+        :param INDICES: indices of result.
+        """
+        # Setup
+        parent, left, right, expect = new_subsets(
+            [0, 2, 4], [2, 3], INDICES)
+        # Test
+        target = getattr(left, OPERATOR)(right)
+        assert isinstance(target, MBITS.SubsetBits)
+        assert target.parent is parent
+        assert expect == target
+
+    def test_algebra_other_set(self, new_subsets):
+        """| Confirm set algebra.
+        | Case: other set is indexed set.
+
+        :param new_subsets: fixture :func:`.new_subsets`.
+        """
+        # Setup
+        parent, target = new_subsets([0, 2, 4])
+        other = MSET.SetIndexed('abc')
+        expect = MSET.SetIndexed.new_from_elements(
+            [parent.find_element(p_index=0), parent.find_element(p_index=2)])
+        # Test
+        assert expect == target & other
+
+    def test_algebra_parent(self, new_subsets):
+        """| Confirm set algebra.
+        | Case: subsets have different parents.
+
+        :param new_subsets: fixture :func:`.new_subsets`.
+        """
+        # Setup
+        _parent, target = new_subsets([0, 2, 4])
+        other = MBITS.SubsetBits(MSET.SetIndexed('xyz'), 0b1)
+        # Test
+        with pytest.raises(ValueError):
+            _ = target | other
+
+    def test_compare(self, new_subsets):
+        """Confirm subset comparisons."""
+        # Setup
+        _parent, small, big, other = new_subsets([2], [0, 2, 4], [1])
+        # Test
+        assert small <= big
+        assert small < big
+        assert big >= small
+        assert big > small
+        assert not big < big
+        assert big <= big
+        assert not small <= other
+        assert small.isdisjoint(other)
+
+    def test_complement(self, new_subsets):
+        """| Confirm complement.
+        | Case: materialized and range-backed parents.
+
+        :param new_subsets: fixture :func:`.new_subsets`.
+        """
+        # Setup
+        _parent, target, expect = new_subsets([0, 2, 4], [1, 3, 5])
+        parent_range = MSET.SetIndexedRange(10)
+        target_range = MBITS.SubsetBits.new_from_indices(
+            parent_range, range(0, 10, 3))
+        # Test
+        assert expect == target.complement()
+        assert [1, 2, 4, 5, 7, 8] == list(
+            target_range.complement().indices())
+
+    @pytest.mark.parametrize('MEMBER, INDEX, RESULT', [
+        ('c', 2, True),
+        ('b', 1, False),
+        ('c', 3, False),
+        ('z', 9, False),
+        ])
+    def test_contains(self, new_subsets, MEMBER, INDEX, RESULT):
+        """| Confirm contains.
+        | Case: elements in and not in subset.
+
+        :param new_subsets: fixture :func:`.new_subsets`.
+        """
+        # Setup
+        _parent, target = new_subsets([0, 2, 4])
+        element = MELEMENT.ElementOpaque(p_member=MEMBER, p_index=INDEX)
+        # Test
+        assert target.__contains__(element) is RESULT
+        assert 'c' not in target
+
+    def test_init(self):
+        """Confirm initialization."""
+        # Setup
+        parent = MSET.SetIndexed('abc')
+        BITS = 0b101
+        # Test
+        target = MBITS.SubsetBits(parent, BITS)
+        assert target.parent is parent
+        assert BITS == target.bits
+        assert not MBITS.SubsetBits(parent)
+
+    @pytest.mark.parametrize('BITS', [0b1000, -1])
+    def test_init_bits(self, BITS):
+        """| Confirm initialization.
+        | Case: bits outside parent.
+
+        :param BITS: bits of subset.
+        """
+        # Setup
+        parent = MSET.SetIndexed('abc')
+        # Test
+        with pytest.raises(ValueError):
+            _ = MBITS.SubsetBits(parent, BITS)
+
+    def test_iter_len(self, new_subsets):
+        """Confirm iteration in order of index and population count.
+
+        :param new_subsets: fixture :func:`.new_subsets`.
+        """
+        # Setup
+        parent, target = new_subsets([4, 0, 2])
+        # Test
+        assert [0, 2, 4] == list(target.indices())
+        assert [parent.find_element(p_index=i) for i in [0, 2, 4]] == list(
+            target)
+        assert 3 == len(target)
+        assert '<SubsetBits: [0, 2, 4]>' == str(target)
+
+    def test_new_from_indices_negative(self):
+        """| Confirm construction from indices.
+        | Case: negative index.
+        """
+        # Setup
+        parent = MSET.SetIndexed('abc')
+        # Test
+        with pytest.raises(ValueError):
+            _ = MBITS.SubsetBits.new_from_indices(parent, [0, -1])
+
+    def test_new_from_set(self, new_subsets):
+        """| Confirm round trip to and from indexed set.
+        | Case: elements in parent.
+
+        :param new_subsets: fixture :func:`.new_subsets`.
+        """
+        # Setup
+        parent, source = new_subsets([1, 3])
+        subset = MSET.SetIndexed.new_from_elements(
+            [parent.find_element(p_index=1), parent.find_element(p_index=3)])
+        # Test
+        assert subset == source.to_set()
+        target = MBITS.SubsetBits.new_from_set(parent, subset)
+        assert source == target
+
+    def test_new_from_set_foreign(self):
+        """| Confirm construction from indexed set.
+        | Case: element not in parent.
+        """
+        # Setup
+        parent = MSET.SetIndexed('abc')
+        subset = MSET.SetIndexed('ax')
+        # Test
+        with pytest.raises(ValueError):
+            _ = MBITS.SubsetBits.new_from_set(parent, subset)
+
+
+class TestSetBitsModule:
+    """Unit tests for module-level functions of :mod:`.setbits`."""
+
+    @pytest.mark.parametrize('PARENT, MASK', [
+        (MSET.SetIndexed(), 0),
+        (MSET.SetIndexed('abc'), 0b111),
+        (MSET.SetIndexedRange(5), 0b11111),
+        ])
+    def test_mask_of(self, PARENT, MASK):
+        """Confirm bits of all indices in set."""
+        # Setup
+        # Test
+        assert MASK == MBITS.mask_of(PARENT)
+
+    def test_mask_of_negative(self):
+        """| Confirm bits of all indices in set.
+        | Case: negative index.
+        """
+        # Setup
+        parent = MSET.SetIndexed.new_from_elements(
+            [MELEMENT.ElementOpaque(p_member='a', p_index=-1)])
+        # Test
+        with pytest.raises(ValueError):
+            _ = MBITS.mask_of(parent)
@@ -2,6 +2,9 @@
 Unit tests for classes representing indexed sets.  See :mod:`.setindexed`.
 """
 # import dataclasses as DC
+import itertools as IT
+from pathlib import Path
+import pickle
 import pytest   # type: ignore[import]
 
 from factsheet.model import element as MELEMENT
@@ -74,6 +77,64 @@ class TestSetIndexed:
         # Test
         assert not target.__eq__(SAMPLE)
 
+    def test_fingerprint(self, patch_members):
+        """| Confirm fingerprint of contents.
+        | Case: equal sets have equal fingerprints.
+        """
+        # Setup
+        target = MSET.SetIndexed(patch_members)
+        other = MSET.SetIndexed(list(patch_members))
+        different = MSET.SetIndexed(patch_members[:-1])
+        # Test
+        fingerprint = target.fingerprint()
+        assert fingerprint == other.fingerprint()
+        assert hash(fingerprint) == hash(other.fingerprint())
+        assert fingerprint != different.fingerprint()
+        assert fingerprint is target.fingerprint()
+
+    def test_fingerprint_unhashable(self):
+        """| Confirm fingerprint of contents.
+        | Case: set contains unhashable member.
+        """
+        # Setup
+        target = MSET.SetIndexed([[1], [2]])
+        # Test
+        assert target.fingerprint() is None
+
+    def test_get_set_state(self, tmp_path):
+        """Confirm conversion to and from pickle format.
+
+        :param tmp_path: built-in fixture `Pytest tmp_path`_.
+        """
+        # Setup
+        path = Path(str(tmp_path / 'get_set.fsg'))
+        MEMBERS = ['a', ['b'], 'c', ['d']]
+        source = MSET.SetIndexed(MEMBERS)
+        # Test
+        with path.open(mode='wb') as io_out:
+            pickle.dump(source, io_out)
+        with path.open(mode='rb') as io_in:
+            target = pickle.load(io_in)
+        assert source == target
+        assert source._indices == target._indices
+        assert source._indices_unhashable == target._indices_unhashable
+
+    def test_getstate(self, patch_members):
+        """| Confirm conversion to pickle format.
+        | Case: state excludes member search index and element cache.
+        """
+        # Setup
+        target = MSET.SetIndexed(patch_members)
+        # Test
+        _ = target.fingerprint()
+        _ = list(target)
+        state = target.__getstate__()
+        assert '_cache_elements' not in state
+        assert '_fingerprint' not in state
+        assert '_indices' not in state
+        assert '_indices_unhashable' not in state
+        assert target._elements == state['_elements']
+
     def test_init(self, patch_members):
         """| Confirm initialization.
         | Case: distinct members, none of which are None.
@@ -126,6 +187,22 @@ class TestSetIndexed:
         target = Set(MEMBERS_NONE)
         assert EXPECT == target._elements
 
+    def test_init_member_unhashable(self):
+        """| Confirm initialization.
+        | Case: members include unhashable duplicates.
+        """
+        # Setup
+        Set = MSET.SetIndexed[list]
+        MEMBERS = [['a'], 'b', ['a'], ['c'], 'b']
+        EXPECT = {0: ['a'], 1: 'b', 2: ['c']}
+        EXPECT_INDICES = {'b': 1}
+        EXPECT_UNHASHABLE = [(['a'], 0), (['c'], 2)]
+        # Test
+        target = Set(MEMBERS)
+        assert EXPECT == target._elements
+        assert EXPECT_INDICES == target._indices
+        assert EXPECT_UNHASHABLE == target._indices_unhashable
+
     def test_iter(self, patch_members):
         """| Confirm iterator.
         | Case: non-empty set.
@@ -137,6 +214,21 @@ class TestSetIndexed:
         # Test
         assert EXPECT == {e.index: e.member for e in target}
 
+    def test_iter_cache(self, patch_members):
+        """| Confirm iterator.
+        | Case: iteration reuses elements.
+        """
+        # Setup
+        target = MSET.SetIndexed(patch_members)
+        elements = list(target)
+        # Test
+        assert len(patch_members) == len(elements)
+        for element_first, element_again in zip(elements, target):
+            assert element_first is element_again
+        INDEX_NEW = MELEMENT.IndexElement(len(elements))
+        assert target._add_element(INDEX_NEW, 'e')
+        assert 'e' == list(target)[-1].member
+
     def test_iter_empty(self):
         """| Confirm iterator.
         | Case: empty set.
@@ -216,6 +308,28 @@ class TestSetIndexed:
             assert EXPECT_I == element.index
             assert EXPECT_M == element.member
 
+    @pytest.mark.parametrize('P_INDEX, P_MEMBER, FOUND, EXPECT_I', [
+        (None, ['x'], False, None),
+        (None, ['c'], True, 2),
+        (2, ['c'], True, 2),
+        (1, ['c'], False, None),
+        ])
+    def test_find_element_unhashable(self, P_INDEX, P_MEMBER, FOUND,
+                                     EXPECT_I):
+        """| Confirm element search.
+        | Case: unhashable members.
+        """
+        # Setup
+        Set = MSET.SetIndexed[list]
+        target = Set([['a'], 'b', ['c']])
+        # Test
+        element = target.find_element(p_index=P_INDEX, p_member=P_MEMBER)
+        if not FOUND:
+            assert element is None
+        else:
+            assert EXPECT_I == element.index
+            assert P_MEMBER == element.member
+
     def test_new_from_elements(self, patch_members):
         """| Confirm construction from elements.
         | Case: distinct elements, none with member None.
@@ -255,6 +369,22 @@ class TestSetIndexed:
         target = MSET.SetIndexed.new_from_elements(source)
         assert reference == target
 
+    def test_new_from_elements_dup_unhashable(self):
+        """| Confirm construction from elements.
+        | Case: elements with duplicate unhashable member.
+        """
+        # Setup
+        Element = MELEMENT.ElementOpaque[list]
+        Set = MSET.SetIndexed[list]
+        reference = Set([['a'], ['b']])
+        source = list(reference)
+        source.append(
+            Element(p_member=['a'], p_index=MELEMENT.IndexElement(7)))
+        # Test
+        target = MSET.SetIndexed.new_from_elements(source)
+        assert reference == target
+        assert reference._indices_unhashable == target._indices_unhashable
+
     def test_new_from_elements_empty(self):
         """| Confirm construction from elements.
         | Case: no elements.
@@ -282,56 +412,218 @@ class TestSetIndexed:
         print('Target:    {}'.format(target._elements.values()))
         assert reference == target
 
-#     def test_new_product_set_none(self):
-#         """Confirm product set constuction.
-#         Case: no components
-#         """
-#         # Setup
-#         components = []
-#         expect = MSET.SetIndexed()
-#         # Test:  no components
-#         target = MSET.SetIndexed.new_product_set(components)
-#         assert expect == target
-
-#     def test_new_product_set_singleton(self, patch_members):
-#         """Confirm product set constuction.
-#         Case: one component that is non-empty
-#         """
-#         # Setup
-#         source = MSET.SetIndexed(patch_members)
-#         components = [source]
-#         expect = MSET.SetIndexed([(x, ) for x in source])
-#         # Test: one component that is non-empty
-#         target = MSET.SetIndexed.new_product_set(components)
-#         assert expect == target
-
-#     def test_new_product_set_multiple(self):
-#         """Confirm product set constuction.
-#         Case: multiple components that are each non-empty
-#         """
-#         # Setup
-#         c_0 = MSET.SetIndexed('xyz')
-#         c_1 = MSET.SetIndexed('01')
-#         c_2 = MSET.SetIndexed('abcd')
-#         components = [c_0, c_1, c_2]
-#         elements = [(i, j, k) for i in c_0 for j in c_1 for k in c_2]
-#         expect = MSET.SetIndexed(elements)
-#         # Test: multiple components that are each non-empty
-#         target = MSET.SetIndexed.new_product_set(components)
-#         assert expect == target
-
-#     def test_new_product_set_empty(self):
-#         """Confirm product set constuction.
-#         Case: multiple components one of which is empty
-#         """
-#         c_0 = MSET.SetIndexed('xyz')
-#         c_1 = MSET.SetIndexed()
-#         c_2 = MSET.SetIndexed('abcd')
-#         components = [c_0, c_1, c_2]
-#         expect = MSET.SetIndexed()
-#         # Test: multiple components that are each non-empty
-#         target = MSET.SetIndexed.new_product_set(components)
-#         assert expect == target
+    @pytest.mark.parametrize('COMPONENTS, MEMBERS', [
+        ([], []),
+        (['abcd'], [('a',), ('b',), ('c',), ('d',)]),
+        (['xyz', '01', 'ab'], list(IT.product('xyz', '01', 'ab'))),
+        (['xyz', '', 'ab'], []),
+        ])
+    def test_new_product_set(self, COMPONENTS, MEMBERS):
+        """| Confirm product set construction.
+        | Case: no components, one component, multiple components, and
+          empty component.
+
+        :param COMPONENTS: members of each component.
+        :param MEMBERS: members of product in order.
+        """
+        # Setup
+        components = [MSET.SetIndexed(c) for c in COMPONENTS]
+        expect = MSET.SetIndexed(MEMBERS)
+        # Test
+        target = MSET.SetIndexed.new_product_set(components)
+        assert isinstance(target, MSET.SetIndexedProduct)
+        assert expect == target
+        assert target == expect
+
+
+class TestElementsRange:
+    """Unit tests for :class:`.ElementsRange`."""
+
+    @pytest.mark.parametrize('OTHER, RESULT', [
+        (MSET.ElementsRange(3), True),
+        (MSET.ElementsRange(4), False),
+        ({0: 0, 1: 1, 2: 2}, True),
+        ({0: 0, 1: 1, 3: 3}, False),
+        ({0: 0, 1: 1, 2: 'c'}, False),
+        ({0: 0, 1: 1}, False),
+        ])
+    def test_eq(self, OTHER, RESULT):
+        """Confirm equality comparison with mappings."""
+        # Setup
+        target = MSET.ElementsRange(3)
+        # Test
+        assert (target == OTHER) is RESULT
+        assert (OTHER == target) is RESULT
+
+    def test_eq_domain(self):
+        """| Confirm equality comparison.
+        | Case: other is not a mapping.
+        """
+        # Setup
+        target = MSET.ElementsRange(3)
+        # Test
+        assert target.__eq__([0, 1, 2]) is NotImplemented
+
+    def test_get_item(self):
+        """Confirm element lookup by index."""
+        # Setup
+        target = MSET.ElementsRange(3)
+        # Test
+        assert 2 == target[2]
+        with pytest.raises(KeyError):
+            target[3]
+
+    @pytest.mark.parametrize('BOUND, EXPECT', [
+        (4, 4),
+        (0, 0),
+        (-2, 0),
+        ])
+    def test_init(self, BOUND, EXPECT):
+        """Confirm initialization."""
+        # Setup
+        # Test
+        target = MSET.ElementsRange(BOUND)
+        assert EXPECT == target._bound
+        assert EXPECT == target.bound
+        assert EXPECT == len(target)
+        assert list(range(EXPECT)) == list(target)
+
+    @pytest.mark.parametrize('VALUE, EXPECT', [
+        (0, 0),
+        (2, 2),
+        (2.0, 2),
+        (True, 1),
+        (3, None),
+        (-1, None),
+        (2.5, None),
+        ('1', None),
+        (float('nan'), None),
+        (float('inf'), None),
+        ([1], None),
+        (None, None),
+        ])
+    def test_to_index(self, VALUE, EXPECT):
+        """Confirm conversion of value to index."""
+        # Setup
+        target = MSET.ElementsRange(3)
+        # Test
+        assert EXPECT == target.to_index(VALUE)
+
+
+class TestSetIndexedRange:
+    """Unit tests for :class:`.SetIndexedRange`."""
+
+    @pytest.mark.parametrize('MEMBER, INDEX, RESULT', [
+        (1, 1, True),
+        (1, 2, False),
+        (5, 5, False),
+        ('a', 0, False),
+        ])
+    def test_contains(self, MEMBER, INDEX, RESULT):
+        """Confirm contains."""
+        # Setup
+        Element = MELEMENT.ElementOpaque[int]
+        target = MSET.SetIndexedRange(5)
+        element = Element(p_member=MEMBER, p_index=INDEX)
+        # Test
+        assert target.__contains__(element) is RESULT
+
+    @pytest.mark.parametrize('BOUND_L, BOUND_R, RESULT', [
+        (0, 0, True),
+        (3, 3, True),
+        (3, 4, False),
+        ])
+    def test_eq(self, BOUND_L, BOUND_R, RESULT):
+        """| Confirm equality comparison.
+        | Case: range-backed and materialized sets.
+        """
+        # Setup
+        target = MSET.SetIndexedRange(BOUND_L)
+        range_right = MSET.SetIndexedRange(BOUND_R)
+        materialized_right = MSET.SetIndexed[int](range(BOUND_R))
+        # Test
+        assert (target == range_right) is RESULT
+        assert (target == materialized_right) is RESULT
+        assert (materialized_right == target) is RESULT
+        assert (target != materialized_right) is not RESULT
+
+    def test_find_element(self):
+        """Confirm element search."""
+        # Setup
+        target = MSET.SetIndexedRange(5)
+        # Test
+        element = target.find_element(p_member=3)
+        assert 3 == element.index
+        assert 3 == element.member
+        assert target.find_element(p_member=5) is None
+        element = target.find_element(p_index=4)
+        assert 4 == element.member
+        assert target.find_element(p_index=4, p_member=3) is None
+
+    def test_fingerprint(self):
+        """Confirm fingerprint depends only on bound."""
+        # Setup
+        target = MSET.SetIndexedRange(5)
+        # Test
+        assert MSET.SetIndexedRange(5).fingerprint() == target.fingerprint()
+        assert MSET.SetIndexedRange(6).fingerprint() != target.fingerprint()
+
+    def test_fingerprint_explicit(self):
+        """| Confirm fingerprint depends only on bound.
+        | Case: indexed set with same elements has other fingerprint.
+        """
+        # Setup
+        target = MSET.SetIndexedRange(5)
+        explicit = MSET.SetIndexed(range(5))
+        # Test
+        assert explicit == target
+        assert explicit.fingerprint() != target.fingerprint()
+
+    def test_get_set_state(self, tmp_path):
+        """Confirm conversion to and from pickle format.
+
+        :param tmp_path: built-in fixture `Pytest tmp_path`_.
+        """
+        # Setup
+        path = Path(str(tmp_path / 'get_set.fsg'))
+        BOUND = 10**6
+        source = MSET.SetIndexedRange(BOUND)
+        # Test
+        assert dict(_bound=BOUND) == source.__getstate__()
+        with path.open(mode='wb') as io_out:
+            pickle.dump(source, io_out)
+        assert path.stat().st_size < 200
+        with path.open(mode='rb') as io_in:
+            target = pickle.load(io_in)
+        assert isinstance(target, MSET.SetIndexedRange)
+        assert source == target
+
+    def test_init(self):
+        """Confirm initialization."""
+        # Setup
+        BOUND = 5
+        reference = MSET.SetIndexed[int](range(BOUND))
+        # Test
+        target = MSET.SetIndexedRange(BOUND)
+        assert isinstance(target._elements, MSET.ElementsRange)
+        assert BOUND == target.bound
+        assert BOUND == len(target)
+        assert list(reference) == list(target)
+
+    def test_new_from_elements(self):
+        """Confirm construction from range-backed elements."""
+        # Setup
+        source = MSET.SetIndexedRange(4)
+        # Test
+        target = MSET.SetIndexed.new_from_elements(source)
+        assert source == target
+
+    def test_str(self):
+        """Confirm printable representation."""
+        # Setup
+        target = MSET.SetIndexedRange(7)
+        # Test
+        assert '<SetIndexedRange: 7>' == str(target)
 
 
 class TestTypes:
@@ -364,142 +656,279 @@ class TestTypes:
 #             target.index = INDEX
 
 
-class TestSubsets:
-    """Unit tests for subset functions"""
+class TestPositionsSet:
+    """Unit tests for :class:`.PositionsSet`."""
 
-#     def test_subset_size_0(self):
-#         """Confirm generation of fixed-sized subsets.
-#         Case: size 0 subset
-#         """
-#         # Setup
-#         reps = list('abc')
-#         source = MSET.SetIndexed(reps)
-#         expect = MSET.SetIndexed()
-#         # Test
-#         target = list(MSET.subsets_size_n(source, 0))
-#         assert 1 == len(target)
-#         assert expect in target
-
-#     def test_subset_size_1(self):
-#         """Confirm generation of fixed-sized subsets.
-#         Case: size 1 subsets
-#         """
-#         # Setup
-#         reps = list('abc')
-#         source = MSET.SetIndexed(reps)
-#         elements = list(source)
-#         expect = []
-#         for x in elements:
-#             expect.append({x})
-#         # Test
-#         target = [set(s) for s in MSET.subsets_size_n(source, 1)]
-#         assert len(expect) == len(target)
-#         for s in expect:
-#             assert s in target
-
-#     def test_subset_size_mid(self):
-#         """Confirm generation of fixed-sized subsets.
-#         Case: subsets between 1 and set size
-#         """
-#         # Setup
-#         reps = list('abc')
-#         source = MSET.SetIndexed(reps)
-#         elements = list(source)
-#         expect = []
-#         for x in elements:
-#             subset = list(elements)
-#             subset.remove(x)
-#             expect.append(set(subset))
-#         # Test
-#         target = [set(s) for s in MSET.subsets_size_n(source, 2)]
-#         assert len(expect) == len(target)
-#         for s in expect:
-#             assert s in target
-
-#     def test_subset_size_max(self):
-#         """Confirm generation of fixed-sized subsets.
-#         Case: subset size of set
-#         """
-#         # Setup
-#         reps = list('abc')
-#         source = MSET.SetIndexed(reps)
-#         expect = source
-#         # Test
-#         target = list(MSET.subsets_size_n(source, 3))
-#         assert 1 == len(target)
-#         assert expect in target
-
-#     def test_subset_size_super_max(self):
-#         """Confirm generation of fixed-sized subsets.
-#         Case: subset size greater than size of set
-#         """
-#         # Setup
-#         reps = list('abc')
-#         source = MSET.SetIndexed(reps)
-#         # Test
-#         target = list(MSET.subsets_size_n(source, 10))
-#         assert 0 == len(target)
+    @pytest.mark.parametrize('SOURCE', [
+        MSET.SetIndexed(['a', 'b', 'c']),
+        MSET.SetIndexedRange(3),
+        ])
+    def test_positions(self, SOURCE):
+        """| Confirm positional access to elements.
+        | Case: materialized and range-backed sets.
 
-#     def test_subset_size_minus(self):
-#         """Confirm generation of fixed-sized subsets.
-#         Case: negative rep for set size
-#         """
-#         # Setup
-#         reps = list('abc')
-#         source = MSET.SetIndexed(reps)
-#         # Test
-#         with pytest.raises(repError):
-#             _target = list(MSET.subsets_size_n(source, -1))
+        :param SOURCE: set to access.
+        """
+        # Setup
+        elements = list(SOURCE)
+        # Test
+        target = MSET.PositionsSet(SOURCE)
+        assert len(elements) == len(target)
+        for i, element in enumerate(elements):
+            assert element == target.element_at(i)
+            assert i == target.position_of(element.member)
+        assert target.position_of('Oops') is None
+        assert target.key() is not None
+
+    def test_key_unhashable(self):
+        """| Confirm summary of elements.
+        | Case: set contains unhashable member.
+        """
+        # Setup
+        source = MSET.SetIndexed([['a'], ['b']])
+        # Test
+        target = MSET.PositionsSet(source)
+        assert target.key() is None
 
-#     def test_subset_all_empty(self):
-#         """Confirm generation of subsets.
-#         Case: all subsets of empty set
-#         """
-#         # Setup
-#         source = MSET.SetIndexed()
-#         expect = MSET.SetIndexed()
-#         # Test
-#         target = list(MSET.subsets_all(source))
-#         assert 1 == len(target)
-#         assert expect in target
-
-#     def test_subset_all_1(self):
-#         """Confirm generation of subsets.
-#         Case: all subsets of 1-element set
-#         """
-#         reps = ['a']
-#         source = MSET.SetIndexed(reps)
-#         elements = list(source)
-#         expect = [set(), set(elements)]
-#         # Test
-#         target = [set(s) for s in MSET.subsets_all(source)]
-#         assert len(expect) == len(target)
-#         for s in expect:
-#             assert s in target
-
-#     def test_subset_all(self):
-#         """Confirm generation of subsets.
-#         Case: all subsets of set with multiple elements
-#         """
-#         # Setup
-#         reps = list('abc')
-#         source = MSET.SetIndexed(reps)
-#         elements = list(source)
-#         expect = []
-#         #    - 0-element subset
-#         expect.append(set())
-#         #    - 1-element subset
-#         for x in elements:
-#             expect.append({x})
-#         #    - 2-element subset
-#         for x in elements:
-#             subset = list(elements)
-#             subset.remove(x)
-#             expect.append(set(subset))
-#         #    - 3-element subset
-#         expect.append(set(elements))
-#         # Test
-#         target = [set(s) for s in MSET.subsets_all(source)]
-#         assert len(expect) == len(target)
-#         for s in expect:
-#             assert s in target
+
+class TestSetIndexedProduct:
+    """Unit tests for :class:`.SetIndexedProduct` and
+    :class:`.ElementsProduct`.
+    """
+
+    @pytest.mark.parametrize('MEMBER, INDEX, RESULT', [
+        (('y', '1', 2), 14, True),
+        (('y', '1', 2), 13, False),
+        (('y', '1', 4), 15, False),
+        (('y', '1'), 6, False),
+        (42, 0, False),
+        ])
+    def test_contains(self, MEMBER, INDEX, RESULT):
+        """Confirm contains."""
+        # Setup
+        components = [MSET.SetIndexed('xyz'), MSET.SetIndexed('01'),
+                      MSET.SetIndexedRange(4)]
+        target = MSET.SetIndexedProduct(components)
+        element = MELEMENT.ElementOpaque(p_member=MEMBER, p_index=INDEX)
+        # Test
+        assert target.__contains__(element) is RESULT
+
+    def test_eq(self):
+        """| Confirm equality comparison.
+        | Case: product and materialized sets.
+        """
+        # Setup
+        target = MSET.SetIndexedProduct(
+            [MSET.SetIndexed('xy'), MSET.SetIndexedRange(3)])
+        same = MSET.SetIndexedProduct(
+            [MSET.SetIndexed('xy'), MSET.SetIndexedRange(3)])
+        materialized = MSET.SetIndexedProduct(
+            [MSET.SetIndexed('xy'), MSET.SetIndexed(range(3))])
+        reversed_ = MSET.SetIndexedProduct(
+            [MSET.SetIndexedRange(3), MSET.SetIndexed('xy')])
+        # Test
+        assert target == same
+        assert target == materialized
+        assert target != reversed_
+        assert target == MSET.SetIndexed(IT.product('xy', range(3)))
+        assert target != MSET.SetIndexed('xy')
+
+    def test_find_element(self):
+        """Confirm element search computes element without storing it."""
+        # Setup
+        BOUND = 10**6
+        target = MSET.SetIndexedProduct([MSET.SetIndexedRange(BOUND)] * 3)
+        MEMBER = (5, 6, 7)
+        INDEX = (5 * BOUND + 6) * BOUND + 7
+        # Test
+        assert BOUND**3 == target.size
+        element = target.find_element(p_member=MEMBER)
+        assert INDEX == element.index
+        assert MEMBER == target.find_element(p_index=INDEX).member
+        assert target.find_element(p_member=(5, 6, BOUND)) is None
+        assert target.find_element(p_index=BOUND**3) is None
+
+    def test_fingerprint(self):
+        """| Confirm fingerprint depends only on components.
+        | Case: hashable and unhashable members.
+        """
+        # Setup
+        target = MSET.SetIndexedProduct(
+            [MSET.SetIndexed('xy'), MSET.SetIndexedRange(3)])
+        same = MSET.SetIndexedProduct(
+            [MSET.SetIndexed('xy'), MSET.SetIndexedRange(3)])
+        other = MSET.SetIndexedProduct(
+            [MSET.SetIndexed('xy'), MSET.SetIndexedRange(4)])
+        unhashable = MSET.SetIndexedProduct([MSET.SetIndexed([['a']])])
+        # Test
+        assert same.fingerprint() == target.fingerprint()
+        assert other.fingerprint() != target.fingerprint()
+        assert unhashable.fingerprint() is None
+
+    def test_get_set_state(self, tmp_path):
+        """Confirm conversion to and from pickle format.
+
+        :param tmp_path: built-in fixture `Pytest tmp_path`_.
+        """
+        # Setup
+        path = Path(str(tmp_path / 'get_set.fsg'))
+        source = MSET.SetIndexedProduct(
+            [MSET.SetIndexed('xyz'), MSET.SetIndexedRange(10**6)])
+        # Test
+        with path.open(mode='wb') as io_out:
+            pickle.dump(source, io_out)
+        assert path.stat().st_size < 1000
+        with path.open(mode='rb') as io_in:
+            target = pickle.load(io_in)
+        assert isinstance(target, MSET.SetIndexedProduct)
+        assert source == target
+
+    def test_str(self):
+        """Confirm string representation."""
+        # Setup
+        target = MSET.SetIndexedProduct(
+            [MSET.SetIndexed('xyz'), MSET.SetIndexedRange(7)])
+        # Test
+        assert '<SetIndexedProduct: 3 x 7>' == str(target)
+        assert 2 == len(target.components)
+
+
+class TestSetIndexedSubsets:
+    """Unit tests for :class:`.SetIndexedSubsets` and
+    :class:`.ElementsSubsets`.
+    """
+
+    @pytest.mark.parametrize('SIZE', [None, 0, 1, 2, 4, 5])
+    def test_eq(self, SIZE):
+        """| Confirm subsets match materialized subsets.
+        | Case: all sizes, each size, and size beyond source.
+
+        :param SIZE: size of subsets.
+        """
+        # Setup
+        source = MSET.SetIndexed('abcd')
+        sizes = range(5) if SIZE is None else [SIZE]
+        expect = MSET.SetIndexed([
+            MSET.SetIndexed.new_from_elements(c)
+            for k in sizes for c in IT.combinations(list(source), k)])
+        # Test
+        target = MSET.SetIndexedSubsets(source, SIZE)
+        assert len(expect) == len(target)
+        assert expect == target
+        assert target == expect
+        assert target == MSET.SetIndexedSubsets(source, SIZE)
+        assert target != MSET.SetIndexedSubsets(MSET.SetIndexed('abc'), SIZE)
+
+    def test_find_element(self):
+        """| Confirm element search.
+        | Case: subset in set, subset of wrong size, subset with element
+          not in source, and not a subset.
+        """
+        # Setup
+        source = MSET.SetIndexedRange(40)
+        target = MSET.subsets_size_n(source, 3)
+        subset = MSET.SetIndexed.new_from_elements(
+            source.find_element(p_member=m) for m in [3, 17, 31])
+        too_big = MSET.SetIndexed(range(4))
+        foreign = MSET.SetIndexed.new_from_elements(
+            [MELEMENT.ElementOpaque(p_member=3, p_index=4)])
+        # Test
+        element = target.find_element(p_member=subset)
+        assert subset == target.find_element(p_index=element.index).member
+        assert target.find_element(p_member=too_big) is None
+        assert target.find_element(p_member=foreign) is None
+        assert target.find_element(p_member=42) is None
+
+    def test_fingerprint(self):
+        """Confirm fingerprint depends only on source and size."""
+        # Setup
+        source = MSET.SetIndexed('abcd')
+        target = MSET.SetIndexedSubsets(source, 2)
+        # Test
+        assert (MSET.SetIndexedSubsets(source, 2).fingerprint()
+                == target.fingerprint())
+        assert (MSET.SetIndexedSubsets(source).fingerprint()
+                != target.fingerprint())
+
+    def test_get_set_state(self, tmp_path):
+        """Confirm conversion to and from pickle format.
+
+        :param tmp_path: built-in fixture `Pytest tmp_path`_.
+        """
+        # Setup
+        path = Path(str(tmp_path / 'get_set.fsg'))
+        source = MSET.SetIndexedSubsets(MSET.SetIndexedRange(200))
+        # Test
+        with path.open(mode='wb') as io_out:
+            pickle.dump(source, io_out)
+        assert path.stat().st_size < 1000
+        with path.open(mode='rb') as io_in:
+            target = pickle.load(io_in)
+        assert isinstance(target, MSET.SetIndexedSubsets)
+        assert 2**200 == target.size
+        assert source == target
+
+    def test_init_size_negative(self):
+        """| Confirm initialization.
+        | Case: negative size.
+        """
+        # Setup
+        source = MSET.SetIndexed('abc')
+        # Test
+        with pytest.raises(ValueError):
+            _ = MSET.SetIndexedSubsets(source, -1)
+
+    def test_str(self):
+        """Confirm string representation."""
+        # Setup
+        source = MSET.SetIndexed('abc')
+        # Test
+        assert '<SetIndexedSubsets: all of 3>' == str(
+            MSET.subsets_all(source))
+        assert '<SetIndexedSubsets: 2 of 3>' == str(
+            MSET.subsets_size_n(source, 2))
+
+
+class TestSetIndexedModule:
+    """Unit tests for module-level functions of :mod:`.setindexed`."""
+
+    @pytest.mark.parametrize('N, K, EXPECT', [
+        (5, 2, 10),
+        (5, 0, 1),
+        (5, 5, 1),
+        (5, 6, 0),
+        (5, -1, 0),
+        (60, 30, 118264581564861424),
+        ])
+    def test_binomial(self, N, K, EXPECT):
+        """Confirm count of combinations."""
+        # Setup
+        # Test
+        assert EXPECT == MSET.binomial(N, K)
+
+    @pytest.mark.parametrize('N', [0, 1, 4, 7])
+    def test_rank_unrank_combination(self, N):
+        """Confirm ranks follow order of itertools.combinations.
+
+        :param N: number of items to choose from.
+        """
+        # Setup
+        # Test
+        for k in range(N + 1):
+            for rank, positions in enumerate(IT.combinations(range(N), k)):
+                assert rank == MSET.rank_combination(N, positions)
+                assert list(positions) == MSET.unrank_combination(
+                    N, k, rank)
+
+    def test_subsets(self):
+        """Confirm subset functions return lazy subset sets."""
+        # Setup
+        source = MSET.SetIndexed('abc')
+        # Test
+        target = MSET.subsets_all(source)
+        assert isinstance(target, MSET.SetIndexedSubsets)
+        assert 8 == len(target)
+        target = MSET.subsets_size_n(source, 2)
+        assert 3 == len(target)
+        assert source == MSET.subsets_size_n(source, 3).find_element(
+            p_index=0).member
@@ -3,6 +3,7 @@ Unit tests for factsheet-level model.  See :mod:`~factsheet.model`.
 
 .. include:: /test/refs_include_pytest.txt
 """
+import pickle
 import pytest
 
 import factsheet.bridge_ui as BUI
@@ -115,7 +116,31 @@ class TestSheet:
         assert target.is_stale()
         assert clear_called
 
-    def test_get_tag(self, new_id_args):
+    def test_extend_topics(self, new_id_args):
+        """Confirm outline marked stale and topics added and tracked.
+
+        :param new_id_args: fixture :func:`.new_id_args`.
+        """
+        # Setup
+        ID_ARGS = new_id_args()
+        target = MSHEET.Sheet(**ID_ARGS)
+        target.set_fresh()
+        TOPICS = [MTOPIC.Topic(p_name='Topic {}'.format(i), p_summary='',
+                               p_title='') for i in range(3)]
+        PREORDER = [(0, TOPICS[0]), (1, TOPICS[1]), (0, TOPICS[2])]
+        outline = target.outline_topics
+        # Test
+        lines_top = target.extend_topics(PREORDER)
+        assert target.is_stale()
+        assert [TOPICS[0], TOPICS[2]] == [
+            outline.get_item(line) for line in lines_top]
+        assert TOPICS == list(target.topics())
+        assert [0, 1, 0] == [outline.depth(line) for line in outline.lines()]
+        target.set_fresh()
+        TOPICS[1].set_stale()
+        assert target.is_stale()
+
+
         """| Confirm tag is for topic at line.
         | Case: line contains topic.
 
@@ -235,12 +260,12 @@ class TestSheet:
         target._stale = False
         target._summary.set_stale()
         assert not target.has_not_changed()
-        assert target._stale
+        assert id(target._summary) in target._parts_stale
         # Test: Sheet fresh, ID info fresh, topics fresh
         target._stale = False
         target._summary.set_fresh()
         assert target.has_not_changed()
-        assert not target._stale
+        assert not target._parts_stale
         # Test: Sheet fresh, ID info fresh, topics fresh
         target._stale = False
         target._summary.set_fresh()
@@ -250,7 +275,8 @@ class TestSheet:
             else:
                 topic.set_fresh()
         assert target.is_stale()
-        assert target._stale
+        assert [id(topic) for i, topic in enumerate(target._topics.items())
+                if i == I_MIDDLE] == list(target._parts_stale)
 
     def test_is_stale(self, new_id_args):
         """Confirm return is accurate.
@@ -289,12 +315,12 @@ class TestSheet:
         target._stale = False
         target._name.set_stale()
         assert target.is_stale()
-        assert target._stale
+        assert id(target._name) in target._parts_stale
         # Test: Sheet fresh, ID info fresh, topics fresh
         target._stale = False
         target._name.set_fresh()
         assert not target.is_stale()
-        assert not target._stale
+        assert not target._parts_stale
         # Test: Sheet fresh, ID info fresh, leaf topic stale
         target._stale = False
         target._name.set_fresh()
@@ -304,7 +330,7 @@ class TestSheet:
             else:
                 topic.set_fresh()
         assert target.is_stale()
-        assert target._stale
+        assert not target._stale
         # Test: Sheet fresh, ID info fresh, last topic stale
         target._stale = False
         target._name.set_fresh()
@@ -314,29 +340,32 @@ class TestSheet:
             else:
                 topic.set_fresh()
         assert target.is_stale()
-        assert target._stale
+        assert not target._stale
 
-    def test_is_stale_warn(self, new_id_args, caplog):
-        """Confirm warning when topics outline contains line with None.
+    def test_is_stale_topic_identity(self, new_id_args):
+        """| Confirm return is accurate.
+        | Case: change to identity of topic in outline.
 
         :param new_id_args: fixture :func:`.new_id_args`.
-        :param caplog: built-in fixture `Pytest caplog`_.
         """
         # Setup
         ID_ARGS = new_id_args()
         target = MSHEET.Sheet(**ID_ARGS)
-        target._topics._ui_model.append(None, [None])
-        N_LOGS = 1
-        LAST = -1
-        log_message = ('Topics outline contains line with no topic ('
-                       'Sheet.is_stale)')
+        parent = None
+        for i in range(3):
+            name = 'Topic {}'.format(i)
+            topic = MTOPIC.Topic(p_name=name, p_summary='', p_title='')
+            parent = target.insert_topic_child(topic, parent)
+        _ = target.insert_topic_child(None, None)
+        target.set_fresh()
         # Test
-        result = target.is_stale()
-        assert not result
-        assert N_LOGS == len(caplog.records)
-        record = caplog.records[LAST]
-        assert log_message == record.message
-        assert 'WARNING' == record.levelname
+        assert not target.is_stale()
+        topic.title.set_stale()
+        assert target.is_stale()
+        assert [id(topic)] == list(target._parts_stale)
+        target.set_fresh()
+        assert not target.is_stale()
+        assert topic.title.has_not_changed()
 
     @pytest.mark.parametrize('NAME_PROP, NAME_ATTR', [
         ('outline_topics', '_topics'),
@@ -384,13 +413,13 @@ class TestSheet:
         remove_called = False
         remove_line = None
 
-        def remove(self, p_line):
+        def remove_many(self, p_lines):
             nonlocal remove_called
             remove_called = True  # pylint: disable=unused-variable
             nonlocal remove_line
-            remove_line = p_line  # pylint: disable=unused-variable
+            remove_line = p_lines  # pylint: disable=unused-variable
 
-        monkeypatch.setattr(BUI.ModelOutlineMulti, 'remove', remove)
+        monkeypatch.setattr(BUI.ModelOutlineMulti, 'remove_many', remove_many)
         TITLE_MODEL = 'Something completely different.'
         target = MSHEET.Sheet(p_title=TITLE_MODEL)
         target.set_fresh()
@@ -399,7 +428,57 @@ class TestSheet:
         target.remove_topic(LINE)
         assert target.is_stale()
         assert remove_called
-        assert remove_line is LINE
+        assert [LINE] == remove_line
+
+    def test_remove_topics(self, new_id_args):
+        """Confirm sheet removes topics and stops tracking them.
+
+        :param new_id_args: fixture :func:`.new_id_args`.
+        """
+        # Setup
+        ID_ARGS = new_id_args()
+        target = MSHEET.Sheet(**ID_ARGS)
+        TOPICS = [MTOPIC.Topic(p_name='Topic {}'.format(i),
+                               p_summary='', p_title='') for i in range(4)]
+        lines = [target.insert_topic_child(t, None) for t in TOPICS[:3]]
+        line_within = target.insert_topic_child(TOPICS[3], lines[2])
+        target.set_fresh()
+        # Test
+        target.remove_topics([lines[0], None, lines[2], line_within])
+        assert target.is_stale()
+        assert [TOPICS[1]] == list(target.topics())
+        target.set_fresh()
+        for topic in [TOPICS[0], TOPICS[2], TOPICS[3]]:
+            topic.set_stale()
+        assert not target.is_stale()
+
+    def test_remove_topic_untrack(self, new_id_args):
+        """Confirm sheet stops tracking change state of removed topics.
+
+        :param new_id_args: fixture :func:`.new_id_args`.
+        """
+        # Setup
+        ID_ARGS = new_id_args()
+        target = MSHEET.Sheet(**ID_ARGS)
+        TOPICS = [MTOPIC.Topic(p_name='Topic {}'.format(i),
+                               p_summary='', p_title='') for i in range(3)]
+        _ = target.insert_topic_child(TOPICS[0], None)
+        line_remove = target.insert_topic_child(TOPICS[1], None)
+        _ = target.insert_topic_child(TOPICS[2], line_remove)
+        TOPICS[2].set_stale()
+        # Test
+        target.remove_topic(line_remove)
+        target.set_fresh()
+        TOPICS[1].set_stale()
+        TOPICS[2].set_stale()
+        assert not target.is_stale()
+        assert not target._parts_stale
+        TOPICS[0].set_stale()
+        assert target.is_stale()
+        target.clear()
+        target.set_fresh()
+        TOPICS[0].set_stale()
+        assert not target.is_stale()
 
     def test_set_fresh(self, new_id_args):
         """Confirm all attributes marked fresh.
@@ -487,26 +566,26 @@ class TestSheet:
         for topic in target._topics.items():
             assert topic.has_not_changed()
 
-    def test_set_fresh_warn(self, new_id_args, caplog):
-        """Confirm warning when topics outline contains line with None.
+    def test_setstate_track(self, new_id_args):
+        """Confirm reconstructed sheet tracks change state of topics.
 
         :param new_id_args: fixture :func:`.new_id_args`.
-        :param caplog: built-in fixture `Pytest caplog`_.
         """
         # Setup
         ID_ARGS = new_id_args()
-        target = MSHEET.Sheet(**ID_ARGS)
-        target._topics._ui_model.append(None, [None])
-        N_LOGS = 1
-        LAST = -1
-        log_message = ('Topics outline contains line with no topic ('
-                       'Sheet.set_fresh)')
+        source = MSHEET.Sheet(**ID_ARGS)
+        topic = MTOPIC.Topic(p_name='Topic', p_summary='', p_title='')
+        _ = source.insert_topic_child(topic, None)
         # Test
-        target.set_fresh()
-        assert N_LOGS == len(caplog.records)
-        record = caplog.records[LAST]
-        assert log_message == record.message
-        assert 'WARNING' == record.levelname
+        target = pickle.loads(pickle.dumps(source))
+        assert not target.is_stale()
+        state = target.__getstate__()
+        assert '_owners_stale' not in state
+        assert '_parts_stale' not in state
+        topic_target = next(target.topics())
+        topic_target.name.set_stale()
+        assert target.is_stale()
+        assert [id(topic_target)] == list(target._parts_stale)
 
     def test_topics(self, new_id_args):
         """Confirm iterations over topics."""
@@ -541,7 +620,7 @@ class TestSheet:
         # Setup
         ID_ARGS = new_id_args()
         target = MSHEET.Sheet(**ID_ARGS)
-        target._topics._ui_model.append(None, [None])
+        _ = target._topics.insert_child(None)
         N_LOGS = 1
         LAST = -1
         log_message = ('Topics outline contains line with no topic ('
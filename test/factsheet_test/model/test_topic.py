@@ -181,6 +181,26 @@ class TestTopic:
         # for fact, fact_target in IT.zip_longest(facts, target):
         #     assert fact is fact_target
 
+    def test_iter_facts(self, new_model_topic):
+        """Confirm base topic has no facts.
+
+        :param new_model_topic: fixture :func:`.new_model_topic`.
+        """
+        # Setup
+        target = new_model_topic(0)
+        # Test
+        assert not list(target.iter_facts())
+
+    def test_fingerprint(self, new_model_topic):
+        """Confirm base topic has no content fingerprint.
+
+        :param new_model_topic: fixture :func:`.new_model_topic`.
+        """
+        # Setup
+        target = new_model_topic(0)
+        # Test
+        assert target.fingerprint() is None
+
     @pytest.mark.parametrize('NAME_ATTR, NAME_PROP', [
         # ('_facts', 'facts'),
         ('_name', 'name'),
@@ -0,0 +1,224 @@
+"""
+Unit tests for headless batch entry point.  See :mod:`.batch`.
+
+.. include:: /test/refs_include_pytest.txt
+"""
+import csv
+import json
+import pickle
+import pytest   # type: ignore[import]
+
+import factsheet.batch as BATCH
+import factsheet.content.sets.int.topic_segint as XSEGINT
+import factsheet.control.format_sheet as CFORMAT
+import factsheet.model.fact as MFACT
+import factsheet.model.sheet as MSHEET
+import factsheet.model.topic as MTOPIC
+
+
+class PatchFact:
+    """Stub for fact with check that squares a number."""
+
+    def __init__(self, p_name, p_n):
+        self.name = MTOPIC.Name(p_text=p_name)
+        self.n = p_n
+        self.value = None
+
+    def check(self):
+        if self.n is None:
+            raise ValueError('No number')
+
+        self.value = self.n * self.n
+        return MFACT.StatusOfFact.DEFINED
+
+
+class PatchTopic(MTOPIC.Topic):
+    """Topic with iterable facts."""
+
+    def __init__(self, p_facts=(), **kwargs):
+        super().__init__(**kwargs)
+        self._facts_stub = list(p_facts)
+
+    def iter_facts(self):
+        return iter(self._facts_stub)
+
+
+@pytest.fixture
+def new_path_sheet(tmp_path):
+    """Pytest fixture: Return factory for factsheet file of topics.
+
+    Topic Numbers has two facts.  Topic Plain has no facts outline.
+    """
+    def new(p_name='sheet.fsg', p_pickle=False):
+        sheet = MSHEET.Sheet(p_name=p_name)
+        topic = PatchTopic(p_name='Numbers', p_summary='', p_title='',
+                           p_facts=[PatchFact('Two', 2),
+                                    PatchFact('None', None)])
+        _ = sheet.insert_topic_child(topic, None)
+        plain = MTOPIC.Topic(p_name='Plain', p_summary='', p_title='')
+        _ = sheet.insert_topic_child(plain, None)
+        path = tmp_path / p_name
+        with path.open(mode='wb') as io_out:
+            if p_pickle:
+                pickle.dump(sheet, io_out)
+            else:
+                CFORMAT.dump_sheet(sheet, io_out)
+        return path
+
+    return new
+
+
+def expect_rows(p_path):
+    """Return rows expected for file from :func:`new_path_sheet`."""
+    return [
+        BATCH.new_row(p_path, 'Numbers', 'Two', 'DEFINED', '4'),
+        BATCH.new_row(p_path, 'Numbers', 'None',
+                      p_error=ValueError('No number')),
+        ]
+
+
+class TestBatch:
+    """Unit tests for functions in :mod:`.batch`."""
+
+    def test_check_file(self, new_path_sheet):
+        """| Confirm result row for each fact in file.
+        | Case: file in factsheet format.
+        """
+        # Setup
+        path = new_path_sheet()
+        # Test
+        assert expect_rows(path) == BATCH.check_file(path)
+
+    def test_check_file_content(self, tmp_path):
+        """| Confirm result row for each fact in file.
+        | Case: file of built-in content topics, which hold no facts.
+
+        :param tmp_path: built-in fixture `Pytest tmp_path`_.
+        """
+        # Setup
+        sheet = MSHEET.Sheet(p_name='Segments')
+        for bound in [1, 5]:
+            topic = XSEGINT.SegInt(
+                p_name='[0, {})'.format(bound), p_summary='', p_title='',
+                p_bound=bound)
+            _ = sheet.insert_topic_child(topic, None)
+        path = tmp_path / 'content.fsg'
+        with path.open(mode='wb') as io_out:
+            CFORMAT.dump_sheet(sheet, io_out)
+        # Test
+        assert not BATCH.check_file(path)
+
+    def test_check_file_error(self, tmp_path, caplog):
+        """| Confirm result row for each fact in file.
+        | Case: file cannot be loaded.
+
+        :param tmp_path: built-in fixture `Pytest tmp_path`_.
+        :param caplog: built-in fixture `Pytest caplog`_.
+        """
+        # Setup
+        path = tmp_path / 'missing.fsg'
+        N_LOGS = 1
+        # Test
+        rows = BATCH.check_file(path)
+        assert 1 == len(rows)
+        row = rows[0]
+        assert str(path) == row['path']
+        assert row['fact'] is None
+        assert row['error'].startswith('FileNotFoundError')
+        assert N_LOGS == len(caplog.records)
+        assert 'ERROR' == caplog.records[0].levelname
+
+    @pytest.mark.parametrize('JOBS', [1, 2])
+    def test_check_files(self, new_path_sheet, JOBS):
+        """Confirm result rows for files in order of files.
+
+        :param JOBS: number of worker processes.
+        """
+        # Setup
+        paths = [new_path_sheet('a.fsg'), new_path_sheet('b.fsg'),
+                 new_path_sheet('c.fsg', p_pickle=True)]
+        expect = [r for p in paths for r in expect_rows(p)]
+        # Test
+        assert expect == list(BATCH.check_files(paths, JOBS))
+
+    @pytest.mark.parametrize('PICKLE', [False, True])
+    def test_load_file(self, new_path_sheet, PICKLE):
+        """| Confirm factsheet loads eagerly.
+        | Case: file in factsheet format and pickle of earlier release.
+
+        :param PICKLE: True when file contains pickle of model.
+        """
+        # Setup
+        path = new_path_sheet(p_pickle=PICKLE)
+        # Test
+        sheet = BATCH.load_file(path)
+        assert isinstance(sheet, MSHEET.Sheet)
+        topics = list(sheet.topics())
+        assert ['Numbers', 'Plain'] == [t.name.text for t in topics]
+        assert type(topics[0]) is PatchTopic
+
+    @pytest.mark.parametrize('FORMAT', ['json', 'csv'])
+    def test_main(self, new_path_sheet, tmp_path, FORMAT):
+        """| Confirm results written to output file.
+        | Case: JSON and CSV.
+
+        :param tmp_path: built-in fixture `Pytest tmp_path`_.
+        :param FORMAT: format of results.
+        """
+        # Setup
+        path = new_path_sheet()
+        path_out = tmp_path / 'out'
+        argv = ['--format', FORMAT, '--jobs', '1', '--output',
+                str(path_out), str(path)]
+        # Test
+        assert 0 == BATCH.main(argv)
+        with path_out.open(newline='') as io_in:
+            if 'json' == FORMAT:
+                rows = json.load(io_in)
+            else:
+                rows = [{k: v or None for k, v in r.items()}
+                        for r in csv.DictReader(io_in)]
+        assert expect_rows(path) == rows
+
+    def test_main_stdout(self, tmp_path, capsys):
+        """| Confirm results written to standard output.
+        | Case: file cannot be loaded.
+
+        :param tmp_path: built-in fixture `Pytest tmp_path`_.
+        :param capsys: built-in fixture `Pytest capsys`_.
+        """
+        # Setup
+        path = tmp_path / 'missing.fsg'
+        # Test
+        assert 1 == BATCH.main([str(path)])
+        rows = json.loads(capsys.readouterr().out)
+        assert [str(path)] == [r['path'] for r in rows]
+
+    def test_new_parser(self):
+        """Confirm command-line arguments and defaults."""
+        # Setup
+        # Test
+        parser = BATCH.new_parser()
+        assert 'factsheet-batch' == parser.prog
+        args = parser.parse_args(['a.fsg', 'b.fsg'])
+        assert ['a.fsg', 'b.fsg'] == [str(p) for p in args.paths]
+        assert 'json' == args.format
+        assert args.jobs is None
+        assert args.output is None
+        assert not args.verbose
+        with pytest.raises(SystemExit):
+            parser.parse_args(['--format', 'xml', 'a.fsg'])
+
+    def test_new_row(self, tmp_path):
+        """Confirm result row fields."""
+        # Setup
+        PATH = tmp_path / 'sheet.fsg'
+        ERROR = OSError('Oops')
+        # Test
+        row = BATCH.new_row(PATH, 'T', 'F', 'DEFINED', '4')
+        assert BATCH.FIELDS_ROW == tuple(row)
+        assert [str(PATH), 'T', 'F', 'DEFINED', '4', None] == list(
+            row.values())
+        row = BATCH.new_row(PATH, p_error=ERROR)
+        assert 'OSError: Oops' == row['error']
+        assert row['topic'] is None
@@ -7,6 +7,7 @@ import pytest
 import factsheet.bridge_gtk.bridge_base as BBASE
 import factsheet.bridge_gtk.bridge_outline as BOUTLINE
 import factsheet.bridge_gtk.bridge_text as BTEXT
+import factsheet.bridge_gtk.store_outline as BSTORE
 import factsheet.bridge_ui as BUI
 
 
@@ -24,6 +25,7 @@ class TestBridgeTypes:
         (BUI.ModelOutline, BOUTLINE.ModelOutline),
         (BUI.ModelOutlineMulti, BOUTLINE.ModelOutlineMulti),
         (BUI.ModelOutlineSingle, BOUTLINE.ModelOutlineSingle),
+        (BUI.StoreOutline, BSTORE.StoreOutline),
         (BUI.ViewOutline, BOUTLINE.ViewOutline),
         (BUI.ModelText, BTEXT.ModelText),
         (BUI.x_b_t_ModelTextMarkup, BTEXT.x_b_t_ModelTextMarkup),
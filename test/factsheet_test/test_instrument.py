@@ -0,0 +1,249 @@
+"""
+Unit tests for named timers and counters.  See :mod:`.instrument`.
+
+.. include:: /test/refs_include_pytest.txt
+"""
+import logging
+import pstats
+import pytest   # type: ignore[import]
+
+import factsheet.instrument as INSTR
+
+
+@pytest.fixture
+def patch_instruments(monkeypatch):
+    """Pytest fixture: isolate instruments of session."""
+    instruments = INSTR.Instruments()
+    monkeypatch.setattr(INSTR, 'g_instruments', instruments)
+    return instruments
+
+
+class TestInstruments:
+    """Unit tests for :class:`.Instruments`."""
+
+    def test_init(self):
+        """Confirm initialization."""
+        # Setup
+        # Test
+        target = INSTR.Instruments()
+        assert not target._counters
+        assert target._profile is None
+        assert not target._timers
+
+    def test_clear(self):
+        """Confirm timers and counters reset."""
+        # Setup
+        target = INSTR.Instruments()
+        target.count('Oops')
+        target.record('Oops', 0.0)
+        # Test
+        target.clear()
+        assert not target._counters
+        assert not target._timers
+
+    def test_count(self):
+        """Confirm counter sums amounts."""
+        # Setup
+        target = INSTR.Instruments()
+        N = 5
+        # Test
+        target.count('Oops')
+        target.count('Oops', N)
+        assert {'Oops': N + 1} == target._counters
+
+    @pytest.mark.parametrize('N_RECORDS, EXPECT', [
+        (0, 'Session summary: no timed runs or counts.'),
+        (1, 'Session summary:\n    Oops: 1'),
+        ])
+    def test_log_summary(self, caplog, N_RECORDS, EXPECT):
+        """| Confirm summary logged.
+        | Case: no timers or counters and one counter.
+
+        :param caplog: built-in fixture `Pytest caplog`_.
+        :param N_RECORDS: number of counts.
+        :param EXPECT: message logged.
+        """
+        # Setup
+        caplog.set_level(logging.INFO)
+        target = INSTR.Instruments()
+        for _ in range(N_RECORDS):
+            target.count('Oops')
+        # Test
+        target.log_summary()
+        assert 1 == len(caplog.records)
+        assert EXPECT == caplog.records[0].message
+        assert 'INFO' == caplog.records[0].levelname
+
+    def test_record(self, caplog):
+        """| Confirm timer statistics.
+        | Case: fast run and slow run.
+
+        :param caplog: built-in fixture `Pytest caplog`_.
+        """
+        # Setup
+        target = INSTR.Instruments()
+        FAST = INSTR.SECONDS_SLOW / 10
+        SLOW = 2 * INSTR.SECONDS_SLOW
+        # Test
+        target.record('Oops', FAST)
+        assert not caplog.records
+        target.record('Oops', SLOW)
+        stats = target._timers['Oops']
+        assert 2 == stats.n_runs
+        assert FAST + SLOW == pytest.approx(stats.seconds_total)
+        assert SLOW == stats.seconds_max
+        assert 1 == len(caplog.records)
+        assert 'WARNING' == caplog.records[0].levelname
+        assert caplog.records[0].message.startswith('Slow run of Oops')
+
+    def test_start_stop_profile(self, tmp_path, caplog):
+        """| Confirm profile capture saves statistics.
+        | Case: capture in progress and no capture.
+
+        :param tmp_path: built-in fixture `Pytest tmp_path`_.
+        :param caplog: built-in fixture `Pytest caplog`_.
+        """
+        # Setup
+        caplog.set_level(logging.INFO)
+        target = INSTR.Instruments()
+        PATH = tmp_path / 'test.prof'
+        # Test
+        target.start_profile()
+        profile = target._profile
+        target.start_profile()
+        assert profile is target._profile
+        assert target.is_profiling()
+        _ = sorted(range(100))
+        assert PATH == target.stop_profile(PATH)
+        assert not target.is_profiling()
+        assert pstats.Stats(str(PATH)).total_calls
+        assert 'Profile stopped.' in caplog.records[-1].message
+        assert target.stop_profile(PATH) is None
+
+    def test_stop_profile_error(self, tmp_path, caplog):
+        """| Confirm profile capture saves statistics.
+        | Case: statistics cannot be saved.
+
+        :param tmp_path: built-in fixture `Pytest tmp_path`_.
+        :param caplog: built-in fixture `Pytest caplog`_.
+        """
+        # Setup
+        target = INSTR.Instruments()
+        PATH = tmp_path / 'missing' / 'test.prof'
+        target.start_profile()
+        # Test
+        assert target.stop_profile(PATH) is None
+        assert 'ERROR' == caplog.records[-1].levelname
+
+    def test_summary(self):
+        """Confirm timers from most to least time then counters."""
+        # Setup
+        target = INSTR.Instruments()
+        target.count('Zeta', 2)
+        target.count('Alpha')
+        target.record('Short', 0.001)
+        target.record('Long', 0.002)
+        target.record('Long', 0.004)
+        EXPECT = [
+            'Long: 2 runs, 0.006s total, 3.000ms mean, 4.000ms max',
+            'Short: 1 runs, 0.001s total, 1.000ms mean, 1.000ms max',
+            'Alpha: 1',
+            'Zeta: 2',
+            ]
+        # Test
+        assert EXPECT == target.summary()
+
+    def test_timer(self):
+        """| Confirm timer records run of block.
+        | Case: block completes and block raises exception.
+        """
+        # Setup
+        target = INSTR.Instruments()
+        # Test
+        with target.timer('Oops'):
+            pass
+        with pytest.raises(ValueError):
+            with target.timer('Oops'):
+                raise ValueError
+        assert 2 == target._timers['Oops'].n_runs
+
+    def test_toggle_profile(self, tmp_path, monkeypatch):
+        """Confirm toggle starts and stops profile capture.
+
+        :param tmp_path: built-in fixture `Pytest tmp_path`_.
+        :param monkeypatch: built-in fixture `Pytest monkeypatch`_.
+        """
+        # Setup
+        monkeypatch.chdir(tmp_path)
+        target = INSTR.Instruments()
+        # Test
+        assert target.toggle_profile()
+        assert not target.toggle_profile()
+        assert (tmp_path / INSTR.PATH_PROFILE).exists()
+
+
+class TestInstrumentModule:
+    """Unit tests for module-level components of :mod:`.instrument`."""
+
+    def test_constants(self):
+        """Confirm constant definitions."""
+        # Setup
+        # Test
+        assert 0 < INSTR.N_LINES_PROFILE
+        assert 'factsheet.prof' == str(INSTR.PATH_PROFILE)
+        assert 0 < INSTR.SECONDS_SLOW
+
+    def test_globals(self):
+        """Confirm global definitions."""
+        # Setup
+        # Test
+        assert isinstance(INSTR.g_instruments, INSTR.Instruments)
+
+    def test_time_signal(self, patch_instruments):
+        """Confirm timer covers handlers of each signal emission."""
+        # Setup
+        class PatchSource:
+            """Stub for object that emits signals."""
+
+            def __init__(self):
+                self.handlers = list()
+                self.handlers_after = list()
+
+            def connect(self, p_signal, p_handler):
+                self.handlers.append(p_handler)
+
+            def connect_after(self, p_signal, p_handler):
+                self.handlers_after.append(p_handler)
+
+            def emit(self):
+                for handler in self.handlers + self.handlers_after:
+                    handler(self)
+
+        source = PatchSource()
+        calls = list()
+        INSTR.time_signal(source, 'changed', 'Search')
+        source.connect('changed', lambda *_args: calls.append(
+            'Search' in patch_instruments._timers))
+        N_EMITS = 3
+        # Test
+        for _ in range(N_EMITS):
+            source.emit()
+        assert [False, True, True] == calls
+        assert N_EMITS == patch_instruments._timers['Search'].n_runs
+
+    def test_timed(self, patch_instruments):
+        """Confirm decorator times each call and keeps function
+        identity.
+        """
+        # Setup
+        def double(p_n):
+            """Return twice number."""
+            return 2 * p_n
+
+        # Test
+        target = INSTR.timed('Double')(double)
+        assert 'double' == target.__name__
+        assert 'Return twice number.' == target.__doc__
+        assert 6 == target(3)
+        assert 4 == target(p_n=2)
+        assert 2 == patch_instruments._timers['Double'].n_runs
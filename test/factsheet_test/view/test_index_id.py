@@ -0,0 +1,256 @@
+"""
+Unit tests for search index over identity fields.  See
+:mod:`.index_id`.
+
+.. include:: /test/refs_include_pytest.txt
+"""
+import pytest   # type: ignore[import]
+
+import factsheet.abc_types.abc_stalefile as ABC_STALE
+import factsheet.view.id as VID
+import factsheet.view.index_id as VINDEX
+
+
+class PatchText:
+    """Stub for text model that notifies stale hooks on change."""
+
+    def __init__(self, p_text):
+        self._text = p_text
+
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, p_text):
+        self._text = p_text
+        ABC_STALE.notify_stale(self)
+
+
+class PatchItem:
+    """Stub for item with identity fields."""
+
+    def __init__(self, p_name, p_summary, p_title):
+        self.name = PatchText(p_name)
+        self.summary = PatchText(p_summary)
+        self.title = PatchText(p_title)
+
+
+@pytest.fixture
+def new_items():
+    """Pytest fixture: Return factory for items with identity fields."""
+    def new():
+        return [PatchItem('Alpha', 'First of many', 'Greek A'),
+                PatchItem('Beta', 'Second in line', 'Greek B'),
+                PatchItem('alphabet', 'Many letters', 'Latin letters'),
+                ]
+
+    return new
+
+
+@pytest.fixture
+def new_index(new_items):
+    """Pytest fixture: Return factory for index and its items."""
+    def new():
+        index = VINDEX.IndexId()
+        items = new_items()
+        for item in items:
+            index.add(item)
+        return index, items
+
+    return new
+
+
+NAME = VID.FieldsId.NAME
+SUMMARY = VID.FieldsId.SUMMARY
+TITLE = VID.FieldsId.TITLE
+
+
+class TestIndexId:
+    """Unit tests for :class:`.IndexId`."""
+
+    def test_add(self, new_index):
+        """| Confirm item addition.
+        | Case: new item and item already in index.
+        """
+        # Setup
+        target, items = new_index()
+        N_ITEMS = len(items)
+        ITEM = PatchItem('Gamma', 'Third', 'Greek C')
+        # Test
+        target.add(ITEM)
+        assert N_ITEMS + 1 == len(target)
+        assert ITEM in target
+        assert target.is_match(ITEM, 'amm', NAME)
+        target.add(ITEM)
+        assert N_ITEMS + 1 == len(target)
+        assert 3 * (N_ITEMS + 1) == len(target._sources)
+
+    def test_clear(self, new_index):
+        """Confirm all items removed."""
+        # Setup
+        target, items = new_index()
+        # Test
+        target.clear()
+        assert 0 == len(target)
+        for item in items:
+            assert item not in target
+        for postings in target._postings.values():
+            assert not postings
+        assert not target._sources
+        for texts in target._texts.values():
+            assert not texts
+        assert not target._keys_source
+
+    @pytest.mark.parametrize('KEY, SCOPE, EXPECT', [
+        ('lph', NAME, [0, 2]),
+        ('Alph', NAME, [0]),
+        ('alpha', NAME, [2]),
+        ('a', NAME, [0, 1, 2]),
+        ('ta', NAME, [1]),
+        ('Greek', NAME, []),
+        ('Greek', TITLE, [0, 1]),
+        ('letters', SUMMARY, [2]),
+        ('letters', SUMMARY | TITLE, [2]),
+        ('in', NAME | SUMMARY | TITLE, [1, 2]),
+        ('', NAME, [0, 1, 2]),
+        ('Alpha', VID.FieldsId.VOID, []),
+        ('aaa', ~VID.FieldsId.VOID, []),
+        ('many letter$', SUMMARY, []),
+        ])
+    def test_find(self, new_index, KEY, SCOPE, EXPECT):
+        """Confirm search for key within scope.
+
+        :param KEY: text to find.
+        :param SCOPE: fields to search.
+        :param EXPECT: indices of matching items.
+        """
+        # Setup
+        target, items = new_index()
+        expect = {id(items[i]) for i in EXPECT}
+        # Test
+        assert expect == target.find(KEY, SCOPE)
+        for i, item in enumerate(items):
+            assert (i in EXPECT) is target.is_match(item, KEY, SCOPE)
+
+    def test_find_cache(self, new_index):
+        """Confirm repeated search reuses result until index changes."""
+        # Setup
+        target, items = new_index()
+        target.start_updates()
+        KEY = 'Greek'
+        found = target.find(KEY, TITLE)
+        # Test
+        assert found is target.find(KEY, TITLE)
+        assert found is not target.find(KEY, NAME)
+        found = target.find(KEY, TITLE)
+        items[2].title.text = 'Greek and Latin'
+        assert found is not target.find(KEY, TITLE)
+        assert id(items[2]) in target.find(KEY, TITLE)
+        target.stop_updates()
+
+    def test_find_narrow(self, new_index):
+        """| Confirm search for short key narrows previous result.
+        | Case: previous key within key, and previous key not within key.
+        """
+        # Setup
+        target, items = new_index()
+        target.start_updates()
+        # Test
+        assert {id(items[0]), id(items[2])} == target.find('l', NAME)
+        items[1].name.text = 'Tilde'
+        assert {id(items[0]), id(items[1]), id(items[2])} == target.find(
+            'l', NAME)
+        assert {id(items[0]), id(items[2])} == target.find('lp', NAME)
+        assert {id(items[1])} == target.find('il', NAME)
+        target.stop_updates()
+
+    def test_find_many(self):
+        """Confirm search is not limited by posting size."""
+        # Setup
+        target = VINDEX.IndexId()
+        N_ITEMS = 1000
+        items = [PatchItem('Topic {}'.format(i), '', '')
+                 for i in range(N_ITEMS)]
+        for item in items:
+            target.add(item)
+        # Test
+        assert N_ITEMS == len(target.find('Topic', NAME))
+        found = target.find('pic 7', NAME)
+        assert 111 == len(found)
+        assert id(items[7]) in found
+        assert id(items[777]) in found
+        assert id(items[17]) not in found
+
+    def test_on_stale(self, new_index):
+        """| Confirm index follows change to item text.
+        | Case: field of item in index and other model component.
+        """
+        # Setup
+        target, items = new_index()
+        target.start_updates()
+        ITEM = items[1]
+        OTHER = PatchText('Beta')
+        # Test
+        ITEM.name.text = 'Delta'
+        assert target.is_match(ITEM, 'elt', NAME)
+        assert not target.is_match(ITEM, 'Bet', NAME)
+        assert 'Bet' not in target._postings[NAME]
+        OTHER.text = 'Zeta'
+        assert not target.find('Zeta', NAME)
+        target.stop_updates()
+        ITEM.name.text = 'Epsilon'
+        assert target.is_match(ITEM, 'Delta', NAME)
+
+    def test_remove(self, new_index):
+        """| Confirm item removal.
+        | Case: item in index and item not in index.
+        """
+        # Setup
+        target, items = new_index()
+        ITEM = items[1]
+        N_ITEMS = len(items)
+        OTHER = PatchItem('Gamma', 'Third', 'Greek C')
+        # Test
+        target.remove(ITEM)
+        assert N_ITEMS - 1 == len(target)
+        assert ITEM not in target
+        assert not target.find('Beta', NAME)
+        assert 'Bet' not in target._postings[NAME]
+        assert id(ITEM.name) not in target._sources
+        target.remove(OTHER)
+        assert N_ITEMS - 1 == len(target)
+
+    def test_start_stop_updates(self):
+        """Confirm index adds and removes stale hook at most once."""
+        # Setup
+        target = VINDEX.IndexId()
+        N_HOOKS = len(ABC_STALE.g_hooks_stale)
+        # Test
+        target.start_updates()
+        target.start_updates()
+        assert N_HOOKS + 1 == len(ABC_STALE.g_hooks_stale)
+        target.stop_updates()
+        target.stop_updates()
+        assert N_HOOKS == len(ABC_STALE.g_hooks_stale)
+
+
+class TestIndexIdModule:
+    """Unit tests for module-level components of :mod:`.index_id`."""
+
+    def test_constants(self):
+        """Confirm constant definitions."""
+        # Setup
+        # Test
+        assert 3 == VINDEX.N_GRAM
+        assert {NAME, SUMMARY, TITLE} == {
+            f for f, _ in VINDEX.FIELDS_INDEXED}
+
+    def test_new_grams(self):
+        """Confirm trigrams of text."""
+        # Setup
+        TEXT = 'abcab'
+        EXPECT = {'abc', 'bca', 'cab'}
+        # Test
+        assert EXPECT == VINDEX.new_grams(TEXT)
+        assert not VINDEX.new_grams('ab')
@@ -10,9 +10,11 @@ from gi.repository import GObject as GO  # type: ignore[import]
 import logging
 import pytest
 
+import factsheet.abc_types.abc_stalefile as ABC_STALE
 import factsheet.bridge_ui as BUI
 import factsheet.model.idcore as MIDCORE
 import factsheet.view.id as VID
+import factsheet.view.index_id as VINDEX
 import factsheet.view.outline_id as VOUTLINE_ID
 import factsheet.view.ui as UI
 
@@ -160,6 +162,10 @@ class TestInitColumnsOutlineId:
         assert target._column_title is columns[C_TITLE]
         assert TITLE_C_TITLE == columns[C_TITLE].get_title()
         assert N_COLUMNS == len(columns)
+        for column in columns:
+            assert column.get_sizing() is Gtk.TreeViewColumnSizing.FIXED
+        assert columns[C_TITLE].get_expand()
+        assert ui_view.get_fixed_height_mode()
         assert actions.lookup_action('cycle-columns') is not None
 
     @pytest.mark.parametrize('METHOD, LINE_STR, EXPECT', [
@@ -206,8 +212,7 @@ class TestInitColumnsOutlineId:
         column = Gtk.TreeViewColumn()
         render = Gtk.CellRendererText()
         column.pack_start(render, expand=True)
-        outline.ui_model.append(None, [None])
-        line = outline.ui_model.get_iter_first()
+        line = outline.insert_child(None)
         EXPECT = 'Missing'
         # Test
         target_method(None, render, outline.ui_model, line, None)
@@ -438,6 +443,41 @@ class TestInitSearchOutlineId:
         equal_func, extra = patch_get_ui.equal_func_args
         assert target._match_spec_ne == equal_func
         assert extra is ui_view_outline
+        assert isinstance(target._index, VINDEX.IndexId)
+        assert target._index.on_stale in ABC_STALE.g_hooks_stale
+        assert target.on_removed_items in BUI.g_hooks_removed_outline
+        assert target._stale_index
+        assert target._ui_model_index is None
+        ui_view_outline.destroy()
+        assert target._index.on_stale not in ABC_STALE.g_hooks_stale
+        assert target.on_removed_items not in BUI.g_hooks_removed_outline
+
+    def test_get_index(self, new_ui_outline):
+        """| Confirm search index of outline items.
+        | Case: new storage, fresh index, and stale index.
+        """
+        # Setup
+        outline, ui_view_outline = new_ui_outline
+        ui_view_search = VOUTLINE_ID.UiSearchOutlineId()
+        target = VOUTLINE_ID.InitSearchOutlineId(
+            ui_view_outline, ui_view_search)
+        N_ITEMS = len(list(outline.items()))
+        # Test: new storage
+        index = target._get_index(outline.ui_model)
+        assert index is target._index
+        assert outline.ui_model is target._ui_model_index
+        assert not target._stale_index
+        assert N_ITEMS == len(index)
+        for item in outline.items():
+            assert item in index
+        # Test: fresh index
+        index.clear()
+        assert index is target._get_index(outline.ui_model)
+        assert 0 == len(index)
+        # Test: stale index
+        target._stale_index = True
+        assert N_ITEMS == len(target._get_index(outline.ui_model))
+        assert not target._stale_index
 
     @pytest.mark.parametrize('NAME_SIGNAL, NAME_BUTTON, ORIGIN, N_DEFAULT', [
         ('toggled', 'ui_search_name', Gtk.CheckButton, 0),
@@ -568,8 +608,7 @@ class TestInitSearchOutlineId:
         target = VOUTLINE_ID.InitSearchOutlineId(
             ui_view_outline, ui_view_search)
         outline.clear()
-        outline.ui_model.append(None, [None])
-        line = outline.ui_model.get_iter_first()
+        line = outline.insert_child(None)
         MATCH_KEY = 'name'
         N_LOGS = 1
         LAST = -1
@@ -584,6 +623,67 @@ class TestInitSearchOutlineId:
         assert log_message == record.message
         assert 'WARNING' == record.levelname
 
+    def test_match_spec_ne_edit(self, new_ui_outline):
+        """Confirm method matches text changed after index built.
+
+        :param new_ui_outline: fixture :func:`.new_ui_outline`.
+        """
+        # Setup
+        outline, ui_view_outline = new_ui_outline
+        ui_view_search = VOUTLINE_ID.UiSearchOutlineId()
+        target = VOUTLINE_ID.InitSearchOutlineId(
+            ui_view_outline, ui_view_search)
+        target._scope_search = VID.FieldsId.NAME
+        line = outline.ui_model.get_iter_from_string('1:0')
+        item = outline.get_item(line)
+        MATCH_KEY = 'Something completely different'
+        assert target._match_spec_ne(
+            outline.ui_model, None, MATCH_KEY, line, ui_view_outline)
+        # Test
+        item.name.text = MATCH_KEY
+        assert not target._match_spec_ne(
+            outline.ui_model, None, MATCH_KEY, line, ui_view_outline)
+
+    def test_on_changed_row(self, new_ui_outline):
+        """| Confirm item at changed line refreshed in search index.
+        | Case: lines of indexed storage and of other storage.
+        """
+        # Setup
+        outline, ui_view_outline = new_ui_outline
+        ui_view_search = VOUTLINE_ID.UiSearchOutlineId()
+        target = VOUTLINE_ID.InitSearchOutlineId(
+            ui_view_outline, ui_view_search)
+        index = target._get_index(outline.ui_model)
+        line = outline.ui_model.get_iter_from_string('1:1')
+        item = outline.get_item(line)
+        index.remove(item)
+        other = BUI.ModelOutlineMulti[ItemStub]()
+        ITEM_OTHER = ItemStub(p_name='name_other')
+        line_other = other.insert_child(ITEM_OTHER)
+        # Test
+        target.on_changed_row(other.ui_model, None, line_other)
+        assert ITEM_OTHER not in index
+        target.on_changed_row(outline.ui_model, None, line)
+        assert item in index
+        assert not target._stale_index
+
+    def test_on_deleted_row(self, new_ui_outline):
+        """| Confirm search index marked stale.
+        | Case: lines of indexed storage and of other storage.
+        """
+        # Setup
+        outline, ui_view_outline = new_ui_outline
+        ui_view_search = VOUTLINE_ID.UiSearchOutlineId()
+        target = VOUTLINE_ID.InitSearchOutlineId(
+            ui_view_outline, ui_view_search)
+        _ = target._get_index(outline.ui_model)
+        other = BUI.ModelOutlineMulti[ItemStub]()
+        # Test
+        target.on_deleted_row(other.ui_model, None)
+        assert not target._stale_index
+        target.on_deleted_row(outline.ui_model, None)
+        assert target._stale_index
+
     @pytest.mark.parametrize('SCOPE, ACTIVE, FIELD, EXPECT', [
         (VID.FieldsId.VOID, True, VID.FieldsId.NAME,
          VID.FieldsId.NAME),
@@ -615,6 +715,80 @@ class TestInitSearchOutlineId:
         target.on_changed_search_scope(button, FIELD)
         assert EXPECT == target._scope_search
 
+    def test_on_inserted_row(self, new_ui_outline):
+        """| Confirm item at new line added to search index.
+        | Case: item, missing item, and line of other storage.
+        """
+        # Setup
+        outline, ui_view_outline = new_ui_outline
+        ui_view_search = VOUTLINE_ID.UiSearchOutlineId()
+        target = VOUTLINE_ID.InitSearchOutlineId(
+            ui_view_outline, ui_view_search)
+        index = target._get_index(outline.ui_model)
+        ITEM = ItemStub(p_name='name_new')
+        other = BUI.ModelOutlineMulti[ItemStub]()
+        # Test: item
+        _ = outline.insert_child(ITEM)
+        assert ITEM in index
+        assert not target._stale_index
+        # Test: line of other storage
+        ITEM_OTHER = ItemStub(p_name='name_other')
+        line_other = other.insert_child(ITEM_OTHER)
+        target.on_inserted_row(other.ui_model, None, line_other)
+        assert ITEM_OTHER not in index
+        assert not target._stale_index
+        # Test: missing item
+        _ = outline.insert_child(None)
+        assert target._stale_index
+
+    def test_on_inserted_row_section(self, new_ui_outline):
+        """| Confirm item at new line added to search index.
+        | Case: section of lines added in one step.
+        """
+        # Setup
+        outline, ui_view_outline = new_ui_outline
+        ui_view_search = VOUTLINE_ID.UiSearchOutlineId()
+        target = VOUTLINE_ID.InitSearchOutlineId(
+            ui_view_outline, ui_view_search)
+        index = target._get_index(outline.ui_model)
+        ITEMS = [ItemStub(p_name='name_top'), ItemStub(p_name='name_child'),
+                 ItemStub(p_name='name_grandchild'),
+                 ItemStub(p_name='name_sibling')]
+        PREORDER = list(zip([0, 1, 2, 1], ITEMS))
+        # Test
+        _ = outline.extend_section(PREORDER)
+        for item in ITEMS:
+            assert item in index
+        assert not target._stale_index
+        assert [ITEMS[2]] == [item for item in ITEMS if index.is_match(
+            item, 'grandch', VID.FieldsId.NAME)]
+
+    def test_on_removed_items(self, new_ui_outline):
+        """| Confirm items of removed lines leave search index.
+        | Case: lines of indexed storage and of other storage.
+        """
+        # Setup
+        outline, ui_view_outline = new_ui_outline
+        ui_view_search = VOUTLINE_ID.UiSearchOutlineId()
+        target = VOUTLINE_ID.InitSearchOutlineId(
+            ui_view_outline, ui_view_search)
+        index = target._get_index(outline.ui_model)
+        line = outline.ui_model.get_iter_from_string('1:1')
+        ITEMS_REMOVE = list(outline.items_section(line))
+        N_ITEMS = len(index)
+        other = BUI.ModelOutlineMulti[ItemStub]()
+        # Test
+        target.on_removed_items(other.ui_model, ITEMS_REMOVE)
+        assert N_ITEMS == len(index)
+        outline.remove(line)
+        assert not target._stale_index
+        assert N_ITEMS - len(ITEMS_REMOVE) == len(index)
+        for item in ITEMS_REMOVE:
+            assert item not in index
+        for item in outline.items():
+            assert item in index
+        ui_view_outline.destroy()
+
 
 class TestInitSummaryOutlineId:
     """Unit tests for :class:`.InitSummaryOutlineId`."""
@@ -707,8 +881,7 @@ class TestInitSummaryOutlineId:
             ui_view_outline, model_summary)
         target._model_summary.text = 'Oops'
         outline.clear()
-        outline.ui_model.append(None, [None])
-        line = outline.ui_model.get_iter_first()
+        line = outline.insert_child(None)
         ui_view_outline.expand_all()
         selection = ui_view_outline.get_selection()
         selection.select_iter(line)
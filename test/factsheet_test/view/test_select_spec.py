@@ -545,7 +545,7 @@ class TestSelectSpec:
         # Setup
         WIN = Gtk.Window()
         specs = SPECS.g_specs
-        line = specs.ui_model.append(None, [None])
+        line = specs.insert_child(None)
         target = VSELECT_SPEC.SelectSpec(p_parent=WIN)
         target._ui_outline_specs.expand_all()
         target._ui_selection.select_iter(line)
@@ -312,6 +312,87 @@ class TestModule:
         # Test
         assert issubclass(TARGET, SUPER)
 
+    def test_get_guide(self):
+        """Confirm dialogs in a guidance file share one builder."""
+        # Setup
+        NAME_FILE = UI.NAME_FILE_GUIDE_TOPIC_UI
+        # Test
+        target = UI.get_guide(NAME_FILE)
+        assert isinstance(target, UI.GetUiElementByPath)
+        assert target is UI.get_guide(NAME_FILE)
+
+    def test_getattr(self):
+        """| Confirm guidance dialog constructed on first access.
+        | Case: name of guidance dialog.
+        """
+        # Setup
+        NAME = 'HELP_TOPIC_DISPLAY'
+        NAME_FILE, ID_UI = UI._GUIDES[NAME]
+        # Test
+        target = UI.__getattr__(NAME)
+        assert target is UI.get_guide(NAME_FILE)(ID_UI)
+        assert target is vars(UI)[NAME]
+        assert target is UI.HELP_TOPIC_DISPLAY
+
+    def test_getattr_missing(self):
+        """| Confirm guidance dialog constructed on first access.
+        | Case: name not defined in module.
+        """
+        # Setup
+        NAME = 'HELP_PARROT'
+        # Test
+        with pytest.raises(AttributeError, match=NAME):
+            _ = UI.HELP_PARROT
+
+    def test_new_builder(self, ui_desc_minimal, tmp_path):
+        """| Confirm builder construction from cached description.
+        | Case: description accessible.
+
+        :param ui_desc_minimal: fixture :func:`.ui_desc_minimal`.
+        :param tmp_path: built-in fixture `Pytest tmp_path`_.
+        """
+        # Setup
+        DESC, ID_ELEMENT, TEXT_ELEMENT = ui_desc_minimal
+        PATH = tmp_path / 'test_builder.ui'
+        _ = PATH.write_text(DESC)
+        # Test
+        builder = UI.new_builder(str(PATH))
+        label = builder.get_object(ID_ELEMENT)
+        assert TEXT_ELEMENT == label.get_text()
+        PATH.unlink()
+        builder_cached = UI.new_builder(PATH)
+        label_cached = builder_cached.get_object(ID_ELEMENT)
+        assert label_cached is not label
+        assert TEXT_ELEMENT == label_cached.get_text()
+
+    def test_new_builder_error(self, tmp_path):
+        """| Confirm builder construction from cached description.
+        | Case: description inaccessible.
+
+        :param tmp_path: built-in fixture `Pytest tmp_path`_.
+        """
+        # Setup
+        PATH = tmp_path / 'no_builder.ui'
+        MATCH = 'Could not access description file "{}".'.format(PATH.name)
+        # Test
+        with pytest.raises(UI.UiDescriptionError, match=MATCH) as exc_info:
+            _ = UI.new_builder(PATH)
+        cause = exc_info.value.__cause__
+        assert isinstance(cause, FileNotFoundError)
+
+    def test_new_column_fixed(self):
+        """Confirm column construction with fixed width."""
+        # Setup
+        TITLE = 'Cheeses'
+        WIDTH = 42
+        # Test
+        column = UI.new_column_fixed(TITLE, None, WIDTH)
+        assert isinstance(column, Gtk.TreeViewColumn)
+        assert TITLE == column.get_title()
+        assert column.get_sizing() is Gtk.TreeViewColumnSizing.FIXED
+        assert WIDTH == column.get_fixed_width()
+        assert column.get_resizable()
+
     def test_new_column_stock(self, monkeypatch):
         """Confirm column construction.
 
@@ -347,6 +428,21 @@ class TestModule:
         assert column.get_reorderable()
         assert column.get_sizing() is Gtk.TreeViewColumnSizing.AUTOSIZE
 
+    def test_read_description(self, ui_desc_minimal, tmp_path):
+        """Confirm description read from file once.
+
+        :param ui_desc_minimal: fixture :func:`.ui_desc_minimal`.
+        :param tmp_path: built-in fixture `Pytest tmp_path`_.
+        """
+        # Setup
+        DESC, _ID_ELEMENT, _TEXT_ELEMENT = ui_desc_minimal
+        PATH = tmp_path / 'test.ui'
+        _ = PATH.write_text(DESC)
+        # Test
+        assert DESC == UI.read_description(PATH)
+        PATH.unlink()
+        assert DESC == UI.read_description(PATH)
+
 
 #     @pytest.mark.skip(reason='Not currently needed.')
 #     def test_new_action_bool_active(self):
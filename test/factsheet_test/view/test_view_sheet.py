@@ -5,13 +5,17 @@ Unit tests for class to display Factsheet document.  See
 .. include:: /test/refs_include_pytest.txt
 """
 import logging
+import os
 # import math
 from pathlib import Path
 import pytest   # type: ignore[import]
+import subprocess
+import sys
 
 import factsheet.bridge_ui as BUI
 # from factsheet.content.note import spec_note as XSPEC_NOTE
 import factsheet.control.control_sheet as CSHEET
+import factsheet.instrument as INSTR
 # import factsheet.model.sheet as MSHEET
 import factsheet.model.sheet as MSHEET
 # from factsheet.model import topic as MTOPIC
@@ -289,7 +293,9 @@ class TestAppFactsheet:
             Gtk.Application, 'do_shutdown', patch.do_shutdown)
 
         caplog.set_level(logging.INFO)
-        N_LOGS = 1
+        monkeypatch.setattr(INSTR, 'g_instruments', INSTR.Instruments())
+        INSTR.g_instruments.count('Oops')
+        N_LOGS = 2
         LAST = -1
         log_message = 'AppFactsheet application shutdown.'
         target = VSHEET.AppFactsheet()
@@ -297,6 +303,7 @@ class TestAppFactsheet:
         target.do_shutdown()
         assert patch.called
         assert N_LOGS == len(caplog.records)
+        assert 'Oops: 1' in caplog.records[0].message
         record = caplog.records[LAST]
         assert log_message == record.message
         assert 'INFO' == record.levelname
@@ -342,6 +349,24 @@ class TestAppFactsheet:
         assert not target.get_windows()
 
 
+class TestViewSheetModule:
+    """Unit tests for module-level components of :mod:`.view_sheet`."""
+
+    def test_import_lazy(self):
+        """Confirm specs do not load at application startup."""
+        # Setup
+        SCRIPT = ('import sys; import factsheet.view.view_sheet; '
+                  'print(sorted(m for m in sys.modules if m.startswith('
+                  '("factsheet.spec", "factsheet.content", '
+                  '"factsheet.view.select_spec"))))')
+        # Test
+        result = subprocess.run(
+            [sys.executable, '-c', SCRIPT], stdout=subprocess.PIPE,
+            env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+            check=True, universal_newlines=True)
+        assert '[]' == result.stdout.strip().splitlines()[-1]
+
+
 class TestNewDialogWarn:
     """Unit tests for :func:`.new_dialog_warn_loss`."""
 
@@ -547,6 +572,7 @@ class TestViewSheet:
         'show-about-app',
         'show-help-app',
         'show-intro-app',
+        'toggle-profile',
         ])
     def test_init_app_menu(self, ACTION):
         """| Confirm initialization.
@@ -1473,6 +1499,28 @@ class TestViewSheet:
         assert patch.called
         assert not dialog.is_visible()
 
+    def test_on_toggle_profile(self, monkeypatch):
+        """Confirm handler toggles profile capture.
+
+        :param monkeypatch: built-in fixture `Pytest monkeypatch`_.
+        """
+        # Setup
+        class PatchInstruments:
+            def __init__(self): self.n_toggles = 0
+
+            def toggle_profile(self):
+                self.n_toggles += 1
+                return True
+
+        control = CSHEET.g_control_app.open_factsheet(
+            p_path=None, p_time=BUI.TIME_EVENT_CURRENT)
+        target = VSHEET.ViewSheet(p_control=control)
+        patch = PatchInstruments()
+        monkeypatch.setattr(INSTR, 'g_instruments', patch)
+        # Test
+        target.on_toggle_profile(None, None)
+        assert 1 == patch.n_toggles
+
     @pytest.mark.skip
     def test_on_toggle_search_field_inactive(self, capfd):
         """| Confirm search field set.